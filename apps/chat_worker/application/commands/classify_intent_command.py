@@ -11,16 +11,25 @@ Clean Architecture:
 구조:
 - Command: 캐시 조회/저장, LLM 호출, Service 호출, 오케스트레이션
 - Service: 프롬프트 구성, LLM 응답 파싱, 신뢰도 계산, 복잡도 판단
+
+캐시 계층 (context 없는 단일 분류만):
+1. CachePort: sha256(message) 정확 키
+2. SemanticIntentCachePort: 어미/공백 정규화 + 근사 중복 (선택)
 """
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
+import time
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 from chat_worker.application.services.intent_classifier_service import (
     INTENT_CACHE_TTL,
+    MERGED_CLASSIFICATION_MIN_CONFIDENCE,
+    DecomposedIntentsSchema,
     IntentClassificationSchema,
     IntentClassifierService,
     MultiIntentDetectionSchema,
@@ -32,12 +41,20 @@ from chat_worker.infrastructure.assets.character_name_detector import (
 )
 
 if TYPE_CHECKING:
-    from chat_worker.application.ports.cache import CachePort
+    from chat_worker.application.ports.cache import (
+        CachePort,
+        SemanticIntentCachePort,
+        SemanticIntentHit,
+    )
     from chat_worker.application.ports.llm import LLMClientPort
+    from chat_worker.application.ports.metrics import MetricsPort
     from chat_worker.application.ports.prompt_loader import PromptLoaderPort
 
 logger = logging.getLogger(__name__)
 
+# 분해된 쿼리 동시 분류 상한 (LLM 동시 호출 폭주 방지)
+DEFAULT_MAX_PARALLEL_CLASSIFICATIONS = 4
+
 
 @dataclass(frozen=True)
 class ClassifyIntentInput:
@@ -88,6 +105,8 @@ class ClassifyIntentCommand:
     - llm: LLM 클라이언트
     - prompt_loader: 프롬프트 로더
     - cache: 캐시 Port (선택)
+    - semantic_cache: 유사 메시지 Intent 캐시 Port (선택)
+    - metrics: 메트릭 Port (선택, 쿼리 수별 분류 지연)
     """
 
     def __init__(
@@ -96,6 +115,10 @@ class ClassifyIntentCommand:
         prompt_loader: "PromptLoaderPort",
         cache: "CachePort | None" = None,
         enable_multi_intent: bool = True,
+        semantic_cache: "SemanticIntentCachePort | None" = None,
+        metrics: "MetricsPort | None" = None,
+        max_parallel_classifications: int = DEFAULT_MAX_PARALLEL_CLASSIFICATIONS,
+        enable_merged_classification: bool = False,
     ) -> None:
         """Command 초기화.
 
@@ -104,11 +127,22 @@ class ClassifyIntentCommand:
             prompt_loader: 프롬프트 로더
             cache: 캐시 Port (선택)
             enable_multi_intent: Multi-Intent 처리 활성화 여부
+            semantic_cache: 유사 메시지 Intent 캐시 Port (선택)
+            metrics: 메트릭 Port (선택)
+            max_parallel_classifications: 분해된 쿼리 동시 분류 상한
+            enable_merged_classification: Multi-Intent 감지 신뢰도가 높으면
+                분해 + 쿼리별 분류를 LLM 1회 호출로 통합
         """
         self._llm = llm
         self._cache = cache
         self._enable_cache = cache is not None
         self._enable_multi_intent = enable_multi_intent
+        self._semantic_cache = semantic_cache
+        self._metrics = metrics
+        self._max_parallel_classifications = max(1, max_parallel_classifications)
+        self._enable_merged_classification = enable_merged_classification
+        # 감사(audit) 백그라운드 태스크 참조 유지 (GC 방지)
+        self._audit_tasks: set[asyncio.Task] = set()
 
         # Service 생성 (프롬프트 로드 - Port 없이 문자열만 전달)
         self._service = IntentClassifierService(
@@ -176,59 +210,115 @@ class ClassifyIntentCommand:
         if detected_character:
             events.append("character_detected")
 
+        started = time.perf_counter()
         if self._enable_multi_intent:
             output = await self._execute_multi_intent(input_dto, events)
         else:
             output = await self._execute_single_intent(message, context, events)
 
+        if self._metrics is not None:
+            self._metrics.track_intent_latency(
+                query_count=max(1, len(output.decomposed_queries)),
+                duration=time.perf_counter() - started,
+            )
+
         # 캐릭터 감지 결과 추가
         output.detected_character = detected_character
         return output
 
+    @staticmethod
+    def _decode_cached(value: Any) -> dict[str, Any] | None:
+        """캐시 값 → dict (Redis는 JSON 문자열, 테스트/인메모리는 dict)."""
+        if not value:
+            return None
+        if isinstance(value, dict):
+            return value
+        try:
+            decoded = json.loads(value)
+        except (TypeError, ValueError):
+            return None
+        return decoded if isinstance(decoded, dict) else None
+
+    @staticmethod
+    def _output_from_cache(
+        message: str,
+        cached: dict[str, Any],
+        events: list[str],
+    ) -> ClassifyIntentOutput:
+        """정확 키 캐시 히트 결과 → 출력 DTO."""
+        events.append("cache_hit")
+        return ClassifyIntentOutput(
+            intent=cached.get("intent", "general"),
+            confidence=cached.get("confidence", 1.0),
+            is_complex=cached.get("is_complex", False),
+            has_multi_intent=False,
+            additional_intents=[],
+            decomposed_queries=[message],
+            events=events,
+        )
+
     async def _execute_single_intent(
         self,
         message: str,
         context: dict | None,
         events: list[str],
+        check_exact_cache: bool = True,
     ) -> ClassifyIntentOutput:
         """단일 Intent 분류 실행.
 
         Model-Centric 접근: Structured Output으로 모델 판단 신뢰.
+
+        Args:
+            message: 분류할 메시지
+            context: 대화 맥락 (있으면 캐시 미사용)
+            events: 이벤트 목록 (in-place 추가)
+            check_exact_cache: False면 정확 키 캐시 조회 생략 (MGET으로 이미 조회한 경우)
         """
         # 1. 캐시 조회 (Command에서 Port 호출)
-        if self._enable_cache and context is None:
+        if self._enable_cache and context is None and check_exact_cache:
             cache_key = self._service.generate_cache_key(message)
             try:
-                cached = await self._cache.get(cache_key)
+                cached = self._decode_cached(await self._cache.get(cache_key))
                 if cached:
                     logger.debug(f"Intent cache hit: {cache_key}")
-                    events.append("cache_hit")
-                    # 캐시된 결과 반환
-                    return ClassifyIntentOutput(
-                        intent=cached.get("intent", "general"),
-                        confidence=cached.get("confidence", 1.0),
-                        is_complex=cached.get("is_complex", False),
-                        has_multi_intent=False,
-                        additional_intents=[],
-                        decomposed_queries=[message],
-                        events=events,
-                    )
+                    return self._output_from_cache(message, cached, events)
             except Exception as e:
                 logger.warning(f"Cache get failed: {e}")
                 events.append("cache_error")
 
+        # 1-1. 유사 메시지 캐시 조회 (어미/공백 정규화 + 근사 중복)
+        if self._semantic_cache is not None and context is None:
+            try:
+                hit = await self._semantic_cache.lookup(message)
+            except Exception as e:
+                logger.warning(f"Semantic intent cache lookup failed: {e}")
+                hit = None
+            if hit is not None:
+                events.append("semantic_cache_hit")
+                if self._semantic_cache.should_audit():
+                    self._schedule_audit(message, hit)
+                logger.debug(
+                    "Semantic intent cache hit",
+                    extra={"intent": hit.intent, "similarity": hit.similarity},
+                )
+                return ClassifyIntentOutput(
+                    intent=hit.intent,
+                    confidence=hit.confidence,
+                    is_complex=hit.is_complex,
+                    has_multi_intent=False,
+                    additional_intents=[],
+                    decomposed_queries=[message],
+                    events=events,
+                )
+
         # 2. 프롬프트 구성 (Service - 순수 로직)
         prompt = self._service.build_prompt_with_context(message, context)
 
         # 3. LLM Structured Output 호출 (Model-Centric)
         try:
-            structured_result = await self._llm.generate_structured(
-                prompt=prompt,
-                response_schema=IntentClassificationSchema,
-                system_prompt=self._service.get_intent_system_prompt(),
-                max_tokens=150,  # reasoning 포함하므로 토큰 증가
-                temperature=0.2,  # 약간의 유연성 허용
-            )
+            llm_started = time.perf_counter()
+            structured_result = await self._classify_with_llm(prompt)
+            llm_latency = time.perf_counter() - llm_started
             events.append("llm_structured_called")
         except Exception as e:
             logger.error(f"LLM structured call failed: {e}")
@@ -250,17 +340,31 @@ class ClassifyIntentCommand:
                 cache_key = self._service.generate_cache_key(message)
                 await self._cache.set(
                     cache_key,
-                    {
-                        "intent": result.intent.value,
-                        "confidence": result.confidence,
-                        "is_complex": result.is_complex,
-                    },
+                    json.dumps(
+                        {
+                            "intent": result.intent.value,
+                            "confidence": result.confidence,
+                            "is_complex": result.is_complex,
+                        }
+                    ),
                     ttl=INTENT_CACHE_TTL,
                 )
                 events.append("cache_saved")
             except Exception as e:
                 logger.warning(f"Cache set failed: {e}")
 
+        if self._semantic_cache is not None and context is None:
+            try:
+                await self._semantic_cache.store(
+                    message,
+                    intent=result.intent.value,
+                    confidence=result.confidence,
+                    is_complex=result.is_complex,
+                    llm_latency=llm_latency,
+                )
+            except Exception as e:
+                logger.warning(f"Semantic intent cache store failed: {e}")
+
         # Multi-Intent 가능성 체크 (Service - 순수 로직)
         has_multi_intent = self._service.has_multi_intent(message)
 
@@ -283,6 +387,125 @@ class ClassifyIntentCommand:
             events=events,
         )
 
+    async def _classify_with_llm(self, prompt: str) -> IntentClassificationSchema:
+        """단일 Intent LLM Structured Output 호출."""
+        return await self._llm.generate_structured(
+            prompt=prompt,
+            response_schema=IntentClassificationSchema,
+            system_prompt=self._service.get_intent_system_prompt(),
+            max_tokens=150,  # reasoning 포함하므로 토큰 증가
+            temperature=0.2,  # 약간의 유연성 허용
+        )
+
+    def _schedule_audit(self, message: str, hit: "SemanticIntentHit") -> None:
+        """유사 캐시 히트 정밀도 감사 (백그라운드 LLM 재분류, 응답 지연 없음)."""
+
+        async def _audit() -> None:
+            try:
+                structured = await self._classify_with_llm(
+                    self._service.build_prompt_with_context(message, None)
+                )
+                result = self._service.parse_structured_intent_response(structured, message, None)
+                self._semantic_cache.record_audit(hit, result.intent.value)
+            except Exception as e:
+                logger.debug(f"Semantic intent cache audit failed: {e}")
+
+        task = asyncio.create_task(_audit())
+        self._audit_tasks.add(task)
+        task.add_done_callback(self._audit_tasks.discard)
+
+    async def _prefetch_cached(
+        self,
+        queries: list[str],
+        events: list[str],
+    ) -> list[dict[str, Any] | None]:
+        """쿼리별 정확 키 캐시 일괄 조회 (MGET 1회)."""
+        if not self._enable_cache or not queries:
+            return [None] * len(queries)
+        keys = [self._service.generate_cache_key(query) for query in queries]
+        try:
+            values = await self._cache.get_many(keys)
+        except Exception as e:
+            logger.warning(f"Cache get_many failed: {e}")
+            events.append("cache_error")
+            return [None] * len(queries)
+        if not isinstance(values, list) or len(values) != len(queries):
+            return [None] * len(queries)
+        return [self._decode_cached(value) for value in values]
+
+    async def _classify_queries(
+        self,
+        queries: list[str],
+        events: list[str],
+    ) -> list[ClassifyIntentOutput]:
+        """분해된 쿼리들을 동시에 분류 (상한: max_parallel_classifications).
+
+        정확 키 캐시는 MGET으로 한 번에 조회하고, 미스만 LLM 분류합니다.
+        asyncio.gather는 입력 순서대로 결과를 반환하므로 원문 순서가 유지됩니다.
+        """
+        cached_values = await self._prefetch_cached(queries, events)
+        semaphore = asyncio.Semaphore(self._max_parallel_classifications)
+
+        async def classify(query: str, cached: dict[str, Any] | None) -> ClassifyIntentOutput:
+            if cached:
+                return self._output_from_cache(query, cached, [])
+            async with semaphore:
+                return await self._execute_single_intent(query, None, [], check_exact_cache=False)
+
+        return list(
+            await asyncio.gather(
+                *(classify(query, cached) for query, cached in zip(queries, cached_values))
+            )
+        )
+
+    async def _decompose_and_classify(
+        self,
+        message: str,
+        events: list[str],
+    ) -> list[ClassifyIntentOutput] | None:
+        """분해 + 쿼리별 분류 통합 LLM 호출.
+
+        Returns:
+            쿼리 순서대로 분류 결과 (실패/빈 결과면 None → 기존 경로로 폴백)
+        """
+        try:
+            merged = await self._llm.generate_structured(
+                prompt=message,
+                response_schema=DecomposedIntentsSchema,
+                system_prompt=self._service.get_merged_classification_system_prompt(),
+                max_tokens=400,
+                temperature=0.1,
+            )
+        except Exception as e:
+            logger.warning(f"Merged decompose+classify failed: {e}, falling back")
+            events.append("merged_classification_error")
+            return None
+
+        if not merged.queries:
+            return None
+        events.append("merged_classification_called")
+
+        outputs: list[ClassifyIntentOutput] = []
+        for item in merged.queries:
+            result = self._service.parse_structured_intent_response(
+                IntentClassificationSchema(
+                    intent=item.intent,
+                    confidence=item.confidence,
+                    reasoning="merged decomposition",
+                ),
+                item.query,
+                None,
+            )
+            outputs.append(
+                ClassifyIntentOutput(
+                    intent=result.intent.value,
+                    confidence=result.confidence,
+                    is_complex=result.is_complex,
+                    decomposed_queries=[item.query],
+                )
+            )
+        return outputs
+
     async def _execute_multi_intent(
         self,
         input_dto: ClassifyIntentInput,
@@ -325,32 +548,40 @@ class ClassifyIntentCommand:
             events.append("multi_detect_error")
             return await self._execute_single_intent(message, None, events)
 
-        # Stage 3: Query Decomposition (Structured Output으로 JSON 보장)
-        try:
-            decomposed = await self._llm.generate_structured(
-                prompt=message,
-                response_schema=QueryDecompositionSchema,
-                system_prompt=self._service.get_decompose_system_prompt(),
-                max_tokens=300,
-                temperature=0.1,
-            )
-            events.append("decompose_llm_called")
-            queries = decomposed.queries if decomposed.is_compound else [message]
+        # Stage 3+4 통합: 감지 신뢰도가 높으면 분해 + 분류를 한 번에
+        classified: list[ClassifyIntentOutput] | None = None
+        if (
+            self._enable_merged_classification
+            and detection.confidence >= MERGED_CLASSIFICATION_MIN_CONFIDENCE
+        ):
+            classified = await self._decompose_and_classify(message, events)
 
-        except Exception as e:
-            logger.warning(f"Query decomposition failed: {e}")
-            events.append("decompose_error")
-            queries = [message]
-
-        # Stage 4: 각 쿼리별 Intent 분류
-        intents: list[ChatIntent] = []
-        for query in queries:
-            single_result = await self._execute_single_intent(query, None, [])
-            chat_intent = ChatIntent.simple(
-                single_result.intent,
-                confidence=single_result.confidence,
-            )
-            intents.append(chat_intent)
+        if classified is not None:
+            queries = [output.decomposed_queries[0] for output in classified]
+        else:
+            # Stage 3: Query Decomposition (Structured Output으로 JSON 보장)
+            try:
+                decomposed = await self._llm.generate_structured(
+                    prompt=message,
+                    response_schema=QueryDecompositionSchema,
+                    system_prompt=self._service.get_decompose_system_prompt(),
+                    max_tokens=300,
+                    temperature=0.1,
+                )
+                events.append("decompose_llm_called")
+                queries = decomposed.queries if decomposed.is_compound else [message]
+
+            except Exception as e:
+                logger.warning(f"Query decomposition failed: {e}")
+                events.append("decompose_error")
+                queries = [message]
+
+            # Stage 4: 각 쿼리별 Intent 분류 (동시 실행, 원문 순서 유지)
+            classified = await self._classify_queries(queries, events)
+
+        intents: list[ChatIntent] = [
+            ChatIntent.simple(output.intent, confidence=output.confidence) for output in classified
+        ]
 
         events.append("multi_intent_classification_completed")
 
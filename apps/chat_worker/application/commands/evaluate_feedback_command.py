@@ -16,6 +16,7 @@ Clean Architecture:
 from __future__ import annotations
 
 import logging
+import time
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
@@ -25,6 +26,10 @@ from chat_worker.application.services.feedback_evaluator import FeedbackEvaluato
 
 if TYPE_CHECKING:
     from chat_worker.application.ports.llm_evaluator import LLMFeedbackEvaluatorPort
+    from chat_worker.application.ports.metrics import MetricsPort
+    from chat_worker.application.services.deferred_feedback_evaluator import (
+        DeferredFeedbackEvaluator,
+    )
     from chat_worker.application.ports.web_search import WebSearchPort
     from chat_worker.application.services.fallback_orchestrator import (
         FallbackOrchestrator,
@@ -75,6 +80,10 @@ class EvaluateFeedbackCommand:
     3. Fallback 필요 여부 판단
     4. 필요시 Fallback 체인 실행
 
+    지연 모드 (deferred_evaluator 주입 시):
+    1. evaluate_fast(태그 커버리지/근거 수/섹션 매칭)로 Fallback 게이트
+    2. LLM 평가는 답변 스트리밍 시작 후 백그라운드 실행 (결과는 기록만)
+
     Port 주입:
     - llm_evaluator: 선택적 LLM 정밀 평가
     - web_search_client: Fallback용 웹 검색
@@ -85,6 +94,8 @@ class EvaluateFeedbackCommand:
         fallback_orchestrator: "FallbackOrchestrator",
         llm_evaluator: "LLMFeedbackEvaluatorPort | None" = None,
         web_search_client: "WebSearchPort | None" = None,
+        deferred_evaluator: "DeferredFeedbackEvaluator | None" = None,
+        metrics: "MetricsPort | None" = None,
     ) -> None:
         """Command 초기화.
 
@@ -92,11 +103,20 @@ class EvaluateFeedbackCommand:
             fallback_orchestrator: Fallback 실행 오케스트레이터
             llm_evaluator: LLM 기반 평가기 (선택)
             web_search_client: 웹 검색 클라이언트 (선택)
+            deferred_evaluator: 백그라운드 LLM 평가기 (있으면 지연 모드)
+            metrics: 메트릭 Port (선택)
         """
         self._feedback_service = FeedbackEvaluatorService()
         self._fallback_orchestrator = fallback_orchestrator
         self._llm_evaluator = llm_evaluator
         self._web_search = web_search_client
+        self._deferred_evaluator = deferred_evaluator
+        self._metrics = metrics
+
+    @property
+    def mode(self) -> str:
+        """평가 모드 (inline/deferred)."""
+        return "deferred" if self._deferred_evaluator is not None else "inline"
 
     async def execute(
         self,
@@ -113,10 +133,20 @@ class EvaluateFeedbackCommand:
         events: list[str] = []
 
         # 1. Rule 기반 빠른 평가 (Service 호출)
-        feedback = self._feedback_service.evaluate_by_rules(
-            query=input_dto.query,
-            rag_results=input_dto.rag_results,
-        )
+        started = time.perf_counter()
+        if self._deferred_evaluator is not None:
+            feedback = self._feedback_service.evaluate_fast(
+                query=input_dto.query,
+                rag_results=input_dto.rag_results,
+            )
+            evaluator = "fast"
+        else:
+            feedback = self._feedback_service.evaluate_by_rules(
+                query=input_dto.query,
+                rag_results=input_dto.rag_results,
+            )
+            evaluator = "rule"
+        self._track(evaluator, feedback, time.perf_counter() - started)
         events.append("rule_evaluation_completed")
 
         logger.info(
@@ -129,7 +159,18 @@ class EvaluateFeedbackCommand:
         )
 
         # 2. LLM 정밀 평가 (조건부, Port 사용)
-        if self._should_trigger_llm_evaluation(feedback):
+        if self._deferred_evaluator is not None:
+            # 지연 모드: 게이트는 빠른 평가로 확정, LLM 평가는 답변 시작 후 기록용
+            if self._feedback_service.needs_llm_evaluation(feedback):
+                scheduled = self._deferred_evaluator.schedule(
+                    job_id=input_dto.job_id,
+                    query=input_dto.query,
+                    intent=input_dto.intent,
+                    rag_results=input_dto.rag_results,
+                    gate_feedback=feedback,
+                )
+                events.append("llm_evaluation_deferred" if scheduled else "llm_evaluation_skipped")
+        elif self._should_trigger_llm_evaluation(feedback):
             feedback, llm_event = await self._evaluate_with_llm(
                 input_dto=input_dto,
                 current_feedback=feedback,
@@ -204,11 +245,13 @@ class EvaluateFeedbackCommand:
 
         try:
             logger.debug("Triggering LLM evaluation for low-quality result")
+            started = time.perf_counter()
             llm_feedback = await self._llm_evaluator.evaluate(
                 query=input_dto.query,
                 rag_results=input_dto.rag_results,
                 context={"intent": input_dto.intent},
             )
+            self._track("llm", llm_feedback, time.perf_counter() - started)
 
             # LLM 결과가 더 좋으면 사용
             if llm_feedback.score > current_feedback.score:
@@ -226,3 +269,13 @@ class EvaluateFeedbackCommand:
         except Exception as e:
             logger.warning(f"LLM evaluation failed, using rule result: {e}")
             return current_feedback, "llm_evaluation_failed"
+
+    def _track(self, evaluator: str, feedback: FeedbackResult, duration: float) -> None:
+        if self._metrics is not None:
+            self._metrics.track_feedback_evaluation(
+                mode=self.mode,
+                evaluator=evaluator,
+                quality=feedback.quality.value,
+                score=feedback.score,
+                duration=duration,
+            )
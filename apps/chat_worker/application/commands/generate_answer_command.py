@@ -13,30 +13,127 @@ Clean Architecture:
 - Service: 컨텍스트 조합, 프롬프트 포매팅
 
 P2: Multi-Intent Policy 조합 주입
-P3: Answer 캐싱 (간단한 질문)
+P3: Answer 캐싱
+- general/greeting: 컨텍스트 없는 질문
+- waste/character: 결정적 컨텍스트(로컬 규정/캐릭터) 해시로 키 구성
+  키 = (intent, 정규화 메시지, 컨텍스트 해시, 캐릭터, 프롬프트 버전)
+- 시점/위치 의존 컨텍스트(날씨/시세/검색/위치 등)나 이전 대화가 있으면 캐시 안함
 """
 
 from __future__ import annotations
 
 import hashlib
+import json
 import logging
+import re
+import time
+import unicodedata
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, AsyncIterator
 
 from chat_worker.application.dto.answer_context import AnswerContext
 from chat_worker.application.services.answer_generator import AnswerGeneratorService
+from chat_worker.application.services.prompt_assembler import (
+    compact_serialize,
+    estimate_tokens,
+)
 
 if TYPE_CHECKING:
     from chat_worker.application.ports.cache import CachePort
     from chat_worker.application.ports.llm import LLMClientPort
+    from chat_worker.application.ports.metrics import MetricsPort
     from chat_worker.application.ports.prompt_builder import PromptBuilderPort
 
 logger = logging.getLogger(__name__)
 
 # Answer 캐시 설정
 ANSWER_CACHE_TTL = 3600  # 1시간
+ANSWER_CACHE_KEY_VERSION = "v2"  # 키 구성/페이로드 형식 변경 시 증가
+
+# 컨텍스트가 없을 때만 캐시하는 Intent
 CACHEABLE_INTENTS = frozenset({"general", "greeting"})
 
+# 결정적 컨텍스트가 있을 때 컨텍스트 해시로 캐시하는 Intent → 필수 컨텍스트 필드
+CONTEXT_KEYED_INTENTS: dict[str, str] = {
+    "waste": "disposal_rules",
+    "character": "character_context",
+}
+
+DEFAULT_ANSWER_CACHE_INTENTS = CACHEABLE_INTENTS | frozenset(CONTEXT_KEYED_INTENTS)
+
+# 시점/위치/검색에 따라 바뀌는 컨텍스트 (있으면 캐시 안함)
+VOLATILE_CONTEXT_FIELDS = (
+    "location_context",
+    "web_search_results",
+    "recyclable_price_context",
+    "bulk_waste_context",
+    "weather_context",
+    "collection_point_context",
+    "image_generation_context",
+)
+
+_PUNCTUATION_RE = re.compile(r"[^\w\s]")
+
+
+def normalize_answer_message(message: str) -> str:
+    """캐시 키용 메시지 정규화 (NFKC, 소문자, 문장부호/중복 공백 제거)."""
+    text = unicodedata.normalize("NFKC", message).lower()
+    return " ".join(_PUNCTUATION_RE.sub(" ", text).split())
+
+
+@dataclass(frozen=True)
+class CachedAnswer:
+    """캐시된 답변.
+
+    Attributes:
+        answer: 답변 텍스트
+        output_tokens: 생성 시 출력 토큰 추정치 (절감 토큰 집계용)
+        generation_seconds: 최초 생성에 걸린 시간 (절감 지연 집계용)
+    """
+
+    answer: str
+    output_tokens: int = 0
+    generation_seconds: float | None = None
+
+    @classmethod
+    def decode(cls, raw: Any) -> "CachedAnswer | None":
+        """캐시 값 복원 (JSON 페이로드 또는 이전 형식의 평문 답변)."""
+        if not raw:
+            return None
+        if isinstance(raw, bytes):
+            raw = raw.decode()
+        if isinstance(raw, str):
+            try:
+                payload = json.loads(raw)
+            except ValueError:
+                payload = None
+            if not isinstance(payload, dict):
+                return cls(answer=raw, output_tokens=estimate_tokens(raw))
+        elif isinstance(raw, dict):
+            payload = raw
+        else:
+            return None
+
+        answer = payload.get("answer")
+        if not isinstance(answer, str) or not answer:
+            return None
+        return cls(
+            answer=answer,
+            output_tokens=int(payload.get("output_tokens") or estimate_tokens(answer)),
+            generation_seconds=payload.get("generation_seconds"),
+        )
+
+    def encode(self) -> str:
+        return json.dumps(
+            {
+                "answer": self.answer,
+                "output_tokens": self.output_tokens,
+                "generation_seconds": self.generation_seconds,
+            },
+            ensure_ascii=False,
+        )
+
 
 @dataclass(frozen=True)
 class GenerateAnswerInput:
@@ -77,6 +174,9 @@ class PreparedPrompt:
 
     LangGraph stream_mode="messages" 지원을 위해
     answer_node에서 직접 LLM 호출할 때 사용.
+
+    prompt는 PromptAssembler가 정적 → 동적 순서로 조립하므로
+    system_prompt + prompt 앞부분이 provider prefix 캐시 대상이 됩니다.
     """
 
     prompt: str
@@ -84,6 +184,9 @@ class PreparedPrompt:
     cache_key: str
     is_cacheable: bool
     cached_answer: str | None = None
+    section_tokens: dict[str, int] = field(default_factory=dict)
+    static_prefix_tokens: int = 0
+    cached: CachedAnswer | None = None
 
 
 class GenerateAnswerCommand:
@@ -100,6 +203,7 @@ class GenerateAnswerCommand:
     - llm: LLM 클라이언트
     - prompt_builder: 프롬프트 빌더 Port
     - cache: 캐시 Port (선택)
+    - metrics: 메트릭 Port (선택, 캐시 히트율/절감 토큰/절감 지연)
     """
 
     def __init__(
@@ -108,6 +212,9 @@ class GenerateAnswerCommand:
         prompt_builder: "PromptBuilderPort",
         cache: "CachePort | None" = None,
         service: AnswerGeneratorService | None = None,
+        metrics: "MetricsPort | None" = None,
+        cacheable_intents: Iterable[str] | None = None,
+        cache_ttl: int = ANSWER_CACHE_TTL,
     ) -> None:
         """Command 초기화.
 
@@ -116,29 +223,159 @@ class GenerateAnswerCommand:
             prompt_builder: 프롬프트 빌더 Port
             cache: 캐시 Port (선택)
             service: 답변 생성 서비스 (선택, 테스트 주입용)
+            metrics: 메트릭 Port (선택)
+            cacheable_intents: 캐시를 허용할 Intent (기본: general/greeting/waste/character,
+                빠진 Intent는 캐시 조회/저장 안함)
+            cache_ttl: 캐시 TTL (초)
         """
         self._llm = llm
         self._prompt_builder = prompt_builder
         self._cache = cache
         self._service = service or AnswerGeneratorService()
+        self._metrics = metrics
+        self._cacheable_intents = frozenset(
+            DEFAULT_ANSWER_CACHE_INTENTS if cacheable_intents is None else cacheable_intents
+        )
+        self._cache_ttl = cache_ttl
 
-    def _generate_cache_key(self, message: str, intent: str) -> str:
-        """Answer 캐시 키 생성."""
-        content = f"answer:{intent}:{message.strip().lower()}"
-        return f"answer:{hashlib.sha256(content.encode()).hexdigest()[:16]}"
+    def _generate_cache_key(
+        self,
+        input_dto: GenerateAnswerInput,
+        context: AnswerContext,
+        system_prompt: str,
+    ) -> str:
+        """Answer 캐시 키 생성.
+
+        (intent, 정규화 메시지, 컨텍스트 해시, 캐릭터, 프롬프트 버전)
+        프롬프트 버전은 시스템 프롬프트 해시라서 프롬프트 파일이 바뀌면 자동 무효화됩니다.
+        """
+        context_hash = hashlib.sha256(
+            compact_serialize(
+                {"classification": context.classification, "rules": context.disposal_rules}
+            ).encode()
+        ).hexdigest()[:16]
+        character = compact_serialize(context.character_context or {})
+        prompt_version = hashlib.sha256(system_prompt.encode()).hexdigest()[:12]
+        content = "|".join(
+            [
+                ANSWER_CACHE_KEY_VERSION,
+                input_dto.intent,
+                normalize_answer_message(input_dto.message),
+                context_hash,
+                hashlib.sha256(character.encode()).hexdigest()[:12],
+                prompt_version,
+            ]
+        )
+        return f"answer:{hashlib.sha256(content.encode()).hexdigest()[:32]}"
 
-    def _is_cacheable(self, intent: str, context: AnswerContext) -> bool:
+    def _is_cacheable(self, input_dto: GenerateAnswerInput, context: AnswerContext) -> bool:
         """캐시 가능 여부 판단.
 
         조건:
-        - general/greeting Intent만 캐시 (동적 데이터 없음)
-        - RAG/Subagent 컨텍스트가 없는 경우만 캐시
+        - 허용된 Intent (cacheable_intents)이고 Multi-Intent가 아님
+        - 이전 대화 턴/요약이 없음 (답변이 대화 맥락에 의존)
+        - 시점/위치 의존 컨텍스트가 없음
+        - general/greeting: 컨텍스트 없음
+        - waste/character: 필수 결정적 컨텍스트(규정/캐릭터)가 있음
         """
-        if intent not in CACHEABLE_INTENTS:
+        intent = input_dto.intent
+        if intent not in self._cacheable_intents:
             return False
-        if context.has_context():
+        if input_dto.has_multi_intent and input_dto.additional_intents:
+            return False
+        if self._has_prior_turns(input_dto):
+            return False
+        if any(getattr(context, name) for name in VOLATILE_CONTEXT_FIELDS):
             return False
-        return True
+
+        required = CONTEXT_KEYED_INTENTS.get(intent)
+        if required is not None:
+            return bool(getattr(context, required))
+        if intent in CACHEABLE_INTENTS:
+            return not (
+                context.classification or context.disposal_rules or context.character_context
+            )
+        return False
+
+    @staticmethod
+    def _has_prior_turns(input_dto: GenerateAnswerInput) -> bool:
+        """현재 메시지 외의 대화 히스토리/요약이 있는지."""
+        if input_dto.conversation_summary:
+            return True
+        history = list(input_dto.conversation_history or [])
+        # 히스토리 마지막은 보통 현재 사용자 메시지 (ProcessChatCommand가 먼저 추가)
+        if history and history[-1].get("content") == input_dto.message:
+            history.pop()
+        return bool(history)
+
+    async def _lookup_cache(
+        self,
+        input_dto: GenerateAnswerInput,
+        cache_key: str,
+        events: list[str] | None = None,
+    ) -> CachedAnswer | None:
+        """캐시 조회 (미스/에러 메트릭 기록, 히트는 전달 후 record_cache_hit에서 기록).
+
+        조회 실패 시 events가 주어지면 "cache_error"를 추가합니다.
+        """
+        try:
+            cached = CachedAnswer.decode(await self._cache.get(cache_key))
+        except Exception as e:
+            logger.warning(f"Answer cache get failed: {e}")
+            self._track_cache(input_dto.intent, "error")
+            if events is not None:
+                events.append("cache_error")
+            return None
+
+        if cached is None:
+            self._track_cache(input_dto.intent, "miss")
+            return None
+
+        logger.info(
+            "Answer cache hit",
+            extra={"job_id": input_dto.job_id, "intent": input_dto.intent},
+        )
+        return cached
+
+    def record_cache_hit(
+        self,
+        intent: str,
+        cached: CachedAnswer,
+        replay_seconds: float = 0.0,
+    ) -> None:
+        """캐시 히트 전달 완료 기록 (절감 토큰/지연).
+
+        Args:
+            intent: 주 Intent
+            cached: 전달한 캐시 답변
+            replay_seconds: 토큰 재생(pacing)에 걸린 시간
+        """
+        saved_seconds = None
+        if cached.generation_seconds is not None:
+            saved_seconds = max(0.0, cached.generation_seconds - replay_seconds)
+        self._track_cache(intent, "hit", cached.output_tokens, saved_seconds)
+
+    def _track_cache(
+        self,
+        intent: str,
+        result: str,
+        saved_tokens: int = 0,
+        saved_seconds: float | None = None,
+    ) -> None:
+        if self._metrics is None:
+            return
+        try:
+            self._metrics.track_answer_cache(intent, result, saved_tokens, saved_seconds)
+        except Exception as e:
+            logger.debug(f"Answer cache metric failed: {e}")
+
+    def _resolve(self, input_dto: GenerateAnswerInput) -> tuple[AnswerContext, str, str, bool]:
+        """컨텍스트/시스템 프롬프트/캐시 키/캐시 가능 여부 구성."""
+        context = self._build_context(input_dto)
+        system_prompt = self._build_system_prompt(input_dto)
+        cache_key = self._generate_cache_key(input_dto, context, system_prompt)
+        is_cacheable = self._cache is not None and self._is_cacheable(input_dto, context)
+        return context, system_prompt, cache_key, is_cacheable
 
     def _build_context(self, input_dto: GenerateAnswerInput) -> AnswerContext:
         """AnswerContext 구성 (Service 사용)."""
@@ -182,56 +419,70 @@ class GenerateAnswerCommand:
             PreparedPrompt with cache status
         """
         # 1. 컨텍스트 구성 (Service - 순수 로직)
-        context = self._build_context(input_dto)
-        cache_key = self._generate_cache_key(input_dto.message, input_dto.intent)
-        is_cacheable = self._cache is not None and self._is_cacheable(input_dto.intent, context)
+        context, system_prompt, cache_key, is_cacheable = self._resolve(input_dto)
 
         # 2. 캐시 확인 (Command에서 Port 호출)
-        cached_answer = None
-        if is_cacheable:
-            try:
-                cached_answer = await self._cache.get(cache_key)
-                if cached_answer:
-                    logger.info(
-                        "Answer cache hit",
-                        extra={"job_id": input_dto.job_id, "intent": input_dto.intent},
-                    )
-            except Exception as e:
-                logger.warning(f"Answer cache get failed: {e}")
+        cached = await self._lookup_cache(input_dto, cache_key) if is_cacheable else None
 
-        # 3. 프롬프트 구성 (Service - 순수 로직)
-        prompt = self._service.build_prompt(context)
-        system_prompt = self._build_system_prompt(input_dto)
+        # 3. 프롬프트 구성 (Service - 순수 로직, 정적 → 동적 순서)
+        assembled = self._service.assemble_prompt(context)
 
         if input_dto.has_multi_intent:
             logger.info(
                 f"Built multi-intent prompt for intents="
                 f"{[input_dto.intent] + list(input_dto.additional_intents)}"
             )
+        if assembled.truncated_sections:
+            logger.info(
+                "Prompt sections truncated to budget",
+                extra={
+                    "job_id": input_dto.job_id,
+                    "sections": list(assembled.truncated_sections),
+                },
+            )
 
         return PreparedPrompt(
-            prompt=prompt,
+            prompt=assembled.prompt,
             system_prompt=system_prompt,
             cache_key=cache_key,
             is_cacheable=is_cacheable,
-            cached_answer=cached_answer,
+            cached_answer=cached.answer if cached else None,
+            section_tokens=assembled.section_tokens,
+            static_prefix_tokens=assembled.static_prefix_tokens,
+            cached=cached,
         )
 
-    async def save_to_cache(self, cache_key: str, answer: str) -> None:
+    async def save_to_cache(
+        self,
+        cache_key: str,
+        answer: str,
+        generation_seconds: float | None = None,
+    ) -> bool:
         """캐시에 답변 저장.
 
         Args:
             cache_key: 캐시 키
             answer: 저장할 답변
+            generation_seconds: 생성에 걸린 시간 (히트 시 절감 지연 집계용)
+
+        Returns:
+            저장 성공 여부 (캐시 없음/빈 답변/저장 실패 시 False)
         """
-        if self._cache is None:
-            return
+        if self._cache is None or not answer:
+            return False
 
+        payload = CachedAnswer(
+            answer=answer,
+            output_tokens=estimate_tokens(answer),
+            generation_seconds=generation_seconds,
+        )
         try:
-            await self._cache.set(cache_key, answer, ttl=ANSWER_CACHE_TTL)
-            logger.debug(f"Answer cached: {cache_key}")
+            await self._cache.set(cache_key, payload.encode(), ttl=self._cache_ttl)
         except Exception as e:
             logger.warning(f"Answer cache set failed: {e}")
+            return False
+        logger.debug(f"Answer cached: {cache_key}")
+        return True
 
     async def execute(
         self,
@@ -246,29 +497,20 @@ class GenerateAnswerCommand:
             토큰 스트림
         """
         # 1. 컨텍스트 구성 (Service - 순수 로직)
-        context = self._build_context(input_dto)
-        cache_key = self._generate_cache_key(input_dto.message, input_dto.intent)
-        is_cacheable = self._cache is not None and self._is_cacheable(input_dto.intent, context)
+        context, system_prompt, cache_key, is_cacheable = self._resolve(input_dto)
 
         # 2. 캐시 확인 (Command에서 Port 호출)
         if is_cacheable:
-            try:
-                cached_answer = await self._cache.get(cache_key)
-                if cached_answer:
-                    logger.info(
-                        "Answer cache hit",
-                        extra={"job_id": input_dto.job_id, "intent": input_dto.intent},
-                    )
-                    # 캐시된 답변을 토큰 단위로 yield
-                    for char in cached_answer:
-                        yield char
-                    return
-            except Exception as e:
-                logger.warning(f"Answer cache get failed: {e}")
+            cached = await self._lookup_cache(input_dto, cache_key)
+            if cached is not None:
+                # 캐시된 답변을 토큰 단위로 yield
+                for char in cached.answer:
+                    yield char
+                self.record_cache_hit(input_dto.intent, cached)
+                return
 
         # 3. 프롬프트 구성 (Service - 순수 로직)
         prompt = self._service.build_prompt(context)
-        system_prompt = self._build_system_prompt(input_dto)
 
         if input_dto.has_multi_intent:
             logger.info(
@@ -278,6 +520,7 @@ class GenerateAnswerCommand:
 
         # 4. LLM 호출 (Command에서 Port 호출 - 스트리밍)
         answer_parts = []
+        started = time.perf_counter()
         async for token in self._llm.generate_stream(
             prompt=prompt,
             system_prompt=system_prompt,
@@ -287,12 +530,9 @@ class GenerateAnswerCommand:
 
         # 5. 캐시 저장 (Command에서 Port 호출)
         if is_cacheable and answer_parts:
-            answer = "".join(answer_parts)
-            try:
-                await self._cache.set(cache_key, answer, ttl=ANSWER_CACHE_TTL)
-                logger.debug(f"Answer cached: {cache_key}")
-            except Exception as e:
-                logger.warning(f"Answer cache set failed: {e}")
+            await self.save_to_cache(
+                cache_key, "".join(answer_parts), time.perf_counter() - started
+            )
 
     async def execute_full(
         self,
@@ -313,27 +553,23 @@ class GenerateAnswerCommand:
         cache_hit = False
 
         # 컨텍스트 구성 (Service - 순수 로직)
-        context = self._build_context(input_dto)
-        cache_key = self._generate_cache_key(input_dto.message, input_dto.intent)
-        is_cacheable = self._cache is not None and self._is_cacheable(input_dto.intent, context)
+        context, system_prompt, cache_key, is_cacheable = self._resolve(input_dto)
 
         # 캐시 확인 (Command에서 Port 호출)
         if is_cacheable:
-            try:
-                cached_answer = await self._cache.get(cache_key)
-                if cached_answer:
-                    events.append("cache_hit")
-                    return GenerateAnswerOutput(
-                        answer=cached_answer,
-                        cache_hit=True,
-                        events=events,
-                    )
-            except Exception:
-                events.append("cache_error")
+            cached = await self._lookup_cache(input_dto, cache_key, events)
+            if cached is not None:
+                events.append("cache_hit")
+                self.record_cache_hit(input_dto.intent, cached)
+                return GenerateAnswerOutput(
+                    answer=cached.answer,
+                    cache_hit=True,
+                    events=events,
+                )
 
         # LLM 호출 (Command에서 Port 호출)
         prompt = self._service.build_prompt(context)
-        system_prompt = self._build_system_prompt(input_dto)
+        started = time.perf_counter()
 
         try:
             async for token in self._llm.generate_stream(
@@ -350,16 +586,16 @@ class GenerateAnswerCommand:
                 cache_hit=False,
                 events=events,
             )
+        generation_seconds = time.perf_counter() - started
 
         answer = "".join(answer_parts)
         events.append("answer_generated")
 
         # 캐시 저장 (Command에서 Port 호출)
         if is_cacheable and answer:
-            try:
-                await self._cache.set(cache_key, answer, ttl=ANSWER_CACHE_TTL)
+            if await self.save_to_cache(cache_key, answer, generation_seconds):
                 events.append("cache_saved")
-            except Exception:
+            else:
                 events.append("cache_save_error")
 
         return GenerateAnswerOutput(
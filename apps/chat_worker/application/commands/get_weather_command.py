@@ -22,6 +22,7 @@ from typing import TYPE_CHECKING, Any
 from chat_worker.application.services.weather_service import WeatherService
 
 if TYPE_CHECKING:
+    from chat_worker.application.ports.geo_resolver import GeoResolverPort
     from chat_worker.application.ports.weather_client import WeatherClientPort
 
 logger = logging.getLogger(__name__)
@@ -67,7 +68,7 @@ class GetWeatherCommand:
     """날씨 정보 조회 Command (UseCase).
 
     Port 호출 + 오케스트레이션:
-    1. 위경도 → 격자좌표 변환 (Service - 순수 로직)
+    1. 위경도 → 격자좌표 변환 (GeoResolverPort 셀 캐시, 없으면 Service - 순수 로직)
     2. API 호출 (WeatherClientPort)
     3. 날씨 팁 생성 (Service - 순수 로직)
 
@@ -79,13 +80,16 @@ class GetWeatherCommand:
     def __init__(
         self,
         weather_client: "WeatherClientPort",
+        geo_resolver: "GeoResolverPort | None" = None,
     ) -> None:
         """초기화.
 
         Args:
             weather_client: 날씨 클라이언트 (Port)
+            geo_resolver: 좌표 해석 (선택, 다른 노드와 격자 계산 결과 공유)
         """
         self._weather_client = weather_client
+        self._geo_resolver = geo_resolver
 
     async def execute(self, input_dto: GetWeatherInput) -> GetWeatherOutput:
         """Command 실행.
@@ -110,7 +114,12 @@ class GetWeatherCommand:
 
         # 2. 위경도 → 격자좌표 변환 (Service - 순수 로직)
         try:
-            nx, ny = WeatherService.convert_to_grid(input_dto.lat, input_dto.lon)
+            if self._geo_resolver is not None:
+                # 격자만 필요: 역지오코딩(외부 호출)을 기다리지 않음
+                resolution = self._geo_resolver.locate(input_dto.lat, input_dto.lon)
+                nx, ny = resolution.nx, resolution.ny
+            else:
+                nx, ny = WeatherService.convert_to_grid(input_dto.lat, input_dto.lon)
             events.append("grid_converted")
             logger.debug(
                 "Grid coordinates calculated",
@@ -31,7 +31,7 @@ from __future__ import annotations
 
 import logging
 import time
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Sequence
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING, Any, Protocol
@@ -52,6 +52,13 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# 파이프라인 astream 구독 모드 (소비하는 이벤트만)
+# - updates: 노드 상태 업데이트 (Progress + 결과 수집)
+# "custom"(get_stream_writer Progress 이벤트)은 발행하는 노드가 생기면 추가
+# "messages"는 토큰마다 (AIMessageChunk, metadata) 튜플을 만들지만
+# 토큰은 answer_node가 직접 발행하므로 기본 구독하지 않음 (디버깅용으로만 추가)
+DEFAULT_STREAM_MODES: tuple[str, ...] = ("updates",)
+
 
 # ============================================================
 # Pipeline Protocol (Graph 인터페이스)
@@ -206,6 +213,7 @@ class ProcessChatCommand:
         telemetry: "TelemetryConfigPort | None" = None,
         provider: str = "openai",
         enable_native_streaming: bool = True,
+        stream_modes: Sequence[str] | None = None,
     ):
         """초기화.
 
@@ -216,6 +224,7 @@ class ProcessChatCommand:
             telemetry: Telemetry 설정 Port (선택, LangSmith 등)
             provider: LLM 프로바이더
             enable_native_streaming: 네이티브 스트리밍 활성화 (기본 True)
+            stream_modes: astream 구독 모드 (None이면 DEFAULT_STREAM_MODES)
 
         Note:
             Event-First Architecture: 메시지 영속화는 done 이벤트에
@@ -227,6 +236,7 @@ class ProcessChatCommand:
         self._telemetry = telemetry
         self._provider = provider
         self._enable_native_streaming = enable_native_streaming
+        self._stream_modes = list(stream_modes or DEFAULT_STREAM_MODES)
 
     async def execute(self, request: ProcessChatRequest) -> ProcessChatResponse:
         """Chat 파이프라인 실행.
@@ -433,9 +443,10 @@ class ProcessChatCommand:
     ) -> dict[str, Any]:
         """stream_mode를 사용한 스트리밍 파이프라인 실행.
 
-        LangGraph 1.0+ 권장 방식.
-        - stream_mode="messages": LLM 토큰 스트리밍 (AIMessageChunk)
+        LangGraph 1.0+ 권장 방식. 구독 모드는 self._stream_modes.
         - stream_mode="updates": 노드 상태 업데이트 (Progress 추적)
+        - stream_mode="custom": 노드 발행 Progress 이벤트 (get_stream_writer, 기본 미구독)
+        - stream_mode="messages": LLM 토큰 (기본 미구독, 발행하지 않음)
 
         참고: https://docs.langchain.com/oss/python/langgraph/streaming#messages
 
@@ -451,23 +462,26 @@ class ProcessChatCommand:
         final_result: dict[str, Any] = {}
         seen_nodes: set[str] = set()  # 노드 시작 추적
 
-        # stream_mode=["messages", "updates"] 사용
         # 반환 형식: (stream_mode, data) 튜플
         async for stream_mode, data in self._pipeline.astream(
             state,
             config=config,
-            stream_mode=["messages", "updates"],
+            stream_mode=self._stream_modes,
         ):
-            if stream_mode == "messages":
-                # LLM 토큰 스트리밍
-                await self._handle_message_chunk(data, job_id)
-
-            elif stream_mode == "updates":
+            if stream_mode == "updates":
                 # 노드 상태 업데이트
                 final_result = await self._handle_node_update(
                     data, job_id, final_result, progress_tracker, seen_nodes
                 )
 
+            elif stream_mode == "custom":
+                # 노드 발행 Progress 이벤트
+                await self._handle_custom_event(data, job_id)
+
+            elif stream_mode == "messages":
+                # LLM 토큰 스트리밍 (구독한 경우에만 도달)
+                await self._handle_message_chunk(data, job_id)
+
         return final_result
 
     async def _handle_message_chunk(
@@ -499,6 +513,28 @@ class ProcessChatCommand:
         # answer_node가 notify_token_v2로 직접 토큰을 발행함
         return
 
+    async def _handle_custom_event(self, data: Any, job_id: str) -> None:
+        """custom 모드 이벤트 처리.
+
+        노드가 get_stream_writer()로 보낸 Progress 이벤트를 stage 이벤트로 전달.
+        형식: {"stage": str, "status": str, "progress": int?, "message": str?}
+        stage가 없는 이벤트는 무시.
+
+        Args:
+            data: 노드가 보낸 이벤트
+            job_id: 작업 ID
+        """
+        if not isinstance(data, dict) or "stage" not in data:
+            return
+
+        await self._progress_notifier.notify_stage(
+            task_id=job_id,
+            stage=data["stage"],
+            status=data.get("status", "processing"),
+            progress=data.get("progress"),
+            message=data.get("message"),
+        )
+
     async def _handle_node_update(
         self,
         data: dict[str, dict[str, Any]],
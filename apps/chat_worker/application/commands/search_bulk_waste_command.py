@@ -15,10 +15,12 @@ import logging
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
+from chat_worker.application.ports.geo_resolver import coordinates_from_location
 from chat_worker.application.services.bulk_waste_service import BulkWasteService
 
 if TYPE_CHECKING:
     from chat_worker.application.ports.bulk_waste_client import BulkWasteClientPort
+    from chat_worker.application.ports.geo_resolver import GeoResolverPort
 
 logger = logging.getLogger(__name__)
 
@@ -65,7 +67,7 @@ class SearchBulkWasteCommand:
     """대형폐기물 정보 검색 Command (UseCase).
 
     Port 호출 + 오케스트레이션:
-    1. 시군구 추출/검증 (Service - 순수 로직)
+    1. 시군구 추출/검증 (Service - 순수 로직, 없으면 좌표 해석 - GeoResolverPort)
     2. API 호출 (BulkWasteClientPort)
     3. 컨텍스트 변환 (Service - 순수 로직)
 
@@ -77,13 +79,16 @@ class SearchBulkWasteCommand:
     def __init__(
         self,
         bulk_waste_client: "BulkWasteClientPort",
+        geo_resolver: "GeoResolverPort | None" = None,
     ) -> None:
         """초기화.
 
         Args:
             bulk_waste_client: 대형폐기물 클라이언트 (Port)
+            geo_resolver: 좌표 → 시군구 해석 (선택, 주소 없는 user_location용)
         """
         self._bulk_waste_client = bulk_waste_client
+        self._geo_resolver = geo_resolver
 
     async def execute(self, input_dto: SearchBulkWasteInput) -> SearchBulkWasteOutput:
         """Command 실행.
@@ -100,6 +105,10 @@ class SearchBulkWasteCommand:
         sigungu = input_dto.sigungu
         if not sigungu:
             sigungu = BulkWasteService.extract_sigungu(input_dto.user_location)
+        if not sigungu:
+            sigungu = await self._resolve_sigungu(input_dto)
+            if sigungu:
+                events.append("sigungu_resolved_from_coordinates")
 
         # 시군구 없으면 HITL 트리거
         if not sigungu:
@@ -197,6 +206,21 @@ class SearchBulkWasteCommand:
             events=events,
         )
 
+    async def _resolve_sigungu(self, input_dto: SearchBulkWasteInput) -> str | None:
+        """user_location 좌표로 시군구 해석 (해석 실패 시 None → HITL)."""
+        coordinates = coordinates_from_location(input_dto.user_location)
+        if self._geo_resolver is None or coordinates is None:
+            return None
+        try:
+            resolution = await self._geo_resolver.resolve(*coordinates)
+        except Exception as e:
+            logger.warning(
+                "Sigungu resolution failed",
+                extra={"job_id": input_dto.job_id, "error": str(e)},
+            )
+            return None
+        return resolution.sigungu
+
 
 __all__ = [
     "SearchBulkWasteCommand",
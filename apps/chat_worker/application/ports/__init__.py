@@ -77,6 +77,14 @@ from chat_worker.application.ports.llm_evaluator import (
     LLMFeedbackEvaluatorPort,
 )
 
+# Integrations - Geo (좌표 → 지역 해석)
+from chat_worker.application.ports.geo_resolver import (
+    AdminRegion,
+    GeoResolution,
+    GeoResolverPort,
+    ReverseGeocoderPort,
+)
+
 # Integrations - Location
 from chat_worker.application.ports.location_client import (
     LocationClientPort,
@@ -153,6 +161,11 @@ __all__ = [
     "CharacterDTO",
     "LocationClientPort",
     "LocationDTO",
+    # Integrations - Geo
+    "AdminRegion",
+    "GeoResolution",
+    "GeoResolverPort",
+    "ReverseGeocoderPort",
     # Feedback
     "LLMFeedbackEvaluatorPort",
     # Interaction
@@ -5,5 +5,9 @@ Application Layer는 이 Port만 알고,
 """
 
 from chat_worker.application.ports.cache.cache_port import CachePort
+from chat_worker.application.ports.cache.semantic_intent_cache_port import (
+    SemanticIntentCachePort,
+    SemanticIntentHit,
+)
 
-__all__ = ["CachePort"]
+__all__ = ["CachePort", "SemanticIntentCachePort", "SemanticIntentHit"]
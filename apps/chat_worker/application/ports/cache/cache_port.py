@@ -76,6 +76,22 @@ class CachePort(ABC):
 
     # === 선택적 메서드 (기본 구현 제공) ===
 
+    async def get_many(self, keys: list[str]) -> list[str | None]:
+        """여러 키 일괄 조회 (입력 순서 유지).
+
+        기본 구현은 get()을 동시 호출합니다.
+        Redis 등은 MGET 한 번으로 오버라이드합니다.
+
+        Args:
+            keys: 캐시 키 목록
+
+        Returns:
+            키 순서대로 캐시된 값 (없으면 None)
+        """
+        import asyncio
+
+        return list(await asyncio.gather(*(self.get(key) for key in keys)))
+
     async def get_json(self, key: str) -> dict[str, Any] | None:
         """JSON 형태로 캐시 조회.
 
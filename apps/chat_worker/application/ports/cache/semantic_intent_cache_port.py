@@ -0,0 +1,95 @@
+"""Semantic Intent Cache Port - 유사 메시지 Intent 캐시 인터페이스.
+
+정확 키 캐시(CachePort, sha256(message))는 "버려?" / "버려요" 같은
+어미·띄어쓰기 차이만으로도 미스가 납니다. 이 Port는 정규화 + 근사 중복
+탐색으로 이미 분류한 메시지와 충분히 비슷하면 LLM 호출 없이
+캐시된 Intent를 돌려줍니다.
+
+구현체: infrastructure/cache/semantic_intent_cache.py (MinHash LSH)
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class SemanticIntentHit:
+    """유사 메시지 캐시 히트 결과.
+
+    Attributes:
+        intent: 캐시된 Intent 값
+        confidence: 캐시된 신뢰도
+        is_complex: 캐시된 복잡도 여부
+        similarity: 정규화 메시지 간 유사도 (0~1, 1이면 정규화 후 동일)
+        matched_message: 히트한 캐시 항목의 정규화 메시지
+    """
+
+    intent: str
+    confidence: float
+    is_complex: bool
+    similarity: float
+    matched_message: str
+
+
+class SemanticIntentCachePort(ABC):
+    """유사 메시지 Intent 캐시 Port."""
+
+    @abstractmethod
+    async def lookup(self, message: str) -> SemanticIntentHit | None:
+        """정규화/근사 중복 탐색.
+
+        Args:
+            message: 원본 사용자 메시지
+
+        Returns:
+            임계값 이상 유사한 캐시 항목 (없으면 None)
+        """
+        raise NotImplementedError
+
+    async def peek(self, message: str) -> SemanticIntentHit | None:
+        """통계/LRU 갱신 없이 조회 (예측용, 기본: 미지원).
+
+        Args:
+            message: 원본 사용자 메시지
+
+        Returns:
+            임계값 이상 유사한 캐시 항목 (없거나 미지원이면 None)
+        """
+        return None
+
+    @abstractmethod
+    async def store(
+        self,
+        message: str,
+        intent: str,
+        confidence: float,
+        is_complex: bool,
+        llm_latency: float | None = None,
+    ) -> None:
+        """분류 결과 저장.
+
+        Args:
+            message: 원본 사용자 메시지
+            intent: 분류된 Intent 값
+            confidence: 신뢰도
+            is_complex: 복잡도 여부
+            llm_latency: 이번 분류의 LLM 호출 지연(초), 절감 지연 추정용
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def should_audit(self) -> bool:
+        """이번 히트를 정밀도 감사(LLM 재분류) 대상으로 샘플링할지."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def record_audit(self, hit: SemanticIntentHit, actual_intent: str) -> None:
+        """감사 결과 기록 (캐시 Intent와 LLM 재분류 Intent 비교).
+
+        Args:
+            hit: 감사 대상 캐시 히트
+            actual_intent: LLM이 다시 분류한 Intent 값
+        """
+        raise NotImplementedError
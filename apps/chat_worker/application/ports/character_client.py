@@ -43,3 +43,7 @@ class CharacterClientPort(ABC):
     async def get_catalog(self) -> list[CharacterDTO]:
         """전체 카탈로그 조회."""
         pass
+
+    async def prewarm(self) -> None:
+        """연결 선행 수립 (선택적 구현, worker warmup에서 호출)."""
+        pass
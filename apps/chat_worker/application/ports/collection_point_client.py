@@ -146,6 +146,10 @@ class CollectionPointClientPort(ABC):
         """
         pass
 
+    async def prewarm(self) -> None:
+        """연결 선행 수립 (선택적 구현, worker warmup에서 호출)."""
+        pass
+
     async def close(self) -> None:
         """리소스 정리 (선택적 구현)."""
         pass
@@ -0,0 +1,150 @@
+"""Geo Resolver Port - 좌표 → 지역 정보 해석 추상화.
+
+여러 노드가 같은 user_location(위경도)에서 각자 지역 정보를 구하던 것을
+하나의 해석 결과(GeoResolution)로 공유합니다.
+
+- 시도/시군구: bulk_waste (대형폐기물 지자체 조회)
+- 기상청 격자 (nx, ny): weather
+- 타일: 위치 기반 캐시/데이터셋 샤드 키
+
+Clean Architecture:
+- Port: 이 파일
+- Adapter: infrastructure/geo/ (캐시 + 오프라인/카카오 역지오코딩)
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class AdminRegion:
+    """행정구역 (역지오코딩 결과).
+
+    Attributes:
+        sido: 시도 (예: "서울특별시")
+        sigungu: 시군구 (예: "강남구", "수원시 장안구"), 세종 등은 None
+        source: 해석 출처 (offline | kakao)
+    """
+
+    sido: str
+    sigungu: str | None = None
+    source: str = ""
+
+
+@dataclass(frozen=True)
+class GeoResolution:
+    """좌표 해석 결과 묶음.
+
+    Attributes:
+        lat: 양자화된 위도 (캐시 셀 기준)
+        lon: 양자화된 경도
+        nx: 기상청 격자 X
+        ny: 기상청 격자 Y
+        tile: 타일 키 (위치 기반 캐시/데이터셋 샤드)
+        region: 행정구역 (역지오코딩 실패/미지원 시 None)
+    """
+
+    lat: float
+    lon: float
+    nx: int
+    ny: int
+    tile: str
+    region: AdminRegion | None = None
+
+    @property
+    def sido(self) -> str | None:
+        """시도."""
+        return self.region.sido if self.region else None
+
+    @property
+    def sigungu(self) -> str | None:
+        """시군구."""
+        return self.region.sigungu if self.region else None
+
+    @property
+    def region_name(self) -> str | None:
+        """표시용 지역명 (예: "서울특별시 강남구")."""
+        if self.region is None:
+            return None
+        return " ".join(part for part in (self.region.sido, self.region.sigungu) if part)
+
+
+def coordinates_from_location(
+    user_location: dict[str, Any] | None,
+) -> tuple[float, float] | None:
+    """user_location에서 (위도, 경도) 추출 (lat/lon, latitude/longitude 모두 지원)."""
+    if not isinstance(user_location, dict):
+        return None
+    lat = user_location.get("lat") or user_location.get("latitude")
+    lon = user_location.get("lon") or user_location.get("longitude")
+    if lat is None or lon is None:
+        return None
+    try:
+        return float(lat), float(lon)
+    except (TypeError, ValueError):
+        return None
+
+
+class ReverseGeocoderPort(ABC):
+    """역지오코딩 Port (좌표 → 행정구역)."""
+
+    @abstractmethod
+    async def reverse_geocode(self, lat: float, lon: float) -> AdminRegion | None:
+        """좌표의 행정구역 조회.
+
+        Args:
+            lat: 위도
+            lon: 경도
+
+        Returns:
+            AdminRegion, 해당 지역 없음이면 None
+
+        Raises:
+            Exception: 일시적 조회 실패 (결과를 캐시하지 않음)
+        """
+        pass
+
+
+class GeoResolverPort(ABC):
+    """좌표 해석 Port (양자화 + 캐시)."""
+
+    @abstractmethod
+    async def resolve(self, lat: float, lon: float) -> GeoResolution:
+        """좌표 해석 (격자/타일은 항상, 행정구역은 가능한 경우).
+
+        Args:
+            lat: 위도
+            lon: 경도
+
+        Returns:
+            GeoResolution
+        """
+        pass
+
+    @abstractmethod
+    def locate(self, lat: float, lon: float) -> GeoResolution:
+        """격자/타일만 즉시 계산 (역지오코딩을 기다리지 않음).
+
+        셀이 이미 해석돼 있으면 행정구역까지 포함한 결과를, 아니면 region=None을 반환.
+        weather처럼 격자만 필요한 경로용.
+
+        Args:
+            lat: 위도
+            lon: 경도
+
+        Returns:
+            GeoResolution
+        """
+        pass
+
+
+__all__ = [
+    "AdminRegion",
+    "GeoResolution",
+    "GeoResolverPort",
+    "ReverseGeocoderPort",
+    "coordinates_from_location",
+]
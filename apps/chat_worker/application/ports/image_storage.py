@@ -21,6 +21,7 @@ class ImageUploadResult:
     cdn_url: str | None = None  # 성공 시 CDN URL
     key: str | None = None  # S3 오브젝트 키
     error: str | None = None  # 실패 시 에러 메시지
+    deduplicated: bool = False  # 동일 내용이 이미 있어 업로드 생략
 
 
 class ImageStoragePort(ABC):
@@ -52,6 +53,10 @@ class ImageStoragePort(ABC):
         """
         ...
 
+    async def prewarm(self) -> None:
+        """연결 선행 수립 (선택적 구현, worker warmup에서 호출)."""
+        ...
+
     @abstractmethod
     async def close(self) -> None:
         """연결을 종료합니다."""
@@ -136,6 +136,25 @@ class KakaoSearchResponse:
     query: str = ""
 
 
+@dataclass(frozen=True)
+class KakaoRegionDTO:
+    """카카오 좌표 → 행정구역 결과 (coord2regioncode).
+
+    Attributes:
+        region_type: H(행정동) | B(법정동)
+        sido: 시도 (region_1depth_name)
+        sigungu: 시군구 (region_2depth_name, 예: "수원시 장안구")
+        dong: 읍면동 (region_3depth_name)
+        code: 행정/법정 코드
+    """
+
+    region_type: str
+    sido: str
+    sigungu: str
+    dong: str = ""
+    code: str = ""
+
+
 class KakaoLocalClientPort(ABC):
     """카카오 로컬 API 클라이언트 Port.
 
@@ -200,6 +219,22 @@ class KakaoLocalClientPort(ABC):
         """
         pass
 
+    async def coord_to_region(self, x: float, y: float) -> list[KakaoRegionDTO]:
+        """좌표로 행정구역 조회 (선택적 구현, 미지원 시 빈 목록).
+
+        Args:
+            x: 경도
+            y: 위도
+
+        Returns:
+            행정동(H)/법정동(B) 결과 목록
+        """
+        return []
+
+    async def prewarm(self) -> None:
+        """연결 선행 수립 (선택적 구현, worker warmup에서 호출)."""
+        pass
+
     async def close(self) -> None:
         """리소스 정리 (선택적 구현)."""
         pass
@@ -208,6 +243,7 @@ class KakaoLocalClientPort(ABC):
 __all__ = [
     "KakaoCategoryGroup",
     "KakaoPlaceDTO",
+    "KakaoRegionDTO",
     "KakaoSearchMeta",
     "KakaoSearchResponse",
     "KakaoLocalClientPort",
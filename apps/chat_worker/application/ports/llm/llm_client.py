@@ -231,3 +231,7 @@ class LLMClientPort(ABC):
             "generate_function_call() is not implemented. "
             "Override this method in the implementation class."
         )
+
+    async def prewarm(self) -> None:
+        """연결 선행 수립 (선택적 구현, worker warmup에서 호출)."""
+        pass
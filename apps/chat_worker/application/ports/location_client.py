@@ -58,3 +58,7 @@ class LocationClientPort(ABC):
     ) -> list[LocationDTO]:
         """주변 제로웨이스트샵 검색."""
         pass
+
+    async def prewarm(self) -> None:
+        """연결 선행 수립 (선택적 구현, worker warmup에서 호출)."""
+        pass
@@ -92,3 +92,48 @@ class MetricsPort(ABC):
             duration: 호출 시간 (초)
         """
         pass
+
+    def track_intent_latency(self, query_count: int, duration: float) -> None:
+        """Intent 분류 종단 지연 기록 (분해된 쿼리 수별).
+
+        Args:
+            query_count: 분해된 쿼리 수 (단일 의도면 1)
+            duration: 분류 전체 소요 시간 (초)
+        """
+        pass
+
+    def track_answer_cache(
+        self,
+        intent: str,
+        result: str,
+        saved_tokens: int = 0,
+        saved_seconds: float | None = None,
+    ) -> None:
+        """Answer 캐시 조회 결과 기록.
+
+        Args:
+            intent: 주 Intent
+            result: 조회 결과 (hit/miss/error)
+            saved_tokens: 히트로 생성하지 않은 출력 토큰 추정치
+            saved_seconds: 히트로 절감한 생성 지연 (초)
+        """
+        pass
+
+    def track_feedback_evaluation(
+        self,
+        mode: str,
+        evaluator: str,
+        quality: str,
+        score: float,
+        duration: float,
+    ) -> None:
+        """RAG 품질 평가 결과 기록 (오프라인 품질 대시보드용).
+
+        Args:
+            mode: 평가 모드 (inline/deferred)
+            evaluator: 평가기 (rule/fast/llm)
+            quality: 품질 등급
+            score: 품질 점수 (0.0 ~ 1.0)
+            duration: 평가 소요 시간 (초)
+        """
+        pass
@@ -110,6 +110,7 @@ class RecyclablePriceSearchResponse:
         survey_date: 조사 기준일
         region: 검색 권역
         total_count: 전체 결과 수
+        context: 미리 포맷된 LLM context 문자열 (구현체가 제공하는 경우)
     """
 
     items: list[RecyclablePriceDTO] = field(default_factory=list)
@@ -117,6 +118,7 @@ class RecyclablePriceSearchResponse:
     survey_date: str | None = None
     region: RecyclableRegion | None = None
     total_count: int = 0
+    context: str | None = None
 
     @property
     def has_results(self) -> bool:
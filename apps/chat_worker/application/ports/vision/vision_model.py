@@ -47,3 +47,7 @@ class VisionModelPort(ABC):
             분류 결과 dict
         """
         pass
+
+    async def prewarm(self) -> None:
+        """연결 선행 수립 (선택적 구현, worker warmup에서 호출)."""
+        pass
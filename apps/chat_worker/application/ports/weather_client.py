@@ -122,6 +122,10 @@ class WeatherClientPort(ABC):
         """
         pass
 
+    async def prewarm(self) -> None:
+        """연결 선행 수립 (선택적 구현, worker warmup에서 호출)."""
+        pass
+
     @abstractmethod
     async def close(self) -> None:
         """리소스 정리."""
@@ -34,6 +34,9 @@ from chat_worker.application.services.fallback_orchestrator import (
 )
 
 # Feedback 평가
+from chat_worker.application.services.deferred_feedback_evaluator import (
+    DeferredFeedbackEvaluator,
+)
 from chat_worker.application.services.feedback_evaluator import (
     FeedbackEvaluatorService,
 )
@@ -100,6 +103,7 @@ __all__ = [
     # Answer
     "AnswerGeneratorService",
     # Feedback
+    "DeferredFeedbackEvaluator",
     "FeedbackEvaluatorService",
     # Fallback
     "FallbackOrchestrator",
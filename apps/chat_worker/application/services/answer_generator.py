@@ -18,6 +18,10 @@ import logging
 from typing import Any
 
 from chat_worker.application.dto.answer_context import AnswerContext
+from chat_worker.application.services.prompt_assembler import (
+    AssembledPrompt,
+    PromptAssembler,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +36,25 @@ class AnswerGeneratorService:
     LLM 호출은 Command에서 담당.
     """
 
+    def __init__(self, assembler: PromptAssembler | None = None) -> None:
+        """초기화.
+
+        Args:
+            assembler: 프롬프트 조립기 (선택, 섹션 예산 조정용)
+        """
+        self._assembler = assembler or PromptAssembler()
+
+    def assemble_prompt(self, context: AnswerContext) -> AssembledPrompt:
+        """정적 → 동적 순서 + compact 직렬화 + 섹션 예산으로 프롬프트 조립.
+
+        Args:
+            context: 답변 컨텍스트
+
+        Returns:
+            조립 결과 (프롬프트 + 섹션별 토큰 통계)
+        """
+        return self._assembler.assemble(context)
+
     def build_prompt(self, context: AnswerContext) -> str:
         """AnswerContext에서 LLM 프롬프트 생성.
 
@@ -41,7 +64,8 @@ class AnswerGeneratorService:
         Returns:
             LLM에 전달할 프롬프트
         """
-        prompt = context.to_prompt_context()
+        assembled = self.assemble_prompt(context)
+        prompt = assembled.prompt
 
         logger.debug(
             "Built answer prompt",
@@ -62,6 +86,8 @@ class AnswerGeneratorService:
                     len(context.conversation_history) if context.conversation_history else 0
                 ),
                 "prompt_length": len(prompt),
+                "static_prefix_tokens": assembled.static_prefix_tokens,
+                "truncated_sections": list(assembled.truncated_sections),
             },
         )
 
@@ -0,0 +1,167 @@
+"""Deferred Feedback Evaluator - LLM 정밀 평가를 답변 스트리밍 이후로 지연.
+
+feedback 노드의 LLM 평가는 waste_rag → answer 사이 critical path에 있어
+모든 waste 질문의 첫 토큰을 LLM 1회 호출만큼 늦춥니다.
+
+지연 모드:
+- Fallback 게이트는 evaluate_fast(로컬 규칙)로 동기 판단
+- LLM 평가는 job별 백그라운드 태스크로 예약
+- answer 노드가 첫 토큰을 내보내면 release(job_id) → 평가 시작
+  (release가 오지 않으면 release_timeout 후 시작)
+- 결과는 답변에 반영하지 않고 기록만 (메트릭 + 구조화 로그, 오프라인 품질 대시보드)
+
+태스크는 강한 참조로 보관하고 max_pending 초과 시 새 예약을 버립니다 (부하 시 평가 샘플링).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from chat_worker.application.dto.feedback_result import FeedbackResult
+    from chat_worker.application.ports.llm_evaluator import LLMFeedbackEvaluatorPort
+    from chat_worker.application.ports.metrics import MetricsPort
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RELEASE_TIMEOUT = 10.0  # 첫 토큰 신호 최대 대기 (초)
+DEFAULT_MAX_PENDING = 64  # 프로세스당 대기/실행 중 평가 상한
+
+
+class DeferredFeedbackEvaluator:
+    """답변 스트리밍 시작 후 실행되는 백그라운드 LLM 품질 평가기."""
+
+    def __init__(
+        self,
+        llm_evaluator: "LLMFeedbackEvaluatorPort",
+        metrics: "MetricsPort | None" = None,
+        release_timeout: float = DEFAULT_RELEASE_TIMEOUT,
+        max_pending: int = DEFAULT_MAX_PENDING,
+    ):
+        """초기화.
+
+        Args:
+            llm_evaluator: LLM 평가기
+            metrics: 메트릭 Port (선택)
+            release_timeout: 첫 토큰 신호 최대 대기 (초)
+            max_pending: 대기/실행 중 평가 상한
+        """
+        self._llm_evaluator = llm_evaluator
+        self._metrics = metrics
+        self._release_timeout = release_timeout
+        self._max_pending = max_pending
+        self._gates: dict[str, asyncio.Event] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    @property
+    def pending(self) -> int:
+        """대기/실행 중 평가 수."""
+        return len(self._tasks)
+
+    def schedule(
+        self,
+        job_id: str,
+        query: str,
+        intent: str,
+        rag_results: dict[str, Any] | None,
+        gate_feedback: "FeedbackResult",
+    ) -> bool:
+        """LLM 평가 예약.
+
+        Args:
+            job_id: 작업 ID (release 키)
+            query: 사용자 질문
+            intent: Intent
+            rag_results: RAG 검색 결과
+            gate_feedback: 동기 게이트(빠른 평가) 결과 (비교 기록용)
+
+        Returns:
+            예약 여부 (상한 초과 시 False)
+        """
+        if len(self._tasks) >= self._max_pending:
+            logger.warning(
+                "Deferred feedback evaluation dropped (too many pending)",
+                extra={"job_id": job_id, "pending": len(self._tasks)},
+            )
+            return False
+
+        gate = self._gates.setdefault(job_id, asyncio.Event())
+        task = asyncio.create_task(
+            self._run(job_id, gate, query, intent, rag_results, gate_feedback),
+            name=f"deferred-feedback:{job_id}",
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return True
+
+    def release(self, job_id: str) -> None:
+        """답변 스트리밍 시작 신호 (예약된 평가가 없으면 무시)."""
+        gate = self._gates.get(job_id)
+        if gate is not None:
+            gate.set()
+
+    async def drain(self, timeout: float | None = None) -> None:
+        """대기 중 평가 즉시 시작 후 완료 대기 (종료 시)."""
+        for gate in list(self._gates.values()):
+            gate.set()
+        if self._tasks:
+            await asyncio.wait(list(self._tasks), timeout=timeout)
+
+    async def _run(
+        self,
+        job_id: str,
+        gate: asyncio.Event,
+        query: str,
+        intent: str,
+        rag_results: dict[str, Any] | None,
+        gate_feedback: "FeedbackResult",
+    ) -> None:
+        try:
+            try:
+                await asyncio.wait_for(gate.wait(), timeout=self._release_timeout)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                self._gates.pop(job_id, None)
+
+            started = time.perf_counter()
+            feedback = await self._llm_evaluator.evaluate(
+                query=query,
+                rag_results=rag_results,
+                context={"intent": intent},
+            )
+            duration = time.perf_counter() - started
+
+            if self._metrics is not None:
+                self._metrics.track_feedback_evaluation(
+                    mode="deferred",
+                    evaluator="llm",
+                    quality=feedback.quality.value,
+                    score=feedback.score,
+                    duration=duration,
+                )
+            logger.info(
+                "rag_feedback_deferred_evaluated",
+                extra={
+                    "job_id": job_id,
+                    "intent": intent,
+                    "gate_score": gate_feedback.score,
+                    "gate_quality": gate_feedback.quality.value,
+                    "llm_score": feedback.score,
+                    "llm_quality": feedback.quality.value,
+                    # 게이트와 LLM 평가의 Fallback 판단이 달랐는지 (게이트 튜닝 지표)
+                    "fallback_disagreement": gate_feedback.needs_fallback
+                    != feedback.needs_fallback,
+                    "duration": duration,
+                },
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(
+                "Deferred feedback evaluation failed",
+                extra={"job_id": job_id, "error": str(e)},
+            )
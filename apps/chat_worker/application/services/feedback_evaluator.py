@@ -15,10 +15,15 @@ import logging
 from typing import Any
 
 from chat_worker.application.dto.feedback_result import FeedbackResult
+from chat_worker.application.services.rag_searcher import RAGSearcherService
 from chat_worker.domain.enums import FallbackReason, FeedbackQuality
 
 logger = logging.getLogger(__name__)
 
+# evaluate_fast: 근거 청크 관련성 → 섹션 매칭 점수
+EVIDENCE_RELEVANCE_SCORE = {"high": 1.0, "medium": 0.6, "low": 0.2}
+FAST_EVIDENCE_FULL_COUNT = 3  # 근거 청크 수 만점 기준
+
 
 class FeedbackEvaluatorService:
     """RAG 품질 평가 서비스 (Rule 기반).
@@ -30,6 +35,9 @@ class FeedbackEvaluatorService:
     LLM 기반 정밀 평가는 Node에서 별도로 호출.
     """
 
+    def __init__(self) -> None:
+        self._searcher = RAGSearcherService()
+
     def evaluate_by_rules(
         self,
         query: str,
@@ -103,6 +111,70 @@ class FeedbackEvaluatorService:
 
         return FeedbackResult.from_score(score, suggestions, metadata)
 
+    def evaluate_fast(
+        self,
+        query: str,
+        rag_results: dict[str, Any] | None,
+    ) -> FeedbackResult:
+        """검색 근거(evidence) 기반 빠른 로컬 평가 (LLM 평가 지연 모드의 Fallback 게이트).
+
+        평가 기준:
+        1. 결과 존재 여부 (0.3)
+        2. 근거 청크 수 (0.2, FAST_EVIDENCE_FULL_COUNT개 이상 만점)
+        3. 태그 커버리지 (0.3): 질문에서 추출한 폐기물 태그 중 매칭 태그/본문 포함 비율
+           (추출 태그가 없으면 evaluate_by_rules와 같은 키워드 매칭)
+        4. 섹션 매칭 (0.2): 최상위 근거 관련성 (근거 없으면 카테고리 유무)
+
+        Args:
+            query: 사용자 질문
+            rag_results: RAG 검색 결과 (evidence 포함)
+
+        Returns:
+            FeedbackResult: 빠른 평가 결과
+        """
+        if not rag_results or not rag_results.get("data"):
+            return self.evaluate_by_rules(query, rag_results)
+
+        data = rag_results["data"]
+        evidence: list[dict[str, Any]] = rag_results.get("evidence") or []
+        content_str = str(data).lower()
+        suggestions: list[str] = []
+        score = 0.3
+
+        # 2. 근거 청크 수
+        score += 0.2 * min(len(evidence), FAST_EVIDENCE_FULL_COUNT) / FAST_EVIDENCE_FULL_COUNT
+
+        # 3. 태그 커버리지
+        tags = self._searcher.extract_keywords(query)
+        if tags:
+            matched = {tag for item in evidence for tag in item.get("matched_tags", [])}
+            coverage = sum(1 for tag in tags if tag in matched or tag in content_str) / len(tags)
+        else:
+            query_keywords = set(query.lower().split())
+            coverage = sum(1 for kw in query_keywords if kw in content_str) / max(
+                len(query_keywords), 1
+            )
+        score += 0.3 * coverage
+
+        # 4. 섹션 매칭
+        if evidence:
+            section = EVIDENCE_RELEVANCE_SCORE.get(evidence[0].get("relevance", "low"), 0.2)
+        else:
+            section = EVIDENCE_RELEVANCE_SCORE["medium"] if rag_results.get("category") else 0.0
+        score += 0.2 * section
+
+        if score < 0.4:
+            suggestions.append("태그 커버리지 낮음")
+            suggestions.append("웹 검색으로 보완 권장")
+
+        metadata = {
+            "has_data": True,
+            "evidence_count": len(evidence),
+            "tag_coverage": coverage,
+            "section_match": section,
+        }
+        return FeedbackResult.from_score(score, suggestions, metadata)
+
     def should_use_fallback(
         self,
         feedback: FeedbackResult,
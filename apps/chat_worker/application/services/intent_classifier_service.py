@@ -70,6 +70,26 @@ class QueryDecompositionSchema(BaseModel):
     queries: list[str] = Field(description="분해된 쿼리 목록")
 
 
+class ClassifiedSubQuerySchema(BaseModel):
+    """분해 + 분류 통합 호출의 하위 쿼리 항목."""
+
+    query: str = Field(description="분해된 단일 의도 쿼리")
+    intent: str = Field(description=IntentClassificationSchema.model_fields["intent"].description)
+    confidence: float = Field(ge=0.0, le=1.0, description="이 쿼리 분류의 신뢰도 (0.0~1.0)")
+
+
+class DecomposedIntentsSchema(BaseModel):
+    """분해 + 분류 통합 결과 스키마 (Structured Output용).
+
+    Multi-Intent 감지 신뢰도가 높을 때 Decomposition과
+    쿼리별 Intent 분류(N회)를 한 번의 LLM 호출로 대체합니다.
+    """
+
+    queries: list[ClassifiedSubQuerySchema] = Field(
+        description="원문 순서대로 분해·분류된 쿼리 목록"
+    )
+
+
 # ===== 상수 =====
 
 # 복잡도 판단 키워드
@@ -98,6 +118,15 @@ MIN_CONFIDENCE_FOR_BOOST = 0.7
 # 캐시 TTL (초)
 INTENT_CACHE_TTL = 3600  # 1시간
 
+# 분해 + 분류 통합 호출 사용 조건: Multi-Intent 감지 신뢰도가 이 값 이상
+MERGED_CLASSIFICATION_MIN_CONFIDENCE = 0.85
+
+# 통합 호출 시스템 프롬프트 지시문 (분해 프롬프트 + 분류 프롬프트 뒤에 추가)
+MERGED_CLASSIFICATION_INSTRUCTION = (
+    "위 기준으로 질문을 단일 의도 쿼리들로 분해하고, "
+    "각 쿼리마다 intent와 confidence를 함께 반환하세요. 쿼리 순서는 원문 순서를 따릅니다."
+)
+
 # 캐시 키 프리픽스
 INTENT_CACHE_PREFIX = "intent:"
 MULTI_DETECT_CACHE_PREFIX = "multi_detect:"
@@ -231,6 +260,12 @@ class IntentClassifierService:
         """Multi-Intent 감지 시스템 프롬프트 반환."""
         return self._multi_detect_prompt
 
+    def get_merged_classification_system_prompt(self) -> str:
+        """분해 + 분류 통합 호출 시스템 프롬프트 반환."""
+        return "\n\n".join(
+            [self._decompose_prompt, self._intent_prompt, MERGED_CLASSIFICATION_INSTRUCTION]
+        )
+
     def build_prompt_with_context(
         self,
         message: str,
@@ -755,6 +790,9 @@ __all__ = [
     "MultiIntentResult",
     "MultiIntentDetectionSchema",
     "QueryDecompositionSchema",
+    "ClassifiedSubQuerySchema",
+    "DecomposedIntentsSchema",
+    "MERGED_CLASSIFICATION_MIN_CONFIDENCE",
     "CONFIDENCE_THRESHOLD",
     "INTENT_CACHE_TTL",
     "MAX_TRANSITION_BOOST",
@@ -0,0 +1,231 @@
+"""Prompt Assembler - Prefix 캐시 친화적 답변 프롬프트 조립 (순수 로직).
+
+OpenAI/Gemini의 프롬프트 prefix 캐시는 요청 앞부분이 바이트 단위로 같아야
+재사용됩니다. 기존 AnswerContext.to_prompt_context는 대화 요약/히스토리
+(사용자별)를 맨 앞에 두어 시스템 프롬프트 뒤의 규정 텍스트까지 캐시되지 못했고,
+`json.dumps(indent=2)` 블록이 입력 토큰을 부풀렸습니다.
+
+조립 규칙:
+1. 정적 → 동적 순서: 규정(같은 품목이면 사용자 무관 동일) → 캐릭터 → 분류
+   → 도구 결과(시세/날씨/위치/검색) → 이미지 → 대화 요약 → 최근 대화 → 질문
+2. 구조화 컨텍스트는 compact 직렬화 (키 정렬 "key: value" 줄, 따옴표/괄호 없음)
+   → 같은 데이터는 항상 같은 바이트 (prefix 안정성)
+3. 섹션별 토큰 예산: 초과분은 줄 단위로 잘라 "…(생략)" 표시,
+   최근 대화는 오래된 메시지부터 제외
+
+Clean Architecture:
+- Service: 이 파일 (순수 로직, Port 의존 없음)
+- Command: GenerateAnswerCommand.prepare (AnswerGeneratorService 경유)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from chat_worker.application.dto.answer_context import AnswerContext
+
+# 대략적 토큰 추정 (한글 혼합: 보수적으로 2자 = 1토큰, summarization과 동일 기준)
+CHARS_PER_TOKEN = 2
+
+TRUNCATION_MARKER = "…(생략)"
+
+# 섹션별 토큰 예산 (None = 제한 없음)
+DEFAULT_SECTION_TOKEN_BUDGETS: dict[str, int | None] = {
+    "disposal_rules": 1500,
+    "character": 300,
+    "classification": 200,
+    "collection_point": 400,
+    "bulk_waste": 500,
+    "recyclable_price": 400,
+    "weather": 200,
+    "location": 400,
+    "web_search": 800,
+    "image_generation": None,  # 출력 규칙 포함 → 자르지 않음
+    "summary": 500,
+    "history": 1200,
+    "user_question": None,
+}
+
+
+def estimate_tokens(text: str) -> int:
+    """대략적인 토큰 수 추정."""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def compact_serialize(value: Any, indent: int = 0) -> str:
+    """구조화 컨텍스트 compact 직렬화.
+
+    dict는 키 정렬 "key: value" 줄, list는 "- item" 줄로 출력합니다.
+    indent=2 JSON 대비 따옴표/괄호/쉼표가 없어 토큰이 적고,
+    키 정렬로 같은 데이터는 항상 같은 문자열이 됩니다.
+    """
+    pad = " " * indent
+    if isinstance(value, dict):
+        lines = []
+        for key in sorted(value, key=str):
+            item = value[key]
+            if item is None or item == "" or item == [] or item == {}:
+                continue
+            if isinstance(item, (dict, list)):
+                lines.append(f"{pad}{key}:")
+                lines.append(compact_serialize(item, indent + 1))
+            else:
+                lines.append(f"{pad}{key}: {_scalar(item)}")
+        return "\n".join(line for line in lines if line)
+    if isinstance(value, list):
+        lines = []
+        for item in value:
+            if isinstance(item, (dict, list)):
+                nested = compact_serialize(item, indent + 1)
+                if nested:
+                    lines.append(f"{pad}-\n{nested}")
+            else:
+                lines.append(f"{pad}- {_scalar(item)}")
+        return "\n".join(lines)
+    return f"{pad}{_scalar(value)}"
+
+
+def _scalar(value: Any) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return " ".join(str(value).split()) if isinstance(value, str) else str(value)
+
+
+def truncate_to_budget(text: str, max_tokens: int | None) -> tuple[str, bool]:
+    """토큰 예산에 맞게 줄 단위로 자르기.
+
+    Returns:
+        (잘린 텍스트, 잘림 여부)
+    """
+    if max_tokens is None or estimate_tokens(text) <= max_tokens:
+        return text, False
+
+    max_chars = max(0, max_tokens * CHARS_PER_TOKEN - len(TRUNCATION_MARKER) - 1)
+    cut = text[:max_chars]
+    newline = cut.rfind("\n")
+    # 줄 경계가 너무 앞이면(절반 미만) 글자 단위로 자름
+    if newline >= max_chars // 2:
+        cut = cut[:newline]
+    return f"{cut.rstrip()}\n{TRUNCATION_MARKER}", True
+
+
+@dataclass(frozen=True)
+class AssembledPrompt:
+    """조립 결과.
+
+    Attributes:
+        prompt: 최종 사용자 프롬프트
+        section_tokens: 섹션별 추정 토큰 수 (조립 순서)
+        truncated_sections: 예산 초과로 잘린 섹션
+        static_prefix_tokens: 동적 섹션 이전까지의 추정 토큰 수 (prefix 캐시 후보)
+    """
+
+    prompt: str
+    section_tokens: dict[str, int] = field(default_factory=dict)
+    truncated_sections: tuple[str, ...] = ()
+    static_prefix_tokens: int = 0
+
+
+# 요청마다 바뀌는 섹션 (이 앞까지가 prefix 캐시 후보)
+DYNAMIC_SECTIONS = frozenset({"image_generation", "summary", "history", "user_question"})
+
+
+class PromptAssembler:
+    """Prefix 캐시 친화적 프롬프트 조립기."""
+
+    def __init__(self, section_budgets: dict[str, int | None] | None = None) -> None:
+        """초기화.
+
+        Args:
+            section_budgets: 섹션별 토큰 예산 (기본값 덮어쓰기)
+        """
+        self._budgets = {**DEFAULT_SECTION_TOKEN_BUDGETS, **(section_budgets or {})}
+
+    def assemble(self, context: AnswerContext) -> AssembledPrompt:
+        """정적 → 동적 순서로 섹션을 조립."""
+        sections: list[tuple[str, str, str]] = []  # (name, title, body)
+
+        def add(name: str, title: str, body: str | None) -> None:
+            if body:
+                sections.append((name, title, body))
+
+        # 1. 정적: 규정 / 캐릭터 (같은 품목·캐릭터면 사용자 무관 동일)
+        if context.disposal_rules:
+            add("disposal_rules", "Disposal Rules", compact_serialize(context.disposal_rules))
+        if context.character_context:
+            add("character", "Character Info", compact_serialize(context.character_context))
+        if context.classification:
+            add("classification", "Classification", compact_serialize(context.classification))
+
+        # 2. 준정적: 도구 결과 (지역/시점에 따라 변동)
+        add("collection_point", "Collection Point Info", context.collection_point_context)
+        add("bulk_waste", "Bulk Waste Info", context.bulk_waste_context)
+        add("recyclable_price", "Recyclable Price Info", context.recyclable_price_context)
+        add("weather", "Weather Info", context.weather_context)
+        if context.location_context:
+            add("location", "Location Info", compact_serialize(context.location_context))
+        add("web_search", "Web Search Results", context.web_search_results)
+
+        # 3. 동적: 이미지 결과 / 대화 / 질문
+        image_section = context.image_generation_section()
+        if image_section:
+            sections.append(("image_generation", "", image_section))
+        add("summary", "Previous Conversation Summary", context.conversation_summary)
+        history, history_truncated = self._format_history(context)
+        add("history", "Recent Conversation", history)
+        add("user_question", "User Question", context.user_input)
+
+        parts: list[str] = []
+        section_tokens: dict[str, int] = {}
+        truncated: list[str] = []
+        static_prefix_tokens = 0
+
+        for name, title, body in sections:
+            if name != "history":  # history는 메시지 단위로 이미 예산 적용
+                body, was_truncated = truncate_to_budget(body, self._budgets.get(name))
+                if was_truncated:
+                    truncated.append(name)
+            text = f"## {title}\n{body}" if title else body
+            parts.append(text)
+            section_tokens[name] = estimate_tokens(text)
+            if name not in DYNAMIC_SECTIONS:
+                static_prefix_tokens += section_tokens[name]
+
+        if history_truncated:
+            truncated.append("history")
+
+        return AssembledPrompt(
+            prompt="\n\n".join(parts),
+            section_tokens=section_tokens,
+            truncated_sections=tuple(truncated),
+            static_prefix_tokens=static_prefix_tokens,
+        )
+
+    def _format_history(self, context: AnswerContext) -> tuple[str | None, bool]:
+        """최근 대화: 최신 메시지부터 예산 안에서 채우고 시간순으로 출력.
+
+        Returns:
+            (히스토리 텍스트, 잘림 여부)
+        """
+        if not context.conversation_history:
+            return None, False
+
+        budget = self._budgets.get("history")
+        lines: list[str] = []
+        used = 0
+        truncated = False
+        for msg in reversed(context.conversation_history):
+            # answer_node는 LangChain 메시지 type("human"/"ai")을 role로 전달
+            role_label = "User" if msg.get("role", "user") in ("user", "human") else "Assistant"
+            line = f"- {role_label}: {msg.get('content', '')}"
+            cost = estimate_tokens(line)
+            if budget is not None and lines and used + cost > budget:
+                truncated = True
+                break
+            if budget is not None and not lines and cost > budget:
+                # 마지막 메시지 하나가 예산 초과면 해당 메시지만 자름
+                line, truncated = truncate_to_budget(line, budget)
+            lines.append(line)
+            used += cost
+        return "\n".join(reversed(lines)) or None, truncated
@@ -92,6 +92,10 @@ class RecyclablePriceService:
         if not response.items:
             return ""
 
+        # 구현체가 미리 포맷한 context가 있으면 그대로 사용
+        if response.context is not None:
+            return response.context
+
         lines = [
             f"## 재활용자원 시세 정보 (조사일: {response.survey_date or '미상'})",
             f"검색어: {response.query}",
@@ -7,8 +7,8 @@ CDN에서 캐릭터 참조 이미지를 로드하는 구현체.
 - CDN: https://images.dev.growbin.app/character/{code}.png
 
 캐싱 전략:
-- 메모리 캐시 (LRU): 자주 사용되는 이미지 캐싱
-- 캐시 TTL: 1시간 (이미지는 잘 변하지 않음)
+- image_cache(ReferenceImageCache) 주입 시: 크기 제한 LRU + 디스크 + ETag 재검증 공유
+- 미주입 시: 코드별 메모리 캐시 (이미지는 잘 변하지 않음)
 """
 
 from __future__ import annotations
@@ -16,7 +16,7 @@ from __future__ import annotations
 import asyncio
 import logging
 from functools import lru_cache
-from typing import ClassVar
+from typing import TYPE_CHECKING, ClassVar
 
 import httpx
 
@@ -26,6 +26,9 @@ from chat_worker.application.ports.character_asset import (
     CharacterAssetPort,
 )
 
+if TYPE_CHECKING:
+    from chat_worker.infrastructure.assets.reference_image_cache import ReferenceImageCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -82,6 +85,7 @@ class CDNCharacterAssetLoader(CharacterAssetPort):
         prefix: str = "character",
         timeout: float = 10.0,
         cache_enabled: bool = True,
+        image_cache: "ReferenceImageCache | None" = None,
     ):
         """초기화.
 
@@ -90,6 +94,7 @@ class CDNCharacterAssetLoader(CharacterAssetPort):
             prefix: S3 object prefix
             timeout: HTTP 요청 타임아웃 (초)
             cache_enabled: 메모리 캐시 사용 여부
+            image_cache: 참조 이미지 캐시 (주입 시 자체 메모리 캐시 대신 사용)
         """
         self._cdn_base_url = cdn_base_url.rstrip("/")
         self._prefix = prefix
@@ -97,6 +102,7 @@ class CDNCharacterAssetLoader(CharacterAssetPort):
         self._cache_enabled = cache_enabled
         self._cache: dict[str, bytes] = {}
         self._cache_lock = asyncio.Lock()
+        self._image_cache = image_cache
         # HTTP 클라이언트 재사용 (커넥션 풀링)
         self._http_client: httpx.AsyncClient | None = None
 
@@ -144,6 +150,10 @@ class CDNCharacterAssetLoader(CharacterAssetPort):
 
         # CDN에서 로드
         try:
+            if self._image_cache is not None:
+                image_bytes = await self._image_cache.get(url)
+                return CharacterAsset(code=code, image_url=url, image_bytes=image_bytes)
+
             client = await self._get_http_client()
             response = await client.get(url)
             response.raise_for_status()
@@ -265,5 +275,8 @@ class CDNCharacterAssetLoader(CharacterAssetPort):
 
 @lru_cache(maxsize=1)
 def get_character_asset_loader() -> CDNCharacterAssetLoader:
-    """CharacterAssetLoader 싱글톤."""
-    return CDNCharacterAssetLoader()
+    """CharacterAssetLoader 싱글톤 (이미지 생성기와 참조 이미지 캐시 공유)."""
+    # setup.dependencies가 infrastructure를 import하므로 순환 방지를 위해 지연 import
+    from chat_worker.setup.dependencies import get_reference_image_cache
+
+    return CDNCharacterAssetLoader(image_cache=get_reference_image_cache())
@@ -198,6 +198,16 @@ class CharacterNameDetector:
         """
         return f"https://images.dev.growbin.app/character/{cdn_code}.png"
 
+    def get_cdn_urls(self) -> list[str]:
+        """등록된 모든 캐릭터의 이미지 URL (참조 이미지 preload용).
+
+        Returns:
+            CDN 이미지 URL 목록 (중복 제거, YAML 순서)
+        """
+        self._load_if_needed()
+        codes = dict.fromkeys(c.cdn_code for c in self._characters if c.cdn_code)
+        return [self.get_cdn_url(code) for code in codes]
+
 
 @lru_cache(maxsize=1)
 def get_character_name_detector() -> CharacterNameDetector:
@@ -56,9 +56,9 @@ INTENT_FILE_MAP: dict[IntentType, str] = {
 }
 
 
-@lru_cache(maxsize=10)
+@lru_cache(maxsize=None)  # 프롬프트 파일 수는 assets/prompts/로 유한 (전부 캐싱)
 def load_prompt_file(category: str, name: str) -> str:
-    """프롬프트 파일 로드 (LRU 캐싱).
+    """프롬프트 파일 로드 (캐싱).
 
     Args:
         category: 카테고리 (global/local)
@@ -82,6 +82,18 @@ def load_prompt_file(category: str, name: str) -> str:
     return content
 
 
+def preload_prompt_files() -> int:
+    """assets/prompts/의 전체 프롬프트 파일 캐시 적재 (워커 warmup).
+
+    Returns:
+        적재된 파일 수
+    """
+    paths = sorted(PROMPTS_DIR.glob("*/*.txt"))
+    for path in paths:
+        load_prompt_file(path.parent.name, path.stem)
+    return len(paths)
+
+
 class PromptLoader(PromptLoaderPort):
     """프롬프트 로더 구현체.
 
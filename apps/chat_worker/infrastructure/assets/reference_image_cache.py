@@ -0,0 +1,269 @@
+"""Reference Image Cache - 캐릭터 참조 이미지 바이트 캐시.
+
+이미지 생성(generate_with_reference)은 매 요청마다 CDN에서 캐릭터 PNG를
+받아오고 있었습니다. 대상은 13종 고정 이미지라 프로세스 내에 두면 충분합니다.
+
+계층:
+- L1: 프로세스 내 LRU (총 바이트 상한)
+- L2: 로컬 디스크 (선택, content-addressed)
+    {disk_dir}/blobs/{sha256}          이미지 바이트 (동일 내용은 한 파일)
+    {disk_dir}/index/{sha256(url)}.json  URL → ETag, digest, 마지막 확인 시각
+
+조회:
+- revalidate_after 이내에 확인한 항목 → 그대로 반환 (hit)
+- 경과 → If-None-Match 조건부 요청, 304면 재사용 (revalidated)
+- 없음 → 다운로드 후 저장 (miss)
+- CDN 장애(연결 실패, 5xx) 시 보유 중인 바이트 반환 (stale)
+- 동일 URL 동시 조회는 하나로 합침 (single-flight)
+
+워커 시작 시 preload()로 character_names.yaml의 전체 캐릭터를 미리 적재합니다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import httpx
+from chat_worker.infrastructure.metrics import (
+    CHAT_REFERENCE_IMAGE_CACHE,
+    CHAT_REFERENCE_IMAGE_CACHE_BYTES,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+DEFAULT_REVALIDATE_AFTER = 3600.0
+
+
+@dataclass
+class _Entry:
+    data: bytes
+    digest: str
+    etag: str | None
+    checked_at: float
+
+
+class ReferenceImageCache:
+    """URL + ETag/content hash 기반 참조 이미지 캐시."""
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        disk_dir: str | Path | None = None,
+        revalidate_after: float = DEFAULT_REVALIDATE_AFTER,
+        timeout: float = 10.0,
+        http_client: httpx.AsyncClient | None = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        """초기화.
+
+        Args:
+            max_bytes: L1 총 바이트 상한 (초과 시 오래 안 쓴 항목부터 제거)
+            disk_dir: 디스크 캐시 디렉토리 (None이면 비활성)
+            revalidate_after: 조건부 재검증 주기 (초)
+            timeout: HTTP 요청 타임아웃 (초)
+            http_client: HTTP 클라이언트 (테스트용, None이면 내부 생성)
+            clock: 현재 시각 (테스트용)
+        """
+        self._max_bytes = max_bytes
+        self._disk_dir = Path(disk_dir) if disk_dir else None
+        self._revalidate_after = revalidate_after
+        self._timeout = timeout
+        self._http_client = http_client
+        self._owns_client = http_client is None
+        self._clock = clock
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._size = 0
+        self._inflight: dict[str, asyncio.Future[bytes]] = {}
+
+    @property
+    def size_bytes(self) -> int:
+        """L1에 보관 중인 바이트 수."""
+        return self._size
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._entries
+
+    async def get(self, url: str) -> bytes:
+        """URL의 이미지 바이트 조회 (캐시 우선).
+
+        Raises:
+            httpx.HTTPError: 캐시에 없고 다운로드도 실패한 경우
+        """
+        entry = self._entries.get(url)
+        result = "hit"
+        if entry is None and self._disk_dir is not None:
+            entry = await asyncio.to_thread(self._load_disk, url)
+            if entry is not None:
+                self._store(url, entry)
+                result = "disk"
+
+        if entry is not None and self._clock() - entry.checked_at < self._revalidate_after:
+            self._entries.move_to_end(url)
+            CHAT_REFERENCE_IMAGE_CACHE.labels(result=result).inc()
+            return entry.data
+
+        return await self._fetch_once(url)
+
+    async def preload(self, urls: Iterable[str]) -> int:
+        """URL 목록을 미리 적재.
+
+        Returns:
+            적재에 성공한 URL 수 (실패는 로그만 남김)
+        """
+        urls = list(dict.fromkeys(urls))
+        results = await asyncio.gather(*(self.get(url) for url in urls), return_exceptions=True)
+        loaded = 0
+        for url, result in zip(urls, results):
+            if isinstance(result, BaseException):
+                logger.warning("Reference image preload failed: %s (%s)", url, result)
+            else:
+                loaded += 1
+        logger.info(
+            "Reference images preloaded",
+            extra={"loaded": loaded, "requested": len(urls), "bytes": self._size},
+        )
+        return loaded
+
+    def clear(self) -> None:
+        """L1 초기화 (디스크는 유지)."""
+        self._entries.clear()
+        self._size = 0
+        CHAT_REFERENCE_IMAGE_CACHE_BYTES.set(0)
+
+    async def close(self) -> None:
+        """리소스 정리 (내부 생성한 HTTP 클라이언트 종료)."""
+        if self._http_client is not None and self._owns_client:
+            await self._http_client.aclose()
+            self._http_client = None
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(timeout=self._timeout)
+        return self._http_client
+
+    async def _fetch_once(self, url: str) -> bytes:
+        inflight = self._inflight.get(url)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._fetch(url))
+            self._inflight[url] = inflight
+            inflight.add_done_callback(lambda _: self._inflight.pop(url, None))
+        # 호출자 취소가 공유 다운로드를 취소하지 않도록 shield
+        return await asyncio.shield(inflight)
+
+    async def _fetch(self, url: str) -> bytes:
+        entry = self._entries.get(url)
+        headers = {"If-None-Match": entry.etag} if entry is not None and entry.etag else {}
+
+        try:
+            response = await self._get_http_client().get(url, headers=headers)
+            if response.status_code == 304 and entry is not None:
+                entry.checked_at = self._clock()
+                self._entries.move_to_end(url)
+                await self._save_disk(url, entry, blob=False)
+                CHAT_REFERENCE_IMAGE_CACHE.labels(result="revalidated").inc()
+                return entry.data
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            if entry is None or e.response.status_code < 500:
+                raise
+            return self._serve_stale(url, entry, e)
+        except httpx.TransportError as e:
+            if entry is None:
+                raise
+            return self._serve_stale(url, entry, e)
+
+        data = response.content
+        fetched = _Entry(
+            data=data,
+            digest=hashlib.sha256(data).hexdigest(),
+            etag=response.headers.get("etag"),
+            checked_at=self._clock(),
+        )
+        self._store(url, fetched)
+        changed = entry is None or entry.digest != fetched.digest
+        await self._save_disk(url, fetched, blob=changed)
+        CHAT_REFERENCE_IMAGE_CACHE.labels(result="miss").inc()
+        logger.debug("Fetched reference image: %s (%d bytes)", url, len(data))
+        return data
+
+    def _serve_stale(self, url: str, entry: _Entry, error: Exception) -> bytes:
+        logger.warning("Reference image revalidation failed, serving cached: %s (%s)", url, error)
+        CHAT_REFERENCE_IMAGE_CACHE.labels(result="stale").inc()
+        return entry.data
+
+    def _store(self, url: str, entry: _Entry) -> None:
+        old = self._entries.pop(url, None)
+        if old is not None:
+            self._size -= len(old.data)
+        if len(entry.data) <= self._max_bytes:
+            self._entries[url] = entry
+            self._size += len(entry.data)
+            while self._size > self._max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted.data)
+        CHAT_REFERENCE_IMAGE_CACHE_BYTES.set(self._size)
+
+    # ----------------------------------------------------------
+    # Disk (L2)
+    # ----------------------------------------------------------
+
+    def _index_path(self, url: str) -> Path:
+        assert self._disk_dir is not None
+        name = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self._disk_dir / "index" / f"{name}.json"
+
+    def _blob_path(self, digest: str) -> Path:
+        assert self._disk_dir is not None
+        return self._disk_dir / "blobs" / digest
+
+    def _load_disk(self, url: str) -> _Entry | None:
+        try:
+            meta = json.loads(self._index_path(url).read_text(encoding="utf-8"))
+            data = self._blob_path(meta["digest"]).read_bytes()
+        except (OSError, ValueError, KeyError):
+            return None
+        # content-addressed: 내용이 digest와 다르면 손상된 파일
+        if hashlib.sha256(data).hexdigest() != meta["digest"]:
+            logger.warning("Corrupted reference image on disk: %s", url)
+            return None
+        return _Entry(
+            data=data,
+            digest=meta["digest"],
+            etag=meta.get("etag"),
+            checked_at=meta.get("checked_at", 0.0),
+        )
+
+    async def _save_disk(self, url: str, entry: _Entry, blob: bool) -> None:
+        if self._disk_dir is None:
+            return
+        try:
+            await asyncio.to_thread(self._write_disk, url, entry, blob)
+        except OSError as e:
+            logger.warning("Failed to write reference image cache: %s (%s)", url, e)
+
+    def _write_disk(self, url: str, entry: _Entry, blob: bool) -> None:
+        blob_path = self._blob_path(entry.digest)
+        if blob or not blob_path.exists():
+            _atomic_write(blob_path, entry.data)
+        meta = {k: v for k, v in asdict(entry).items() if k != "data"}
+        _atomic_write(self._index_path(url), json.dumps(meta).encode("utf-8"))
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+__all__ = ["ReferenceImageCache"]
@@ -65,6 +65,20 @@ class RedisCacheAdapter(CachePort):
             )
             return None
 
+    async def get_many(self, keys: list[str]) -> list[str | None]:
+        """여러 키 일괄 조회 (MGET 1회 왕복)."""
+        if not keys:
+            return []
+        full_keys = [self._make_key(key) for key in keys]
+        try:
+            return list(await self._redis.mget(full_keys))
+        except Exception as e:
+            logger.warning(
+                "cache_mget_failed",
+                extra={"keys": len(full_keys), "error": str(e)},
+            )
+            return [None] * len(keys)
+
     async def set(self, key: str, value: str, ttl: int | None = None) -> bool:
         """캐시 저장."""
         full_key = self._make_key(key)
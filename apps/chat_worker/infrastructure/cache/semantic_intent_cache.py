@@ -0,0 +1,365 @@
+"""Semantic Intent Cache - 정규화 + MinHash LSH 근사 중복 Intent 캐시.
+
+"페트병 어떻게 버려?" / "페트병 어떻게 버려요" / "페트병  어떻게버려"처럼
+어미·문장부호·띄어쓰기만 다른 메시지는 같은 Intent이지만
+sha256 정확 키 캐시에서는 모두 미스가 나 LLM을 다시 호출합니다.
+
+조회 단계:
+1. 정규화 (NFKC, 소문자, 문장부호/자모(ㅋㅋ, ㅠㅠ) 제거, 마지막 어절의 존댓말 "요" 제거)
+2. 정규화 문자열 정확 일치 → similarity 1.0
+3. 문자 2-gram MinHash 시그니처 → LSH 밴드 버킷으로 후보 수집
+   → 후보와 실제 Jaccard 계산 → threshold 이상 중 최고 유사도 반환
+
+프로세스 로컬 LRU (max_entries) + TTL. 워커 재시작 시 비워지며,
+정확 키 캐시(Redis)가 그 사이를 메웁니다.
+
+메트릭:
+- chat_intent_semantic_cache_lookups_total{result=exact|near|miss}: 히트율
+- chat_intent_semantic_cache_audits_total{outcome=match|mismatch}: 샘플 감사 정밀도
+- chat_intent_semantic_cache_saved_llm_seconds_total: 히트로 절감한 LLM 지연 추정치
+
+Port: application/ports/cache/semantic_intent_cache_port.py
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import re
+import time
+import unicodedata
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import numpy as np
+
+from chat_worker.application.ports.cache import SemanticIntentCachePort, SemanticIntentHit
+from chat_worker.infrastructure.metrics import (
+    CHAT_INTENT_SEMANTIC_CACHE_AUDITS,
+    CHAT_INTENT_SEMANTIC_CACHE_LOOKUPS,
+    CHAT_INTENT_SEMANTIC_CACHE_SAVED_SECONDS,
+    CHAT_INTENT_SEMANTIC_CACHE_SIMILARITY,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_THRESHOLD = 0.8
+DEFAULT_MAX_ENTRIES = 10_000
+DEFAULT_TTL = 3600  # INTENT_CACHE_TTL과 동일
+DEFAULT_AUDIT_RATE = 0.02
+DEFAULT_NUM_PERM = 64
+DEFAULT_BANDS = 16  # 16 밴드 × 4 행: Jaccard 0.8에서 후보 누락 확률 < 0.1%
+
+# 근사 매칭 최소 길이 (공백 제거 기준). 더 짧으면 정확 일치만 허용
+MIN_NEAR_MATCH_LENGTH = 4
+
+# LLM 지연 지수이동평균 계수
+_LATENCY_EWMA_ALPHA = 0.2
+
+_MERSENNE_PRIME = (1 << 31) - 1
+_NON_WORD_PATTERN = re.compile(r"[^\w\s]")
+_JAMO_PATTERN = re.compile(r"[ㄱ-ㆎ]+")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_FILLER_TOKENS = frozenset({"좀", "혹시", "그럼", "근데"})
+
+
+def normalize_intent_message(message: str) -> str:
+    """Intent 캐시용 메시지 정규화.
+
+    Intent를 바꾸지 않는 표면 차이(문장부호, 자모 이모티콘, 공백,
+    존댓말 "요", 군말)만 제거합니다. 조사/어간은 건드리지 않습니다
+    ("종이" → "종" 같은 오정규화 방지).
+
+    Args:
+        message: 원본 메시지
+
+    Returns:
+        정규화된 메시지 (공백 하나로 구분된 어절)
+    """
+    # 자모는 NFKC 전에 제거 (NFKC가 호환 자모를 조합형 자모로 바꿈)
+    text = _JAMO_PATTERN.sub(" ", message)
+    text = unicodedata.normalize("NFKC", text).lower()
+    text = _NON_WORD_PATTERN.sub(" ", text)
+    tokens = [t for t in _WHITESPACE_PATTERN.split(text) if t and t not in _FILLER_TOKENS]
+    if tokens and len(tokens[-1]) > 1 and tokens[-1].endswith("요"):
+        tokens[-1] = tokens[-1][:-1]
+    return " ".join(tokens)
+
+
+def _shingles(normalized: str) -> frozenset[str]:
+    """공백 제거 문자열의 문자 2-gram 집합 (띄어쓰기 변형에 강건)."""
+    compact = normalized.replace(" ", "")
+    if len(compact) < 2:
+        return frozenset({compact}) if compact else frozenset()
+    return frozenset(compact[i : i + 2] for i in range(len(compact) - 1))
+
+
+def _jaccard(a: frozenset[str], b: frozenset[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+@dataclass
+class _Entry:
+    intent: str
+    confidence: float
+    is_complex: bool
+    shingles: frozenset[str]
+    band_keys: tuple[tuple[int, bytes], ...]
+    expires_at: float
+
+
+class SemanticIntentCache(SemanticIntentCachePort):
+    """MinHash LSH 기반 유사 메시지 Intent 캐시 (프로세스 로컬)."""
+
+    def __init__(
+        self,
+        threshold: float = DEFAULT_THRESHOLD,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl: int = DEFAULT_TTL,
+        audit_rate: float = DEFAULT_AUDIT_RATE,
+        num_perm: int = DEFAULT_NUM_PERM,
+        bands: int = DEFAULT_BANDS,
+        seed: int = 42,
+    ):
+        """초기화.
+
+        Args:
+            threshold: 근사 히트 최소 Jaccard 유사도 (정규화 문자 2-gram 기준)
+            max_entries: 최대 항목 수 (초과 시 LRU 제거)
+            ttl: 항목 TTL 초
+            audit_rate: 히트 중 LLM 재분류로 감사할 비율 (0이면 감사 안함)
+            num_perm: MinHash 해시 함수 수
+            bands: LSH 밴드 수 (num_perm의 약수)
+            seed: MinHash 계수 시드 (프로세스 간 동일 시그니처)
+
+        Raises:
+            ValueError: num_perm이 bands로 나누어떨어지지 않음
+        """
+        if num_perm % bands != 0:
+            raise ValueError(f"num_perm({num_perm}) must be divisible by bands({bands})")
+
+        self._threshold = threshold
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._audit_rate = audit_rate
+        self._bands = bands
+        self._rows = num_perm // bands
+
+        rng = np.random.default_rng(seed)
+        self._coef_a = rng.integers(1, _MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+        self._coef_b = rng.integers(0, _MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._buckets: dict[tuple[int, bytes], set[str]] = {}
+        self._llm_latency_ewma: float | None = None
+
+        self._stats = {"exact": 0, "near": 0, "miss": 0, "audit_match": 0, "audit_mismatch": 0}
+
+    # ========== MinHash / LSH ==========
+
+    def _band_keys(self, shingles: frozenset[str]) -> tuple[tuple[int, bytes], ...]:
+        """MinHash 시그니처 → 밴드별 버킷 키."""
+        hashes = np.fromiter(
+            (zlib.crc32(s.encode("utf-8")) % _MERSENNE_PRIME for s in shingles),
+            dtype=np.uint64,
+            count=len(shingles),
+        )
+        # (num_perm, n_shingles) 해시 → 행별 최소값이 시그니처
+        permuted = (np.outer(self._coef_a, hashes) + self._coef_b[:, None]) % _MERSENNE_PRIME
+        signature = permuted.min(axis=1).reshape(self._bands, self._rows)
+        return tuple((band, signature[band].tobytes()) for band in range(self._bands))
+
+    def _remove(self, normalized: str) -> None:
+        entry = self._entries.pop(normalized, None)
+        if entry is None:
+            return
+        for band_key in entry.band_keys:
+            bucket = self._buckets.get(band_key)
+            if bucket is not None:
+                bucket.discard(normalized)
+                if not bucket:
+                    del self._buckets[band_key]
+
+    def _live_entry(self, normalized: str, now: float) -> _Entry | None:
+        entry = self._entries.get(normalized)
+        if entry is None:
+            return None
+        if entry.expires_at <= now:
+            self._remove(normalized)
+            return None
+        self._entries.move_to_end(normalized)
+        return entry
+
+    # ========== SemanticIntentCachePort ==========
+
+    def _find(self, normalized: str, now: float) -> tuple[str, str, float] | None:
+        """정규화 정확 일치 → LSH 후보 Jaccard 순 탐색 (부수효과 없음).
+
+        Returns:
+            (결과 종류 exact|near, 캐시 키, 유사도) 또는 None
+        """
+        entry = self._entries.get(normalized)
+        if entry is not None and entry.expires_at > now:
+            return "exact", normalized, 1.0
+
+        if len(normalized.replace(" ", "")) < MIN_NEAR_MATCH_LENGTH or not self._entries:
+            return None
+
+        shingles = _shingles(normalized)
+        candidates: set[str] = set()
+        for band_key in self._band_keys(shingles):
+            candidates.update(self._buckets.get(band_key, ()))
+
+        best_key: str | None = None
+        best_score = 0.0
+        for candidate in candidates:
+            candidate_entry = self._entries.get(candidate)
+            if candidate_entry is None or candidate_entry.expires_at <= now:
+                continue
+            score = _jaccard(shingles, candidate_entry.shingles)
+            if score > best_score:
+                best_key, best_score = candidate, score
+
+        if best_key is None or best_score < self._threshold:
+            return None
+        return "near", best_key, best_score
+
+    async def lookup(self, message: str) -> SemanticIntentHit | None:
+        """유사 항목 조회 (히트 시 LRU 갱신 + 메트릭 기록)."""
+        normalized = normalize_intent_message(message)
+        if not normalized:
+            return None
+        now = time.monotonic()
+        self._live_entry(normalized, now)  # 만료된 정확 키 정리
+
+        found = self._find(normalized, now)
+        entry = self._live_entry(found[1], now) if found else None
+        if found is None or entry is None:
+            return self._miss()
+        result, key, similarity = found
+        return self._hit(result, entry, key, similarity)
+
+    async def peek(self, message: str) -> SemanticIntentHit | None:
+        """통계/LRU 갱신 없이 조회 (Speculative prefetch 예측용)."""
+        normalized = normalize_intent_message(message)
+        found = self._find(normalized, time.monotonic()) if normalized else None
+        if found is None:
+            return None
+        _, key, similarity = found
+        entry = self._entries[key]
+        return SemanticIntentHit(
+            intent=entry.intent,
+            confidence=entry.confidence,
+            is_complex=entry.is_complex,
+            similarity=similarity,
+            matched_message=key,
+        )
+
+    async def store(
+        self,
+        message: str,
+        intent: str,
+        confidence: float,
+        is_complex: bool,
+        llm_latency: float | None = None,
+    ) -> None:
+        """분류 결과 저장 (같은 정규화 키는 덮어쓰기)."""
+        if llm_latency is not None:
+            if self._llm_latency_ewma is None:
+                self._llm_latency_ewma = llm_latency
+            else:
+                self._llm_latency_ewma += _LATENCY_EWMA_ALPHA * (
+                    llm_latency - self._llm_latency_ewma
+                )
+
+        normalized = normalize_intent_message(message)
+        if not normalized:
+            return
+
+        self._remove(normalized)
+        shingles = _shingles(normalized)
+        band_keys = self._band_keys(shingles)
+        self._entries[normalized] = _Entry(
+            intent=intent,
+            confidence=confidence,
+            is_complex=is_complex,
+            shingles=shingles,
+            band_keys=band_keys,
+            expires_at=time.monotonic() + self._ttl,
+        )
+        for band_key in band_keys:
+            self._buckets.setdefault(band_key, set()).add(normalized)
+
+        while len(self._entries) > self._max_entries:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+
+    def should_audit(self) -> bool:
+        """audit_rate 확률로 감사 샘플링."""
+        return self._audit_rate > 0 and random.random() < self._audit_rate
+
+    def record_audit(self, hit: SemanticIntentHit, actual_intent: str) -> None:
+        """감사 결과 기록, 불일치 항목은 캐시에서 제거."""
+        matched = hit.intent == actual_intent
+        self._stats["audit_match" if matched else "audit_mismatch"] += 1
+        if not matched:
+            self._remove(hit.matched_message)
+            logger.warning(
+                "Semantic intent cache audit mismatch",
+                extra={
+                    "cached_intent": hit.intent,
+                    "actual_intent": actual_intent,
+                    "similarity": hit.similarity,
+                    "matched_message": hit.matched_message[:50],
+                },
+            )
+        self._record_metric("audit", "match" if matched else "mismatch")
+
+    # ========== 통계 / 메트릭 ==========
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> dict[str, float]:
+        """히트율/감사 정밀도 통계 (모니터링용)."""
+        lookups = self._stats["exact"] + self._stats["near"] + self._stats["miss"]
+        audits = self._stats["audit_match"] + self._stats["audit_mismatch"]
+        return {
+            **self._stats,
+            "entries": len(self._entries),
+            "hit_rate": (self._stats["exact"] + self._stats["near"]) / lookups if lookups else 0.0,
+            "audit_precision": self._stats["audit_match"] / audits if audits else 1.0,
+            "llm_latency_ewma": self._llm_latency_ewma or 0.0,
+        }
+
+    def _hit(
+        self, result: str, entry: _Entry, normalized: str, similarity: float
+    ) -> SemanticIntentHit:
+        self._stats[result] += 1
+        self._record_metric("lookup", result, similarity=similarity)
+        return SemanticIntentHit(
+            intent=entry.intent,
+            confidence=entry.confidence,
+            is_complex=entry.is_complex,
+            similarity=similarity,
+            matched_message=normalized,
+        )
+
+    def _miss(self) -> None:
+        self._stats["miss"] += 1
+        self._record_metric("lookup", "miss")
+        return None
+
+    def _record_metric(self, kind: str, label: str, similarity: float | None = None) -> None:
+        """Prometheus 메트릭 기록."""
+        if kind == "audit":
+            CHAT_INTENT_SEMANTIC_CACHE_AUDITS.labels(outcome=label).inc()
+            return
+        CHAT_INTENT_SEMANTIC_CACHE_LOOKUPS.labels(result=label).inc()
+        if similarity is not None:
+            CHAT_INTENT_SEMANTIC_CACHE_SIMILARITY.observe(similarity)
+            if self._llm_latency_ewma is not None:
+                CHAT_INTENT_SEMANTIC_CACHE_SAVED_SECONDS.inc(self._llm_latency_ewma)
@@ -2,6 +2,7 @@
 
 - RedisProgressNotifier: SSE/UI 진행률 (Redis Streams)
 - RedisStreamDomainEventBus: 도메인 이벤트 (Redis Streams)
+- TokenStreamWriter: job 단위 비동기 토큰 발행기 (LLM 스트림과 발행 분리)
 
 Port 매핑:
 - ProgressNotifierPort → RedisProgressNotifier
@@ -19,8 +20,12 @@ from chat_worker.infrastructure.events.redis_progress_notifier import (
 from chat_worker.infrastructure.events.redis_stream_domain_event_bus import (
     RedisStreamDomainEventBus,
 )
+from chat_worker.infrastructure.events.token_stream_writer import (
+    TokenStreamWriter,
+)
 
 __all__ = [
     "RedisProgressNotifier",
     "RedisStreamDomainEventBus",
+    "TokenStreamWriter",
 ]
@@ -0,0 +1,151 @@
+"""Token Stream Writer - LLM 스트림 수신과 토큰 발행 분리.
+
+answer_node가 청크마다 `await notify_token_v2()`를 하면 Redis 지연이
+LLM 스트림 소비 속도에 그대로 전파되어 provider 측 타임아웃까지 유발합니다.
+
+TokenStreamWriter (job 단위):
+```
+LLM stream ──push()──▶ bounded asyncio.Queue ──writer task──▶ notify_token_v2
+                                                  (밀린 청크 병합 발행)
+```
+- push(): 큐에 넣고 즉시 반환 (큐가 가득 찬 경우에만 대기 → 메모리 상한)
+- writer task: 밀린 청크를 하나의 delta로 병합해 발행 (순서 보존, 단일 writer)
+- finalize(): 배리어 - 큐의 모든 청크 발행 후 finalize_token_stream 호출
+- abort(): 에러 시 writer 정리 (finalize 없이)
+
+메트릭:
+- chat_stream_writer_lag_seconds{node}: 토큰 수신 → 발행 완료 지연
+- chat_stream_writer_max_queue_depth{node}: 스트림당 최대 큐 깊이
+- chat_stream_writer_batch_size{node}: 발행 1회당 병합된 청크 수
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING
+
+from chat_worker.infrastructure.metrics import (
+    CHAT_STREAM_WRITER_BATCH_SIZE,
+    CHAT_STREAM_WRITER_LAG,
+    CHAT_STREAM_WRITER_QUEUE_DEPTH,
+)
+
+if TYPE_CHECKING:
+    from chat_worker.application.ports.events import ProgressNotifierPort
+
+logger = logging.getLogger(__name__)
+
+# 큐 상한 (이 이상 밀리면 push가 대기 → 메모리 보호)
+DEFAULT_TOKEN_QUEUE_SIZE = 256
+
+# 병합 발행 1회당 최대 청크 수 (SSE delta 크기 제한)
+DEFAULT_MAX_BATCH_CHUNKS = 32
+
+_CLOSE = object()
+
+
+class TokenStreamWriter:
+    """Job 단위 비동기 토큰 발행기."""
+
+    def __init__(
+        self,
+        publisher: "ProgressNotifierPort",
+        job_id: str,
+        node: str = "answer",
+        max_queue_size: int = DEFAULT_TOKEN_QUEUE_SIZE,
+        max_batch_chunks: int = DEFAULT_MAX_BATCH_CHUNKS,
+    ):
+        """초기화.
+
+        Args:
+            publisher: 토큰 발행 Port (notify_token_v2 / finalize_token_stream)
+            job_id: 작업 ID
+            node: 토큰 발생 노드명
+            max_queue_size: 큐 상한 (청크 수)
+            max_batch_chunks: 병합 발행 1회당 최대 청크 수
+        """
+        self._publisher = publisher
+        self._job_id = job_id
+        self._node = node
+        self._max_batch_chunks = max(1, max_batch_chunks)
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, max_queue_size))
+        self._task: asyncio.Task | None = None
+        self._closed = False
+        self.max_queue_depth = 0
+        self.published_events = 0
+
+    async def push(self, content: str) -> None:
+        """청크 추가 (발행을 기다리지 않음)."""
+        if self._closed or not content:
+            return
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        await self._queue.put((content, time.perf_counter()))
+        self.max_queue_depth = max(self.max_queue_depth, self._queue.qsize())
+
+    async def finalize(self) -> None:
+        """배리어: 남은 청크를 모두 발행한 뒤 토큰 스트림 완료 처리."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._task is not None:
+            await self._queue.put(_CLOSE)
+            await self._task
+        self._record_stream_metrics()
+        await self._publisher.finalize_token_stream(self._job_id)
+
+    async def abort(self) -> None:
+        """에러 경로: 발행 중단 (finalize_token_stream 호출 안함)."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def _run(self) -> None:
+        """writer task: 밀린 청크를 병합해 순서대로 발행."""
+        while True:
+            item = await self._queue.get()
+            if item is _CLOSE:
+                return
+
+            parts = [item[0]]
+            oldest = item[1]
+            closing = False
+            while len(parts) < self._max_batch_chunks and not self._queue.empty():
+                item = self._queue.get_nowait()
+                if item is _CLOSE:
+                    closing = True
+                    break
+                parts.append(item[0])
+
+            try:
+                await self._publisher.notify_token_v2(
+                    task_id=self._job_id,
+                    content="".join(parts),
+                    node=self._node,
+                )
+            except Exception as e:
+                # 발행 실패가 LLM 스트림/후속 청크를 막지 않도록 기록만
+                logger.warning(
+                    "Token publish failed",
+                    extra={"job_id": self._job_id, "node": self._node, "error": str(e)},
+                )
+            self.published_events += 1
+            self._record_batch_metrics(len(parts), time.perf_counter() - oldest)
+
+            if closing:
+                return
+
+    def _record_batch_metrics(self, batch_size: int, lag: float) -> None:
+        CHAT_STREAM_WRITER_BATCH_SIZE.labels(node=self._node).observe(batch_size)
+        CHAT_STREAM_WRITER_LAG.labels(node=self._node).observe(lag)
+
+    def _record_stream_metrics(self) -> None:
+        CHAT_STREAM_WRITER_QUEUE_DEPTH.labels(node=self._node).observe(self.max_queue_depth)
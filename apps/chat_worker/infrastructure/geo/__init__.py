@@ -0,0 +1,14 @@
+"""Geo Resolution - 좌표 → 지역 정보 (시도/시군구, 기상청 격자, 타일).
+
+- CachedGeoResolver: 양자화 셀 캐시 (L1 + Redis L2) + 역지오코딩 체인
+- SnapshotReverseGeocoder: 공공데이터 스냅샷 색인 (오프라인)
+- KakaoReverseGeocoder: 카카오 coord2regioncode
+"""
+
+from chat_worker.infrastructure.geo.geo_resolver import CachedGeoResolver
+from chat_worker.infrastructure.geo.reverse_geocoders import (
+    KakaoReverseGeocoder,
+    SnapshotReverseGeocoder,
+)
+
+__all__ = ["CachedGeoResolver", "KakaoReverseGeocoder", "SnapshotReverseGeocoder"]
@@ -0,0 +1,216 @@
+"""Cached Geo Resolver - 좌표 → 지역 정보 해석 (GeoResolverPort 구현체).
+
+같은 사용자는 턴마다 같은 user_location을 보내고, weather/bulk_waste 등 여러
+노드가 그 좌표에서 각자 지역 정보를 구합니다. 좌표를 양자화한 셀 단위로
+해석 결과 묶음(시도/시군구, 기상청 격자, 타일)을 한 번만 계산해 공유합니다.
+
+계층:
+- L1: 프로세스 내 LRU (셀 → GeoResolution)
+- L2: CachePort (Redis, 선택) - replica 간 공유, 행정구역이 해석된 결과만 저장
+- 동일 셀 동시 해석은 하나로 합침 (single-flight)
+
+역지오코딩 체인 (앞에서부터, 결과가 나오면 중단):
+- KakaoReverseGeocoder: 카카오 coord2regioncode
+- SnapshotReverseGeocoder: 공공데이터 스냅샷의 region_cell 색인 (외부 호출 없음,
+  주변 수거함 주소 기준 근사치라 카카오 장애/미설정 시 fallback)
+
+해석에 실패해도 격자/타일은 항상 채워서 반환합니다 (날씨는 행정구역 불필요).
+행정구역이 없는 결과는 L1에만 짧게 보관합니다 (스냅샷 갱신/장애 복구 후 재시도).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from dataclasses import asdict
+from typing import TYPE_CHECKING
+
+from chat_worker.application.ports.geo_resolver import (
+    AdminRegion,
+    GeoResolution,
+    GeoResolverPort,
+    ReverseGeocoderPort,
+)
+from chat_worker.application.services.weather_service import WeatherService
+from chat_worker.infrastructure.metrics import CHAT_GEO_RESOLUTIONS
+
+if TYPE_CHECKING:
+    from chat_worker.application.ports.cache import CachePort
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PRECISION = 3  # 소수점 3자리 (약 100m 셀)
+DEFAULT_TILE_DEGREES = 0.1  # 타일 크기 (약 10km)
+DEFAULT_MAX_ENTRIES = 4096  # L1 셀 상한
+DEFAULT_CACHE_TTL = 30 * 24 * 3600  # 행정구역은 거의 바뀌지 않음
+DEFAULT_UNRESOLVED_TTL = 600.0  # 행정구역 미해석 결과 L1 보관 (초)
+DEFAULT_GEOCODE_TIMEOUT = 2.0  # 역지오코더 1회 호출 상한 (초)
+
+
+class CachedGeoResolver(GeoResolverPort):
+    """양자화 셀 캐시 + single-flight + 역지오코딩 체인."""
+
+    def __init__(
+        self,
+        reverse_geocoders: Sequence[ReverseGeocoderPort] = (),
+        cache: "CachePort | None" = None,
+        precision: int = DEFAULT_PRECISION,
+        tile_degrees: float = DEFAULT_TILE_DEGREES,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        cache_ttl: int = DEFAULT_CACHE_TTL,
+        unresolved_ttl: float = DEFAULT_UNRESOLVED_TTL,
+        geocode_timeout: float = DEFAULT_GEOCODE_TIMEOUT,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """초기화.
+
+        Args:
+            reverse_geocoders: 역지오코딩 체인 (비어 있으면 격자/타일만 해석)
+            cache: 공유 캐시 (L2, 선택)
+            precision: 좌표 양자화 소수점 자릿수
+            tile_degrees: 타일 크기 (도)
+            max_entries: L1 셀 상한
+            cache_ttl: L2 TTL (초)
+            unresolved_ttl: 행정구역 미해석 결과의 L1 보관 시간 (초)
+            geocode_timeout: 역지오코더 1회 호출 상한 (초)
+            clock: 시계 (테스트용)
+        """
+        self._geocoders = list(reverse_geocoders)
+        self._cache = cache
+        self._precision = precision
+        self._tile_degrees = tile_degrees
+        self._max_entries = max_entries
+        self._cache_ttl = cache_ttl
+        self._unresolved_ttl = unresolved_ttl
+        self._geocode_timeout = geocode_timeout
+        self._clock = clock
+        self._entries: OrderedDict[tuple[float, float], tuple[GeoResolution, float | None]] = (
+            OrderedDict()
+        )
+        self._inflight: dict[tuple[float, float], asyncio.Future[GeoResolution]] = {}
+
+    async def resolve(self, lat: float, lon: float) -> GeoResolution:
+        """좌표 해석 (셀 캐시 우선)."""
+        cell = self._cell(lat, lon)
+
+        resolution = self._cached(cell)
+        if resolution is not None:
+            CHAT_GEO_RESOLUTIONS.labels(result="l1").inc()
+            return resolution
+
+        inflight = self._inflight.get(cell)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._load(cell))
+            self._inflight[cell] = inflight
+            inflight.add_done_callback(lambda _: self._inflight.pop(cell, None))
+        # 호출자 취소가 공유 해석을 취소하지 않도록 shield
+        return await asyncio.shield(inflight)
+
+    def locate(self, lat: float, lon: float) -> GeoResolution:
+        """격자/타일 즉시 계산 (L1에 해석된 셀이 있으면 그대로, 역지오코딩 없음)."""
+        cell = self._cell(lat, lon)
+        resolution = self._cached(cell)
+        if resolution is not None:
+            return resolution
+        return self._grid(cell, region=None)
+
+    def _cell(self, lat: float, lon: float) -> tuple[float, float]:
+        return (round(lat, self._precision), round(lon, self._precision))
+
+    def _cached(self, cell: tuple[float, float]) -> GeoResolution | None:
+        """L1 조회 (만료된 미해석 결과는 제거)."""
+        entry = self._entries.get(cell)
+        if entry is None:
+            return None
+        resolution, expires_at = entry
+        if expires_at is not None and self._clock() >= expires_at:
+            del self._entries[cell]
+            return None
+        self._entries.move_to_end(cell)
+        return resolution
+
+    def _grid(self, cell: tuple[float, float], region: AdminRegion | None) -> GeoResolution:
+        lat, lon = cell
+        nx, ny = WeatherService.convert_to_grid(lat, lon)
+        return GeoResolution(
+            lat=lat, lon=lon, nx=nx, ny=ny, tile=self._tile(lat, lon), region=region
+        )
+
+    async def _load(self, cell: tuple[float, float]) -> GeoResolution:
+        cache_key = f"geo:{self._precision}:{cell[0]}:{cell[1]}"
+
+        if self._cache is not None:
+            try:
+                cached = await self._cache.get_json(cache_key)
+            except Exception as e:
+                logger.debug("Geo cache read failed", extra={"error": str(e)})
+                cached = None
+            if cached is not None:
+                resolution = _resolution_from_dict(cached)
+                self._store(cell, resolution, resolved=True)
+                CHAT_GEO_RESOLUTIONS.labels(result="l2").inc()
+                return resolution
+
+        region, result = await self._reverse_geocode(*cell)
+        resolution = self._grid(cell, region)
+        CHAT_GEO_RESOLUTIONS.labels(result=result).inc()
+
+        self._store(cell, resolution, resolved=region is not None)
+        if region is not None and self._cache is not None:
+            try:
+                await self._cache.set_json(cache_key, asdict(resolution), ttl=self._cache_ttl)
+            except Exception as e:
+                logger.debug("Geo cache write failed", extra={"error": str(e)})
+        return resolution
+
+    async def _reverse_geocode(self, lat: float, lon: float) -> tuple[AdminRegion | None, str]:
+        """역지오코딩 체인 실행 → (행정구역, 결과 라벨)."""
+        failed = False
+        for geocoder in self._geocoders:
+            try:
+                region = await asyncio.wait_for(
+                    geocoder.reverse_geocode(lat, lon), timeout=self._geocode_timeout
+                )
+            except Exception as e:
+                failed = True
+                logger.warning(
+                    "Reverse geocoding failed",
+                    extra={
+                        "geocoder": type(geocoder).__name__,
+                        "error": str(e) or type(e).__name__,
+                    },
+                )
+                continue
+            if region is not None:
+                return region, region.source
+        return None, "error" if failed else "unresolved"
+
+    def _store(self, cell: tuple[float, float], resolution: GeoResolution, resolved: bool) -> None:
+        expires_at = None if resolved else self._clock() + self._unresolved_ttl
+        self._entries[cell] = (resolution, expires_at)
+        self._entries.move_to_end(cell)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def _tile(self, lat: float, lon: float) -> str:
+        return f"{math.floor(lat / self._tile_degrees)}:{math.floor(lon / self._tile_degrees)}"
+
+
+def _resolution_from_dict(data: dict) -> GeoResolution:
+    """L2 JSON → GeoResolution."""
+    region = data.get("region")
+    return GeoResolution(
+        lat=data["lat"],
+        lon=data["lon"],
+        nx=data["nx"],
+        ny=data["ny"],
+        tile=data["tile"],
+        region=AdminRegion(**region) if region else None,
+    )
+
+
+__all__ = ["CachedGeoResolver"]
@@ -0,0 +1,70 @@
+"""Reverse Geocoders - 좌표 → 행정구역 (ReverseGeocoderPort 구현체).
+
+- SnapshotReverseGeocoder: 오프라인. 공공데이터 스냅샷의 region_cell 색인
+  (public_data_syncer가 지오코딩된 수거함 주소로 생성, 외부 호출 없음)
+- KakaoReverseGeocoder: 카카오 로컬 coord2regioncode
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from chat_worker.application.ports.geo_resolver import AdminRegion, ReverseGeocoderPort
+
+if TYPE_CHECKING:
+    from chat_worker.application.ports.kakao_local_client import KakaoLocalClientPort
+    from chat_worker.infrastructure.integrations.public_data import PublicDataSnapshotStore
+
+
+class SnapshotReverseGeocoder(ReverseGeocoderPort):
+    """공공데이터 스냅샷 색인 기반 오프라인 역지오코더."""
+
+    def __init__(self, store: "PublicDataSnapshotStore", rings: int = 3):
+        """초기화.
+
+        Args:
+            store: 스냅샷 조회기
+            rings: 빈 셀일 때 주변 탐색 범위 (셀, 약 1km 단위)
+        """
+        self._store = store
+        self._rings = rings
+
+    async def reverse_geocode(self, lat: float, lon: float) -> AdminRegion | None:
+        """스냅샷 색인에서 가장 가까운 셀의 행정구역."""
+        try:
+            found = await asyncio.to_thread(self._store.reverse_geocode, lat, lon, self._rings)
+        except FileNotFoundError:
+            return None  # 스냅샷 미생성 (다음 역지오코더로)
+        if found is None:
+            return None
+        sido, sigungu = found
+        return AdminRegion(sido=sido, sigungu=sigungu, source="offline")
+
+
+class KakaoReverseGeocoder(ReverseGeocoderPort):
+    """카카오 coord2regioncode 기반 역지오코더."""
+
+    def __init__(self, client: "KakaoLocalClientPort"):
+        """초기화.
+
+        Args:
+            client: 카카오 로컬 클라이언트
+        """
+        self._client = client
+
+    async def reverse_geocode(self, lat: float, lon: float) -> AdminRegion | None:
+        """카카오 행정구역 조회 (법정동 결과 우선)."""
+        regions = await self._client.coord_to_region(x=lon, y=lat)
+        regions = sorted(regions, key=lambda region: region.region_type != "B")
+        for region in regions:
+            if region.sido:
+                return AdminRegion(
+                    sido=region.sido,
+                    sigungu=region.sigungu or None,
+                    source="kakao",
+                )
+        return None
+
+
+__all__ = ["KakaoReverseGeocoder", "SnapshotReverseGeocoder"]
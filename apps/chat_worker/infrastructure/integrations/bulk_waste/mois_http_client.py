@@ -337,6 +337,11 @@ class MoisWasteInfoHttpClient(BulkWasteClientPort):
 
         return results
 
+    async def prewarm(self) -> None:
+        """커넥션 풀에 연결 하나를 선행 수립 (DNS/TCP/TLS, 응답 코드는 확인하지 않음)."""
+        client = await self._get_client()
+        await client.head(str(client.base_url))
+
     async def close(self) -> None:
         """HTTP 클라이언트 종료."""
         if self._client:
@@ -142,6 +142,12 @@ class CharacterGrpcClient(CharacterClientPort):
         logger.warning("get_catalog not implemented in gRPC client")
         return []
 
+    async def prewarm(self) -> None:
+        """채널 생성 후 연결 수립까지 대기."""
+        await self._get_stub()
+        if self._channel is not None:
+            await self._channel.channel_ready()
+
     async def close(self) -> None:
         """연결 종료."""
         if self._channel:
@@ -5,11 +5,18 @@ Images API의 gRPC 서비스를 호출하여 이미지를 S3에 업로드합니
 Clean Architecture:
 - Port: ImageStoragePort (application/ports/image_storage.py)
 - Adapter: ImageStorageClient (이 파일)
+
+업로드 경로:
+- UploadStream: SHA-256을 header에 담아 청크 전송. 서버가 같은 내용을 이미
+  가지고 있으면 청크 전송 없이 기존 CDN URL 반환 (재생성 이미지, 재시도)
+- UploadBytes: 서버가 UploadStream 미지원(UNIMPLEMENTED)일 때 fallback
 """
 
 from __future__ import annotations
 
+import hashlib
 import logging
+from collections.abc import AsyncIterator
 
 import grpc
 
@@ -20,6 +27,9 @@ from chat_worker.application.ports.image_storage import (
 from chat_worker.infrastructure.integrations.image.proto import (
     ImageServiceStub,
     UploadBytesRequest,
+    UploadBytesResponse,
+    UploadStreamHeader,
+    UploadStreamRequest,
 )
 
 logger = logging.getLogger(__name__)
@@ -27,6 +37,9 @@ logger = logging.getLogger(__name__)
 # gRPC 타임아웃 (초) - 이미지 업로드는 시간이 걸릴 수 있음
 DEFAULT_GRPC_TIMEOUT = 30.0
 
+# 스트리밍 청크 크기 (gRPC 기본 메시지 한도 4MB보다 충분히 작게)
+STREAM_CHUNK_SIZE = 256 * 1024
+
 
 class ImageStorageClient(ImageStoragePort):
     """Image Storage gRPC 클라이언트.
@@ -54,6 +67,7 @@ class ImageStorageClient(ImageStoragePort):
         self._address = f"{host}:{port}"
         self._channel: grpc.aio.Channel | None = None
         self._stub: ImageServiceStub | None = None
+        self._stream_supported = True
 
     async def _get_stub(self) -> ImageServiceStub:
         """Lazy connection - 첫 호출 시 연결."""
@@ -81,7 +95,7 @@ class ImageStorageClient(ImageStoragePort):
     ) -> ImageUploadResult:
         """이미지 바이트를 S3에 업로드합니다.
 
-        gRPC로 Images API의 UploadBytes 호출.
+        gRPC로 Images API의 UploadStream 호출 (미지원 서버면 UploadBytes).
 
         Args:
             image_data: 이미지 바이트 데이터
@@ -95,44 +109,33 @@ class ImageStorageClient(ImageStoragePort):
         """
         stub = await self._get_stub()
 
-        request = UploadBytesRequest(
-            channel=channel,
-            image_data=image_data,
-            content_type=content_type,
-            uploader_id=uploader_id,
-        )
-        if metadata:
-            request.metadata.update(metadata)
-
         try:
+            if self._stream_supported:
+                try:
+                    response = await stub.UploadStream(
+                        self._stream_requests(
+                            image_data, content_type, channel, uploader_id, metadata
+                        ),
+                        timeout=DEFAULT_GRPC_TIMEOUT,
+                    )
+                    return self._to_result(response, channel, len(image_data))
+                except grpc.aio.AioRpcError as e:
+                    if e.code() != grpc.StatusCode.UNIMPLEMENTED:
+                        raise
+                    # 구버전 Images API - 이후 호출은 바로 UploadBytes 사용
+                    self._stream_supported = False
+                    logger.warning("UploadStream not supported, falling back to UploadBytes")
+
+            request = UploadBytesRequest(
+                channel=channel,
+                image_data=image_data,
+                content_type=content_type,
+                uploader_id=uploader_id,
+            )
+            if metadata:
+                request.metadata.update(metadata)
             response = await stub.UploadBytes(request, timeout=DEFAULT_GRPC_TIMEOUT)
-
-            if response.success:
-                logger.info(
-                    "Image uploaded via gRPC",
-                    extra={
-                        "channel": channel,
-                        "cdn_url": response.cdn_url,
-                        "size_bytes": len(image_data),
-                    },
-                )
-                return ImageUploadResult(
-                    success=True,
-                    cdn_url=response.cdn_url,
-                    key=response.key,
-                )
-            else:
-                logger.error(
-                    "Image upload failed via gRPC",
-                    extra={
-                        "channel": channel,
-                        "error": response.error,
-                    },
-                )
-                return ImageUploadResult(
-                    success=False,
-                    error=response.error,
-                )
+            return self._to_result(response, channel, len(image_data))
 
         except grpc.aio.AioRpcError as e:
             logger.error(
@@ -148,6 +151,66 @@ class ImageStorageClient(ImageStoragePort):
                 error=f"gRPC error: {e.code().name} - {e.details()}",
             )
 
+    @staticmethod
+    async def _stream_requests(
+        image_data: bytes,
+        content_type: str,
+        channel: str,
+        uploader_id: str,
+        metadata: dict[str, str] | None,
+    ) -> AsyncIterator[UploadStreamRequest]:
+        """header(SHA-256 포함) + 청크 메시지 생성."""
+        header = UploadStreamHeader(
+            channel=channel,
+            content_type=content_type,
+            uploader_id=uploader_id,
+            sha256=hashlib.sha256(image_data).hexdigest(),
+        )
+        if metadata:
+            header.metadata.update(metadata)
+        yield UploadStreamRequest(header=header)
+
+        view = memoryview(image_data)
+        for offset in range(0, len(view), STREAM_CHUNK_SIZE):
+            yield UploadStreamRequest(chunk=bytes(view[offset : offset + STREAM_CHUNK_SIZE]))
+
+    @staticmethod
+    def _to_result(response: UploadBytesResponse, channel: str, size: int) -> ImageUploadResult:
+        if response.success:
+            logger.info(
+                "Image uploaded via gRPC",
+                extra={
+                    "channel": channel,
+                    "cdn_url": response.cdn_url,
+                    "size_bytes": size,
+                    "deduplicated": response.deduplicated,
+                },
+            )
+            return ImageUploadResult(
+                success=True,
+                cdn_url=response.cdn_url,
+                key=response.key,
+                deduplicated=response.deduplicated,
+            )
+
+        logger.error(
+            "Image upload failed via gRPC",
+            extra={
+                "channel": channel,
+                "error": response.error,
+            },
+        )
+        return ImageUploadResult(
+            success=False,
+            error=response.error,
+        )
+
+    async def prewarm(self) -> None:
+        """채널 생성 후 연결 수립까지 대기."""
+        await self._get_stub()
+        if self._channel is not None:
+            await self._channel.channel_ready()
+
     async def close(self) -> None:
         """연결 종료."""
         if self._channel:
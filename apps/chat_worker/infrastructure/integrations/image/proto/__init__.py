@@ -3,6 +3,8 @@
 from chat_worker.infrastructure.integrations.image.proto.image_pb2 import (
     UploadBytesRequest,
     UploadBytesResponse,
+    UploadStreamHeader,
+    UploadStreamRequest,
 )
 from chat_worker.infrastructure.integrations.image.proto.image_pb2_grpc import (
     ImageServiceStub,
@@ -11,5 +13,7 @@ from chat_worker.infrastructure.integrations.image.proto.image_pb2_grpc import (
 __all__ = [
     "UploadBytesRequest",
     "UploadBytesResponse",
+    "UploadStreamHeader",
+    "UploadStreamRequest",
     "ImageServiceStub",
 ]
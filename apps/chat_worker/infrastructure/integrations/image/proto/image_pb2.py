@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0bimage.proto\x12\x08image.v1\"\xd3\x01\n\x12UploadBytesRequest\x12\x0f\n\x07\x63hannel\x18\x01 \x01(\t\x12\x12\n\nimage_data\x18\x02 \x01(\x0c\x12\x14\n\x0c\x63ontent_type\x18\x03 \x01(\t\x12\x13\n\x0buploader_id\x18\x04 \x01(\t\x12<\n\x08metadata\x18\x05 \x03(\x0b\x32*.image.v1.UploadBytesRequest.MetadataEntry\x1a/\n\rMetadataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"S\n\x13UploadBytesResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07\x63\x64n_url\x18\x02 \x01(\t\x12\x0b\n\x03key\x18\x03 \x01(\t\x12\r\n\x05\x65rror\x18\x04 \x01(\t2\\\n\x0cImageService\x12L\n\x0bUploadBytes\x12\x1c.image.v1.UploadBytesRequest\x1a\x1d.image.v1.UploadBytesResponse\"\x00\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0bimage.proto\x12\x08image.v1\"\xd3\x01\n\x12UploadBytesRequest\x12\x0f\n\x07\x63hannel\x18\x01 \x01(\t\x12\x12\n\nimage_data\x18\x02 \x01(\x0c\x12\x14\n\x0c\x63ontent_type\x18\x03 \x01(\t\x12\x13\n\x0buploader_id\x18\x04 \x01(\t\x12<\n\x08metadata\x18\x05 \x03(\x0b\x32*.image.v1.UploadBytesRequest.MetadataEntry\x1a/\n\rMetadataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"i\n\x13UploadBytesResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07\x63\x64n_url\x18\x02 \x01(\t\x12\x0b\n\x03key\x18\x03 \x01(\t\x12\r\n\x05\x65rror\x18\x04 \x01(\t\x12\x14\n\x0c\x64\x65\x64uplicated\x18\x05 \x01(\x08\"\xcf\x01\n\x12UploadStreamHeader\x12\x0f\n\x07\x63hannel\x18\x01 \x01(\t\x12\x14\n\x0c\x63ontent_type\x18\x02 \x01(\t\x12\x13\n\x0buploader_id\x18\x03 \x01(\t\x12<\n\x08metadata\x18\x04 \x03(\x0b\x32*.image.v1.UploadStreamHeader.MetadataEntry\x12\x0e\n\x06sha256\x18\x05 \x01(\t\x1a/\n\rMetadataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"a\n\x13UploadStreamRequest\x12.\n\x06header\x18\x01 \x01(\x0b\x32\x1c.image.v1.UploadStreamHeaderH\x00\x12\x0f\n\x05\x63hunk\x18\x02 \x01(\x0cH\x00\x42\t\n\x07payload2\xae\x01\n\x0cImageService\x12L\n\x0bUploadBytes\x12\x1c.image.v1.UploadBytesRequest\x1a\x1d.image.v1.UploadBytesResponse\"\x00\x12P\n\x0cUploadStream\x12\x1d.image.v1.UploadStreamRequest\x1a\x1d.image.v1.UploadBytesResponse\"\x00(\x01\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -33,12 +33,20 @@ if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
   _globals['_UPLOADBYTESREQUEST_METADATAENTRY']._loaded_options = None
   _globals['_UPLOADBYTESREQUEST_METADATAENTRY']._serialized_options = b'8\001'
+  _globals['_UPLOADSTREAMHEADER_METADATAENTRY']._loaded_options = None
+  _globals['_UPLOADSTREAMHEADER_METADATAENTRY']._serialized_options = b'8\001'
   _globals['_UPLOADBYTESREQUEST']._serialized_start=26
   _globals['_UPLOADBYTESREQUEST']._serialized_end=237
   _globals['_UPLOADBYTESREQUEST_METADATAENTRY']._serialized_start=190
   _globals['_UPLOADBYTESREQUEST_METADATAENTRY']._serialized_end=237
   _globals['_UPLOADBYTESRESPONSE']._serialized_start=239
-  _globals['_UPLOADBYTESRESPONSE']._serialized_end=322
-  _globals['_IMAGESERVICE']._serialized_start=324
-  _globals['_IMAGESERVICE']._serialized_end=416
+  _globals['_UPLOADBYTESRESPONSE']._serialized_end=344
+  _globals['_UPLOADSTREAMHEADER']._serialized_start=347
+  _globals['_UPLOADSTREAMHEADER']._serialized_end=554
+  _globals['_UPLOADSTREAMHEADER_METADATAENTRY']._serialized_start=507
+  _globals['_UPLOADSTREAMHEADER_METADATAENTRY']._serialized_end=554
+  _globals['_UPLOADSTREAMREQUEST']._serialized_start=556
+  _globals['_UPLOADSTREAMREQUEST']._serialized_end=653
+  _globals['_IMAGESERVICE']._serialized_start=656
+  _globals['_IMAGESERVICE']._serialized_end=830
 # @@protoc_insertion_point(module_scope)
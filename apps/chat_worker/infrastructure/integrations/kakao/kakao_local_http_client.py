@@ -3,6 +3,7 @@
 카카오 로컬 API의 HTTP 구현체.
 - 키워드 검색: GET /v2/local/search/keyword.json
 - 카테고리 검색: GET /v2/local/search/category.json
+- 좌표 → 행정구역: GET /v2/local/geo/coord2regioncode.json
 - 인증: Authorization: KakaoAK {REST_API_KEY}
 
 Clean Architecture:
@@ -22,6 +23,7 @@ import httpx
 from chat_worker.application.ports.kakao_local_client import (
     KakaoLocalClientPort,
     KakaoPlaceDTO,
+    KakaoRegionDTO,
     KakaoSearchMeta,
     KakaoSearchResponse,
 )
@@ -53,6 +55,7 @@ class KakaoLocalHttpClient(KakaoLocalClientPort):
     """
 
     BASE_URL = "https://dapi.kakao.com/v2/local/search"
+    REGION_URL = "https://dapi.kakao.com/v2/local/geo/coord2regioncode.json"
 
     def __init__(
         self,
@@ -243,6 +246,51 @@ class KakaoLocalHttpClient(KakaoLocalClientPort):
             )
             raise
 
+    async def coord_to_region(self, x: float, y: float) -> list[KakaoRegionDTO]:
+        """좌표로 행정구역 조회.
+
+        Args:
+            x: 경도
+            y: 위도
+
+        Returns:
+            행정동(H)/법정동(B) 결과 목록
+        """
+        client = await self._get_client()
+
+        try:
+            response = await client.get(self.REGION_URL, params={"x": str(x), "y": str(y)})
+            response.raise_for_status()
+            documents = response.json().get("documents", [])
+        except httpx.HTTPStatusError as e:
+            logger.error(
+                "Kakao API HTTP error",
+                extra={
+                    "status_code": e.response.status_code,
+                    "x": x,
+                    "y": y,
+                    "detail": e.response.text[:200] if e.response.text else "",
+                },
+            )
+            raise
+        except Exception as e:
+            logger.error(
+                "Kakao coord2region failed",
+                extra={"x": x, "y": y, "error": str(e)},
+            )
+            raise
+
+        return [
+            KakaoRegionDTO(
+                region_type=doc.get("region_type", ""),
+                sido=doc.get("region_1depth_name", ""),
+                sigungu=doc.get("region_2depth_name", ""),
+                dong=doc.get("region_3depth_name", ""),
+                code=doc.get("code", ""),
+            )
+            for doc in documents
+        ]
+
     def _parse_response(
         self,
         data: dict[str, Any],
@@ -291,6 +339,11 @@ class KakaoLocalHttpClient(KakaoLocalClientPort):
             query=query,
         )
 
+    async def prewarm(self) -> None:
+        """커넥션 풀에 연결 하나를 선행 수립 (DNS/TCP/TLS, 응답 코드는 확인하지 않음)."""
+        client = await self._get_client()
+        await client.head(str(client.base_url))
+
     async def close(self) -> None:
         """HTTP 클라이언트 종료."""
         if self._client:
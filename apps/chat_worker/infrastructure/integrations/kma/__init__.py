@@ -3,13 +3,17 @@
 기상청 공공데이터포털 API:
 - 초단기실황 (getUltraSrtNcst): 현재 날씨
 - 단기예보 (getVilageFcst): 향후 예보
+- CachedWeatherClient: 격자/발표시각 단위 캐시 + prefetch
 
 참고:
 - https://www.data.go.kr/data/15084084/openapi.do
 """
 
+from chat_worker.infrastructure.integrations.kma.cached_weather_client import (
+    CachedWeatherClient,
+)
 from chat_worker.infrastructure.integrations.kma.kma_weather_http_client import (
     KmaWeatherHttpClient,
 )
 
-__all__ = ["KmaWeatherHttpClient"]
+__all__ = ["CachedWeatherClient", "KmaWeatherHttpClient"]
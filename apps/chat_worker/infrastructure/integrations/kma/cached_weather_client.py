@@ -0,0 +1,300 @@
+"""Cached Weather Client - 기상청 격자/발표시각 단위 캐시 (WeatherClientPort 데코레이터).
+
+기상청 데이터는 5km 격자(nx, ny) 단위이고 정해진 발표 시각에만 갱신되므로
+같은 격자의 같은 발표분은 한 번만 조회하면 됩니다.
+
+캐시 키: (product, nx, ny, hours, base_date, base_time)
+- 초단기실황: 매시 40분에 base_time 변경
+- 단기예보: 02/05/.../23시 발표 1시간 후 base_time 변경
+- TTL = 다음 발표분 조회 가능 시각까지 (+ replica 간 시계 오차 여유)
+
+계층:
+- L1: 프로세스 내 격자별 최신 응답 (LRU, base가 같으면 히트)
+- L2: CachePort (Redis, 선택) - replica 간 공유
+- 동일 키 동시 조회는 하나의 요청으로 합침 (single-flight)
+- 조회 실패 시 같은 격자의 직전 발표분이 있으면 그대로 반환 (stale)
+
+백그라운드 prefetch (선택, prefetch_top_n > 0):
+- 조회 빈도 상위 N개 격자를 base_time 변경 직후 미리 갱신
+- weather 노드(Priority.LOW)가 네트워크를 거의 기다리지 않도록 함
+- 빈도는 갱신 주기마다 절반으로 감쇠 (오래된 인기 격자 자연 탈락)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import Counter, OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from chat_worker.application.ports.weather_client import (
+    CurrentWeatherDTO,
+    PrecipitationType,
+    SkyStatus,
+    WeatherClientPort,
+    WeatherForecastDTO,
+    WeatherResponse,
+)
+from chat_worker.infrastructure.integrations.kma.kma_weather_http_client import (
+    get_base_datetime,
+    get_forecast_base_datetime,
+    next_base_change,
+    next_forecast_base_change,
+)
+
+if TYPE_CHECKING:
+    from chat_worker.application.ports.cache import CachePort
+
+logger = logging.getLogger(__name__)
+
+PRODUCT_CURRENT = "ncst"  # 초단기실황
+PRODUCT_FORECAST = "fcst"  # 단기예보
+
+DEFAULT_MAX_CELLS = 2048  # L1 격자 상한
+DEFAULT_PREFETCH_DELAY = 60.0  # base_time 변경 후 prefetch까지 대기 (초)
+TTL_GRACE_SECONDS = 60  # replica 간 시계 오차 여유
+
+_BASE_FUNCTIONS: dict[str, tuple[Callable[..., tuple[str, str]], Callable[..., datetime]]] = {
+    PRODUCT_CURRENT: (get_base_datetime, next_base_change),
+    PRODUCT_FORECAST: (get_forecast_base_datetime, next_forecast_base_change),
+}
+
+
+@dataclass(frozen=True)
+class _Cell:
+    """격자 + 상품 (base와 무관한 캐시 단위)."""
+
+    product: str
+    nx: int
+    ny: int
+    hours: int = 0
+
+
+@dataclass
+class _Entry:
+    base: tuple[str, str]
+    response: WeatherResponse
+
+
+class CachedWeatherClient(WeatherClientPort):
+    """발표 시각 정렬 TTL 캐시 + single-flight + prefetch를 적용한 WeatherClientPort 래퍼."""
+
+    def __init__(
+        self,
+        client: WeatherClientPort,
+        cache: "CachePort | None" = None,
+        max_cells: int = DEFAULT_MAX_CELLS,
+        prefetch_top_n: int = 0,
+        prefetch_delay: float = DEFAULT_PREFETCH_DELAY,
+        clock: Callable[[], datetime] = datetime.now,
+    ):
+        """초기화.
+
+        Args:
+            client: 실제 기상청 클라이언트
+            cache: 공유 캐시 (L2, 선택)
+            max_cells: L1 격자 상한
+            prefetch_top_n: 백그라운드 prefetch 대상 격자 수 (0이면 비활성)
+            prefetch_delay: base_time 변경 후 prefetch까지 대기 (초)
+            clock: 현재 시각 (테스트용)
+        """
+        self._client = client
+        self._cache = cache
+        self._max_cells = max_cells
+        self._prefetch_top_n = prefetch_top_n
+        self._prefetch_delay = prefetch_delay
+        self._clock = clock
+        self._entries: OrderedDict[_Cell, _Entry] = OrderedDict()
+        self._inflight: dict[tuple[_Cell, tuple[str, str]], asyncio.Future[WeatherResponse]] = {}
+        self._hotness: Counter[_Cell] = Counter()
+        self._prefetch_task: asyncio.Task[None] | None = None
+
+    async def get_current_weather(self, nx: int, ny: int) -> WeatherResponse:
+        """현재 날씨 조회 (초단기실황, 캐시 우선)."""
+        cell = _Cell(PRODUCT_CURRENT, nx, ny)
+        return await self._get(cell, lambda: self._client.get_current_weather(nx, ny))
+
+    async def get_forecast(self, nx: int, ny: int, hours: int = 24) -> WeatherResponse:
+        """단기예보 조회 (캐시 우선)."""
+        cell = _Cell(PRODUCT_FORECAST, nx, ny, hours)
+        return await self._get(cell, lambda: self._client.get_forecast(nx, ny, hours))
+
+    async def prewarm(self) -> None:
+        """내부 클라이언트 연결 선행 수립."""
+        await self._client.prewarm()
+
+    async def close(self) -> None:
+        """prefetch 중단 + 내부 클라이언트 종료."""
+        if self._prefetch_task is not None:
+            self._prefetch_task.cancel()
+            try:
+                await self._prefetch_task
+            except asyncio.CancelledError:
+                pass
+            self._prefetch_task = None
+        await self._client.close()
+
+    async def _get(
+        self,
+        cell: _Cell,
+        fetch: Callable[[], Awaitable[WeatherResponse]],
+        record: bool = True,
+    ) -> WeatherResponse:
+        if record:
+            self._hotness[cell] += 1
+            self._ensure_prefetch()
+
+        now = self._clock()
+        base_fn, _ = _BASE_FUNCTIONS[cell.product]
+        base = base_fn(now)
+
+        entry = self._entries.get(cell)
+        if entry is not None and entry.base == base:
+            self._entries.move_to_end(cell)
+            return entry.response
+
+        key = (cell, base)
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._load(cell, base, fetch))
+            self._inflight[key] = inflight
+            inflight.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # 호출자 취소가 공유 조회를 취소하지 않도록 shield
+        return await asyncio.shield(inflight)
+
+    async def _load(
+        self,
+        cell: _Cell,
+        base: tuple[str, str],
+        fetch: Callable[[], Awaitable[WeatherResponse]],
+    ) -> WeatherResponse:
+        cache_key = _cache_key(cell, base)
+
+        if self._cache is not None:
+            cached = await self._cache.get_json(cache_key)
+            if cached is not None:
+                response = _response_from_dict(cached)
+                self._store(cell, base, response)
+                return response
+
+        response = await fetch()
+        if not response.success:
+            stale = self._entries.get(cell)
+            if stale is not None:
+                logger.warning(
+                    "KMA fetch failed, serving previous base",
+                    extra={
+                        "nx": cell.nx,
+                        "ny": cell.ny,
+                        "product": cell.product,
+                        "stale_base": "".join(stale.base),
+                        "error": response.error_message,
+                    },
+                )
+                return stale.response
+            return response
+
+        self._store(cell, base, response)
+        if self._cache is not None:
+            await self._cache.set_json(cache_key, asdict(response), ttl=self._ttl(cell))
+        return response
+
+    def _store(self, cell: _Cell, base: tuple[str, str], response: WeatherResponse) -> None:
+        self._entries[cell] = _Entry(base=base, response=response)
+        self._entries.move_to_end(cell)
+        while len(self._entries) > self._max_cells:
+            self._entries.popitem(last=False)
+
+    def _ttl(self, cell: _Cell) -> int:
+        """다음 발표분 조회 가능 시각까지 남은 초."""
+        now = self._clock()
+        _, next_change = _BASE_FUNCTIONS[cell.product]
+        return max(1, int((next_change(now) - now).total_seconds())) + TTL_GRACE_SECONDS
+
+    # ------------------------------------------------------------------
+    # 백그라운드 prefetch
+    # ------------------------------------------------------------------
+
+    def _ensure_prefetch(self) -> None:
+        if self._prefetch_top_n <= 0 or self._prefetch_task is not None:
+            return
+        self._prefetch_task = asyncio.create_task(
+            self._prefetch_loop(), name="kma-weather-prefetch"
+        )
+
+    async def _prefetch_loop(self) -> None:
+        while True:
+            now = self._clock()
+            next_change = min(fn(now) for _, fn in _BASE_FUNCTIONS.values())
+            wait = (next_change - now).total_seconds() + self._prefetch_delay
+            await asyncio.sleep(max(wait, 1.0))
+            try:
+                await self.prefetch()
+            except Exception as e:
+                logger.warning("KMA weather prefetch failed", extra={"error": str(e)})
+
+    async def prefetch(self) -> int:
+        """조회 빈도 상위 격자 갱신 (base가 바뀐 격자만 실제 조회).
+
+        Returns:
+            prefetch 대상 격자 수
+        """
+        hot = [cell for cell, _ in self._hotness.most_common(self._prefetch_top_n)]
+        # 빈도 감쇠: 최근 인기 격자 위주로 유지
+        self._hotness = Counter(
+            {cell: count // 2 for cell, count in self._hotness.items() if count // 2 > 0}
+        )
+
+        await asyncio.gather(
+            *(self._get(cell, self._fetcher(cell), record=False) for cell in hot),
+            return_exceptions=True,
+        )
+        logger.info("KMA weather prefetch completed", extra={"cells": len(hot)})
+        return len(hot)
+
+    def _fetcher(self, cell: _Cell) -> Callable[[], Awaitable[WeatherResponse]]:
+        if cell.product == PRODUCT_CURRENT:
+            return lambda: self._client.get_current_weather(cell.nx, cell.ny)
+        return lambda: self._client.get_forecast(cell.nx, cell.ny, cell.hours)
+
+
+def _cache_key(cell: _Cell, base: tuple[str, str]) -> str:
+    return f"kma:{cell.product}:{cell.nx}:{cell.ny}:{cell.hours}:{base[0]}{base[1]}"
+
+
+def _response_from_dict(data: dict[str, Any]) -> WeatherResponse:
+    """L2 JSON → WeatherResponse (Enum 복원)."""
+    current = data.get("current")
+    return WeatherResponse(
+        success=data["success"],
+        current=(
+            CurrentWeatherDTO(
+                **{
+                    **current,
+                    "precipitation_type": PrecipitationType(current["precipitation_type"]),
+                    "sky_status": SkyStatus(current["sky_status"]),
+                }
+            )
+            if current
+            else None
+        ),
+        forecasts=[
+            WeatherForecastDTO(
+                **{
+                    **forecast,
+                    "precipitation_type": PrecipitationType(forecast["precipitation_type"]),
+                    "sky_status": SkyStatus(forecast["sky_status"]),
+                }
+            )
+            for forecast in data.get("forecasts", [])
+        ],
+        error_message=data.get("error_message"),
+        nx=data.get("nx"),
+        ny=data.get("ny"),
+    )
+
+
+__all__ = ["CachedWeatherClient"]
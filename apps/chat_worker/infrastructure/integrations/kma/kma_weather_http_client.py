@@ -33,6 +33,75 @@ from chat_worker.application.ports.weather_client import (
 
 logger = logging.getLogger(__name__)
 
+# 단기예보 발표 시각 (02, 05, ..., 23시, 발표 후 1시간 여유를 두고 사용)
+FORECAST_BASE_HOURS = (2, 5, 8, 11, 14, 17, 20, 23)
+# 초단기실황은 매 정시 발표, 40분 이후 조회 가능
+CURRENT_AVAILABLE_MINUTE = 40
+
+
+def get_base_datetime(now: datetime | None = None) -> tuple[str, str]:
+    """초단기실황 base_date, base_time 계산.
+
+    초단기실황은 매 정시 발표 (00, 01, ..., 23시).
+    API는 발표 후 40분 이후 조회 가능 → 그 전에는 1시간 전 데이터 사용.
+
+    Args:
+        now: 기준 시간 (기본: 현재 시간)
+
+    Returns:
+        (base_date, base_time) YYYYMMDD, HHMM 형식
+    """
+    if now is None:
+        now = datetime.now()
+
+    if now.minute < CURRENT_AVAILABLE_MINUTE:
+        now = now - timedelta(hours=1)
+
+    return now.strftime("%Y%m%d"), now.strftime("%H00")
+
+
+def get_forecast_base_datetime(now: datetime | None = None) -> tuple[str, str]:
+    """단기예보 base_date, base_time 계산.
+
+    단기예보는 02, 05, 08, 11, 14, 17, 20, 23시 발표.
+
+    Args:
+        now: 기준 시간 (기본: 현재 시간)
+
+    Returns:
+        (base_date, base_time) YYYYMMDD, HHMM 형식
+    """
+    if now is None:
+        now = datetime.now()
+
+    # 현재 시간 이전의 가장 최근 발표 시각 찾기
+    for h in reversed(FORECAST_BASE_HOURS):
+        if now.hour >= h + 1:  # 발표 후 1시간 여유
+            return now.strftime("%Y%m%d"), f"{h:02d}00"
+
+    # 03시 이전이면 전날 23시 사용
+    return (now - timedelta(days=1)).strftime("%Y%m%d"), "2300"
+
+
+def next_base_change(now: datetime | None = None) -> datetime:
+    """초단기실황 base_time이 바뀌는 다음 시각 (매시 40분)."""
+    if now is None:
+        now = datetime.now()
+    slot = now.replace(minute=CURRENT_AVAILABLE_MINUTE, second=0, microsecond=0)
+    return slot if now < slot else slot + timedelta(hours=1)
+
+
+def next_forecast_base_change(now: datetime | None = None) -> datetime:
+    """단기예보 base_time이 바뀌는 다음 시각 (발표 1시간 후 정시)."""
+    if now is None:
+        now = datetime.now()
+    hour = now.replace(minute=0, second=0, microsecond=0)
+    for offset in range(1, 25):
+        candidate = hour + timedelta(hours=offset)
+        if (candidate.hour - 1) % 24 in FORECAST_BASE_HOURS:
+            return candidate
+    return hour + timedelta(hours=3)
+
 
 class KmaWeatherHttpClient(WeatherClientPort):
     """기상청 단기예보 API HTTP 클라이언트.
@@ -68,62 +137,12 @@ class KmaWeatherHttpClient(WeatherClientPort):
         return self._client
 
     def _get_base_datetime(self, now: datetime | None = None) -> tuple[str, str]:
-        """API 요청용 base_date, base_time 계산.
-
-        초단기실황은 매 정시 발표 (00, 01, ..., 23시).
-        API는 발표 후 10분 정도 지나야 데이터 조회 가능.
-
-        Args:
-            now: 기준 시간 (기본: 현재 시간)
-
-        Returns:
-            (base_date, base_time) YYYYMMDD, HHMM 형식
-        """
-        if now is None:
-            now = datetime.now()
-
-        # 발표 시각: 정시 (API는 40분 이후 조회 가능)
-        # 안전하게 1시간 전 데이터 사용
-        if now.minute < 40:
-            now = now - timedelta(hours=1)
-
-        base_date = now.strftime("%Y%m%d")
-        base_time = now.strftime("%H00")
-
-        return base_date, base_time
+        """API 요청용 base_date, base_time 계산 (초단기실황)."""
+        return get_base_datetime(now)
 
     def _get_forecast_base_datetime(self, now: datetime | None = None) -> tuple[str, str]:
-        """단기예보용 base_date, base_time 계산.
-
-        단기예보는 02, 05, 08, 11, 14, 17, 20, 23시 발표.
-
-        Args:
-            now: 기준 시간
-
-        Returns:
-            (base_date, base_time) YYYYMMDD, HHMM 형식
-        """
-        if now is None:
-            now = datetime.now()
-
-        # 발표 시각 목록
-        forecast_hours = [2, 5, 8, 11, 14, 17, 20, 23]
-
-        # 현재 시간 이전의 가장 최근 발표 시각 찾기
-        current_hour = now.hour
-        base_hour = 23  # 기본값 (전날 23시)
-        base_date = now
-
-        for h in reversed(forecast_hours):
-            if current_hour >= h + 1:  # 발표 후 1시간 여유
-                base_hour = h
-                break
-        else:
-            # 02시 이전이면 전날 23시 사용
-            base_date = now - timedelta(days=1)
-            base_hour = 23
-
-        return base_date.strftime("%Y%m%d"), f"{base_hour:02d}00"
+        """단기예보용 base_date, base_time 계산."""
+        return get_forecast_base_datetime(now)
 
     def _parse_current_weather(self, data: dict[str, Any], nx: int, ny: int) -> WeatherResponse:
         """초단기실황 응답 파싱.
@@ -433,6 +452,11 @@ class KmaWeatherHttpClient(WeatherClientPort):
                 ny=ny,
             )
 
+    async def prewarm(self) -> None:
+        """커넥션 풀에 연결 하나를 선행 수립 (DNS/TCP/TLS, 응답 코드는 확인하지 않음)."""
+        client = await self._get_client()
+        await client.head(str(client.base_url))
+
     async def close(self) -> None:
         """HTTP 클라이언트 종료."""
         if self._client:
@@ -441,4 +465,10 @@ class KmaWeatherHttpClient(WeatherClientPort):
             logger.debug("KMA Weather HTTP client closed")
 
 
-__all__ = ["KmaWeatherHttpClient"]
+__all__ = [
+    "KmaWeatherHttpClient",
+    "get_base_datetime",
+    "get_forecast_base_datetime",
+    "next_base_change",
+    "next_forecast_base_change",
+]
@@ -166,6 +166,12 @@ class LocationGrpcClient(LocationClientPort):
         # 재활용 센터와 동일한 API 사용 (category 필터는 서버에서 처리)
         return await self.search_recycling_centers(lat, lon, radius, limit)
 
+    async def prewarm(self) -> None:
+        """채널 생성 후 연결 수립까지 대기."""
+        await self._get_stub()
+        if self._channel is not None:
+            await self._channel.channel_ready()
+
     async def close(self) -> None:
         """연결 종료."""
         if self._channel:
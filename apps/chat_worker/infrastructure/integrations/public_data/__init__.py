@@ -0,0 +1,29 @@
+"""Public Data Snapshot - MOIS/KECO 공공데이터 로컬 스냅샷.
+
+- PublicDataSnapshotStore: SQLite 스냅샷 조회 (시군구/토큰/좌표 인덱스)
+- PublicDataSnapshotSync: 전체 데이터셋 다운로드 + 지오코딩 → 스냅샷 교체
+- LocalFirst*Client: 스냅샷 우선, 실시간 API fallback
+
+동기화 실행:
+    python -m chat_worker.public_data_syncer
+"""
+
+from chat_worker.infrastructure.integrations.public_data.local_first import (
+    LocalFirstBulkWasteClient,
+    LocalFirstCollectionPointClient,
+)
+from chat_worker.infrastructure.integrations.public_data.snapshot_store import (
+    PublicDataSnapshotStore,
+    SnapshotWriter,
+)
+from chat_worker.infrastructure.integrations.public_data.snapshot_sync import (
+    PublicDataSnapshotSync,
+)
+
+__all__ = [
+    "LocalFirstBulkWasteClient",
+    "LocalFirstCollectionPointClient",
+    "PublicDataSnapshotStore",
+    "PublicDataSnapshotSync",
+    "SnapshotWriter",
+]
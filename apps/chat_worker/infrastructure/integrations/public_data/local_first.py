@@ -0,0 +1,268 @@
+"""Local-first 공공데이터 클라이언트 - 스냅샷 우선 조회, 실시간 API fallback.
+
+BulkWasteClientPort / CollectionPointClientPort 데코레이터:
+- 스냅샷이 있고 max_age 이내면 로컬 검색 (인덱스 조회, 네트워크 없음)
+- 스냅샷이 없거나 오래됐거나 결과가 없으면 실시간 API
+- 실시간 API도 비면(오류 시 빈 응답) 오래된 스냅샷이라도 사용
+- get_nearby_collection_points: 지오코딩된 스냅샷 좌표로 처리
+
+SQLite 조회(신선도 확인 포함)는 asyncio.to_thread로 실행
+(부분 일치 fallback 스캔이 조회 락을 잡는 동안 루프를 막지 않도록).
+조회 오류(손상/잠김/교체 중 삭제)는 스냅샷 없음과 같이 실시간 API로 넘깁니다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import sqlite3
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING, TypeVar
+
+from chat_worker.application.ports.bulk_waste_client import (
+    BulkWasteClientPort,
+    BulkWasteCollectionDTO,
+    BulkWasteItemDTO,
+    WasteInfoSearchResponse,
+)
+from chat_worker.application.ports.collection_point_client import (
+    CollectionPointClientPort,
+    CollectionPointDTO,
+    CollectionPointSearchResponse,
+)
+from chat_worker.infrastructure.integrations.public_data.snapshot_store import (
+    DATASET_KECO,
+    DATASET_MOIS,
+)
+
+if TYPE_CHECKING:
+    from chat_worker.infrastructure.integrations.public_data.snapshot_store import (
+        PublicDataSnapshotStore,
+    )
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_AGE = 14 * 24 * 3600.0  # 스냅샷 신선도 한도 (초)
+
+T = TypeVar("T")
+
+
+async def _snapshot_state(store: "PublicDataSnapshotStore", dataset: str, max_age: float) -> str:
+    """스냅샷 상태: fresh | stale | missing.
+
+    synced_at도 조회 락을 기다릴 수 있으므로(진행 중인 스캔) 스레드에서 실행.
+    """
+    try:
+        synced_at = await asyncio.to_thread(store.synced_at, dataset)
+    except Exception as e:
+        logger.warning("Public data snapshot unreadable", extra={"error": str(e)})
+        return "missing"
+    if synced_at is None:
+        return "missing"
+    return "fresh" if time.time() - synced_at <= max_age else "stale"
+
+
+async def _query_local(query: Callable[..., T], *args: object) -> T | None:
+    """스냅샷 조회 (스레드), 실패 시 None (호출 측은 실시간 API 사용)."""
+    try:
+        return await asyncio.to_thread(query, *args)
+    except (sqlite3.Error, FileNotFoundError) as e:
+        logger.warning(
+            "Public data snapshot query failed, using live API",
+            extra={"query": query.__name__, "error": str(e)},
+        )
+        return None
+
+
+class LocalFirstBulkWasteClient(BulkWasteClientPort):
+    """MOIS 배출정보 스냅샷 우선 클라이언트."""
+
+    def __init__(
+        self,
+        client: BulkWasteClientPort,
+        store: "PublicDataSnapshotStore",
+        max_age: float = DEFAULT_MAX_AGE,
+    ):
+        """초기화.
+
+        Args:
+            client: 실시간 MOIS 클라이언트 (fallback, 대형폐기물 정적 데이터)
+            store: 스냅샷 저장소
+            max_age: 스냅샷 신선도 한도 (초)
+        """
+        self._client = client
+        self._store = store
+        self._max_age = max_age
+
+    async def search_disposal_info(
+        self,
+        sido: str | None = None,
+        sigungu: str | None = None,
+        page: int = 1,
+        page_size: int = 10,
+    ) -> WasteInfoSearchResponse:
+        """폐기물 배출 정보 검색 (스냅샷 우선)."""
+        query = {"sido": sido, "sigungu": sigungu}
+        state = await _snapshot_state(self._store, DATASET_MOIS, self._max_age)
+
+        if state == "fresh":
+            local = await self._search_local(sido, sigungu, page, page_size)
+            if local is not None and local.results:
+                return local
+
+        live = await self._client.search_disposal_info(
+            sido=sido, sigungu=sigungu, page=page, page_size=page_size
+        )
+        if live.results or state != "stale":
+            return live
+
+        logger.warning("MOIS live search empty, serving stale snapshot", extra=query)
+        return await self._search_local(sido, sigungu, page, page_size) or live
+
+    async def _search_local(
+        self,
+        sido: str | None,
+        sigungu: str | None,
+        page: int,
+        page_size: int,
+    ) -> WasteInfoSearchResponse | None:
+        found = await _query_local(self._store.search_disposal_info, sido, sigungu, page, page_size)
+        if found is None:
+            return None
+        results, total = found
+        return WasteInfoSearchResponse(
+            results=results,
+            total_count=total,
+            page=page,
+            page_size=page_size,
+            query={"sido": sido, "sigungu": sigungu},
+        )
+
+    async def get_bulk_waste_info(self, sigungu: str) -> BulkWasteCollectionDTO | None:
+        """대형폐기물 수거 정보 조회 (실시간 클라이언트 위임)."""
+        return await self._client.get_bulk_waste_info(sigungu)
+
+    async def search_bulk_waste_fee(self, sigungu: str, item_name: str) -> list[BulkWasteItemDTO]:
+        """대형폐기물 품목별 수수료 검색 (실시간 클라이언트 위임)."""
+        return await self._client.search_bulk_waste_fee(sigungu, item_name)
+
+    async def prewarm(self) -> None:
+        """내부 클라이언트 연결 선행 수립."""
+        await self._client.prewarm()
+
+    async def close(self) -> None:
+        """리소스 정리."""
+        self._store.close()
+        await self._client.close()
+
+
+class LocalFirstCollectionPointClient(CollectionPointClientPort):
+    """KECO 수거함 스냅샷 우선 클라이언트."""
+
+    def __init__(
+        self,
+        client: CollectionPointClientPort,
+        store: "PublicDataSnapshotStore",
+        max_age: float = DEFAULT_MAX_AGE,
+    ):
+        """초기화.
+
+        Args:
+            client: 실시간 KECO 클라이언트 (fallback)
+            store: 스냅샷 저장소
+            max_age: 스냅샷 신선도 한도 (초)
+        """
+        self._client = client
+        self._store = store
+        self._max_age = max_age
+
+    async def search_collection_points(
+        self,
+        address_keyword: str | None = None,
+        name_keyword: str | None = None,
+        page: int = 1,
+        page_size: int = 10,
+    ) -> CollectionPointSearchResponse:
+        """수거함 위치 검색 (스냅샷 우선)."""
+        state = await _snapshot_state(self._store, DATASET_KECO, self._max_age)
+
+        if state == "fresh":
+            local = await self._search_local(address_keyword, name_keyword, page, page_size)
+            if local is not None and local.results:
+                return local
+
+        live = await self._client.search_collection_points(
+            address_keyword=address_keyword,
+            name_keyword=name_keyword,
+            page=page,
+            page_size=page_size,
+        )
+        if live.results or state != "stale":
+            return live
+
+        logger.warning(
+            "KECO live search empty, serving stale snapshot",
+            extra={"address_keyword": address_keyword, "name_keyword": name_keyword},
+        )
+        return await self._search_local(address_keyword, name_keyword, page, page_size) or live
+
+    async def _search_local(
+        self,
+        address_keyword: str | None,
+        name_keyword: str | None,
+        page: int,
+        page_size: int,
+    ) -> CollectionPointSearchResponse | None:
+        found = await _query_local(
+            self._store.search_collection_points, address_keyword, name_keyword, page, page_size
+        )
+        if found is None:
+            return None
+        results, total = found
+        query: dict[str, str] = {}
+        if address_keyword:
+            query["address"] = address_keyword
+        if name_keyword:
+            query["name"] = name_keyword
+        return CollectionPointSearchResponse(
+            results=results,
+            total_count=total,
+            page=page,
+            page_size=page_size,
+            query=query,
+        )
+
+    async def get_nearby_collection_points(
+        self,
+        lat: float,
+        lon: float,
+        radius_km: float = 2.0,
+        limit: int = 10,
+    ) -> list[CollectionPointDTO]:
+        """주변 수거함 검색 (지오코딩된 스냅샷 좌표 기준).
+
+        스냅샷이 없거나 조회에 실패하면 실시간 클라이언트에 위임합니다
+        (KECO API는 좌표 검색 미지원).
+        """
+        if await _snapshot_state(self._store, DATASET_KECO, self._max_age) != "missing":
+            local = await _query_local(
+                self._store.get_nearby_collection_points, lat, lon, radius_km, limit
+            )
+            if local is not None:
+                return local
+        return await self._client.get_nearby_collection_points(
+            lat=lat, lon=lon, radius_km=radius_km, limit=limit
+        )
+
+    async def prewarm(self) -> None:
+        """내부 클라이언트 연결 선행 수립."""
+        await self._client.prewarm()
+
+    async def close(self) -> None:
+        """리소스 정리."""
+        self._store.close()
+        await self._client.close()
+
+
+__all__ = ["LocalFirstBulkWasteClient", "LocalFirstCollectionPointClient"]
@@ -0,0 +1,519 @@
+"""Public Data Snapshot Store - MOIS/KECO 데이터셋 로컬 SQLite 스냅샷.
+
+공공데이터포털 cond[...::LIKE] 실시간 조회 대신 동기화된 로컬 파일에서 검색합니다.
+데이터셋은 드물게 바뀌므로 주기적 동기화(public_data_syncer)로 충분합니다.
+
+테이블/인덱스:
+- mois_disposal: (sigungu), (sido, sigungu) 인덱스
+- keco_point: (name), (lat, lon) 인덱스 - 좌표는 동기화 시 지오코딩
+- keco_token: (kind, token, point_id) - 주소/상호명 토큰 역색인 (접두 검색)
+- region_cell: (cell_lat, cell_lon) → 시도/시군구 - 오프라인 역지오코딩 격자 색인
+  (지오코딩된 수거함 주소를 0.01° 셀 단위로 다수결 집계, 스냅샷 생성 시 재계산)
+- snapshot_meta: 데이터셋별 동기화 시각/행 수
+
+검색 순서: 토큰 접두 일치 → (없으면) 전체 LIKE 부분 일치 (live API와 같은 의미).
+주변 검색: (lat, lon) 인덱스 bounding box → 하버사인 거리 필터/정렬.
+
+동기화는 새 파일을 만든 뒤 os.replace로 교체하며,
+읽기 측은 파일 변경(mtime/inode)을 감지해 다시 엽니다.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from chat_worker.application.ports.bulk_waste_client import WasteDisposalInfoDTO
+from chat_worker.application.ports.collection_point_client import CollectionPointDTO
+
+logger = logging.getLogger(__name__)
+
+DATASET_MOIS = "mois_disposal"
+DATASET_KECO = "keco_point"
+
+TOKEN_KIND_ADDRESS = "address"
+TOKEN_KIND_NAME = "name"
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_LAT_DEGREE = 111.32
+
+REGION_CELL_DEGREES = 0.01  # 역지오코딩 셀 크기 (약 1km)
+DEFAULT_REGION_RINGS = 3  # 빈 셀일 때 주변 탐색 범위 (셀)
+
+_TOKEN_SPLIT = re.compile(r"[\s,()\[\]/·]+")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshot_meta (
+    dataset TEXT PRIMARY KEY,
+    synced_at REAL NOT NULL,
+    row_count INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS mois_disposal (
+    region_code TEXT,
+    sido TEXT,
+    sigungu TEXT,
+    dong TEXT,
+    disposal_location_type TEXT,
+    general_waste_method TEXT,
+    food_waste_method TEXT,
+    recyclable_schedule TEXT,
+    bulk_waste_method TEXT,
+    management_dept TEXT,
+    contact TEXT,
+    data_date TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_mois_sigungu ON mois_disposal(sigungu);
+CREATE INDEX IF NOT EXISTS idx_mois_sido_sigungu ON mois_disposal(sido, sigungu);
+CREATE TABLE IF NOT EXISTS keco_point (
+    id INTEGER PRIMARY KEY,
+    name TEXT,
+    collection_types TEXT,
+    collection_method TEXT,
+    address TEXT,
+    place_category TEXT,
+    fee TEXT,
+    lat REAL,
+    lon REAL
+);
+CREATE INDEX IF NOT EXISTS idx_keco_name ON keco_point(name);
+CREATE INDEX IF NOT EXISTS idx_keco_lat_lon ON keco_point(lat, lon);
+CREATE TABLE IF NOT EXISTS keco_token (
+    kind TEXT NOT NULL,
+    token TEXT NOT NULL,
+    point_id INTEGER NOT NULL,
+    PRIMARY KEY (kind, token, point_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS region_cell (
+    cell_lat INTEGER NOT NULL,
+    cell_lon INTEGER NOT NULL,
+    sido TEXT NOT NULL,
+    sigungu TEXT,
+    PRIMARY KEY (cell_lat, cell_lon)
+) WITHOUT ROWID;
+"""
+
+_MOIS_COLUMNS = (
+    "region_code",
+    "sido",
+    "sigungu",
+    "dong",
+    "disposal_location_type",
+    "general_waste_method",
+    "food_waste_method",
+    "recyclable_schedule",
+    "bulk_waste_method",
+    "management_dept",
+    "contact",
+    "data_date",
+)
+_KECO_COLUMNS = (
+    "id",
+    "name",
+    "collection_types",
+    "collection_method",
+    "address",
+    "place_category",
+    "fee",
+    "lat",
+    "lon",
+)
+
+
+def tokenize(text: str | None) -> list[str]:
+    """주소/상호명 토큰화 (공백/구두점 기준)."""
+    if not text:
+        return []
+    return [token for token in _TOKEN_SPLIT.split(text.strip()) if token]
+
+
+def parse_admin_region(address: str | None) -> tuple[str, str | None] | None:
+    """주소 앞부분에서 (시도, 시군구) 추출.
+
+    "경기도 수원시 장안구 ..."처럼 구가 있는 시는 "수원시 장안구"로 합칩니다.
+    """
+    tokens = tokenize(address)
+    if not tokens or not tokens[0].endswith(("도", "시")):
+        return None
+    sido = tokens[0]
+    if len(tokens) < 2 or not tokens[1].endswith(("시", "군", "구")):
+        return sido, None
+    sigungu = tokens[1]
+    if sigungu.endswith("시") and len(tokens) > 2 and tokens[2].endswith("구"):
+        sigungu = f"{sigungu} {tokens[2]}"
+    return sido, sigungu
+
+
+def region_cell(lat: float, lon: float) -> tuple[int, int]:
+    """좌표 → 역지오코딩 셀 인덱스."""
+    return math.floor(lat / REGION_CELL_DEGREES), math.floor(lon / REGION_CELL_DEGREES)
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """두 좌표 간 거리 (km)."""
+    p1, p2 = math.radians(lat1), math.radians(lat2)
+    dp = p2 - p1
+    dl = math.radians(lon2 - lon1)
+    a = math.sin(dp / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(dl / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+class SnapshotWriter:
+    """스냅샷 파일 생성기 (동기화 작업 전용)."""
+
+    def __init__(self, path: str):
+        """초기화.
+
+        Args:
+            path: 생성할 SQLite 파일 경로 (기존 파일은 덮어씀)
+        """
+        if os.path.exists(path):
+            os.remove(path)
+        self._conn = sqlite3.connect(path)
+        self._conn.executescript(SCHEMA)
+
+    def write_disposal_info(self, rows: Iterable[WasteDisposalInfoDTO]) -> int:
+        """MOIS 배출정보 저장."""
+        values = [tuple(getattr(row, column) for column in _MOIS_COLUMNS) for row in rows]
+        self._conn.executemany(
+            f"INSERT INTO mois_disposal ({', '.join(_MOIS_COLUMNS)}) "
+            f"VALUES ({', '.join('?' * len(_MOIS_COLUMNS))})",
+            values,
+        )
+        self._mark(DATASET_MOIS, len(values))
+        return len(values)
+
+    def write_collection_points(self, points: Iterable[CollectionPointDTO]) -> int:
+        """KECO 수거함 + 토큰 역색인 저장."""
+        count = 0
+        for point in points:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO keco_point ({', '.join(_KECO_COLUMNS)}) "
+                f"VALUES ({', '.join('?' * len(_KECO_COLUMNS))})",
+                (
+                    point.id,
+                    point.name,
+                    ",".join(point.collection_types),
+                    point.collection_method,
+                    point.address,
+                    point.place_category,
+                    point.fee,
+                    point.lat,
+                    point.lon,
+                ),
+            )
+            tokens = [(TOKEN_KIND_ADDRESS, t, point.id) for t in tokenize(point.address)]
+            tokens += [(TOKEN_KIND_NAME, t, point.id) for t in tokenize(point.name)]
+            self._conn.executemany("INSERT OR IGNORE INTO keco_token VALUES (?, ?, ?)", tokens)
+            count += 1
+        self._mark(DATASET_KECO, count)
+        return count
+
+    def copy_dataset(self, source_path: str, dataset: str) -> int:
+        """기존 스냅샷에서 데이터셋 복사 (동기화 실패 시 이전 데이터 유지)."""
+        self._conn.execute("ATTACH DATABASE ? AS previous", (source_path,))
+        try:
+            tables = [dataset] + (["keco_token"] if dataset == DATASET_KECO else [])
+            for table in tables:
+                self._conn.execute(f"INSERT INTO {table} SELECT * FROM previous.{table}")
+            self._conn.execute(
+                "INSERT OR REPLACE INTO snapshot_meta SELECT * FROM previous.snapshot_meta "
+                "WHERE dataset = ?",
+                (dataset,),
+            )
+            row = self._conn.execute(
+                "SELECT row_count FROM snapshot_meta WHERE dataset = ?", (dataset,)
+            ).fetchone()
+            self._conn.commit()
+        finally:
+            self._conn.execute("DETACH DATABASE previous")
+        return row[0] if row else 0
+
+    def close(self) -> None:
+        """역지오코딩 색인 재계산 + 커밋 + 통계 갱신 후 종료."""
+        self._build_region_index()
+        self._conn.commit()
+        self._conn.execute("ANALYZE")
+        self._conn.close()
+
+    def _build_region_index(self) -> None:
+        """수거함 좌표/주소로 셀별 시도/시군구 다수결 색인 생성."""
+        votes: dict[tuple[int, int], Counter[tuple[str, str | None]]] = {}
+        for address, lat, lon in self._conn.execute(
+            "SELECT address, lat, lon FROM keco_point WHERE lat IS NOT NULL AND lon IS NOT NULL"
+        ):
+            region = parse_admin_region(address)
+            if region is not None:
+                votes.setdefault(region_cell(lat, lon), Counter())[region] += 1
+
+        self._conn.execute("DELETE FROM region_cell")
+        self._conn.executemany(
+            "INSERT INTO region_cell VALUES (?, ?, ?, ?)",
+            [
+                (cell_lat, cell_lon, *counter.most_common(1)[0][0])
+                for (cell_lat, cell_lon), counter in votes.items()
+            ],
+        )
+
+    def _mark(self, dataset: str, row_count: int) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO snapshot_meta VALUES (?, ?, ?)",
+            (dataset, time.time(), row_count),
+        )
+        self._conn.commit()
+
+
+class PublicDataSnapshotStore:
+    """스냅샷 읽기 전용 조회기 (파일 교체 시 자동 재연결)."""
+
+    def __init__(self, path: str):
+        """초기화.
+
+        Args:
+            path: 스냅샷 SQLite 파일 경로
+        """
+        self._path = path
+        self._conn: sqlite3.Connection | None = None
+        self._file_id: tuple[int, int] | None = None
+        self._lock = threading.Lock()
+
+    def synced_at(self, dataset: str) -> float | None:
+        """데이터셋 동기화 시각 (epoch, 없으면 None)."""
+        with self._reading(required=False) as conn:
+            if conn is None:
+                return None
+            row = conn.execute(
+                "SELECT synced_at, row_count FROM snapshot_meta WHERE dataset = ?", (dataset,)
+            ).fetchone()
+            if row is None or row[1] == 0:
+                return None
+            return row[0]
+
+    def search_disposal_info(
+        self,
+        sido: str | None = None,
+        sigungu: str | None = None,
+        page: int = 1,
+        page_size: int = 10,
+    ) -> tuple[list[WasteDisposalInfoDTO], int]:
+        """MOIS 배출정보 검색 (시군구 정확 일치 → 부분 일치).
+
+        Returns:
+            (결과 목록, 전체 결과 수)
+        """
+        with self._reading(required=True) as conn:
+            where, params = [], []
+            if sido:
+                where.append("sido = ?")
+                params.append(sido)
+            if sigungu:
+                exact = conn.execute(
+                    "SELECT 1 FROM mois_disposal WHERE sigungu = ? LIMIT 1", (sigungu,)
+                ).fetchone()
+                where.append("sigungu = ?" if exact else "sigungu LIKE ?")
+                params.append(sigungu if exact else f"%{sigungu}%")
+
+            clause = f"WHERE {' AND '.join(where)}" if where else ""
+            total = conn.execute(f"SELECT COUNT(*) FROM mois_disposal {clause}", params).fetchone()[
+                0
+            ]
+            rows = conn.execute(
+                f"SELECT {', '.join(_MOIS_COLUMNS)} FROM mois_disposal {clause} "
+                "ORDER BY rowid LIMIT ? OFFSET ?",
+                [*params, page_size, (page - 1) * page_size],
+            ).fetchall()
+            return [WasteDisposalInfoDTO(*row) for row in rows], total
+
+    def search_collection_points(
+        self,
+        address_keyword: str | None = None,
+        name_keyword: str | None = None,
+        page: int = 1,
+        page_size: int = 10,
+    ) -> tuple[list[CollectionPointDTO], int]:
+        """KECO 수거함 검색 (토큰 접두 일치 → 부분 일치).
+
+        Returns:
+            (결과 목록, 전체 결과 수)
+        """
+        with self._reading(required=True) as conn:
+            ids: set[int] | None = None
+            for kind, keyword in (
+                (TOKEN_KIND_ADDRESS, address_keyword),
+                (TOKEN_KIND_NAME, name_keyword),
+            ):
+                if not keyword:
+                    continue
+                matched = self._match_tokens(conn, kind, keyword)
+                ids = matched if ids is None else ids & matched
+
+            if ids is None:
+                total = conn.execute("SELECT COUNT(*) FROM keco_point").fetchone()[0]
+                rows = conn.execute(
+                    f"SELECT {', '.join(_KECO_COLUMNS)} FROM keco_point ORDER BY id LIMIT ? OFFSET ?",
+                    (page_size, (page - 1) * page_size),
+                ).fetchall()
+                return [_point(row) for row in rows], total
+
+            page_ids = sorted(ids)[(page - 1) * page_size : page * page_size]
+            rows = conn.execute(
+                f"SELECT {', '.join(_KECO_COLUMNS)} FROM keco_point "
+                f"WHERE id IN ({', '.join('?' * len(page_ids))}) ORDER BY id",
+                page_ids,
+            ).fetchall()
+            return [_point(row) for row in rows], len(ids)
+
+    def get_nearby_collection_points(
+        self,
+        lat: float,
+        lon: float,
+        radius_km: float = 2.0,
+        limit: int = 10,
+    ) -> list[CollectionPointDTO]:
+        """좌표 기반 주변 수거함 (거리순)."""
+        with self._reading(required=True) as conn:
+            dlat = radius_km / KM_PER_LAT_DEGREE
+            dlon = radius_km / (KM_PER_LAT_DEGREE * max(math.cos(math.radians(lat)), 0.01))
+            rows = conn.execute(
+                f"SELECT {', '.join(_KECO_COLUMNS)} FROM keco_point "
+                "WHERE lat BETWEEN ? AND ? AND lon BETWEEN ? AND ?",
+                (lat - dlat, lat + dlat, lon - dlon, lon + dlon),
+            ).fetchall()
+
+            candidates = []
+            for row in rows:
+                distance = haversine_km(lat, lon, row[7], row[8])
+                if distance <= radius_km:
+                    candidates.append((distance, row))
+            candidates.sort(key=lambda item: item[0])
+            return [_point(row) for _, row in candidates[:limit]]
+
+    def reverse_geocode(
+        self,
+        lat: float,
+        lon: float,
+        rings: int = DEFAULT_REGION_RINGS,
+    ) -> tuple[str, str | None] | None:
+        """좌표 → (시도, 시군구) (주변 rings 셀 중 가장 가까운 색인 셀).
+
+        Returns:
+            (시도, 시군구), 주변에 색인 셀이 없으면 None
+        """
+        with self._reading(required=True) as conn:
+            cell_lat, cell_lon = region_cell(lat, lon)
+            try:
+                rows = conn.execute(
+                    "SELECT cell_lat, cell_lon, sido, sigungu FROM region_cell "
+                    "WHERE cell_lat BETWEEN ? AND ? AND cell_lon BETWEEN ? AND ?",
+                    (cell_lat - rings, cell_lat + rings, cell_lon - rings, cell_lon + rings),
+                ).fetchall()
+            except sqlite3.OperationalError:
+                return None  # 색인 도입 이전 스냅샷
+
+            best: tuple[float, tuple[str, str | None]] | None = None
+            for row_lat, row_lon, sido, sigungu in rows:
+                distance = haversine_km(
+                    lat,
+                    lon,
+                    (row_lat + 0.5) * REGION_CELL_DEGREES,
+                    (row_lon + 0.5) * REGION_CELL_DEGREES,
+                )
+                if best is None or distance < best[0]:
+                    best = (distance, (sido, sigungu))
+            return best[1] if best else None
+
+    def close(self) -> None:
+        """연결 종료."""
+        with self._lock:
+            self._close()
+
+    def _close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+            self._file_id = None
+
+    @contextmanager
+    def _reading(self, required: bool) -> Iterator[sqlite3.Connection | None]:
+        """조회 구간 동안 _lock을 잡아 재연결과 읽기가 겹치지 않게 한다."""
+        with self._lock:
+            conn = self._connection()
+            if conn is None and required:
+                raise FileNotFoundError(self._path)
+            yield conn
+
+    def _connection(self) -> sqlite3.Connection | None:
+        """현재 파일 연결 (동기화로 교체되면 재연결, _lock 보유 상태에서 호출)."""
+        try:
+            stat = os.stat(self._path)
+        except FileNotFoundError:
+            self._close()
+            return None
+
+        file_id = (stat.st_ino, stat.st_mtime_ns)
+        if self._conn is None or file_id != self._file_id:
+            self._close()
+            # 읽기 전용 + 스레드 간 공유 (sqlite3 serialized 모드)
+            self._conn = sqlite3.connect(
+                f"file:{self._path}?mode=ro", uri=True, check_same_thread=False
+            )
+            self._file_id = file_id
+            logger.info("Public data snapshot opened", extra={"path": self._path})
+        return self._conn
+
+    @staticmethod
+    def _match_tokens(conn: sqlite3.Connection, kind: str, keyword: str) -> set[int]:
+        """키워드 토큰이 모두 (접두) 일치하는 수거함 ID, 없으면 부분 일치 검색."""
+        matched: set[int] | None = None
+        for token in tokenize(keyword):
+            ids = {
+                row[0]
+                for row in conn.execute(
+                    "SELECT point_id FROM keco_token WHERE kind = ? AND token >= ? AND token < ?",
+                    (kind, token, token + "\U0010ffff"),
+                )
+            }
+            matched = ids if matched is None else matched & ids
+        if matched:
+            return matched
+
+        column = "address" if kind == TOKEN_KIND_ADDRESS else "name"
+        return {
+            row[0]
+            for row in conn.execute(
+                f"SELECT id FROM keco_point WHERE {column} LIKE ?", (f"%{keyword}%",)
+            )
+        }
+
+
+def _point(row: tuple[Any, ...]) -> CollectionPointDTO:
+    return CollectionPointDTO(
+        id=row[0],
+        name=row[1] or "",
+        collection_types=tuple(t for t in (row[2] or "").split(",") if t),
+        collection_method=row[3],
+        address=row[4],
+        place_category=row[5],
+        fee=row[6],
+        lat=row[7],
+        lon=row[8],
+    )
+
+
+__all__ = [
+    "DATASET_KECO",
+    "DATASET_MOIS",
+    "PublicDataSnapshotStore",
+    "SnapshotWriter",
+    "haversine_km",
+    "parse_admin_region",
+    "tokenize",
+]
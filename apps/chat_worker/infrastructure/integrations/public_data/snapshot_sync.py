@@ -0,0 +1,228 @@
+"""Public Data Snapshot Sync - MOIS/KECO 전체 데이터셋 다운로드 → 스냅샷 파일 교체.
+
+동작:
+1. 실시간 클라이언트로 전체 페이지 순회 (MOIS 100건, KECO 1000건 단위)
+2. KECO 주소 지오코딩 (Kakao 키워드 검색 첫 결과)
+   - 이전 스냅샷에 같은 주소 좌표가 있으면 재사용 (Kakao 쿼터 절약)
+3. 임시 파일에 기록 → os.replace로 원자적 교체
+
+페이지가 중간에 비면(실시간 클라이언트는 오류 시 빈 응답 반환) 해당 데이터셋은
+불완전으로 보고 이전 스냅샷의 데이터를 그대로 옮깁니다.
+클라이언트가 설정되지 않은 데이터셋도 이전 스냅샷에서 옮깁니다 (교체로 사라지지 않도록).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import sqlite3
+from dataclasses import replace
+from typing import TYPE_CHECKING
+
+from chat_worker.infrastructure.integrations.public_data.snapshot_store import (
+    DATASET_KECO,
+    DATASET_MOIS,
+    SnapshotWriter,
+)
+
+if TYPE_CHECKING:
+    from chat_worker.application.ports.bulk_waste_client import (
+        BulkWasteClientPort,
+        WasteDisposalInfoDTO,
+    )
+    from chat_worker.application.ports.collection_point_client import (
+        CollectionPointClientPort,
+        CollectionPointDTO,
+    )
+    from chat_worker.application.ports.kakao_local_client import KakaoLocalClientPort
+
+logger = logging.getLogger(__name__)
+
+MOIS_PAGE_SIZE = 100  # API 최대
+KECO_PAGE_SIZE = 1000  # API 최대
+DEFAULT_GEOCODE_CONCURRENCY = 4
+
+
+class IncompleteDatasetError(Exception):
+    """데이터셋 다운로드가 중간에 끊김."""
+
+
+class PublicDataSnapshotSync:
+    """공공데이터 스냅샷 동기화 작업."""
+
+    def __init__(
+        self,
+        bulk_waste_client: "BulkWasteClientPort | None" = None,
+        collection_point_client: "CollectionPointClientPort | None" = None,
+        geocoder: "KakaoLocalClientPort | None" = None,
+        geocode_concurrency: int = DEFAULT_GEOCODE_CONCURRENCY,
+    ):
+        """초기화.
+
+        Args:
+            bulk_waste_client: MOIS 실시간 클라이언트
+            collection_point_client: KECO 실시간 클라이언트
+            geocoder: 주소 → 좌표 (Kakao 로컬, 없으면 좌표 없이 저장)
+            geocode_concurrency: 지오코딩 동시 요청 수
+        """
+        self._bulk_waste_client = bulk_waste_client
+        self._collection_point_client = collection_point_client
+        self._geocoder = geocoder
+        self._geocode_semaphore = asyncio.Semaphore(geocode_concurrency)
+
+    async def run(self, path: str) -> dict[str, int]:
+        """전체 동기화 후 스냅샷 교체.
+
+        Args:
+            path: 스냅샷 파일 경로
+
+        Returns:
+            데이터셋별 저장 행 수
+        """
+        previous = path if os.path.exists(path) else None
+        tmp_path = f"{path}.tmp"
+        writer = SnapshotWriter(tmp_path)
+        counts: dict[str, int] = {}
+
+        try:
+            if self._bulk_waste_client is not None:
+                try:
+                    rows = await self._download_disposal_info()
+                    counts[DATASET_MOIS] = writer.write_disposal_info(rows)
+                except IncompleteDatasetError as e:
+                    counts[DATASET_MOIS] = self._keep_previous(writer, previous, DATASET_MOIS, e)
+            else:
+                counts[DATASET_MOIS] = self._keep_previous(writer, previous, DATASET_MOIS)
+
+            if self._collection_point_client is not None:
+                try:
+                    points = await self._download_collection_points()
+                    points = await self._geocode(points, previous)
+                    counts[DATASET_KECO] = writer.write_collection_points(points)
+                except IncompleteDatasetError as e:
+                    counts[DATASET_KECO] = self._keep_previous(writer, previous, DATASET_KECO, e)
+            else:
+                counts[DATASET_KECO] = self._keep_previous(writer, previous, DATASET_KECO)
+        finally:
+            writer.close()
+
+        os.replace(tmp_path, path)
+        logger.info("Public data snapshot synced", extra={"path": path, **counts})
+        return counts
+
+    async def _download_disposal_info(self) -> list["WasteDisposalInfoDTO"]:
+        assert self._bulk_waste_client is not None
+        rows: list[WasteDisposalInfoDTO] = []
+        page = 1
+        while True:
+            response = await self._bulk_waste_client.search_disposal_info(
+                page=page, page_size=MOIS_PAGE_SIZE
+            )
+            if not response.results:
+                if not rows or len(rows) < response.total_count:
+                    raise IncompleteDatasetError(f"MOIS page {page} empty ({len(rows)} rows)")
+                break
+            rows.extend(response.results)
+            if len(rows) >= response.total_count:
+                break
+            page += 1
+        return rows
+
+    async def _download_collection_points(self) -> list["CollectionPointDTO"]:
+        assert self._collection_point_client is not None
+        points: list[CollectionPointDTO] = []
+        page = 1
+        while True:
+            response = await self._collection_point_client.search_collection_points(
+                page=page, page_size=KECO_PAGE_SIZE
+            )
+            if not response.results:
+                if not points or len(points) < response.total_count:
+                    raise IncompleteDatasetError(f"KECO page {page} empty ({len(points)} rows)")
+                break
+            points.extend(response.results)
+            if len(points) >= response.total_count:
+                break
+            page += 1
+        return points
+
+    async def _geocode(
+        self,
+        points: list["CollectionPointDTO"],
+        previous: str | None,
+    ) -> list["CollectionPointDTO"]:
+        """주소 좌표 채우기 (이전 스냅샷 좌표 우선)."""
+        known = _previous_coordinates(previous) if previous else {}
+
+        async def locate(point: CollectionPointDTO) -> CollectionPointDTO:
+            if not point.address:
+                return point
+            if point.address in known:
+                lat, lon = known[point.address]
+                return replace(point, lat=lat, lon=lon)
+            if self._geocoder is None:
+                return point
+            async with self._geocode_semaphore:
+                try:
+                    response = await self._geocoder.search_keyword(query=point.address, size=1)
+                except Exception as e:
+                    logger.warning(
+                        "Geocoding failed", extra={"address": point.address, "error": str(e)}
+                    )
+                    return point
+            if not response.places:
+                return point
+            place = response.places[0]
+            return replace(point, lat=float(place.y), lon=float(place.x))
+
+        located = await asyncio.gather(*(locate(point) for point in points))
+        logger.info(
+            "KECO geocoding completed",
+            extra={
+                "total": len(located),
+                "reused": sum(1 for p in points if p.address in known),
+                "located": sum(1 for p in located if p.lat is not None),
+            },
+        )
+        return list(located)
+
+    @staticmethod
+    def _keep_previous(
+        writer: SnapshotWriter,
+        previous: str | None,
+        dataset: str,
+        error: Exception | None = None,
+    ) -> int:
+        """이전 스냅샷의 데이터셋을 새 파일로 복사 (error가 None이면 미설정 데이터셋)."""
+        if error is not None:
+            logger.error(
+                "Public data download incomplete, keeping previous snapshot",
+                extra={"dataset": dataset, "error": str(error)},
+            )
+        if previous is None:
+            return 0
+        return writer.copy_dataset(previous, dataset)
+
+
+def _previous_coordinates(path: str) -> dict[str, tuple[float, float]]:
+    """이전 스냅샷의 주소 → 좌표."""
+    try:
+        conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    except sqlite3.Error:
+        return {}
+    try:
+        return {
+            address: (lat, lon)
+            for address, lat, lon in conn.execute(
+                "SELECT address, lat, lon FROM keco_point "
+                "WHERE address IS NOT NULL AND lat IS NOT NULL"
+            )
+        }
+    except sqlite3.Error:
+        return {}
+    finally:
+        conn.close()
+
+
+__all__ = ["IncompleteDatasetError", "PublicDataSnapshotSync"]
@@ -6,5 +6,8 @@
 from chat_worker.infrastructure.integrations.recyclable_price.local_price_client import (
     LocalRecyclablePriceClient,
 )
+from chat_worker.infrastructure.integrations.recyclable_price.price_store import (
+    CompiledPriceStore,
+)
 
-__all__ = ["LocalRecyclablePriceClient"]
+__all__ = ["CompiledPriceStore", "LocalRecyclablePriceClient"]
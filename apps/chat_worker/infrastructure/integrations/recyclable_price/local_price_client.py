@@ -12,37 +12,38 @@ Clean Architecture:
 - 공공데이터포털에서 CSV 다운로드
 - scripts/update_recyclable_prices.py로 YAML 변환
 - CI/CD 또는 수동 업데이트
+- 실행 중 파일 교체 시 reload_interval 주기로 감지해 재컴파일 (재배포 불필요)
 
 API 문서: https://www.data.go.kr/data/3076421/fileData.do
 """
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import time
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
 import yaml
 
 from chat_worker.application.ports.recyclable_price_client import (
-    REGION_NAMES,
     RecyclableCategory,
     RecyclablePriceDTO,
     RecyclablePriceSearchResponse,
     RecyclablePriceTrendDTO,
     RecyclableRegion,
 )
+from chat_worker.infrastructure.integrations.recyclable_price.price_store import (
+    REGION_KEY_NAMES,
+    CompiledPriceStore,
+)
 
 logger = logging.getLogger(__name__)
 
-# Category ID → RecyclableCategory 매핑
-CATEGORY_ID_MAP: dict[str, RecyclableCategory] = {
-    "paper": RecyclableCategory.PAPER,
-    "plastic": RecyclableCategory.PLASTIC,
-    "glass": RecyclableCategory.GLASS,
-    "metal": RecyclableCategory.METAL,
-    "tire": RecyclableCategory.TIRE,
-}
+# 파일 변경 확인 주기 기본값 (초)
+DEFAULT_RELOAD_INTERVAL = 60.0
 
 
 class LocalRecyclablePriceClient:
@@ -53,9 +54,10 @@ class LocalRecyclablePriceClient:
     Features:
     - 로컬 파일 기반 (네트워크 불필요)
     - 동의어 검색 지원 (캔 → 철캔, 알루미늄캔)
-    - 권역별 가격 조회
-    - context 생성 지원 (LLM 프롬프트용)
+    - 권역별 가격 조회 (권역 × 카테고리 뷰 사전 계산, O(1) 조회)
+    - context 생성 지원 (LLM 프롬프트용, 품목 줄 사전 포맷)
     - Lazy loading (첫 호출 시 파일 로드)
+    - 핫 리로드 (mtime 변경 + 체크섬 비교 후 스냅샷 교체, 재배포 불필요)
 
     Usage:
         client = LocalRecyclablePriceClient()
@@ -65,11 +67,15 @@ class LocalRecyclablePriceClient:
     def __init__(
         self,
         data_path: Path | str | None = None,
+        reload_interval: float | None = DEFAULT_RELOAD_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
     ):
         """초기화.
 
         Args:
             data_path: 가격 데이터 YAML 파일 경로 (None이면 기본 에셋)
+            reload_interval: 파일 변경 확인 주기 (초, None이면 리로드 안 함)
+            clock: 변경 확인 주기 판단용 시계 (테스트 주입용)
         """
         if data_path is None:
             # 기본 에셋 경로
@@ -79,158 +85,98 @@ class LocalRecyclablePriceClient:
         else:
             self._data_path = Path(data_path)
 
-        self._raw_data: dict[str, Any] | None = None
-        self._items: list[dict[str, Any]] = []  # 원본 아이템 데이터
-        self._synonym_index: dict[str, list[str]] = {}  # 검색어 → item_id 목록
-        self._item_index: dict[str, dict[str, Any]] = {}  # item_id → 아이템 데이터
-
-    def _load_data(self) -> None:
-        """데이터 로드 (Lazy loading)."""
-        if self._raw_data is not None:
-            return
-
-        if not self._data_path.exists():
-            logger.warning(
-                "Recyclable price data not found: %s",
-                self._data_path,
+        self._reload_interval = reload_interval
+        self._clock = clock
+        self._store: CompiledPriceStore | None = None
+        self._file_id: tuple[int, int, int] | None = None  # (inode, mtime_ns, size)
+        self._checked_at = 0.0
+
+    # ========== 스냅샷 관리 ==========
+
+    def _load_data(self) -> CompiledPriceStore:
+        """현재 스냅샷 (첫 호출 시 로드, 이후 주기적으로 파일 변경 확인)."""
+        store = self._store
+        if store is not None:
+            if self._reload_interval is None:
+                return store
+            if self._clock() - self._checked_at < self._reload_interval:
+                return store
+        self._checked_at = self._clock()
+
+        try:
+            stat = self._data_path.stat()
+        except FileNotFoundError:
+            if store is None:
+                logger.warning(
+                    "Recyclable price data not found: %s",
+                    self._data_path,
+                )
+                store = self._store = CompiledPriceStore.empty()
+            return store
+
+        file_id = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if store is not None and file_id == self._file_id:
+            return store
+
+        try:
+            content = self._data_path.read_bytes()
+            checksum = hashlib.sha256(content).hexdigest()
+            if store is not None and checksum == store.checksum:
+                # touch 등 내용 변화 없는 변경
+                self._file_id = file_id
+                return store
+            compiled = CompiledPriceStore(yaml.safe_load(content) or {}, checksum=checksum)
+        except Exception as e:
+            # 잘못된 파일은 무시하고 이전 스냅샷 유지 (다음 주기에 재시도)
+            logger.error(
+                "Recyclable price data load failed",
+                extra={"path": str(self._data_path), "error": str(e)},
             )
-            self._raw_data = {}
-            return
-
-        with open(self._data_path, encoding="utf-8") as f:
-            self._raw_data = yaml.safe_load(f) or {}
-            logger.info("Recyclable price data loaded: %s", self._data_path)
-
-        # 인덱스 빌드
-        self._build_indices()
-
-    def _build_indices(self) -> None:
-        """검색 인덱스 빌드."""
-        if not self._raw_data:
-            return
-
-        # 카테고리 순회하며 아이템 수집
-        for category in self._raw_data.get("categories", []):
-            category_id = category.get("id", "")
-            category_name = category.get("name", "")
-
-            for item in category.get("items", []):
-                item_id = item.get("id", "")
-                item_name = item.get("name", "")
-                synonyms = item.get("synonyms", [])
-
-                # 아이템 데이터 저장 (카테고리 정보 포함)
-                item_data = {
-                    **item,
-                    "category_id": category_id,
-                    "category_name": category_name,
-                }
-                self._items.append(item_data)
-                self._item_index[item_id] = item_data
-
-                # 이름과 동의어를 인덱스에 추가
-                name_lower = item_name.lower()
-                if name_lower not in self._synonym_index:
-                    self._synonym_index[name_lower] = []
-                self._synonym_index[name_lower].append(item_id)
-
-                for syn in synonyms:
-                    syn_lower = syn.lower()
-                    if syn_lower not in self._synonym_index:
-                        self._synonym_index[syn_lower] = []
-                    if item_id not in self._synonym_index[syn_lower]:
-                        self._synonym_index[syn_lower].append(item_id)
-
-        # YAML의 search_synonyms도 인덱스에 추가
-        for keyword, item_ids in self._raw_data.get("search_synonyms", {}).items():
-            keyword_lower = keyword.lower()
-            if keyword_lower not in self._synonym_index:
-                self._synonym_index[keyword_lower] = []
-            for item_id in item_ids:
-                if item_id not in self._synonym_index[keyword_lower]:
-                    self._synonym_index[keyword_lower].append(item_id)
+            if store is None:
+                store = self._store = CompiledPriceStore.empty()
+            return store
 
+        # 참조 교체만으로 전환 (진행 중인 조회는 이전 스냅샷 사용)
+        self._store = compiled
+        self._file_id = file_id
         logger.info(
-            "Price indices built",
+            "Recyclable price data loaded: %s",
+            self._data_path,
             extra={
-                "items_count": len(self._items),
-                "synonyms_count": len(self._synonym_index),
+                "items_count": len(compiled.items),
+                "synonyms_count": len(compiled.synonym_index),
+                "survey_date": compiled.survey_date,
+                "reloaded": store is not None,
             },
         )
+        return compiled
 
-    def _get_region_key(self, region: RecyclableRegion | None) -> str:
-        """RecyclableRegion → YAML region key 변환."""
-        if region is None:
-            return "nationwide"
-
-        # RecyclableRegion.value → YAML key
-        region_map = {
-            "national": "nationwide",
-            "capital": "capital",
-            "gangwon": "gangwon",
-            "chungbuk": "chungbuk",
-            "chungnam": "chungnam",
-            "jeonbuk": "jeonbuk",
-            "jeonnam": "jeonnam",
-            "gyeongbuk": "gyeongbuk",
-            "gyeongnam": "gyeongnam",
-        }
-        return region_map.get(region.value, "nationwide")
-
-    def _item_to_dto(
-        self,
-        item: dict[str, Any],
-        region: RecyclableRegion | None = None,
-    ) -> RecyclablePriceDTO:
-        """아이템 데이터를 DTO로 변환."""
-        region_key = self._get_region_key(region)
-        prices = item.get("prices", {})
-        price = prices.get(region_key, prices.get("nationwide", 0))
-
-        category_id = item.get("category_id", "")
-        category = CATEGORY_ID_MAP.get(category_id, RecyclableCategory.PLASTIC)
-
-        survey_info = self._raw_data.get("survey_info", {}) if self._raw_data else {}
-
-        return RecyclablePriceDTO(
-            item_code=item.get("id", ""),
-            item_name=item.get("name", ""),
-            category=category,
-            price_per_kg=price,
-            region=region or RecyclableRegion.NATIONAL,
-            survey_date=survey_info.get("date"),
-            form=item.get("form"),
-            note=item.get("note"),
-        )
+    # ========== 조회 ==========
 
     def _search_items(self, query: str) -> list[dict[str, Any]]:
         """검색어로 아이템 검색.
 
         동의어 인덱스를 사용한 빠른 검색.
         """
-        self._load_data()
-
-        query_lower = query.lower().strip()
-        matched_items = []
-        seen_ids = set()
-
-        # 1. 정확 매칭 (인덱스 사용)
-        if query_lower in self._synonym_index:
-            for item_id in self._synonym_index[query_lower]:
-                if item_id in self._item_index and item_id not in seen_ids:
-                    matched_items.append(self._item_index[item_id])
-                    seen_ids.add(item_id)
-
-        # 2. 부분 매칭 (인덱스 키 순회)
-        if not matched_items:
-            for key, item_ids in self._synonym_index.items():
-                if query_lower in key or key in query_lower:
-                    for item_id in item_ids:
-                        if item_id in self._item_index and item_id not in seen_ids:
-                            matched_items.append(self._item_index[item_id])
-                            seen_ids.add(item_id)
-
-        return matched_items
+        store = self._load_data()
+        return [store.item_index[item_id] for item_id in store.search(query)]
+
+    def _response(
+        self,
+        store: CompiledPriceStore,
+        items: tuple[RecyclablePriceDTO, ...] | list[RecyclablePriceDTO],
+        query: str,
+        region: RecyclableRegion,
+        context: str | None,
+    ) -> RecyclablePriceSearchResponse:
+        return RecyclablePriceSearchResponse(
+            items=list(items),
+            query=query,
+            survey_date=store.survey_date,
+            region=region,
+            total_count=len(items),
+            context=context,
+        )
 
     async def search_price(
         self,
@@ -246,28 +192,22 @@ class LocalRecyclablePriceClient:
         Returns:
             RecyclablePriceSearchResponse
         """
-        self._load_data()
+        store = self._load_data()
+        region = region or RecyclableRegion.NATIONAL
 
-        matched = self._search_items(item_name)
-        items = [self._item_to_dto(item, region) for item in matched]
-
-        survey_info = self._raw_data.get("survey_info", {}) if self._raw_data else {}
+        items = [store.dto(item_id, region) for item_id in store.search(item_name)]
 
         logger.info(
             "Recyclable price search completed",
             extra={
                 "query": item_name,
-                "region": region.value if region else "national",
+                "region": region.value,
                 "count": len(items),
             },
         )
 
-        return RecyclablePriceSearchResponse(
-            items=items,
-            query=item_name,
-            survey_date=survey_info.get("date"),
-            region=region or RecyclableRegion.NATIONAL,
-            total_count=len(items),
+        return self._response(
+            store, items, item_name, region, store.render(item_name, region, items)
         )
 
     async def get_category_prices(
@@ -284,38 +224,22 @@ class LocalRecyclablePriceClient:
         Returns:
             RecyclablePriceSearchResponse
         """
-        self._load_data()
+        store = self._load_data()
+        region = region or RecyclableRegion.NATIONAL
 
-        # category.value → category_id 매핑
-        category_id_map = {
-            "paper": "paper",
-            "plastic": "plastic",
-            "glass": "glass",
-            "metal": "metal",
-            "tire": "tire",
-        }
-        target_category_id = category_id_map.get(category.value, "")
-
-        matched = [item for item in self._items if item.get("category_id") == target_category_id]
-        items = [self._item_to_dto(item, region) for item in matched]
-
-        survey_info = self._raw_data.get("survey_info", {}) if self._raw_data else {}
+        items = store.category_view(category, region)
 
         logger.info(
             "Recyclable category prices fetched",
             extra={
                 "category": category.value,
-                "region": region.value if region else "national",
+                "region": region.value,
                 "count": len(items),
             },
         )
 
-        return RecyclablePriceSearchResponse(
-            items=items,
-            query=category.value,
-            survey_date=survey_info.get("date"),
-            region=region or RecyclableRegion.NATIONAL,
-            total_count=len(items),
+        return self._response(
+            store, items, category.value, region, store.view_context(category.value, region)
         )
 
     async def get_all_prices(
@@ -330,26 +254,20 @@ class LocalRecyclablePriceClient:
         Returns:
             RecyclablePriceSearchResponse
         """
-        self._load_data()
+        store = self._load_data()
+        region = region or RecyclableRegion.NATIONAL
 
-        items = [self._item_to_dto(item, region) for item in self._items]
-        survey_info = self._raw_data.get("survey_info", {}) if self._raw_data else {}
+        items = store.all_view(region)
 
         logger.info(
             "All recyclable prices fetched",
             extra={
-                "region": region.value if region else "national",
+                "region": region.value,
                 "count": len(items),
             },
         )
 
-        return RecyclablePriceSearchResponse(
-            items=items,
-            query="all",
-            survey_date=survey_info.get("date"),
-            region=region or RecyclableRegion.NATIONAL,
-            total_count=len(items),
-        )
+        return self._response(store, items, "all", region, store.view_context("all", region))
 
     async def get_price_trend(
         self,
@@ -395,51 +313,19 @@ class LocalRecyclablePriceClient:
         """
         if not response.items:
             return ""
-
-        lines = [
-            f"## 재활용자원 시세 정보 (조사일: {response.survey_date or '미상'})",
-            f"검색어: {response.query}",
-            f"기준 권역: {REGION_NAMES.get(response.region, '전국')}",
-            "",
-        ]
-
-        for item in response.items:
-            form_str = f" ({item.form})" if item.form else ""
-            lines.append(f"- **{item.item_name}{form_str}**: {item.price_per_kg:,}원/kg")
-
-            # 모든 권역 가격 포함
-            if include_all_regions:
-                # 원본 아이템에서 모든 권역 가격 가져오기
-                if item.item_code in self._item_index:
-                    prices = self._item_index[item.item_code].get("prices", {})
-                    region_prices = []
-                    for region_id, price in prices.items():
-                        if region_id != "nationwide":
-                            region_name = self._get_region_name(region_id)
-                            region_prices.append(f"{region_name} {price:,}원")
-                    if region_prices:
-                        lines.append(f"  - 권역별: {', '.join(region_prices)}")
-
-        lines.append("")
-        lines.append("※ 출처: 한국환경공단 재활용가능자원 가격조사")
-        lines.append("※ 가격은 업체별로 상이할 수 있습니다.")
-
-        return "\n".join(lines)
+        if response.context is not None and not include_all_regions:
+            return response.context
+
+        return self._load_data().render(
+            response.query,
+            response.region or RecyclableRegion.NATIONAL,
+            response.items,
+            include_all_regions=include_all_regions,
+        )
 
     def _get_region_name(self, region_id: str) -> str:
         """region_id → 한글 권역명."""
-        names = {
-            "nationwide": "전국",
-            "capital": "수도권",
-            "gangwon": "강원",
-            "chungbuk": "충북",
-            "chungnam": "충남",
-            "jeonbuk": "전북",
-            "jeonnam": "전남",
-            "gyeongbuk": "경북",
-            "gyeongnam": "경남",
-        }
-        return names.get(region_id, region_id)
+        return REGION_KEY_NAMES.get(region_id, region_id)
 
     def get_context_id(self, item_code: str) -> str:
         """아이템 코드로 context_id 생성.
@@ -0,0 +1,249 @@
+"""재활용자원 가격 컴파일 저장소.
+
+YAML 원본을 한 번 파싱해 조회용 뷰를 미리 만들어 둔 불변 스냅샷.
+
+사전 계산:
+- (품목, 권역) → RecyclablePriceDTO
+- (카테고리, 권역) → DTO 튜플, 권역 → 전체 DTO 튜플
+- (품목, 권역) → LLM context 한 줄, 품목 → 권역별 가격 줄
+- 카테고리/전체 뷰의 완성된 context 문자열
+
+스냅샷은 만들어진 뒤 변경하지 않으므로, 핫 리로드는 새 스냅샷을
+만든 뒤 참조만 교체하면 됩니다 (조회 중인 요청은 이전 스냅샷을 그대로 사용).
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from chat_worker.application.ports.recyclable_price_client import (
+    REGION_NAMES,
+    RecyclableCategory,
+    RecyclablePriceDTO,
+    RecyclableRegion,
+)
+
+# Category ID → RecyclableCategory 매핑
+CATEGORY_ID_MAP: dict[str, RecyclableCategory] = {
+    "paper": RecyclableCategory.PAPER,
+    "plastic": RecyclableCategory.PLASTIC,
+    "glass": RecyclableCategory.GLASS,
+    "metal": RecyclableCategory.METAL,
+    "tire": RecyclableCategory.TIRE,
+}
+
+# RecyclableRegion → YAML region key
+REGION_KEYS: dict[RecyclableRegion, str] = {
+    region: ("nationwide" if region is RecyclableRegion.NATIONAL else region.value)
+    for region in RecyclableRegion
+}
+
+# YAML region key → 한글 권역명
+REGION_KEY_NAMES: dict[str, str] = {
+    key: REGION_NAMES[region] for region, key in REGION_KEYS.items()
+}
+
+CONTEXT_FOOTER = (
+    "",
+    "※ 출처: 한국환경공단 재활용가능자원 가격조사",
+    "※ 가격은 업체별로 상이할 수 있습니다.",
+)
+
+# 부분 매칭 결과 메모이즈 상한 (스냅샷별)
+MAX_PARTIAL_QUERIES = 1024
+
+
+def context_header(query: str, region: RecyclableRegion, survey_date: str | None) -> list[str]:
+    """LLM context 머리말."""
+    return [
+        f"## 재활용자원 시세 정보 (조사일: {survey_date or '미상'})",
+        f"검색어: {query}",
+        f"기준 권역: {REGION_NAMES.get(region, '전국')}",
+        "",
+    ]
+
+
+class CompiledPriceStore:
+    """재활용자원 가격 불변 스냅샷.
+
+    모든 조회는 dict 조회 한 번 (부분 매칭은 첫 조회 후 메모이즈).
+    """
+
+    def __init__(self, raw_data: dict[str, Any], checksum: str = ""):
+        """원본 데이터로 뷰 컴파일.
+
+        Args:
+            raw_data: YAML 파싱 결과
+            checksum: 원본 파일 체크섬 (리로드 판단용)
+        """
+        self.raw_data = raw_data
+        self.checksum = checksum
+        self.survey_date: str | None = raw_data.get("survey_info", {}).get("date")
+
+        self.items: list[dict[str, Any]] = []
+        self.item_index: dict[str, dict[str, Any]] = {}
+        self.synonym_index: dict[str, list[str]] = {}
+        self._partial: dict[str, tuple[str, ...]] = {}
+
+        self._dtos: dict[tuple[str, RecyclableRegion], RecyclablePriceDTO] = {}
+        self._lines: dict[tuple[str, RecyclableRegion], str] = {}
+        self._region_lines: dict[str, str] = {}
+        self._category_views: dict[tuple[str, RecyclableRegion], tuple[RecyclablePriceDTO, ...]]
+        self._all_views: dict[RecyclableRegion, tuple[RecyclablePriceDTO, ...]]
+        self._view_contexts: dict[tuple[str, RecyclableRegion], str] = {}
+
+        self._build_indices()
+        self._build_views()
+
+    @classmethod
+    def empty(cls) -> CompiledPriceStore:
+        """데이터 파일이 없을 때 사용하는 빈 스냅샷."""
+        return cls({})
+
+    def _build_indices(self) -> None:
+        """품목/동의어 인덱스 빌드."""
+        for category in self.raw_data.get("categories", []):
+            category_id = category.get("id", "")
+            category_name = category.get("name", "")
+
+            for item in category.get("items", []):
+                item_id = item.get("id", "")
+                # 아이템 데이터 저장 (카테고리 정보 포함)
+                item_data = {
+                    **item,
+                    "category_id": category_id,
+                    "category_name": category_name,
+                }
+                self.items.append(item_data)
+                self.item_index[item_id] = item_data
+
+                # 이름과 동의어를 인덱스에 추가
+                self._add_synonym(item.get("name", ""), item_id)
+                for syn in item.get("synonyms", []):
+                    self._add_synonym(syn, item_id)
+
+        # YAML의 search_synonyms도 인덱스에 추가
+        for keyword, item_ids in self.raw_data.get("search_synonyms", {}).items():
+            for item_id in item_ids:
+                self._add_synonym(keyword, item_id)
+
+    def _add_synonym(self, keyword: str, item_id: str) -> None:
+        item_ids = self.synonym_index.setdefault(keyword.lower(), [])
+        if item_id not in item_ids:
+            item_ids.append(item_id)
+
+    def _build_views(self) -> None:
+        """권역 × 카테고리 DTO 뷰와 context 조각 빌드."""
+        category_views: dict[tuple[str, RecyclableRegion], list[RecyclablePriceDTO]] = {}
+        all_views: dict[RecyclableRegion, list[RecyclablePriceDTO]] = {}
+
+        for item in self.items:
+            item_id = item.get("id", "")
+            prices = item.get("prices", {})
+            category_id = item.get("category_id", "")
+            category = CATEGORY_ID_MAP.get(category_id, RecyclableCategory.PLASTIC)
+            form_str = f" ({item['form']})" if item.get("form") else ""
+
+            for region, region_key in REGION_KEYS.items():
+                dto = RecyclablePriceDTO(
+                    item_code=item_id,
+                    item_name=item.get("name", ""),
+                    category=category,
+                    price_per_kg=prices.get(region_key, prices.get("nationwide", 0)),
+                    region=region,
+                    survey_date=self.survey_date,
+                    form=item.get("form"),
+                    note=item.get("note"),
+                )
+                self._dtos[(item_id, region)] = dto
+                self._lines[(item_id, region)] = (
+                    f"- **{dto.item_name}{form_str}**: {dto.price_per_kg:,}원/kg"
+                )
+                category_views.setdefault((category_id, region), []).append(dto)
+                all_views.setdefault(region, []).append(dto)
+
+            region_prices = [
+                f"{REGION_KEY_NAMES.get(key, key)} {price:,}원"
+                for key, price in prices.items()
+                if key != "nationwide"
+            ]
+            if region_prices:
+                self._region_lines[item_id] = f"  - 권역별: {', '.join(region_prices)}"
+
+        self._category_views = {key: tuple(dtos) for key, dtos in category_views.items()}
+        self._all_views = {key: tuple(dtos) for key, dtos in all_views.items()}
+
+        for (category_id, region), dtos in self._category_views.items():
+            self._view_contexts[(category_id, region)] = self.render(category_id, region, dtos)
+        for region, dtos in self._all_views.items():
+            self._view_contexts[("all", region)] = self.render("all", region, dtos)
+
+    # ========== 조회 ==========
+
+    def search(self, query: str) -> tuple[str, ...]:
+        """검색어 → 매칭 item_id (정확 매칭 우선, 없으면 부분 매칭)."""
+        query_lower = query.lower().strip()
+        exact = self.synonym_index.get(query_lower)
+        if exact:
+            return tuple(item_id for item_id in exact if item_id in self.item_index)
+
+        cached = self._partial.get(query_lower)
+        if cached is not None:
+            return cached
+
+        matched: dict[str, None] = {}
+        for key, item_ids in self.synonym_index.items():
+            if query_lower in key or key in query_lower:
+                for item_id in item_ids:
+                    if item_id in self.item_index:
+                        matched[item_id] = None
+        result = tuple(matched)
+
+        if len(self._partial) >= MAX_PARTIAL_QUERIES:
+            self._partial.clear()
+        self._partial[query_lower] = result
+        return result
+
+    def dto(self, item_id: str, region: RecyclableRegion) -> RecyclablePriceDTO:
+        """(품목, 권역) DTO."""
+        return self._dtos[(item_id, region)]
+
+    def category_view(
+        self, category: RecyclableCategory, region: RecyclableRegion
+    ) -> tuple[RecyclablePriceDTO, ...]:
+        """(카테고리, 권역) DTO 뷰."""
+        return self._category_views.get((category.value, region), ())
+
+    def all_view(self, region: RecyclableRegion) -> tuple[RecyclablePriceDTO, ...]:
+        """권역 전체 DTO 뷰."""
+        return self._all_views.get(region, ())
+
+    def view_context(self, query: str, region: RecyclableRegion) -> str | None:
+        """카테고리(query=category id)/전체(query="all") 뷰의 완성된 context."""
+        return self._view_contexts.get((query, region))
+
+    def render(
+        self,
+        query: str,
+        region: RecyclableRegion,
+        items: tuple[RecyclablePriceDTO, ...] | list[RecyclablePriceDTO],
+        include_all_regions: bool = False,
+    ) -> str:
+        """미리 포맷한 줄을 이어 붙여 LLM context 생성."""
+        if not items:
+            return ""
+
+        lines = context_header(query, region, self.survey_date)
+        for item in items:
+            line = self._lines.get((item.item_code, item.region))
+            if line is None:
+                form_str = f" ({item.form})" if item.form else ""
+                line = f"- **{item.item_name}{form_str}**: {item.price_per_kg:,}원/kg"
+            lines.append(line)
+            if include_all_regions and item.item_code in self._region_lines:
+                lines.append(self._region_lines[item.item_code])
+        lines.extend(CONTEXT_FOOTER)
+        return "\n".join(lines)
+
+
+__all__ = ["CATEGORY_ID_MAP", "CompiledPriceStore", "REGION_KEY_NAMES", "REGION_KEYS"]
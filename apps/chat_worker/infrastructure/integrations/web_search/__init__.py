@@ -3,10 +3,24 @@
 웹 검색 구현체들:
 - DuckDuckGo: 무료, API 키 불필요
 - Tavily: LLM 최적화, 1000 req/월 무료
+- CachedWebSearchClient: 질의 캐시 + stale-while-revalidate 데코레이터
+- BoundedSearchExecutor: 동기 SDK 전용 thread pool
 """
 
+from chat_worker.infrastructure.integrations.web_search.cached_search import (
+    CachedWebSearchClient,
+)
 from chat_worker.infrastructure.integrations.web_search.duckduckgo import (
     DuckDuckGoSearchClient,
 )
+from chat_worker.infrastructure.integrations.web_search.executor import (
+    BoundedSearchExecutor,
+    SearchExecutorSaturated,
+)
 
-__all__ = ["DuckDuckGoSearchClient"]
+__all__ = [
+    "BoundedSearchExecutor",
+    "CachedWebSearchClient",
+    "DuckDuckGoSearchClient",
+    "SearchExecutorSaturated",
+]
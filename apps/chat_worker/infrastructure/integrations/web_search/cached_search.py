@@ -0,0 +1,258 @@
+"""Cached Web Search Client - 정규화 질의 캐시 + stale-while-revalidate (WebSearchPort 데코레이터).
+
+같은 화제성 질의(정책 변경 뉴스 등)가 반복되면 매번 1~3초를 다시 기다리게 됩니다.
+
+캐시 키: (kind, 정규화 질의, max_results, region, time_range)
+- 정규화: NFKC, 소문자, 공백 축약, 끝 문장부호 제거
+
+TTL 계층 (time_range별, fresh / stale 허용):
+- day·news: 10분 / +30분
+- week: 1시간 / +3시간
+- month: 6시간 / +18시간
+- year·all: 24시간 / +72시간
+
+조회:
+- fresh → 그대로 반환 (hit)
+- stale → 그대로 반환 + 백그라운드 갱신 1회 (stale)
+- 없음/만료 → 조회 (miss), 동일 질의 동시 조회는 하나로 합침 (single-flight)
+- 빈 결과(검색 실패 포함)는 캐시하지 않음
+
+계층: L1 프로세스 내 LRU, L2 CachePort (Redis, 선택) - replica 간 공유.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+import time
+import unicodedata
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Literal
+
+from chat_worker.application.ports.web_search import (
+    SearchResult,
+    WebSearchPort,
+    WebSearchResponse,
+)
+from chat_worker.infrastructure.metrics import CHAT_WEB_SEARCH_CACHE
+
+if TYPE_CHECKING:
+    from chat_worker.application.ports.cache import CachePort
+
+logger = logging.getLogger(__name__)
+
+KIND_TEXT = "text"
+KIND_NEWS = "news"
+
+# time_range → (fresh TTL, stale 허용 추가 시간) 초
+TTL_TIERS: dict[str, tuple[float, float]] = {
+    "day": (600, 1800),
+    "week": (3600, 3 * 3600),
+    "month": (6 * 3600, 18 * 3600),
+    "year": (24 * 3600, 72 * 3600),
+    "all": (24 * 3600, 72 * 3600),
+}
+NEWS_TTL = TTL_TIERS["day"]
+
+DEFAULT_MAX_ENTRIES = 1024
+
+_WHITESPACE = re.compile(r"\s+")
+_TRAILING_PUNCT = re.compile(r"[\s?？!！.。~]+$")
+
+
+def normalize_query(query: str) -> str:
+    """캐시 키용 질의 정규화."""
+    text = unicodedata.normalize("NFKC", query).lower()
+    text = _WHITESPACE.sub(" ", text).strip()
+    return _TRAILING_PUNCT.sub("", text)
+
+
+@dataclass
+class _Entry:
+    response: WebSearchResponse
+    stored_at: float
+
+
+class CachedWebSearchClient(WebSearchPort):
+    """질의 캐시 + stale-while-revalidate + single-flight를 적용한 WebSearchPort 래퍼."""
+
+    def __init__(
+        self,
+        client: WebSearchPort,
+        cache: "CachePort | None" = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.time,
+    ):
+        """초기화.
+
+        Args:
+            client: 실제 검색 클라이언트
+            cache: 공유 캐시 (L2, 선택)
+            max_entries: L1 항목 상한
+            clock: 현재 시각 (테스트용)
+        """
+        self._client = client
+        self._cache = cache
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future[WebSearchResponse]] = {}
+        self._refreshing: set[asyncio.Task[WebSearchResponse]] = set()
+
+    async def search(
+        self,
+        query: str,
+        max_results: int = 5,
+        region: str = "kr-kr",
+        time_range: Literal["day", "week", "month", "year", "all"] = "all",
+    ) -> WebSearchResponse:
+        """웹 검색 (캐시 우선)."""
+        key = _cache_key(KIND_TEXT, query, max_results, region, time_range)
+        return await self._get(
+            key,
+            KIND_TEXT,
+            TTL_TIERS.get(time_range, TTL_TIERS["all"]),
+            query,
+            lambda: self._client.search(
+                query=query, max_results=max_results, region=region, time_range=time_range
+            ),
+        )
+
+    async def search_news(
+        self,
+        query: str,
+        max_results: int = 5,
+        region: str = "kr-kr",
+    ) -> WebSearchResponse:
+        """뉴스 검색 (캐시 우선, 짧은 TTL)."""
+        key = _cache_key(KIND_NEWS, query, max_results, region, "news")
+        return await self._get(
+            key,
+            KIND_NEWS,
+            NEWS_TTL,
+            query,
+            lambda: self._client.search_news(query=query, max_results=max_results, region=region),
+        )
+
+    async def _get(
+        self,
+        key: str,
+        kind: str,
+        ttl: tuple[float, float],
+        query: str,
+        fetch: Callable[[], Awaitable[WebSearchResponse]],
+    ) -> WebSearchResponse:
+        fresh_ttl, stale_ttl = ttl
+        entry = self._entries.get(key)
+        if entry is None and self._cache is not None:
+            entry = await self._load_shared(key)
+
+        if entry is not None:
+            age = self._clock() - entry.stored_at
+            if age < fresh_ttl:
+                self._entries.move_to_end(key)
+                CHAT_WEB_SEARCH_CACHE.labels(kind=kind, result="hit").inc()
+                return _for_query(entry.response, query)
+            if age < fresh_ttl + stale_ttl:
+                CHAT_WEB_SEARCH_CACHE.labels(kind=kind, result="stale").inc()
+                self._revalidate(key, fresh_ttl + stale_ttl, fetch)
+                return _for_query(entry.response, query)
+
+        CHAT_WEB_SEARCH_CACHE.labels(kind=kind, result="miss").inc()
+        response = await self._fetch_once(key, fresh_ttl + stale_ttl, fetch)
+        return _for_query(response, query)
+
+    def _revalidate(
+        self,
+        key: str,
+        ttl: float,
+        fetch: Callable[[], Awaitable[WebSearchResponse]],
+    ) -> None:
+        """백그라운드 갱신 (이미 진행 중이면 무시)."""
+        if key in self._inflight:
+            return
+        task = asyncio.create_task(self._fetch_once(key, ttl, fetch))
+        self._refreshing.add(task)
+        task.add_done_callback(self._refreshing.discard)
+
+    async def _fetch_once(
+        self,
+        key: str,
+        ttl: float,
+        fetch: Callable[[], Awaitable[WebSearchResponse]],
+    ) -> WebSearchResponse:
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._fetch(key, ttl, fetch))
+            self._inflight[key] = inflight
+            inflight.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # 호출자 취소가 공유 조회를 취소하지 않도록 shield
+        return await asyncio.shield(inflight)
+
+    async def _fetch(
+        self,
+        key: str,
+        ttl: float,
+        fetch: Callable[[], Awaitable[WebSearchResponse]],
+    ) -> WebSearchResponse:
+        response = await fetch()
+        if not response.results:
+            return response
+
+        stored_at = self._clock()
+        self._remember(key, _Entry(response=response, stored_at=stored_at))
+
+        if self._cache is not None:
+            await self._cache.set_json(
+                key,
+                {"response": asdict(response), "stored_at": stored_at},
+                ttl=int(ttl),
+            )
+        return response
+
+    async def _load_shared(self, key: str) -> _Entry | None:
+        assert self._cache is not None
+        data = await self._cache.get_json(key)
+        if not data:
+            return None
+        raw = data["response"]
+        entry = _Entry(
+            response=WebSearchResponse(
+                query=raw["query"],
+                results=[SearchResult(**result) for result in raw.get("results", [])],
+                total_results=raw.get("total_results", 0),
+                search_engine=raw.get("search_engine", ""),
+            ),
+            stored_at=data["stored_at"],
+        )
+        self._remember(key, entry)
+        return entry
+
+    def _remember(self, key: str, entry: _Entry) -> None:
+        """L1 저장 (max_entries 초과 시 LRU 제거)."""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+
+def _cache_key(kind: str, query: str, max_results: int, region: str, time_range: str) -> str:
+    return f"web_search:{kind}:{region}:{time_range}:{max_results}:{normalize_query(query)}"
+
+
+def _for_query(response: WebSearchResponse, query: str) -> WebSearchResponse:
+    """정규화로 합쳐진 다른 표기 질의에는 원래 질의를 돌려줌."""
+    if response.query == query or normalize_query(response.query) != normalize_query(query):
+        return response
+    return WebSearchResponse(
+        query=query,
+        results=response.results,
+        total_results=response.total_results,
+        search_engine=response.search_engine,
+    )
+
+
+__all__ = ["CachedWebSearchClient", "normalize_query"]
@@ -15,7 +15,6 @@ Usage:
 
 from __future__ import annotations
 
-import asyncio
 import logging
 from typing import Literal
 
@@ -24,6 +23,9 @@ from chat_worker.application.ports.web_search import (
     WebSearchPort,
     WebSearchResponse,
 )
+from chat_worker.infrastructure.integrations.web_search.executor import (
+    BoundedSearchExecutor,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -32,16 +34,18 @@ class DuckDuckGoSearchClient(WebSearchPort):
     """DuckDuckGo 검색 클라이언트.
 
     duckduckgo-search 패키지를 사용한 웹 검색 구현.
-    비동기 컨텍스트에서 동기 API를 thread pool로 실행.
+    비동기 컨텍스트에서 동기 API를 전용 thread pool로 실행.
     """
 
-    def __init__(self, timeout: int = 10):
+    def __init__(self, timeout: int = 10, executor: BoundedSearchExecutor | None = None):
         """초기화.
 
         Args:
             timeout: 검색 타임아웃 (초)
+            executor: 동기 검색 실행용 전용 thread pool (없으면 생성)
         """
         self._timeout = timeout
+        self._executor = executor or BoundedSearchExecutor(name="duckduckgo")
 
     async def search(
         self,
@@ -62,8 +66,8 @@ class DuckDuckGoSearchClient(WebSearchPort):
             WebSearchResponse: 검색 결과
         """
         try:
-            # 동기 함수를 thread pool에서 실행
-            results = await asyncio.to_thread(
+            # 동기 함수를 전용 thread pool에서 실행 (대기열 초과 시 즉시 실패)
+            results = await self._executor.run(
                 self._search_sync,
                 query,
                 max_results,
@@ -97,7 +101,7 @@ class DuckDuckGoSearchClient(WebSearchPort):
             WebSearchResponse: 뉴스 검색 결과
         """
         try:
-            results = await asyncio.to_thread(
+            results = await self._executor.run(
                 self._search_news_sync,
                 query,
                 max_results,
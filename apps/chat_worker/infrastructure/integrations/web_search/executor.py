@@ -0,0 +1,126 @@
+"""Bounded Search Executor - 동기 검색 SDK 전용 스레드 풀.
+
+DuckDuckGo(ddgs)/Tavily SDK는 동기 API라 스레드에서 실행해야 합니다.
+asyncio.to_thread는 기본 executor를 공유하므로 느린 검색이 몰리면
+다른 to_thread 사용처(스냅샷 조회 등)까지 대기하게 됩니다.
+
+- 전용 ThreadPoolExecutor (max_workers)
+- 대기열 상한 (max_queue): 초과 시 SearchExecutorSaturated 즉시 발생 (fail-fast)
+- 대기열 깊이/실행 중 수 Gauge, 거부 Counter 기록
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from chat_worker.infrastructure.metrics import (
+    CHAT_WEB_SEARCH_EXECUTOR_REJECTED,
+    CHAT_WEB_SEARCH_EXECUTOR_TASKS,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_MAX_QUEUE = 32
+
+
+class SearchExecutorSaturated(Exception):
+    """검색 executor 대기열 초과."""
+
+
+class BoundedSearchExecutor:
+    """대기열 상한이 있는 검색 전용 스레드 풀."""
+
+    def __init__(
+        self,
+        name: str = "web_search",
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+    ):
+        """초기화.
+
+        Args:
+            name: executor 이름 (메트릭 라벨, 스레드 이름)
+            max_workers: 스레드 수
+            max_queue: 실행 대기 상한 (실행 중 제외)
+        """
+        self._name = name
+        self._max_queue = max_queue
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        self._queued = 0
+        self._active = 0
+        self._lock = threading.Lock()
+
+    @property
+    def queued(self) -> int:
+        """실행 대기 중 작업 수."""
+        return self._queued
+
+    @property
+    def active(self) -> int:
+        """실행 중 작업 수."""
+        return self._active
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """동기 함수를 전용 스레드에서 실행.
+
+        Raises:
+            SearchExecutorSaturated: 대기열 상한 초과
+        """
+        with self._lock:
+            if self._queued >= self._max_queue:
+                CHAT_WEB_SEARCH_EXECUTOR_REJECTED.labels(executor=self._name).inc()
+                raise SearchExecutorSaturated(
+                    f"{self._name} executor saturated (queued={self._queued})"
+                )
+            self._queued += 1
+            self._publish()
+
+        # abandoned: 시작 전에 호출자가 떠남 / started: 스레드가 작업을 시작함
+        state = {"abandoned": False, "started": False}
+
+        def call() -> T:
+            # 카운터는 스레드에서 갱신: 호출자가 취소돼도 실제 실행이 끝날 때까지 active 유지
+            with self._lock:
+                if state["abandoned"]:
+                    raise asyncio.CancelledError
+                state["started"] = True
+                self._queued -= 1
+                self._active += 1
+                self._publish()
+            try:
+                return fn(*args)
+            finally:
+                with self._lock:
+                    self._active -= 1
+                    self._publish()
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._pool, call)
+        finally:
+            with self._lock:
+                if not state["started"]:
+                    # 대기 중 취소/거부: 스레드는 이 작업을 건너뜀
+                    state["abandoned"] = True
+                    self._queued -= 1
+                    self._publish()
+
+    def shutdown(self) -> None:
+        """스레드 풀 종료 (실행 중 작업은 완료까지 대기하지 않음)."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _publish(self) -> None:
+        """Gauge 갱신 (_lock 보유 상태에서 호출)."""
+        tasks = CHAT_WEB_SEARCH_EXECUTOR_TASKS
+        tasks.labels(executor=self._name, state="queued").set(self._queued)
+        tasks.labels(executor=self._name, state="active").set(self._active)
+
+
+__all__ = ["BoundedSearchExecutor", "SearchExecutorSaturated"]
@@ -18,7 +18,6 @@ Usage:
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import os
 from typing import Literal
@@ -28,6 +27,9 @@ from chat_worker.application.ports.web_search import (
     WebSearchPort,
     WebSearchResponse,
 )
+from chat_worker.infrastructure.integrations.web_search.executor import (
+    BoundedSearchExecutor,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -39,13 +41,19 @@ class TavilySearchClient(WebSearchPort):
     결과에 요약 및 관련성 점수 포함.
     """
 
-    def __init__(self, api_key: str | None = None):
+    def __init__(
+        self,
+        api_key: str | None = None,
+        executor: BoundedSearchExecutor | None = None,
+    ):
         """초기화.
 
         Args:
             api_key: Tavily API 키 (없으면 환경변수에서 로드)
+            executor: 동기 SDK 실행용 전용 thread pool (없으면 생성)
         """
         self._api_key = api_key or os.getenv("TAVILY_API_KEY")
+        self._executor = executor or BoundedSearchExecutor(name="tavily")
         if not self._api_key:
             logger.warning("TAVILY_API_KEY not set, Tavily search will fail")
 
@@ -77,7 +85,7 @@ class TavilySearchClient(WebSearchPort):
             )
 
         try:
-            results = await asyncio.to_thread(
+            results = await self._executor.run(
                 self._search_sync,
                 query,
                 max_results,
@@ -12,7 +12,10 @@ Token Streaming:
 """
 
 from chat_worker.infrastructure.llm.clients import (
+    AdmissionControlledLLMClient,
     GeminiLLMClient,
+    HedgedLLMClient,
+    HedgingPolicy,
     LangChainLLMAdapter,
     LangChainOpenAIRunnable,
     OpenAILLMClient,
@@ -25,6 +28,9 @@ __all__ = [
     "OpenAILLMClient",
     "LangChainOpenAIRunnable",
     "LangChainLLMAdapter",
+    "AdmissionControlledLLMClient",
+    "HedgedLLMClient",
+    "HedgingPolicy",
     "DefaultLLMPolicy",
     "LLMFeedbackEvaluator",
 ]
@@ -4,6 +4,8 @@
 - GeminiLLMClient: Google Gemini 클라이언트
 - LangChainOpenAIRunnable: LangChain Runnable 기반 OpenAI 클라이언트
 - LangChainLLMAdapter: LangChain Runnable을 LLMClientPort로 래핑
+- AdmissionControlledLLMClient: 클러스터 공유 예산/AIMD 동시성 승인 래퍼 (opt-in)
+- HedgedLLMClient: 구조화 호출 hedging 래퍼 (opt-in, tail latency 완화)
 
 Token Streaming 아키텍처:
 - LangGraph stream_mode="messages"로 토큰 캡처
@@ -11,7 +13,14 @@ Token Streaming 아키텍처:
 - answer_node에서 사용 시 토큰이 SSE로 전달됨
 """
 
+from chat_worker.infrastructure.llm.clients.admission_client import (
+    AdmissionControlledLLMClient,
+)
 from chat_worker.infrastructure.llm.clients.gemini_client import GeminiLLMClient
+from chat_worker.infrastructure.llm.clients.hedged_client import (
+    HedgedLLMClient,
+    HedgingPolicy,
+)
 from chat_worker.infrastructure.llm.clients.langchain_adapter import (
     LangChainLLMAdapter,
 )
@@ -25,4 +34,7 @@ __all__ = [
     "GeminiLLMClient",
     "LangChainOpenAIRunnable",
     "LangChainLLMAdapter",
+    "AdmissionControlledLLMClient",
+    "HedgedLLMClient",
+    "HedgingPolicy",
 ]
@@ -0,0 +1,162 @@
+"""Admission Controlled LLM Client - LLM 호출 전 클러스터 예산/동시성 승인.
+
+모든 LLMClientPort 호출을 LLMAdmissionController.admit()으로 감쌉니다.
+
+우선순위:
+- 호출 시점의 LangGraph 노드(runnable config metadata "langgraph_node")로 결정
+- LLM_NODE_PRIORITY(answer/intent 등 LLM 주 소비 노드) → NODE_PRIORITY → NORMAL
+- 그래프 밖 호출(평가기, 배치 등)은 NORMAL
+
+스트리밍 호출(generate_stream/generate_with_tools)은 스트림 종료까지 슬롯을 점유하며,
+지연은 AIMD 증가 판단에 쓰지 않습니다 (출력 길이에 비례하므로).
+answer_node의 LangChain astream 경로는 admit()을 직접 사용합니다.
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from contextlib import AbstractAsyncContextManager
+from typing import Any, TypeVar
+
+from langchain_core.runnables.config import var_child_runnable_config
+from pydantic import BaseModel
+
+from chat_worker.application.ports.llm import LLMClientPort
+from chat_worker.infrastructure.orchestration.langgraph.priority import (
+    Priority,
+    get_node_priority,
+)
+from chat_worker.infrastructure.ratelimit.llm_admission import LLMAdmissionController
+
+T = TypeVar("T", bound=BaseModel)
+
+# NODE_PRIORITY는 서브에이전트(컨텍스트 생산자) 기준이므로
+# LLM을 직접 호출하는 파이프라인 노드 우선순위를 보강
+LLM_NODE_PRIORITY: dict[str, Priority] = {
+    "answer": Priority.CRITICAL,
+    "intent": Priority.CRITICAL,
+    "vision": Priority.CRITICAL,
+    "feedback": Priority.LOW,
+    "summarize": Priority.BACKGROUND,
+}
+
+
+def current_llm_priority() -> Priority:
+    """현재 실행 중인 LangGraph 노드 기준 LLM 호출 우선순위."""
+    config = var_child_runnable_config.get() or {}
+    node = (config.get("metadata") or {}).get("langgraph_node")
+    if not node:
+        return Priority.NORMAL
+    if node in LLM_NODE_PRIORITY:
+        return LLM_NODE_PRIORITY[node]
+    return get_node_priority(node)
+
+
+class AdmissionControlledLLMClient(LLMClientPort):
+    """LLMAdmissionController를 거쳐 호출하는 LLMClientPort 래퍼."""
+
+    def __init__(self, client: LLMClientPort, controller: LLMAdmissionController):
+        """초기화.
+
+        Args:
+            client: 실제 LLM 클라이언트
+            controller: 승인 제어기 (provider 단위 공유)
+        """
+        self._client = client
+        self._controller = controller
+
+    def __getattr__(self, name: str) -> Any:
+        # get_langchain_llm 등 구현체 전용 속성은 그대로 위임
+        return getattr(self._client, name)
+
+    async def prewarm(self) -> None:
+        """내부 클라이언트 연결 선행 수립."""
+        await self._client.prewarm()
+
+    def admit(self, measure_latency: bool = False) -> AbstractAsyncContextManager[None]:
+        """포트 밖 직접 호출(LangChain astream 등)용 승인 컨텍스트."""
+        return self._controller.admit(current_llm_priority(), measure_latency=measure_latency)
+
+    async def generate(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        context: dict[str, Any] | None = None,
+        max_tokens: int | None = None,
+        temperature: float | None = None,
+    ) -> str:
+        """텍스트 생성."""
+        async with self._controller.admit(current_llm_priority()):
+            return await self._client.generate(
+                prompt=prompt,
+                system_prompt=system_prompt,
+                context=context,
+                max_tokens=max_tokens,
+                temperature=temperature,
+            )
+
+    async def generate_stream(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        context: dict[str, Any] | None = None,
+    ) -> AsyncIterator[str]:
+        """스트리밍 텍스트 생성 (스트림 종료까지 슬롯 점유)."""
+        async with self._controller.admit(current_llm_priority(), measure_latency=False):
+            async for chunk in self._client.generate_stream(
+                prompt=prompt,
+                system_prompt=system_prompt,
+                context=context,
+            ):
+                yield chunk
+
+    async def generate_structured(
+        self,
+        prompt: str,
+        response_schema: type[T],
+        system_prompt: str | None = None,
+        max_tokens: int | None = None,
+        temperature: float | None = None,
+    ) -> T:
+        """구조화된 응답 생성."""
+        async with self._controller.admit(current_llm_priority()):
+            return await self._client.generate_structured(
+                prompt=prompt,
+                response_schema=response_schema,
+                system_prompt=system_prompt,
+                max_tokens=max_tokens,
+                temperature=temperature,
+            )
+
+    async def generate_with_tools(
+        self,
+        prompt: str,
+        tools: list[str],
+        system_prompt: str | None = None,
+        context: dict[str, Any] | None = None,
+    ) -> AsyncIterator[str]:
+        """네이티브 도구 스트리밍 생성 (스트림 종료까지 슬롯 점유)."""
+        async with self._controller.admit(current_llm_priority(), measure_latency=False):
+            async for chunk in self._client.generate_with_tools(
+                prompt=prompt,
+                tools=tools,
+                system_prompt=system_prompt,
+                context=context,
+            ):
+                yield chunk
+
+    async def generate_function_call(
+        self,
+        prompt: str,
+        functions: list[dict[str, Any]],
+        system_prompt: str | None = None,
+        function_call: str | dict[str, str] = "auto",
+    ) -> tuple[str | None, dict[str, Any] | None]:
+        """Function Calling."""
+        async with self._controller.admit(current_llm_priority()):
+            return await self._client.generate_function_call(
+                prompt=prompt,
+                functions=functions,
+                system_prompt=system_prompt,
+                function_call=function_call,
+            )
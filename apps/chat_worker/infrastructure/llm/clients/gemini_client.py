@@ -32,6 +32,7 @@ from pydantic import BaseModel
 from chat_worker.application.ports.llm import LLMClientPort
 from chat_worker.infrastructure.llm.config import MODEL_CONTEXT_WINDOWS
 from chat_worker.infrastructure.telemetry import (
+    extract_cached_tokens,
     is_langsmith_enabled,
     track_token_usage,
 )
@@ -67,6 +68,10 @@ class GeminiLLMClient(LLMClientPort):
         self._max_context = MODEL_CONTEXT_WINDOWS.get(model, 1_000_000)
         logger.info("GeminiLLMClient initialized", extra={"model": model})
 
+    async def prewarm(self) -> None:
+        """SDK 커넥션 풀에 연결 하나를 선행 수립 (models.list)."""
+        await self._client.aio.models.list(config={"page_size": 1})
+
     async def generate(
         self,
         prompt: str,
@@ -111,6 +116,7 @@ class GeminiLLMClient(LLMClientPort):
                         model=self._model,
                         input_tokens=response.usage_metadata.prompt_token_count,
                         output_tokens=response.usage_metadata.candidates_token_count,
+                        cached_tokens=extract_cached_tokens(response.usage_metadata),
                     )
             except Exception as e:
                 logger.debug("Failed to track token usage: %s", e)
@@ -163,6 +169,7 @@ class GeminiLLMClient(LLMClientPort):
                         model=self._model,
                         input_tokens=last_usage.prompt_token_count or 0,
                         output_tokens=last_usage.candidates_token_count or 0,
+                        cached_tokens=extract_cached_tokens(last_usage),
                     )
             except ImportError:
                 pass
@@ -226,6 +233,7 @@ class GeminiLLMClient(LLMClientPort):
                             model=self._model,
                             input_tokens=last_usage.prompt_token_count or 0,
                             output_tokens=last_usage.candidates_token_count or 0,
+                            cached_tokens=extract_cached_tokens(last_usage),
                         )
                 except ImportError:
                     pass
@@ -314,6 +322,7 @@ class GeminiLLMClient(LLMClientPort):
                         model=self._model,
                         input_tokens=response.usage_metadata.prompt_token_count or 0,
                         output_tokens=response.usage_metadata.candidates_token_count or 0,
+                        cached_tokens=extract_cached_tokens(response.usage_metadata),
                     )
             except ImportError:
                 pass
@@ -383,6 +392,7 @@ class GeminiLLMClient(LLMClientPort):
                             model=self._model,
                             input_tokens=response.usage_metadata.prompt_token_count or 0,
                             output_tokens=response.usage_metadata.candidates_token_count or 0,
+                            cached_tokens=extract_cached_tokens(response.usage_metadata),
                         )
                 except ImportError:
                     pass
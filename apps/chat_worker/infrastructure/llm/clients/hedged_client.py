@@ -0,0 +1,340 @@
+"""Hedged LLM Client - 지연 민감 구조화 호출의 tail latency 완화.
+
+Intent 분류(generate_structured)는 매 턴 파이프라인을 막고,
+p99는 provider tail latency가 좌우합니다.
+
+Hedging (opt-in, LLMClientPort 래퍼):
+1. primary 호출 시작
+2. 호출 종류(스키마)별 p95 지연을 deadline으로 사용
+   - 표본이 부족하면 initial_delay, [min_delay, max_delay]로 clamp
+3. deadline까지 응답이 없거나 primary가 먼저 실패하면 hedge 요청 발행
+   (같은 클라이언트 또는 대체 provider/model)
+4. 먼저 성공한 응답 채택, 나머지는 취소
+5. 예산 상한:
+   - hedge_budget_ratio: 전체 호출 대비 hedge 비율 상한 (token bucket)
+   - max_call_seconds: 호출 1회당 총 대기 상한 (초과 시 TimeoutError)
+
+구조화 호출 외 메서드(generate/generate_stream/...)와 기타 속성
+(get_langchain_llm 등)은 primary에 그대로 위임합니다.
+
+메트릭:
+- chat_llm_hedge_calls_total{call, outcome=primary_only|hedged|budget_exhausted}
+- chat_llm_hedge_wins_total{call, source=primary|hedge}
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+
+from chat_worker.application.ports.llm import LLMClientPort
+from chat_worker.infrastructure.metrics import (
+    CHAT_LLM_HEDGE_CALLS,
+    CHAT_LLM_HEDGE_WINS,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T", bound=BaseModel)
+
+# deadline 기본값
+DEFAULT_HEDGE_INITIAL_DELAY = 1.5  # 표본 부족 시 (초)
+DEFAULT_HEDGE_MIN_DELAY = 0.25
+DEFAULT_HEDGE_MAX_DELAY = 4.0
+DEFAULT_HEDGE_QUANTILE = 0.95
+
+# 예산
+DEFAULT_HEDGE_BUDGET_RATIO = 0.1  # 호출의 최대 10%까지 hedge
+DEFAULT_HEDGE_BUDGET_BURST = 5.0  # 순간적으로 허용되는 hedge 수
+DEFAULT_MAX_CALL_SECONDS = 20.0
+
+# 지연 표본
+LATENCY_WINDOW = 200
+MIN_LATENCY_SAMPLES = 20
+
+
+class HedgingPolicy:
+    """Hedge deadline/예산 관리 + 경합 실행."""
+
+    def __init__(
+        self,
+        initial_delay: float = DEFAULT_HEDGE_INITIAL_DELAY,
+        min_delay: float = DEFAULT_HEDGE_MIN_DELAY,
+        max_delay: float = DEFAULT_HEDGE_MAX_DELAY,
+        quantile: float = DEFAULT_HEDGE_QUANTILE,
+        budget_ratio: float = DEFAULT_HEDGE_BUDGET_RATIO,
+        budget_burst: float = DEFAULT_HEDGE_BUDGET_BURST,
+        max_call_seconds: float | None = DEFAULT_MAX_CALL_SECONDS,
+    ):
+        """초기화.
+
+        Args:
+            initial_delay: 지연 표본이 부족할 때 hedge deadline (초)
+            min_delay: deadline 하한 (초)
+            max_delay: deadline 상한 (초)
+            quantile: deadline으로 사용할 지연 분위수
+            budget_ratio: 호출 1회당 적립되는 hedge 예산 (= 최대 hedge 비율)
+            budget_burst: hedge 예산 최대 적립량
+            max_call_seconds: 호출 1회 총 대기 상한 (None이면 제한 없음)
+        """
+        self._initial_delay = initial_delay
+        self._min_delay = min_delay
+        self._max_delay = max_delay
+        self._quantile = quantile
+        self._budget_ratio = budget_ratio
+        self._budget_burst = budget_burst
+        self._budget = budget_burst
+        self._max_call_seconds = max_call_seconds
+        self._latencies: dict[str, deque[float]] = {}
+
+    def deadline(self, call: str) -> float:
+        """호출 종류별 hedge deadline (primary p95)."""
+        samples = self._latencies.get(call)
+        if not samples or len(samples) < MIN_LATENCY_SAMPLES:
+            delay = self._initial_delay
+        else:
+            ordered = sorted(samples)
+            index = min(len(ordered) - 1, math.ceil(self._quantile * len(ordered)) - 1)
+            delay = ordered[index]
+        return min(self._max_delay, max(self._min_delay, delay))
+
+    def observe(self, call: str, latency: float) -> None:
+        """primary 지연 표본 기록."""
+        self._latencies.setdefault(call, deque(maxlen=LATENCY_WINDOW)).append(latency)
+
+    def _accrue_budget(self) -> None:
+        self._budget = min(self._budget_burst, self._budget + self._budget_ratio)
+
+    def _try_spend_budget(self) -> bool:
+        if self._budget >= 1.0:
+            self._budget -= 1.0
+            return True
+        return False
+
+    async def run(
+        self,
+        call: str,
+        primary: Callable[[], Awaitable[Any]],
+        hedge: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """primary 실행, deadline 초과/실패 시 hedge와 경합.
+
+        Args:
+            call: 호출 종류 (지연 분포/메트릭 라벨)
+            primary: primary 요청 생성 함수
+            hedge: hedge 요청 생성 함수
+
+        Returns:
+            먼저 성공한 응답
+
+        Raises:
+            asyncio.TimeoutError: max_call_seconds 초과
+            Exception: 모든 요청 실패 시 primary 예외
+        """
+        self._accrue_budget()
+        started = time.monotonic()
+        primary_task = asyncio.ensure_future(primary())
+        tasks: dict[asyncio.Future, str] = {primary_task: "primary"}
+
+        try:
+            done, _ = await asyncio.wait({primary_task}, timeout=self._remaining(started, call))
+            if primary_task in done and primary_task.exception() is None:
+                self.observe(call, time.monotonic() - started)
+                _record_hedge(call, "primary_only", winner="primary")
+                return primary_task.result()
+
+            if not self._try_spend_budget():
+                _record_hedge(call, "budget_exhausted")
+                result = await self._await_within_budget(primary_task, started)
+                self.observe(call, time.monotonic() - started)
+                _record_hedge(call, None, winner="primary")
+                return result
+
+            logger.info(
+                "LLM call hedged",
+                extra={
+                    "call": call,
+                    "elapsed": round(time.monotonic() - started, 3),
+                    "primary_failed": primary_task.done(),
+                },
+            )
+            _record_hedge(call, "hedged")
+            tasks[asyncio.ensure_future(hedge())] = "hedge"
+            return await self._race(call, tasks, started)
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def _race(self, call: str, tasks: dict[asyncio.Future, str], started: float) -> Any:
+        """먼저 성공한 응답 채택 (실패한 쪽은 무시하고 나머지를 기다림)."""
+        errors: dict[str, BaseException] = {}
+        pending = set(tasks)
+        while pending:
+            timeout = None
+            if self._max_call_seconds is not None:
+                timeout = max(0.0, self._max_call_seconds - (time.monotonic() - started))
+            done, pending = await asyncio.wait(
+                pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+            if not done:
+                raise asyncio.TimeoutError(f"Hedged LLM call '{call}' exceeded budget")
+            for task in done:
+                source = tasks[task]
+                if task.exception() is None:
+                    # hedge가 이겼으면 primary는 최소 이만큼 걸림 (하한 표본으로 기록해
+                    # 취소된 느린 응답이 p95에서 빠지지 않도록 함)
+                    self.observe(call, time.monotonic() - started)
+                    _record_hedge(call, None, winner=source)
+                    return task.result()
+                errors[source] = task.exception()
+                logger.warning(
+                    "Hedged LLM request failed",
+                    extra={"call": call, "source": source, "error": str(task.exception())},
+                )
+        raise errors.get("primary") or errors["hedge"]
+
+    async def _await_within_budget(self, task: asyncio.Future, started: float) -> Any:
+        if self._max_call_seconds is None:
+            return await task
+        remaining = max(0.0, self._max_call_seconds - (time.monotonic() - started))
+        return await asyncio.wait_for(task, timeout=remaining)
+
+    def _remaining(self, started: float, call: str) -> float:
+        deadline = self.deadline(call)
+        if self._max_call_seconds is None:
+            return deadline
+        return min(deadline, max(0.0, self._max_call_seconds - (time.monotonic() - started)))
+
+
+class HedgedLLMClient(LLMClientPort):
+    """generate_structured에 hedging을 적용하는 LLMClientPort 래퍼."""
+
+    def __init__(
+        self,
+        primary: LLMClientPort,
+        hedge: LLMClientPort | None = None,
+        policy: HedgingPolicy | None = None,
+    ):
+        """초기화.
+
+        Args:
+            primary: 기본 LLM 클라이언트
+            hedge: hedge 요청용 클라이언트 (None이면 primary로 재요청)
+            policy: hedge deadline/예산 정책
+        """
+        self._primary = primary
+        self._hedge = hedge or primary
+        self._policy = policy or HedgingPolicy()
+
+    def __getattr__(self, name: str) -> Any:
+        # get_langchain_llm 등 구현체 전용 속성은 primary에 위임
+        return getattr(self._primary, name)
+
+    async def prewarm(self) -> None:
+        """primary/hedge 클라이언트 연결 선행 수립."""
+        await self._primary.prewarm()
+        if self._hedge is not self._primary:
+            await self._hedge.prewarm()
+
+    async def generate(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        context: dict[str, Any] | None = None,
+        max_tokens: int | None = None,
+        temperature: float | None = None,
+    ) -> str:
+        """텍스트 생성 (primary 위임)."""
+        return await self._primary.generate(
+            prompt=prompt,
+            system_prompt=system_prompt,
+            context=context,
+            max_tokens=max_tokens,
+            temperature=temperature,
+        )
+
+    async def generate_stream(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        context: dict[str, Any] | None = None,
+    ) -> AsyncIterator[str]:
+        """스트리밍 텍스트 생성 (primary 위임)."""
+        async for chunk in self._primary.generate_stream(
+            prompt=prompt,
+            system_prompt=system_prompt,
+            context=context,
+        ):
+            yield chunk
+
+    async def generate_structured(
+        self,
+        prompt: str,
+        response_schema: type[T],
+        system_prompt: str | None = None,
+        max_tokens: int | None = None,
+        temperature: float | None = None,
+    ) -> T:
+        """구조화된 응답 생성 (hedging 적용)."""
+
+        def request(client: LLMClientPort) -> Callable[[], Awaitable[T]]:
+            return lambda: client.generate_structured(
+                prompt=prompt,
+                response_schema=response_schema,
+                system_prompt=system_prompt,
+                max_tokens=max_tokens,
+                temperature=temperature,
+            )
+
+        return await self._policy.run(
+            response_schema.__name__,
+            request(self._primary),
+            request(self._hedge),
+        )
+
+    async def generate_with_tools(
+        self,
+        prompt: str,
+        tools: list[str],
+        system_prompt: str | None = None,
+        context: dict[str, Any] | None = None,
+    ) -> AsyncIterator[str]:
+        """네이티브 도구 스트리밍 생성 (primary 위임)."""
+        async for chunk in self._primary.generate_with_tools(
+            prompt=prompt,
+            tools=tools,
+            system_prompt=system_prompt,
+            context=context,
+        ):
+            yield chunk
+
+    async def generate_function_call(
+        self,
+        prompt: str,
+        functions: list[dict[str, Any]],
+        system_prompt: str | None = None,
+        function_call: str | dict[str, str] = "auto",
+    ) -> tuple[str | None, dict[str, Any] | None]:
+        """Function Calling (primary 위임)."""
+        return await self._primary.generate_function_call(
+            prompt=prompt,
+            functions=functions,
+            system_prompt=system_prompt,
+            function_call=function_call,
+        )
+
+
+def _record_hedge(call: str, outcome: str | None, winner: str | None = None) -> None:
+    """Prometheus 메트릭 기록."""
+    if outcome is not None:
+        CHAT_LLM_HEDGE_CALLS.labels(call=call, outcome=outcome).inc()
+    if winner is not None:
+        CHAT_LLM_HEDGE_WINS.labels(call=call, source=winner).inc()
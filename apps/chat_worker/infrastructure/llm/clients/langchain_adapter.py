@@ -44,6 +44,7 @@ from pydantic import BaseModel
 
 from chat_worker.application.ports.llm import LLMClientPort
 from chat_worker.infrastructure.telemetry.langsmith import (
+    extract_cached_tokens,
     is_langsmith_enabled,
     track_token_usage,
 )
@@ -354,6 +355,7 @@ class LangChainLLMAdapter(LLMClientPort):
         # 토큰 사용량 누적 (여러 response가 있을 수 있음)
         total_input_tokens = 0
         total_output_tokens = 0
+        total_cached_tokens = 0
 
         async for event in result.stream_events():
             if (
@@ -371,6 +373,7 @@ class LangChainLLMAdapter(LLMClientPort):
                 usage = event.data.response.usage
                 total_input_tokens += usage.input_tokens
                 total_output_tokens += usage.output_tokens
+                total_cached_tokens += extract_cached_tokens(usage)
 
         # 스트리밍 완료 후 LangSmith에 토큰 사용량 보고
         if total_input_tokens > 0 or total_output_tokens > 0:
@@ -385,6 +388,7 @@ class LangChainLLMAdapter(LLMClientPort):
                             model=model_name,
                             input_tokens=total_input_tokens,
                             output_tokens=total_output_tokens,
+                            cached_tokens=total_cached_tokens,
                         )
                         logger.debug(
                             "Agents SDK token usage tracked",
@@ -434,6 +438,7 @@ class LangChainLLMAdapter(LLMClientPort):
             # 토큰 사용량 캡처용
             total_input_tokens = 0
             total_output_tokens = 0
+            total_cached_tokens = 0
 
             async for event in response:
                 if hasattr(event, "type") and event.type == "response.output_text.delta":
@@ -449,6 +454,7 @@ class LangChainLLMAdapter(LLMClientPort):
                     usage = event.response.usage
                     total_input_tokens += usage.input_tokens
                     total_output_tokens += usage.output_tokens
+                    total_cached_tokens += extract_cached_tokens(usage)
 
             # 스트리밍 완료 후 LangSmith에 토큰 사용량 보고
             if total_input_tokens > 0 or total_output_tokens > 0:
@@ -463,6 +469,7 @@ class LangChainLLMAdapter(LLMClientPort):
                                 model=model_name,
                                 input_tokens=total_input_tokens,
                                 output_tokens=total_output_tokens,
+                                cached_tokens=total_cached_tokens,
                             )
                             logger.debug(
                                 "Responses API token usage tracked",
@@ -551,6 +558,7 @@ class LangChainLLMAdapter(LLMClientPort):
                                 model=model,
                                 input_tokens=response.usage.prompt_tokens,
                                 output_tokens=response.usage.completion_tokens,
+                                cached_tokens=extract_cached_tokens(response.usage),
                             )
                             logger.debug(
                                 "Function call token usage tracked",
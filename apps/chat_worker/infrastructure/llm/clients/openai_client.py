@@ -40,6 +40,7 @@ from chat_worker.infrastructure.llm.config import (
     MAX_RETRIES,
 )
 from chat_worker.infrastructure.telemetry import (
+    extract_cached_tokens,
     is_langsmith_enabled,
     track_token_usage,
 )
@@ -81,6 +82,10 @@ class OpenAILLMClient(LLMClientPort):
         self._model = model
         logger.info("OpenAILLMClient initialized", extra={"model": model})
 
+    async def prewarm(self) -> None:
+        """SDK 커넥션 풀에 연결 하나를 선행 수립 (models.list)."""
+        await self._client.models.list()
+
     async def generate(
         self,
         prompt: str,
@@ -125,6 +130,7 @@ class OpenAILLMClient(LLMClientPort):
                         model=self._model,
                         input_tokens=response.usage.prompt_tokens,
                         output_tokens=response.usage.completion_tokens,
+                        cached_tokens=extract_cached_tokens(response.usage),
                     )
             except Exception as e:
                 logger.debug("Failed to track token usage: %s", e)
@@ -153,11 +159,33 @@ class OpenAILLMClient(LLMClientPort):
             model=self._model,
             messages=messages,
             stream=True,
+            # 마지막 청크에 usage 포함 (prefix 캐시 히트율 추적)
+            stream_options={"include_usage": True},
         )
 
+        last_usage = None
         async for chunk in stream:
             if chunk.choices and chunk.choices[0].delta.content:
                 yield chunk.choices[0].delta.content
+            if getattr(chunk, "usage", None):
+                last_usage = chunk.usage
+
+        # 스트리밍 완료 후 LangSmith에 토큰 사용량 보고
+        if is_langsmith_enabled() and last_usage:
+            try:
+                from langsmith.run_helpers import get_current_run_tree
+
+                run_tree = get_current_run_tree()
+                if run_tree:
+                    track_token_usage(
+                        run_tree=run_tree,
+                        model=self._model,
+                        input_tokens=last_usage.prompt_tokens or 0,
+                        output_tokens=last_usage.completion_tokens or 0,
+                        cached_tokens=extract_cached_tokens(last_usage),
+                    )
+            except Exception as e:
+                logger.debug("Failed to track token usage: %s", e)
 
     async def generate_structured(
         self,
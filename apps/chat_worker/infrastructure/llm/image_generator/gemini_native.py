@@ -22,6 +22,7 @@ import base64
 import io
 import logging
 import os
+from typing import TYPE_CHECKING
 
 import httpx
 from google import genai
@@ -40,6 +41,9 @@ from chat_worker.infrastructure.telemetry import (
     track_token_usage,
 )
 
+if TYPE_CHECKING:
+    from chat_worker.infrastructure.assets.reference_image_cache import ReferenceImageCache
+
 logger = logging.getLogger(__name__)
 
 # Gemini 모델별 참조 이미지 제한
@@ -93,12 +97,14 @@ class GeminiNativeImageGenerator(ImageGeneratorPort):
         self,
         model: str = "gemini-3-pro-image-preview",
         api_key: str | None = None,
+        reference_cache: "ReferenceImageCache | None" = None,
     ):
         """초기화.
 
         Args:
             model: Gemini 이미지 모델 (기본 gemini-3-pro-image-preview)
             api_key: API 키 (None이면 환경변수 GOOGLE_API_KEY)
+            reference_cache: 참조 이미지 캐시 (None이면 매번 URL에서 다운로드)
 
         Raises:
             ValueError: API 키가 없는 경우
@@ -113,6 +119,7 @@ class GeminiNativeImageGenerator(ImageGeneratorPort):
         self._client = genai.Client(api_key=self._api_key)
         self._max_reference = MODEL_REFERENCE_LIMITS.get(model, 3)
         self._http_client: httpx.AsyncClient | None = None
+        self._reference_cache = reference_cache
 
     async def _get_http_client(self) -> httpx.AsyncClient:
         """HTTP 클라이언트 가져오기 (lazy initialization)."""
@@ -133,6 +140,8 @@ class GeminiNativeImageGenerator(ImageGeneratorPort):
             ImageGenerationError: 이미지 다운로드 실패 시
         """
         try:
+            if self._reference_cache is not None:
+                return await self._reference_cache.get(url)
             client = await self._get_http_client()
             response = await client.get(url)
             response.raise_for_status()
@@ -71,6 +71,10 @@ class GeminiVisionClient(VisionModelPort):
             logger.warning("Vision prompt not found, using default")
             return "이 이미지의 폐기물을 분류해주세요."
 
+    async def prewarm(self) -> None:
+        """SDK 커넥션 풀에 연결 하나를 선행 수립 (models.list)."""
+        await self._client.aio.models.list(config={"page_size": 1})
+
     async def _fetch_image_bytes(self, image_url: str) -> tuple[bytes, str]:
         """이미지 다운로드.
 
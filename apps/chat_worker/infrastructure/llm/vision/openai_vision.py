@@ -7,6 +7,7 @@ Clean Architecture:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 from typing import Any
@@ -62,6 +63,10 @@ class OpenAIVisionClient(VisionModelPort):
             logger.warning("Vision prompt not found, using default")
             return "이 이미지의 폐기물을 분류해주세요."
 
+    async def prewarm(self) -> None:
+        """SDK 커넥션 풀에 연결 하나를 선행 수립 (동기 SDK이므로 스레드에서 models.list)."""
+        await asyncio.to_thread(self._client.models.list)
+
     async def analyze_image(
         self,
         image_url: str,
@@ -7,9 +7,39 @@ from chat_worker.infrastructure.metrics.metrics import (
     CHAT_ERRORS_TOTAL,
     CHAT_ACTIVE_JOBS,
     CHAT_INTENT_DISTRIBUTION,
+    CHAT_INTENT_CLASSIFICATION_DURATION,
+    CHAT_INTENT_SEMANTIC_CACHE_LOOKUPS,
+    CHAT_INTENT_SEMANTIC_CACHE_SIMILARITY,
+    CHAT_INTENT_SEMANTIC_CACHE_AUDITS,
+    CHAT_INTENT_SEMANTIC_CACHE_SAVED_SECONDS,
     CHAT_VISION_REQUESTS,
+    CHAT_SPECULATIVE_PREFETCH_TOTAL,
+    CHAT_SPECULATIVE_PREFETCH_SAVED_SECONDS,
     CHAT_SUBAGENT_CALLS,
+    CHAT_LLM_HEDGE_CALLS,
+    CHAT_LLM_HEDGE_WINS,
+    CHAT_LLM_ADMISSION_WAIT,
+    CHAT_LLM_ADMISSION_LIMIT,
+    CHAT_LLM_ADMISSION_EVENTS,
+    CHAT_CIRCUIT_BREAKER_TRANSITIONS,
     CHAT_TOKEN_USAGE,
+    CHAT_ANSWER_CACHE_LOOKUPS,
+    CHAT_ANSWER_CACHE_SAVED_TOKENS,
+    CHAT_ANSWER_CACHE_SAVED_SECONDS,
+    CHAT_FEEDBACK_EVALUATIONS,
+    CHAT_FEEDBACK_SCORE,
+    CHAT_FEEDBACK_EVALUATION_DURATION,
+    CHAT_WEB_SEARCH_CACHE,
+    CHAT_WEB_SEARCH_EXECUTOR_TASKS,
+    CHAT_WEB_SEARCH_EXECUTOR_REJECTED,
+    CHAT_REFERENCE_IMAGE_CACHE,
+    CHAT_REFERENCE_IMAGE_CACHE_BYTES,
+    CHAT_GEO_RESOLUTIONS,
+    CHAT_AGENT_TOOL_CALLS,
+    # Startup / Warmup metrics
+    CHAT_WORKER_STARTUP_PHASE_SECONDS,
+    CHAT_WORKER_STARTUP_PHASE_FAILURES,
+    CHAT_WORKER_WARM,
     # Checkpoint metrics (Read-Through)
     CHAT_CHECKPOINT_PROMOTES_TOTAL,
     CHAT_CHECKPOINT_COLD_MISSES_TOTAL,
@@ -23,6 +53,9 @@ from chat_worker.infrastructure.metrics.metrics import (
     CHAT_STREAM_TOKEN_COUNT,
     CHAT_STREAM_RECOVERY_TOTAL,
     CHAT_STREAM_ACTIVE,
+    CHAT_STREAM_WRITER_LAG,
+    CHAT_STREAM_WRITER_QUEUE_DEPTH,
+    CHAT_STREAM_WRITER_BATCH_SIZE,
     # Helper functions
     track_request,
     track_intent,
@@ -47,9 +80,39 @@ __all__ = [
     "CHAT_ERRORS_TOTAL",
     "CHAT_ACTIVE_JOBS",
     "CHAT_INTENT_DISTRIBUTION",
+    "CHAT_INTENT_CLASSIFICATION_DURATION",
+    "CHAT_INTENT_SEMANTIC_CACHE_LOOKUPS",
+    "CHAT_INTENT_SEMANTIC_CACHE_SIMILARITY",
+    "CHAT_INTENT_SEMANTIC_CACHE_AUDITS",
+    "CHAT_INTENT_SEMANTIC_CACHE_SAVED_SECONDS",
     "CHAT_VISION_REQUESTS",
+    "CHAT_SPECULATIVE_PREFETCH_TOTAL",
+    "CHAT_SPECULATIVE_PREFETCH_SAVED_SECONDS",
     "CHAT_SUBAGENT_CALLS",
+    "CHAT_LLM_HEDGE_CALLS",
+    "CHAT_LLM_HEDGE_WINS",
+    "CHAT_LLM_ADMISSION_WAIT",
+    "CHAT_LLM_ADMISSION_LIMIT",
+    "CHAT_LLM_ADMISSION_EVENTS",
+    "CHAT_CIRCUIT_BREAKER_TRANSITIONS",
     "CHAT_TOKEN_USAGE",
+    "CHAT_ANSWER_CACHE_LOOKUPS",
+    "CHAT_ANSWER_CACHE_SAVED_TOKENS",
+    "CHAT_ANSWER_CACHE_SAVED_SECONDS",
+    "CHAT_FEEDBACK_EVALUATIONS",
+    "CHAT_FEEDBACK_SCORE",
+    "CHAT_FEEDBACK_EVALUATION_DURATION",
+    "CHAT_WEB_SEARCH_CACHE",
+    "CHAT_WEB_SEARCH_EXECUTOR_TASKS",
+    "CHAT_WEB_SEARCH_EXECUTOR_REJECTED",
+    "CHAT_REFERENCE_IMAGE_CACHE",
+    "CHAT_REFERENCE_IMAGE_CACHE_BYTES",
+    "CHAT_GEO_RESOLUTIONS",
+    "CHAT_AGENT_TOOL_CALLS",
+    # Startup / Warmup metrics
+    "CHAT_WORKER_STARTUP_PHASE_SECONDS",
+    "CHAT_WORKER_STARTUP_PHASE_FAILURES",
+    "CHAT_WORKER_WARM",
     # Checkpoint metrics (Read-Through)
     "CHAT_CHECKPOINT_PROMOTES_TOTAL",
     "CHAT_CHECKPOINT_COLD_MISSES_TOTAL",
@@ -63,6 +126,9 @@ __all__ = [
     "CHAT_STREAM_TOKEN_COUNT",
     "CHAT_STREAM_RECOVERY_TOTAL",
     "CHAT_STREAM_ACTIVE",
+    "CHAT_STREAM_WRITER_LAG",
+    "CHAT_STREAM_WRITER_QUEUE_DEPTH",
+    "CHAT_STREAM_WRITER_BATCH_SIZE",
     # Helper functions
     "track_request",
     "track_intent",
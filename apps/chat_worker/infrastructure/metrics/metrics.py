@@ -82,6 +82,55 @@ CHAT_INTENT_DISTRIBUTION = Counter(
     ["intent"],
 )
 
+# Intent 분류 종단 지연 (감지 + 분해 + 쿼리별 분류, 쿼리 수별)
+CHAT_INTENT_CLASSIFICATION_DURATION = Histogram(
+    "chat_intent_classification_duration_seconds",
+    "End-to-end intent classification latency by decomposed query count",
+    ["query_count"],  # 1, 2, 3, 4+
+    buckets=[0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0],
+)
+
+# Semantic Intent Cache (정규화 + MinHash 근사 중복)
+CHAT_INTENT_SEMANTIC_CACHE_LOOKUPS = Counter(
+    "chat_intent_semantic_cache_lookups_total",
+    "Semantic intent cache lookups",
+    ["result"],  # exact, near, miss
+)
+
+CHAT_INTENT_SEMANTIC_CACHE_SIMILARITY = Histogram(
+    "chat_intent_semantic_cache_hit_similarity",
+    "Jaccard similarity of semantic intent cache hits",
+    buckets=[0.7, 0.75, 0.8, 0.85, 0.9, 0.95, 1.0],
+)
+
+CHAT_INTENT_SEMANTIC_CACHE_AUDITS = Counter(
+    "chat_intent_semantic_cache_audits_total",
+    "Sampled semantic intent cache hits re-classified by LLM",
+    ["outcome"],  # match, mismatch
+)
+
+CHAT_INTENT_SEMANTIC_CACHE_SAVED_SECONDS = Counter(
+    "chat_intent_semantic_cache_saved_llm_seconds_total",
+    "Estimated LLM latency saved by semantic intent cache hits (EWMA per hit)",
+)
+
+# ============================================================
+# Speculative Prefetch Metrics (intent 분류 중 서브에이전트 선행 조회)
+# ============================================================
+
+CHAT_SPECULATIVE_PREFETCH_TOTAL = Counter(
+    "chat_speculative_prefetch_total",
+    "Speculative subagent prefetch outcomes",
+    ["node", "outcome"],  # outcome: hit, wasted, unpredicted, error
+)
+
+CHAT_SPECULATIVE_PREFETCH_SAVED_SECONDS = Histogram(
+    "chat_speculative_prefetch_saved_seconds",
+    "Subagent latency removed from the critical path (time-to-first-token saved)",
+    ["node"],
+    buckets=[0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5],
+)
+
 # ============================================================
 # Vision Metrics
 # ============================================================
@@ -116,6 +165,45 @@ CHAT_SUBAGENT_DURATION = Histogram(
     buckets=[0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0],
 )
 
+# ============================================================
+# LLM Hedging Metrics
+# ============================================================
+
+CHAT_LLM_HEDGE_CALLS = Counter(
+    "chat_llm_hedge_calls_total",
+    "Hedging decisions for latency-critical structured LLM calls",
+    ["call", "outcome"],  # outcome: primary_only, hedged, budget_exhausted
+)
+
+CHAT_LLM_HEDGE_WINS = Counter(
+    "chat_llm_hedge_wins_total",
+    "Which request won a (possibly hedged) structured LLM call",
+    ["call", "source"],  # source: primary, hedge
+)
+
+# ============================================================
+# LLM Admission Metrics (클러스터 공유 예산 + AIMD 동시성)
+# ============================================================
+
+CHAT_LLM_ADMISSION_WAIT = Histogram(
+    "chat_llm_admission_wait_seconds",
+    "Time an LLM call waited for a concurrency slot and shared budget permit",
+    ["priority"],
+    buckets=[0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0],
+)
+
+CHAT_LLM_ADMISSION_LIMIT = Gauge(
+    "chat_llm_admission_limit",
+    "Current AIMD concurrency limit for LLM calls in this process",
+    ["scope"],
+)
+
+CHAT_LLM_ADMISSION_EVENTS = Counter(
+    "chat_llm_admission_events_total",
+    "LLM admission control events",
+    ["scope", "event"],  # event: throttled, budget_timeout, redis_error
+)
+
 # ============================================================
 # Token Usage Metrics
 # ============================================================
@@ -126,6 +214,128 @@ CHAT_TOKEN_USAGE = Counter(
     ["provider", "type"],  # type: input, output
 )
 
+# Answer 캐시 (intent + 정규화 메시지 + 컨텍스트 해시 + 프롬프트 버전)
+CHAT_ANSWER_CACHE_LOOKUPS = Counter(
+    "chat_answer_cache_lookups_total",
+    "Answer cache lookups for cacheable requests",
+    ["intent", "result"],  # result: hit, miss, error
+)
+
+CHAT_ANSWER_CACHE_SAVED_TOKENS = Counter(
+    "chat_answer_cache_saved_tokens_total",
+    "Estimated output tokens not generated thanks to answer cache hits",
+    ["intent"],
+)
+
+CHAT_ANSWER_CACHE_SAVED_SECONDS = Histogram(
+    "chat_answer_cache_saved_seconds",
+    "Generation latency avoided per answer cache hit (original LLM time - replay time)",
+    ["intent"],
+    buckets=[0.1, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 16.0],
+)
+
+# ============================================================
+# RAG Feedback Evaluation Metrics
+# ============================================================
+
+# evaluator: rule, fast, llm / mode: inline, deferred
+CHAT_FEEDBACK_EVALUATIONS = Counter(
+    "chat_feedback_evaluations_total",
+    "RAG feedback evaluations by evaluator and resulting quality",
+    ["mode", "evaluator", "quality"],
+)
+
+CHAT_FEEDBACK_SCORE = Histogram(
+    "chat_feedback_score",
+    "RAG feedback quality score",
+    ["mode", "evaluator"],
+    buckets=[0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0],
+)
+
+CHAT_FEEDBACK_EVALUATION_DURATION = Histogram(
+    "chat_feedback_evaluation_duration_seconds",
+    "RAG feedback evaluation latency",
+    ["mode", "evaluator"],
+    buckets=[0.001, 0.01, 0.1, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0],
+)
+
+# ============================================================
+# Web Search Metrics
+# ============================================================
+
+# result: hit, stale, miss
+CHAT_WEB_SEARCH_CACHE = Counter(
+    "chat_web_search_cache_total",
+    "Web search cache lookups by result",
+    ["kind", "result"],
+)
+
+CHAT_WEB_SEARCH_EXECUTOR_TASKS = Gauge(
+    "chat_web_search_executor_tasks",
+    "Web search executor tasks by state (queued = waiting for a thread)",
+    ["executor", "state"],
+)
+
+CHAT_WEB_SEARCH_EXECUTOR_REJECTED = Counter(
+    "chat_web_search_executor_rejected_total",
+    "Web search calls rejected because the executor queue was full",
+    ["executor"],
+)
+
+CHAT_REFERENCE_IMAGE_CACHE = Counter(
+    "chat_reference_image_cache_total",
+    "Reference image cache lookups by result (hit, disk, revalidated, miss, stale)",
+    ["result"],
+)
+
+CHAT_REFERENCE_IMAGE_CACHE_BYTES = Gauge(
+    "chat_reference_image_cache_bytes",
+    "Bytes held in the in-process reference image cache",
+)
+
+CHAT_GEO_RESOLUTIONS = Counter(
+    "chat_geo_resolutions_total",
+    "Coordinate resolutions by result (l1, l2, offline, kakao, unresolved, error)",
+    ["result"],
+)
+
+CHAT_AGENT_TOOL_CALLS = Counter(
+    "chat_agent_tool_calls_total",
+    "Agent node tool calls by outcome (executed, deduped)",
+    ["tool", "outcome"],
+)
+
+# ============================================================
+# Startup / Warmup Metrics
+# ============================================================
+
+CHAT_WORKER_STARTUP_PHASE_SECONDS = Gauge(
+    "chat_worker_startup_phase_seconds",
+    "Worker warmup duration by phase (prompts, assets, graph, connections, dry_run, total)",
+    ["phase"],
+)
+
+CHAT_WORKER_STARTUP_PHASE_FAILURES = Counter(
+    "chat_worker_startup_phase_failures_total",
+    "Worker warmup phase failures",
+    ["phase"],
+)
+
+CHAT_WORKER_WARM = Gauge(
+    "chat_worker_warm",
+    "Whether this worker process is warm (0 if graph compilation failed or warmup timed out)",
+)
+
+# ============================================================
+# Circuit Breaker Metrics
+# ============================================================
+
+CHAT_CIRCUIT_BREAKER_TRANSITIONS = Counter(
+    "chat_circuit_breaker_transitions_total",
+    "Circuit breaker state transitions (source: local detection or peer replica)",
+    ["name", "state", "source"],  # state: open, closed / source: local, remote
+)
+
 # ============================================================
 # Checkpoint Metrics (Read-Through)
 # ============================================================
@@ -209,6 +419,30 @@ CHAT_STREAM_ACTIVE = Gauge(
     "Number of active token streams",
 )
 
+# 비동기 토큰 발행기: LLM 수신 → Redis 발행까지 지연 (배치 내 가장 오래된 토큰 기준)
+CHAT_STREAM_WRITER_LAG = Histogram(
+    "chat_stream_writer_lag_seconds",
+    "Delay between receiving a token from the LLM and publishing it",
+    ["node"],
+    buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0],
+)
+
+# 비동기 토큰 발행기: 스트림당 최대 큐 깊이
+CHAT_STREAM_WRITER_QUEUE_DEPTH = Histogram(
+    "chat_stream_writer_max_queue_depth",
+    "Maximum token channel depth per stream",
+    ["node"],
+    buckets=[1, 2, 5, 10, 25, 50, 100, 250],
+)
+
+# 비동기 토큰 발행기: 발행 1회당 병합된 토큰 수
+CHAT_STREAM_WRITER_BATCH_SIZE = Histogram(
+    "chat_stream_writer_batch_size",
+    "Number of LLM chunks coalesced into one published token event",
+    ["node"],
+    buckets=[1, 2, 4, 8, 16, 32, 64],
+)
+
 # ============================================================
 # Helper Functions
 # ============================================================
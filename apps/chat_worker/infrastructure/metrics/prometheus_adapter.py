@@ -13,10 +13,17 @@ import logging
 
 from chat_worker.application.ports.metrics import MetricsPort
 from chat_worker.infrastructure.metrics.metrics import (
+    CHAT_ANSWER_CACHE_LOOKUPS,
+    CHAT_ANSWER_CACHE_SAVED_SECONDS,
+    CHAT_ANSWER_CACHE_SAVED_TOKENS,
+    CHAT_FEEDBACK_EVALUATIONS,
+    CHAT_FEEDBACK_EVALUATION_DURATION,
+    CHAT_FEEDBACK_SCORE,
     CHAT_REQUESTS_TOTAL,
     CHAT_REQUEST_DURATION,
     CHAT_ERRORS_TOTAL,
     CHAT_INTENT_DISTRIBUTION,
+    CHAT_INTENT_CLASSIFICATION_DURATION,
     CHAT_SUBAGENT_CALLS,
     CHAT_SUBAGENT_DURATION,
 )
@@ -101,6 +108,58 @@ class PrometheusMetricsAdapter(MetricsPort):
         """
         logger.debug("cache_miss", extra={"cache_type": cache_type})
 
+    def track_intent_latency(self, query_count: int, duration: float) -> None:
+        """Intent 분류 종단 지연 기록 (쿼리 수 4 이상은 "4+")."""
+        try:
+            label = str(query_count) if query_count < 4 else "4+"
+            CHAT_INTENT_CLASSIFICATION_DURATION.labels(query_count=label).observe(duration)
+        except Exception as e:
+            logger.warning(
+                "metrics_track_intent_latency_failed",
+                extra={"query_count": query_count, "error": str(e)},
+            )
+
+    def track_answer_cache(
+        self,
+        intent: str,
+        result: str,
+        saved_tokens: int = 0,
+        saved_seconds: float | None = None,
+    ) -> None:
+        """Answer 캐시 히트율/절감 토큰/절감 지연 기록."""
+        try:
+            CHAT_ANSWER_CACHE_LOOKUPS.labels(intent=intent, result=result).inc()
+            if saved_tokens > 0:
+                CHAT_ANSWER_CACHE_SAVED_TOKENS.labels(intent=intent).inc(saved_tokens)
+            if saved_seconds is not None:
+                CHAT_ANSWER_CACHE_SAVED_SECONDS.labels(intent=intent).observe(saved_seconds)
+        except Exception as e:
+            logger.warning(
+                "metrics_track_answer_cache_failed",
+                extra={"intent": intent, "result": result, "error": str(e)},
+            )
+
+    def track_feedback_evaluation(
+        self,
+        mode: str,
+        evaluator: str,
+        quality: str,
+        score: float,
+        duration: float,
+    ) -> None:
+        """RAG 품질 평가 점수/등급/지연 기록."""
+        try:
+            CHAT_FEEDBACK_EVALUATIONS.labels(mode=mode, evaluator=evaluator, quality=quality).inc()
+            CHAT_FEEDBACK_SCORE.labels(mode=mode, evaluator=evaluator).observe(score)
+            CHAT_FEEDBACK_EVALUATION_DURATION.labels(mode=mode, evaluator=evaluator).observe(
+                duration
+            )
+        except Exception as e:
+            logger.warning(
+                "metrics_track_feedback_evaluation_failed",
+                extra={"evaluator": evaluator, "error": str(e)},
+            )
+
     def track_subagent_call(
         self,
         subagent: str,
@@ -84,6 +84,9 @@ from typing import TYPE_CHECKING, Any
 
 from langgraph.graph import END, StateGraph
 
+from chat_worker.application.services.deferred_feedback_evaluator import (
+    DeferredFeedbackEvaluator,
+)
 from chat_worker.infrastructure.orchestration.langgraph.nodes import (
     create_aggregator_node,
     create_answer_node,
@@ -107,6 +110,9 @@ from chat_worker.infrastructure.orchestration.langgraph.nodes.kakao_place_node i
     create_kakao_place_node,
 )
 from chat_worker.infrastructure.orchestration.langgraph.state import ChatState
+from chat_worker.infrastructure.orchestration.langgraph.speculation import (
+    SpeculativePrefetcher,
+)
 from chat_worker.infrastructure.orchestration.langgraph.summarization import (
     SummarizationNode,
 )
@@ -115,13 +121,15 @@ if TYPE_CHECKING:
     from langgraph.checkpoint.base import BaseCheckpointSaver
 
     from chat_worker.application.ports.bulk_waste_client import BulkWasteClientPort
-    from chat_worker.application.ports.cache import CachePort
+    from chat_worker.application.ports.cache import CachePort, SemanticIntentCachePort
     from chat_worker.application.ports.character_asset import CharacterAssetPort
     from chat_worker.application.ports.collection_point_client import (
         CollectionPointClientPort,
     )
+    from chat_worker.application.ports.geo_resolver import GeoResolverPort
     from chat_worker.application.ports.image_generator import ImageGeneratorPort
     from chat_worker.application.ports.image_storage import ImageStoragePort
+    from chat_worker.application.ports.metrics import MetricsPort
     from chat_worker.application.ports.recyclable_price_client import (
         RecyclablePriceClientPort,
     )
@@ -195,15 +203,30 @@ def create_chat_graph(
     recyclable_price_client: "RecyclablePriceClientPort | None" = None,  # 재활용자원 시세 (한국환경공단)
     weather_client: "WeatherClientPort | None" = None,  # 날씨 정보 (기상청 API)
     collection_point_client: "CollectionPointClientPort | None" = None,  # 수거함 위치 (KECO API)
+    geo_resolver: "GeoResolverPort | None" = None,  # 좌표 → 시군구/격자 해석 (노드 간 공유)
     image_generator: "ImageGeneratorPort | None" = None,  # 이미지 생성 (Responses API)
     image_storage: "ImageStoragePort | None" = None,  # 이미지 업로드 (gRPC)
     image_default_size: str = "1024x1024",  # 이미지 기본 크기
     image_default_quality: str = "medium",  # 이미지 기본 품질
     cache: "CachePort | None" = None,  # P2: Intent 캐싱용 (CachePort 추상화)
+    intent_semantic_cache: "SemanticIntentCachePort | None" = None,  # 유사 메시지 Intent 캐시
+    metrics: "MetricsPort | None" = None,  # Intent 분류 지연 등
+    intent_max_parallel_classifications: int = 4,  # 분해된 쿼리 동시 분류 상한
+    enable_merged_intent_classification: bool = False,  # 분해 + 분류 통합 호출
+    enable_speculative_prefetch: bool = False,  # intent 분류 중 서브에이전트 선행 조회
+    answer_token_queue_size: int = 256,  # answer 토큰 발행 큐 상한
+    enable_answer_cache: bool = False,  # Answer 캐시 (cache Port 사용, 히트 시 토큰 재생)
+    answer_cache_intents: list[str] | None = None,  # None이면 Command 기본 Intent
+    answer_cache_ttl: int = 3600,  # Answer 캐시 TTL (초)
+    answer_cache_replay_chunk_chars: int = 4,  # 캐시 히트 재생 청크 크기
+    answer_cache_replay_interval: float = 0.02,  # 캐시 히트 재생 청크 간격 (초)
     input_requester: "InputRequesterPort | None" = None,  # Reserved for future use
     checkpointer: "BaseCheckpointSaver | None" = None,
     fallback_orchestrator: "FallbackOrchestrator | None" = None,  # Fallback 체인
     llm_evaluator: "LLMFeedbackEvaluatorPort | None" = None,  # LLM 기반 정밀 평가
+    feedback_evaluation_mode: str = "inline",  # inline | deferred (LLM 평가를 답변 시작 후로)
+    deferred_feedback_evaluator: "DeferredFeedbackEvaluator | None" = None,  # 종료 시 drain
+    intent_llm: "LLMClientPort | None" = None,  # 의도 분류 전용 (hedging 적용 클라이언트)
     enable_summarization: bool = False,  # LangGraph 1.0+ 컨텍스트 압축
     summarization_model: str | None = None,  # 동적 설정용 모델명 (예: "gpt-5.2")
     max_tokens_before_summary: int | None = None,  # None이면 context-output 동적 계산
@@ -234,11 +257,30 @@ def create_chat_graph(
         web_search_client: 웹 검색 클라이언트 (선택, DuckDuckGo/Tavily/Fallback)
         bulk_waste_client: 대형폐기물 클라이언트 (선택, 행정안전부 API)
         recyclable_price_client: 재활용자원 시세 클라이언트 (선택, 한국환경공단)
+        geo_resolver: 좌표 해석기 (선택, weather/bulk_waste 노드가 셀 단위 결과 공유)
         image_generator: 이미지 생성 클라이언트 (선택, Responses API)
+        cache: Intent 정확 키 캐시 (선택)
+        intent_semantic_cache: 유사 메시지 Intent 캐시 (선택, 어미/공백 정규화 + MinHash)
+        metrics: 메트릭 Port (선택)
+        intent_max_parallel_classifications: Multi-Intent 분해 쿼리 동시 분류 상한
+        enable_merged_intent_classification: 고신뢰 Multi-Intent 시 분해 + 분류 통합 호출
+        enable_speculative_prefetch: intent 분류와 병렬로 유력 서브에이전트(waste_rag,
+            character) 컨텍스트 선행 조회 (예측이 맞으면 router 이후 그대로 사용)
+        answer_token_queue_size: answer 노드 비동기 토큰 발행 큐 상한 (청크 수)
+        enable_answer_cache: (intent, 정규화 메시지, 컨텍스트 해시, 캐릭터, 프롬프트 버전)
+            키 Answer 캐시 활성화 (cache 필요, 히트 시 LLM 없이 토큰 스트림 재생)
+        answer_cache_intents: Answer 캐시 허용 Intent (목록에서 빼면 해당 Intent 비활성화)
+        answer_cache_ttl: Answer 캐시 TTL (초)
+        answer_cache_replay_chunk_chars: 캐시 히트 재생 청크 크기 (글자 수)
+        answer_cache_replay_interval: 캐시 히트 재생 청크 간격 (초)
         input_requester: Reserved for future use (현재 미사용)
         checkpointer: LangGraph 체크포인터 (세션 유지용)
         fallback_orchestrator: Fallback 체인 오케스트레이터 (선택)
         llm_evaluator: LLM 기반 품질 평가기 (선택, 정밀 평가용)
+        feedback_evaluation_mode: "deferred"면 Fallback 게이트는 빠른 로컬 평가로 하고
+            LLM 평가는 answer 첫 토큰 이후 백그라운드 실행 (결과는 메트릭/로그 기록만)
+        deferred_feedback_evaluator: deferred 모드 평가기 (None이면 생성, 종료 시 drain하려면 주입)
+        intent_llm: 의도 분류 Command 전용 LLM (None이면 llm, hedging은 여기에만 적용)
         enable_summarization: 컨텍스트 압축 활성화 (멀티턴 대화용)
         summarization_model: 동적 설정용 모델명 (예: "gpt-5.2", context-output 트리거 자동 계산)
         max_tokens_before_summary: 요약 트리거 임계값 (None이면 context-output 동적 계산)
@@ -290,10 +332,53 @@ def create_chat_graph(
 
     # 핵심 노드 생성
     intent_node = create_intent_node(
-        llm, event_publisher, prompt_loader=prompt_loader, cache=cache
-    )  # P2: Intent 캐싱
-    rag_node = create_rag_node(retriever, event_publisher)
-    answer_node = create_answer_node(llm, event_publisher=event_publisher)  # 네이티브 스트리밍
+        intent_llm or llm,
+        event_publisher,
+        prompt_loader=prompt_loader,
+        cache=cache,  # P2: Intent 캐싱
+        semantic_cache=intent_semantic_cache,
+        metrics=metrics,
+        max_parallel_classifications=intent_max_parallel_classifications,
+        enable_merged_classification=enable_merged_intent_classification,
+    )
+
+    # Speculative prefetch (선택): intent 분류 중 유력 서브에이전트 선행 조회
+    prefetcher: SpeculativePrefetcher | None = None
+    if enable_speculative_prefetch:
+        prefetcher = SpeculativePrefetcher(semantic_cache=intent_semantic_cache)
+        classify_intent_node = intent_node
+
+        async def intent_node(state: dict[str, Any]) -> dict[str, Any]:
+            await prefetcher.start(state)
+            return await classify_intent_node(state)
+
+        logger.info("Speculative prefetch enabled")
+
+    rag_node = create_rag_node(retriever, event_publisher, prefetcher=prefetcher)
+    # 지연 feedback 평가: answer 첫 토큰에서 release → 백그라운드 LLM 평가 시작
+    deferred_feedback = None
+    if (
+        feedback_evaluation_mode == "deferred"
+        and fallback_orchestrator is not None
+        and llm_evaluator is not None
+    ):
+        deferred_feedback = deferred_feedback_evaluator or DeferredFeedbackEvaluator(
+            llm_evaluator, metrics=metrics
+        )
+        logger.info("Feedback LLM evaluation deferred until answer streaming starts")
+
+    answer_node = create_answer_node(  # 네이티브 스트리밍 (백그라운드 토큰 발행)
+        llm,
+        event_publisher=event_publisher,
+        token_queue_size=answer_token_queue_size,
+        cache=cache if enable_answer_cache else None,
+        metrics=metrics,
+        answer_cache_intents=answer_cache_intents,
+        answer_cache_ttl=answer_cache_ttl,
+        replay_chunk_chars=answer_cache_replay_chunk_chars,
+        replay_interval=answer_cache_replay_interval,
+        on_answer_started=deferred_feedback.release if deferred_feedback else None,
+    )
 
     # Vision 노드 (선택)
     if vision_model is not None:
@@ -315,6 +400,8 @@ def create_chat_graph(
             event_publisher=event_publisher,
             llm_evaluator=llm_evaluator,  # 선택적 LLM 평가
             web_search_client=web_search_client,  # Fallback용 웹 검색
+            deferred_evaluator=deferred_feedback,
+            metrics=metrics,
         )
         logger.info("Feedback node created (with Fallback chain)")
         feedback_enabled = True
@@ -329,6 +416,8 @@ def create_chat_graph(
 
     # Router 노드 (조건부 라우팅을 위한 passthrough)
     async def router_node(state: dict[str, Any]) -> dict[str, Any]:
+        if prefetcher is not None:
+            prefetcher.settle(state)  # 빗나간 선행 조회 취소
         return state
 
     graph = StateGraph(ChatState)
@@ -349,6 +438,7 @@ def create_chat_graph(
             event_publisher=event_publisher,
             prompt_loader=prompt_loader,
             character_asset_loader=character_asset_loader,
+            prefetcher=prefetcher,
         )
         logger.info(
             "Character subagent node created (gRPC, asset_loader=%s)",
@@ -393,6 +483,7 @@ def create_chat_graph(
             bulk_waste_client=bulk_waste_client,
             event_publisher=event_publisher,
             llm=llm,  # Function Calling용
+            geo_resolver=geo_resolver,  # 주소 없는 좌표 → 시군구
         )
         logger.info("Bulk waste subagent node created (MOIS API + Function Calling)")
     else:
@@ -426,6 +517,7 @@ def create_chat_graph(
             weather_client=weather_client,
             event_publisher=event_publisher,
             llm=llm,  # Function Calling용
+            geo_resolver=geo_resolver,  # 격자 계산 셀 캐시
         )
         logger.info("Weather subagent node created (KMA API + Function Calling)")
     else:
@@ -10,34 +10,87 @@ Clean Architecture:
 
 토큰 스트리밍 아키텍처:
 - answer_node에서 모든 토큰을 직접 발행 (notify_token_v2)
+- 발행은 TokenStreamWriter(백그라운드 writer)가 담당 → Redis 지연이 LLM 스트림 소비를 막지 않음
 - ProcessChatCommand는 answer 노드의 토큰을 건너뜀 (중복 방지)
 - LangChain/네이티브 경로 모두 동일한 발행 메커니즘 사용
+
+Answer 캐시 히트:
+- LLM 호출 없이 캐시된 답변을 같은 토큰 스트림으로 재생 (replay pacing)
+- SSE 클라이언트 입장에서는 일반 스트리밍과 동일한 UX
 """
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
+import time
+from collections.abc import Callable, Iterable, Iterator
 from typing import TYPE_CHECKING, Any
 
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 
 from chat_worker.application.commands.generate_answer_command import (
+    ANSWER_CACHE_TTL,
     GenerateAnswerCommand,
     GenerateAnswerInput,
+    PreparedPrompt,
 )
 from chat_worker.infrastructure.assets.prompt_loader import PromptBuilder
+from chat_worker.infrastructure.events.token_stream_writer import (
+    DEFAULT_TOKEN_QUEUE_SIZE,
+    TokenStreamWriter,
+)
 from chat_worker.infrastructure.orchestration.langgraph.sequence import cleanup_sequence
 
 if TYPE_CHECKING:
+    from chat_worker.application.ports.cache import CachePort
     from chat_worker.application.ports.events import ProgressNotifierPort
     from chat_worker.application.ports.llm import LLMClientPort
+    from chat_worker.application.ports.metrics import MetricsPort
 
 logger = logging.getLogger(__name__)
 
+# 캐시 히트 재생 기본값: 4자씩 20ms 간격 (≈200자/초, LLM 스트리밍과 비슷한 체감 속도)
+DEFAULT_REPLAY_CHUNK_CHARS = 4
+DEFAULT_REPLAY_INTERVAL = 0.02
+
+
+def _replay_chunks(text: str, chunk_chars: int) -> Iterator[str]:
+    """캐시 답변을 스트리밍 청크 크기로 분할."""
+    step = max(1, chunk_chars)
+    for start in range(0, len(text), step):
+        yield text[start : start + step]
+
+
+def _once(callback: Callable[[str], None] | None, job_id: str) -> Callable[[], None]:
+    """첫 호출에만 callback(job_id) 실행 (콜백 예외는 답변에 영향 없음)."""
+    fired = False
+
+    def fire() -> None:
+        nonlocal fired
+        if fired or callback is None:
+            return
+        fired = True
+        try:
+            callback(job_id)
+        except Exception as e:
+            logger.warning("on_answer_started callback failed", extra={"error": str(e)})
+
+    return fire
+
 
 def create_answer_node(
     llm: "LLMClientPort",
     event_publisher: "ProgressNotifierPort | None" = None,
+    token_queue_size: int = DEFAULT_TOKEN_QUEUE_SIZE,
+    cache: "CachePort | None" = None,
+    metrics: "MetricsPort | None" = None,
+    answer_cache_intents: Iterable[str] | None = None,
+    answer_cache_ttl: int = ANSWER_CACHE_TTL,
+    replay_chunk_chars: int = DEFAULT_REPLAY_CHUNK_CHARS,
+    replay_interval: float = DEFAULT_REPLAY_INTERVAL,
+    on_answer_started: Callable[[str], None] | None = None,
 ):
     """답변 생성 노드 팩토리.
 
@@ -48,11 +101,20 @@ def create_answer_node(
 
     토큰 스트리밍:
     - answer_node에서 토큰을 직접 발행 (notify_token_v2)
+    - 청크는 job 단위 TokenStreamWriter 큐에 넣고 즉시 LLM 스트림으로 복귀
     - ProcessChatCommand는 answer 노드의 토큰을 건너뜀 (중복 방지)
 
     Args:
         llm: LLM 클라이언트
         event_publisher: 이벤트 발행자 (토큰 직접 발행용)
+        token_queue_size: 토큰 발행 큐 상한 (청크 수)
+        cache: Answer 캐시 Port (선택, None이면 캐시 비활성화)
+        metrics: 메트릭 Port (선택, 캐시 히트율/절감 토큰/절감 지연)
+        answer_cache_intents: 캐시를 허용할 Intent (None이면 Command 기본값)
+        answer_cache_ttl: Answer 캐시 TTL (초)
+        replay_chunk_chars: 캐시 히트 재생 청크 크기 (글자 수)
+        replay_interval: 캐시 히트 재생 청크 간격 (초, 0이면 즉시)
+        on_answer_started: 첫 토큰 발행 시 job_id로 호출 (지연 feedback 평가 시작 신호)
 
     Returns:
         answer_node 함수
@@ -62,8 +124,81 @@ def create_answer_node(
     command = GenerateAnswerCommand(
         llm=llm,
         prompt_builder=prompt_builder,
+        cache=cache,
+        metrics=metrics,
+        cacheable_intents=answer_cache_intents,
+        cache_ttl=answer_cache_ttl,
     )
 
+    async def replay_cached(
+        job_id: str,
+        intent: str,
+        prepared: PreparedPrompt,
+        token_writer: TokenStreamWriter | None,
+        answer_started: Callable[[], None],
+    ) -> str:
+        """캐시 답변을 토큰 스트림으로 재생."""
+        cached = prepared.cached
+        started = time.perf_counter()
+        if token_writer is not None:
+            for chunk in _replay_chunks(cached.answer, replay_chunk_chars):
+                await token_writer.push(chunk)
+                answer_started()
+                if replay_interval > 0:
+                    await asyncio.sleep(replay_interval)
+        command.record_cache_hit(intent, cached, time.perf_counter() - started)
+        logger.info(
+            "Answer replayed from cache",
+            extra={"job_id": job_id, "intent": intent, "length": len(cached.answer)},
+        )
+        return cached.answer
+
+    async def stream_llm(
+        prepared: PreparedPrompt,
+        token_writer: TokenStreamWriter | None,
+        answer_started: Callable[[], None],
+    ) -> tuple[str, float]:
+        """LLM 스트리밍 호출 및 토큰 발행.
+
+        Returns:
+            (답변, 생성 소요 시간)
+        """
+        answer_parts = []
+        started = time.perf_counter()
+
+        if hasattr(llm, "get_langchain_llm"):
+            # LangChain 방식
+            langchain_llm = llm.get_langchain_llm()
+
+            langchain_messages = []
+            if prepared.system_prompt:
+                langchain_messages.append(SystemMessage(content=prepared.system_prompt))
+            langchain_messages.append(HumanMessage(content=prepared.prompt))
+
+            # 포트를 거치지 않는 호출 → LLM 승인 제어(있으면) 직접 적용
+            admit = getattr(llm, "admit", None)
+            async with admit() if callable(admit) else contextlib.nullcontext():
+                async for chunk in langchain_llm.astream(langchain_messages):
+                    content = chunk.content
+                    if content:
+                        answer_parts.append(content)
+                        if token_writer is not None:
+                            await token_writer.push(content)
+                        answer_started()
+        else:
+            # 네이티브 LLM (OpenAI/Gemini) - generate_stream 사용
+            async for chunk in llm.generate_stream(
+                prompt=prepared.prompt,
+                system_prompt=prepared.system_prompt,
+            ):
+                if chunk:
+                    answer_parts.append(chunk)
+                    if token_writer is not None:
+                        await token_writer.push(chunk)
+                    answer_started()
+
+        return "".join(answer_parts), time.perf_counter() - started
+
     async def answer_node(state: dict[str, Any]) -> dict[str, Any]:
         """LangGraph 노드 (얇은 어댑터).
 
@@ -79,6 +214,14 @@ def create_answer_node(
             업데이트된 상태
         """
         job_id = state.get("job_id", "")
+        token_writer = (
+            TokenStreamWriter(
+                event_publisher, job_id, node="answer", max_queue_size=token_queue_size
+            )
+            if event_publisher is not None
+            else None
+        )
+        answer_started = _once(on_answer_started, job_id)
 
         try:
             # 1. state → input DTO 변환
@@ -151,51 +294,28 @@ def create_answer_node(
                 conversation_summary=conversation_summary,
             )
 
-            # 2. 프롬프트 준비 (Command에서 컨텍스트 빌드만 수행)
+            # 2. 프롬프트 준비 (Command에서 컨텍스트 빌드 + Answer 캐시 조회)
             prepared = await command.prepare(input_dto)
 
-            # 3. LLM 스트리밍 호출 및 토큰 발행
-            answer_parts = []
-
-            if hasattr(llm, "get_langchain_llm"):
-                # LangChain 방식
-                langchain_llm = llm.get_langchain_llm()
+            # 3. 캐시 히트: LLM 호출 없이 토큰 스트림으로 재생
+            generation_seconds = None
+            if prepared.cached is not None:
+                answer = await replay_cached(
+                    job_id, input_dto.intent, prepared, token_writer, answer_started
+                )
+            else:
+                answer, generation_seconds = await stream_llm(
+                    prepared, token_writer, answer_started
+                )
+            answer_started()  # 빈 답변이어도 대기 중인 후속 작업 해제
 
-                langchain_messages = []
-                if prepared.system_prompt:
-                    langchain_messages.append(SystemMessage(content=prepared.system_prompt))
-                langchain_messages.append(HumanMessage(content=prepared.prompt))
+            # 토큰 스트림 완료 처리 (배리어: 남은 토큰 발행 후 finalize)
+            if token_writer is not None:
+                await token_writer.finalize()
 
-                async for chunk in langchain_llm.astream(langchain_messages):
-                    content = chunk.content
-                    if content:
-                        answer_parts.append(content)
-                        if event_publisher is not None:
-                            await event_publisher.notify_token_v2(
-                                task_id=job_id,
-                                content=content,
-                                node="answer",
-                            )
-            else:
-                # 네이티브 LLM (OpenAI/Gemini) - generate_stream 사용
-                async for chunk in llm.generate_stream(
-                    prompt=prepared.prompt,
-                    system_prompt=prepared.system_prompt,
-                ):
-                    if chunk:
-                        answer_parts.append(chunk)
-                        if event_publisher is not None:
-                            await event_publisher.notify_token_v2(
-                                task_id=job_id,
-                                content=chunk,
-                                node="answer",
-                            )
-
-            # 토큰 스트림 완료 처리
-            if event_publisher is not None:
-                await event_publisher.finalize_token_stream(job_id)
-
-            answer = "".join(answer_parts)
+            # 캐시 저장 (스트림 완료 후, 결정적 컨텍스트 답변만)
+            if generation_seconds is not None and prepared.is_cacheable:
+                await command.save_to_cache(prepared.cache_key, answer, generation_seconds)
 
             logger.info(
                 "Answer generated",
@@ -216,6 +336,9 @@ def create_answer_node(
                 extra={"job_id": job_id, "error": str(e)},
                 exc_info=True,
             )
+            if token_writer is not None:
+                await token_writer.abort()
+            answer_started()
             # 에러 발생 시에도 Lamport Clock 정리
             cleanup_sequence(job_id)
             error_answer = "답변 생성 중 오류가 발생했습니다. 다시 시도해주세요."
@@ -47,6 +47,7 @@ from chat_worker.infrastructure.orchestration.langgraph.nodes.node_executor impo
 if TYPE_CHECKING:
     from chat_worker.application.ports.bulk_waste_client import BulkWasteClientPort
     from chat_worker.application.ports.events import ProgressNotifierPort
+    from chat_worker.application.ports.geo_resolver import GeoResolverPort
     from chat_worker.application.ports.llm import LLMClientPort
 
 logger = logging.getLogger(__name__)
@@ -76,6 +77,7 @@ def create_bulk_waste_node(
     bulk_waste_client: "BulkWasteClientPort",
     event_publisher: "ProgressNotifierPort",
     llm: "LLMClientPort",
+    geo_resolver: "GeoResolverPort | None" = None,
 ):
     """대형폐기물 노드 팩토리.
 
@@ -90,12 +92,13 @@ def create_bulk_waste_node(
         bulk_waste_client: 대형폐기물 클라이언트
         event_publisher: 이벤트 발행기
         llm: LLM 클라이언트 (Function Calling용)
+        geo_resolver: 좌표 → 지역 해석 (선택, 노드 간 셀 캐시 공유)
 
     Returns:
         bulk_waste_node 함수
     """
     # Command(UseCase) 인스턴스 생성 - Port 조립
-    command = SearchBulkWasteCommand(bulk_waste_client=bulk_waste_client)
+    command = SearchBulkWasteCommand(bulk_waste_client=bulk_waste_client, geo_resolver=geo_resolver)
 
     async def _bulk_waste_node_inner(state: dict[str, Any]) -> dict[str, Any]:
         """실제 노드 로직 (NodeExecutor가 래핑).
@@ -41,6 +41,9 @@ if TYPE_CHECKING:
     from chat_worker.application.ports.events import ProgressNotifierPort
     from chat_worker.application.ports.llm import LLMClientPort
     from chat_worker.application.ports.prompt_loader import PromptLoaderPort
+    from chat_worker.infrastructure.orchestration.langgraph.speculation import (
+        SpeculativePrefetcher,
+    )
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +54,7 @@ def create_character_subagent_node(
     event_publisher: "ProgressNotifierPort",
     prompt_loader: "PromptLoaderPort",
     character_asset_loader: "CharacterAssetPort | None" = None,
+    prefetcher: "SpeculativePrefetcher | None" = None,
 ):
     """Character Subagent 노드 생성.
 
@@ -66,6 +70,7 @@ def create_character_subagent_node(
         event_publisher: 이벤트 발행자 (SSE 진행 상황)
         prompt_loader: 프롬프트 로더
         character_asset_loader: 캐릭터 에셋 로더 (이미지 생성 참조용)
+        prefetcher: Speculative prefetch 관리자 (선택, intent 분류 중 선행 조회)
 
     Returns:
         LangGraph 노드 함수
@@ -78,6 +83,15 @@ def create_character_subagent_node(
         character_asset_loader=character_asset_loader,
     )
 
+    if prefetcher is not None:
+
+        async def _prefetch(state: dict[str, Any]):
+            return await command.execute(
+                GetCharacterInput(job_id=state.get("job_id", ""), message=state.get("message", ""))
+            )
+
+        prefetcher.register("character", _prefetch)
+
     async def _character_subagent_inner(state: dict[str, Any]) -> dict[str, Any]:
         """실제 노드 로직 (NodeExecutor가 래핑).
 
@@ -109,8 +123,10 @@ def create_character_subagent_node(
             message=state.get("message", ""),
         )
 
-        # 2. Command 실행 (정책/흐름은 Command에서)
-        output = await command.execute(input_dto)
+        # 2. Command 실행 (정책/흐름은 Command에서, 선행 조회 결과가 있으면 사용)
+        output = await prefetcher.take(job_id, "character") if prefetcher is not None else None
+        if output is None:
+            output = await command.execute(input_dto)
 
         # 3. output → state 변환
         if not output.success:
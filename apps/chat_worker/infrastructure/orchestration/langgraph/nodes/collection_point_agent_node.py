@@ -39,6 +39,7 @@ if TYPE_CHECKING:
     )
     from chat_worker.application.ports.events import ProgressNotifierPort
     from chat_worker.application.ports.kakao_local_client import KakaoLocalClientPort
+    from chat_worker.infrastructure.orchestration.langgraph.tool_memo import ToolCallMemo
 
 logger = logging.getLogger(__name__)
 
@@ -856,6 +857,7 @@ def create_collection_point_agent_node(
     gemini_client: Any | None = None,
     default_model: str = "gpt-5.2",
     default_provider: str = "openai",
+    tool_memo: "ToolCallMemo | None" = None,
 ):
     """Collection Point Agent 노드 팩토리.
 
@@ -870,6 +872,7 @@ def create_collection_point_agent_node(
         gemini_client: Gemini Client (선택)
         default_model: 기본 모델명
         default_provider: 기본 프로바이더
+        tool_memo: Job 단위 Tool 호출 메모 (선택, 에이전트 노드 간 공유)
 
     Returns:
         collection_point_agent_node 함수
@@ -882,6 +885,8 @@ def create_collection_point_agent_node(
     async def collection_point_agent_node(state: dict[str, Any]) -> dict[str, Any]:
         """LangGraph Collection Point Agent 노드."""
         job_id = state.get("job_id", "")
+        # 같은 job의 동일 Tool 호출은 라운드/노드 간 재사용
+        executor = tool_memo.bind(job_id, tool_executor) if tool_memo is not None else tool_executor
         message = state.get("message", "")
         user_location = state.get("user_location")
 
@@ -903,7 +908,7 @@ def create_collection_point_agent_node(
                     model=model,
                     message=message,
                     user_location=user_location,
-                    tool_executor=tool_executor,
+                    tool_executor=executor,
                 )
             elif openai_client is not None:
                 # Primary: Agents SDK, Fallback: Function Calling
@@ -913,7 +918,7 @@ def create_collection_point_agent_node(
                         model=model,
                         message=message,
                         user_location=user_location,
-                        tool_executor=tool_executor,
+                        tool_executor=executor,
                     )
                 except ImportError:
                     logger.warning("openai-agents not installed, using function calling")
@@ -922,7 +927,7 @@ def create_collection_point_agent_node(
                         model=model,
                         message=message,
                         user_location=user_location,
-                        tool_executor=tool_executor,
+                        tool_executor=executor,
                     )
                 except Exception as e:
                     logger.warning(
@@ -934,7 +939,7 @@ def create_collection_point_agent_node(
                         model=model,
                         message=message,
                         user_location=user_location,
-                        tool_executor=tool_executor,
+                        tool_executor=executor,
                     )
             else:
                 logger.warning("No LLM client available for collection point agent")
@@ -20,9 +20,13 @@ from chat_worker.application.commands.evaluate_feedback_command import (
 )
 
 if TYPE_CHECKING:
+    from chat_worker.application.services.deferred_feedback_evaluator import (
+        DeferredFeedbackEvaluator,
+    )
     from chat_worker.application.services.fallback_orchestrator import FallbackOrchestrator
     from chat_worker.application.ports.llm_evaluator import LLMFeedbackEvaluatorPort
     from chat_worker.application.ports.events import ProgressNotifierPort
+    from chat_worker.application.ports.metrics import MetricsPort
     from chat_worker.application.ports.web_search import WebSearchPort
 
 logger = logging.getLogger(__name__)
@@ -33,6 +37,8 @@ def create_feedback_node(
     event_publisher: "ProgressNotifierPort",
     llm_evaluator: "LLMFeedbackEvaluatorPort | None" = None,
     web_search_client: "WebSearchPort | None" = None,
+    deferred_evaluator: "DeferredFeedbackEvaluator | None" = None,
+    metrics: "MetricsPort | None" = None,
 ):
     """피드백 노드 팩토리.
 
@@ -47,6 +53,8 @@ def create_feedback_node(
         event_publisher: 진행률 이벤트 발행자 (UX)
         llm_evaluator: LLM 평가기 (선택)
         web_search_client: 웹 검색 클라이언트 (선택)
+        deferred_evaluator: 백그라운드 LLM 평가기 (있으면 LLM 평가를 critical path 밖으로)
+        metrics: 메트릭 Port (선택)
 
     Returns:
         feedback_node 함수
@@ -56,6 +64,8 @@ def create_feedback_node(
         fallback_orchestrator=fallback_orchestrator,
         llm_evaluator=llm_evaluator,
         web_search_client=web_search_client,
+        deferred_evaluator=deferred_evaluator,
+        metrics=metrics,
     )
 
     async def feedback_node(state: dict[str, Any]) -> dict[str, Any]:
@@ -20,9 +20,10 @@ from chat_worker.application.commands.classify_intent_command import (
 )
 
 if TYPE_CHECKING:
-    from chat_worker.application.ports.cache import CachePort
+    from chat_worker.application.ports.cache import CachePort, SemanticIntentCachePort
     from chat_worker.application.ports.events import ProgressNotifierPort
     from chat_worker.application.ports.llm import LLMClientPort
+    from chat_worker.application.ports.metrics import MetricsPort
     from chat_worker.application.ports.prompt_loader import PromptLoaderPort
 
 logger = logging.getLogger(__name__)
@@ -34,6 +35,10 @@ def create_intent_node(
     prompt_loader: "PromptLoaderPort",
     cache: "CachePort | None" = None,
     enable_multi_intent: bool = True,
+    semantic_cache: "SemanticIntentCachePort | None" = None,
+    metrics: "MetricsPort | None" = None,
+    max_parallel_classifications: int = 4,
+    enable_merged_classification: bool = False,
 ):
     """의도 분류 노드 팩토리.
 
@@ -49,6 +54,10 @@ def create_intent_node(
         prompt_loader: 프롬프트 로더
         cache: 캐시 Port
         enable_multi_intent: Multi-Intent 처리 활성화 여부
+        semantic_cache: 유사 메시지 Intent 캐시 Port (선택)
+        metrics: 메트릭 Port (선택, 쿼리 수별 분류 지연)
+        max_parallel_classifications: 분해된 쿼리 동시 분류 상한
+        enable_merged_classification: 고신뢰 Multi-Intent 시 분해 + 분류 통합 호출
 
     Returns:
         intent_node 함수
@@ -59,6 +68,10 @@ def create_intent_node(
         prompt_loader=prompt_loader,
         cache=cache,
         enable_multi_intent=enable_multi_intent,
+        semantic_cache=semantic_cache,
+        metrics=metrics,
+        max_parallel_classifications=max_parallel_classifications,
+        enable_merged_classification=enable_merged_classification,
     )
 
     async def intent_node(state: dict[str, Any]) -> dict[str, Any]:
@@ -41,6 +41,7 @@ from chat_worker.infrastructure.orchestration.langgraph.context_helper import (
 if TYPE_CHECKING:
     from chat_worker.application.ports.events import ProgressNotifierPort
     from chat_worker.application.ports.kakao_local_client import KakaoLocalClientPort
+    from chat_worker.infrastructure.orchestration.langgraph.tool_memo import ToolCallMemo
 
 logger = logging.getLogger(__name__)
 
@@ -977,6 +978,7 @@ def create_location_agent_node(
     gemini_client: Any | None = None,
     default_model: str = "gpt-5.2",  # GPT-5.2 (2026)
     default_provider: str = "openai",
+    tool_memo: "ToolCallMemo | None" = None,
 ):
     """Location Agent 노드 팩토리.
 
@@ -990,6 +992,7 @@ def create_location_agent_node(
         gemini_client: Gemini Client (선택)
         default_model: 기본 모델명 (gpt-5.2, gemini-3-flash 등)
         default_provider: 기본 프로바이더 ("openai" | "gemini")
+        tool_memo: Job 단위 Tool 호출 메모 (선택, 에이전트 노드 간 공유)
 
     Returns:
         location_agent_node 함수
@@ -1006,6 +1009,8 @@ def create_location_agent_node(
             업데이트된 상태 (location_context)
         """
         job_id = state.get("job_id", "")
+        # 같은 job의 동일 Tool 호출은 라운드/노드 간 재사용
+        executor = tool_memo.bind(job_id, tool_executor) if tool_memo is not None else tool_executor
         message = state.get("message", "")
         user_location = state.get("user_location")
 
@@ -1029,7 +1034,7 @@ def create_location_agent_node(
                     model=model,
                     message=message,
                     user_location=user_location,
-                    tool_executor=tool_executor,
+                    tool_executor=executor,
                 )
             elif openai_client is not None:
                 # Primary: Agents SDK, Fallback: Function Calling
@@ -1039,7 +1044,7 @@ def create_location_agent_node(
                         model=model,
                         message=message,
                         user_location=user_location,
-                        tool_executor=tool_executor,
+                        tool_executor=executor,
                     )
                 except ImportError:
                     logger.warning("openai-agents not installed, using function calling")
@@ -1048,7 +1053,7 @@ def create_location_agent_node(
                         model=model,
                         message=message,
                         user_location=user_location,
-                        tool_executor=tool_executor,
+                        tool_executor=executor,
                     )
                 except Exception as e:
                     logger.warning(
@@ -1060,7 +1065,7 @@ def create_location_agent_node(
                         model=model,
                         message=message,
                         user_location=user_location,
-                        tool_executor=tool_executor,
+                        tool_executor=executor,
                     )
             else:
                 # Fallback: 직접 키워드 검색
@@ -29,6 +29,9 @@ from chat_worker.infrastructure.orchestration.langgraph.nodes.node_executor impo
 if TYPE_CHECKING:
     from chat_worker.application.ports.events import ProgressNotifierPort
     from chat_worker.application.ports.retrieval import RetrieverPort
+    from chat_worker.infrastructure.orchestration.langgraph.speculation import (
+        SpeculativePrefetcher,
+    )
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +39,7 @@ logger = logging.getLogger(__name__)
 def create_rag_node(
     retriever: "RetrieverPort",
     event_publisher: "ProgressNotifierPort",
+    prefetcher: "SpeculativePrefetcher | None" = None,
 ):
     """RAG 노드 팩토리.
 
@@ -48,6 +52,7 @@ def create_rag_node(
     Args:
         retriever: 검색 Port
         event_publisher: 진행률 이벤트 발행자 (UX)
+        prefetcher: Speculative prefetch 관리자 (선택, intent 분류 중 선행 검색)
 
     Returns:
         rag_node 함수
@@ -55,6 +60,15 @@ def create_rag_node(
     # Command(UseCase) 인스턴스 생성 - Port 조립
     command = SearchRAGCommand(retriever=retriever)
 
+    if prefetcher is not None:
+
+        async def _prefetch(state: dict[str, Any]):
+            return await command.execute(
+                SearchRAGInput(job_id=state.get("job_id", ""), message=state.get("message", ""))
+            )
+
+        prefetcher.register("waste_rag", _prefetch)
+
     async def _rag_node_inner(state: dict[str, Any]) -> dict[str, Any]:
         """실제 노드 로직 (NodeExecutor가 래핑).
 
@@ -89,7 +103,12 @@ def create_rag_node(
             )
 
             # 2. Command 실행 (정책/흐름은 Command에서)
-            output = await command.execute(input_dto)
+            # Speculative prefetch 결과는 vision 분류 없이 검색한 것이므로 그때만 사용
+            output = None
+            if prefetcher is not None and input_dto.classification is None:
+                output = await prefetcher.take(job_id, "waste_rag")
+            if output is None:
+                output = await command.execute(input_dto)
 
             # Progress: 완료 (UX)
             await event_publisher.notify_stage(
@@ -105,9 +124,13 @@ def create_rag_node(
             )
 
             # 3. output → state 변환
+            # evidence(근거 청크/매칭 태그)는 feedback 빠른 평가용 (answer는 data만 사용)
+            data = dict(output.disposal_rules or {})
+            if output.evidence:
+                data["evidence"] = output.evidence
             return {
                 "disposal_rules": create_context(
-                    data=output.disposal_rules or {},
+                    data=data,
                     producer="waste_rag",
                     job_id=job_id,
                 ),
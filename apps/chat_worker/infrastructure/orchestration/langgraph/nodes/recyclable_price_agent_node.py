@@ -43,6 +43,7 @@ if TYPE_CHECKING:
     from chat_worker.application.ports.recyclable_price_client import (
         RecyclablePriceClientPort,
     )
+    from chat_worker.infrastructure.orchestration.langgraph.tool_memo import ToolCallMemo
 
 logger = logging.getLogger(__name__)
 
@@ -779,6 +780,7 @@ def create_recyclable_price_agent_node(
     gemini_client: Any | None = None,
     default_model: str = "gpt-5.2",
     default_provider: str = "openai",
+    tool_memo: "ToolCallMemo | None" = None,
 ):
     """Recyclable Price Agent 노드 팩토리.
 
@@ -792,6 +794,7 @@ def create_recyclable_price_agent_node(
         gemini_client: Gemini Client (선택)
         default_model: 기본 모델명
         default_provider: 기본 프로바이더
+        tool_memo: Job 단위 Tool 호출 메모 (선택, 에이전트 노드 간 공유)
 
     Returns:
         recyclable_price_agent_node 함수
@@ -801,6 +804,8 @@ def create_recyclable_price_agent_node(
     async def recyclable_price_agent_node(state: dict[str, Any]) -> dict[str, Any]:
         """LangGraph Recyclable Price Agent 노드."""
         job_id = state.get("job_id", "")
+        # 같은 job의 동일 Tool 호출은 라운드/노드 간 재사용
+        executor = tool_memo.bind(job_id, tool_executor) if tool_memo is not None else tool_executor
         message = state.get("message", "")
 
         await event_publisher.notify_stage(
@@ -820,7 +825,7 @@ def create_recyclable_price_agent_node(
                     gemini_client=gemini_client,
                     model=model,
                     message=message,
-                    tool_executor=tool_executor,
+                    tool_executor=executor,
                 )
             elif openai_client is not None:
                 # Primary: Agents SDK, Fallback: Function Calling
@@ -829,7 +834,7 @@ def create_recyclable_price_agent_node(
                         openai_client=openai_client,
                         model=model,
                         message=message,
-                        tool_executor=tool_executor,
+                        tool_executor=executor,
                     )
                 except ImportError:
                     logger.warning("openai-agents not installed, using function calling")
@@ -837,7 +842,7 @@ def create_recyclable_price_agent_node(
                         openai_client=openai_client,
                         model=model,
                         message=message,
-                        tool_executor=tool_executor,
+                        tool_executor=executor,
                     )
                 except Exception as e:
                     logger.warning(
@@ -848,7 +853,7 @@ def create_recyclable_price_agent_node(
                         openai_client=openai_client,
                         model=model,
                         message=message,
-                        tool_executor=tool_executor,
+                        tool_executor=executor,
                     )
             else:
                 logger.warning("No LLM client available for recyclable price agent")
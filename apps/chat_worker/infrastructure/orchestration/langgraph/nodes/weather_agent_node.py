@@ -38,6 +38,7 @@ if TYPE_CHECKING:
     from chat_worker.application.ports.events import ProgressNotifierPort
     from chat_worker.application.ports.kakao_local_client import KakaoLocalClientPort
     from chat_worker.application.ports.weather_client import WeatherClientPort
+    from chat_worker.infrastructure.orchestration.langgraph.tool_memo import ToolCallMemo
 
 logger = logging.getLogger(__name__)
 
@@ -791,6 +792,7 @@ def create_weather_agent_node(
     gemini_client: Any | None = None,
     default_model: str = "gpt-5.2",
     default_provider: str = "openai",
+    tool_memo: "ToolCallMemo | None" = None,
 ):
     """Weather Agent 노드 팩토리.
 
@@ -805,6 +807,7 @@ def create_weather_agent_node(
         gemini_client: Gemini Client (선택)
         default_model: 기본 모델명 (gpt-5.2, gemini-3-flash 등)
         default_provider: 기본 프로바이더 ("openai" | "gemini")
+        tool_memo: Job 단위 Tool 호출 메모 (선택, 에이전트 노드 간 공유)
 
     Returns:
         weather_agent_node 함수
@@ -824,6 +827,8 @@ def create_weather_agent_node(
             업데이트된 상태 (weather_context)
         """
         job_id = state.get("job_id", "")
+        # 같은 job의 동일 Tool 호출은 라운드/노드 간 재사용
+        executor = tool_memo.bind(job_id, tool_executor) if tool_memo is not None else tool_executor
         message = state.get("message", "")
         user_location = state.get("user_location")
 
@@ -847,7 +852,7 @@ def create_weather_agent_node(
                     model=model,
                     message=message,
                     user_location=user_location,
-                    tool_executor=tool_executor,
+                    tool_executor=executor,
                 )
             elif openai_client is not None:
                 # Primary: Agents SDK, Fallback: Function Calling
@@ -857,7 +862,7 @@ def create_weather_agent_node(
                         model=model,
                         message=message,
                         user_location=user_location,
-                        tool_executor=tool_executor,
+                        tool_executor=executor,
                     )
                 except ImportError:
                     logger.warning("openai-agents not installed, using function calling")
@@ -866,7 +871,7 @@ def create_weather_agent_node(
                         model=model,
                         message=message,
                         user_location=user_location,
-                        tool_executor=tool_executor,
+                        tool_executor=executor,
                     )
                 except Exception as e:
                     logger.warning(
@@ -878,7 +883,7 @@ def create_weather_agent_node(
                         model=model,
                         message=message,
                         user_location=user_location,
-                        tool_executor=tool_executor,
+                        tool_executor=executor,
                     )
             else:
                 # Fallback: LLM 없으면 직접 날씨 조회
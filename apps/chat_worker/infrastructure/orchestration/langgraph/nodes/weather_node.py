@@ -56,6 +56,7 @@ from chat_worker.infrastructure.orchestration.langgraph.nodes.node_executor impo
 
 if TYPE_CHECKING:
     from chat_worker.application.ports.events import ProgressNotifierPort
+    from chat_worker.application.ports.geo_resolver import GeoResolverPort
     from chat_worker.application.ports.llm import LLMClientPort
     from chat_worker.application.ports.weather_client import WeatherClientPort
 
@@ -86,6 +87,7 @@ def create_weather_node(
     weather_client: "WeatherClientPort",
     event_publisher: "ProgressNotifierPort",
     llm: "LLMClientPort",
+    geo_resolver: "GeoResolverPort | None" = None,
 ):
     """날씨 노드 팩토리.
 
@@ -104,12 +106,13 @@ def create_weather_node(
         weather_client: 날씨 클라이언트
         event_publisher: 이벤트 발행기
         llm: LLM 클라이언트 (Function Calling용)
+        geo_resolver: 좌표 → 지역 해석 (선택, 노드 간 셀 캐시 공유)
 
     Returns:
         weather_node 함수
     """
     # Command(UseCase) 인스턴스 생성 - Port 조립
-    command = GetWeatherCommand(weather_client=weather_client)
+    command = GetWeatherCommand(weather_client=weather_client, geo_resolver=geo_resolver)
 
     async def _weather_node_inner(state: dict[str, Any]) -> dict[str, Any]:
         """실제 노드 로직 (NodeExecutor가 래핑).
@@ -0,0 +1,258 @@
+"""Speculative Prefetch - Intent 분류와 병렬로 서브에이전트 컨텍스트 선행 조회.
+
+그래프는 intent → router → Send fan-out 순서라서
+waste_rag(로컬 규정 검색), character(gRPC) 같은 결정적 조회도
+Intent LLM 호출이 끝날 때까지 시작하지 못합니다.
+
+Speculative 모드 (opt-in):
+1. intent 노드 진입 시 저비용 휴리스틱으로 유력 노드 예측
+   - 키워드 매칭 (버려/분리/재활용, 캐릭터 ...)
+   - CharacterNameDetector (캐릭터 공식 이름)
+   - 유사 메시지 Intent 캐시 peek (SemanticIntentCachePort)
+2. 예측 노드의 Command를 백그라운드 태스크로 실행 (progress 이벤트 없음)
+3. router에서 실제 Intent와 대조: 빗나간 예측은 취소 (settle)
+4. 서브에이전트 노드는 선행 결과가 있으면 Command 재실행 없이 사용 (take)
+
+메트릭:
+- chat_speculative_prefetch_total{node, outcome=hit|wasted|unpredicted|error}
+- chat_speculative_prefetch_saved_seconds{node}: 노드 입장에서 절감된 대기 시간
+
+Usage (factory.py):
+    prefetcher = SpeculativePrefetcher(semantic_cache=...)
+    rag_node = create_rag_node(retriever, publisher, prefetcher=prefetcher)  # register + take
+    intent 노드 래퍼에서 prefetcher.start(state), router 노드에서 prefetcher.settle(state)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from chat_worker.infrastructure.assets.character_name_detector import (
+    get_character_name_detector,
+)
+from chat_worker.infrastructure.metrics import (
+    CHAT_SPECULATIVE_PREFETCH_SAVED_SECONDS,
+    CHAT_SPECULATIVE_PREFETCH_TOTAL,
+)
+from chat_worker.infrastructure.orchestration.langgraph.routing import INTENT_TO_NODE
+
+if TYPE_CHECKING:
+    from chat_worker.application.ports.cache import SemanticIntentCachePort
+
+logger = logging.getLogger(__name__)
+
+PrefetchFunc = Callable[[dict[str, Any]], Awaitable[Any]]
+
+# 노드별 예측 키워드 (IntentClassifierService 키워드 부스트와 동일 계열)
+SPECULATION_KEYWORDS: dict[str, tuple[str, ...]] = {
+    "waste_rag": ("버려", "버리", "분리", "재활용", "쓰레기", "폐기", "배출"),
+    "character": ("캐릭터", "컬렉션"),
+}
+
+# 소비되지 않은 선행 결과 보관 한도 (그래프 실패로 settle이 안 된 경우 정리)
+DEFAULT_PREFETCH_TTL = 30.0
+
+
+@dataclass
+class _Prefetch:
+    started_at: float
+    task: asyncio.Task | None = None
+    finished_at: float | None = None
+
+    def cancel(self) -> None:
+        if self.task is not None:
+            self.task.cancel()
+
+
+@dataclass
+class _JobPrefetches:
+    created_at: float
+    entries: dict[str, _Prefetch] = field(default_factory=dict)
+
+
+class SpeculativePrefetcher:
+    """Job 단위 선행 조회 관리자 (프로세스 로컬)."""
+
+    def __init__(
+        self,
+        semantic_cache: "SemanticIntentCachePort | None" = None,
+        ttl: float = DEFAULT_PREFETCH_TTL,
+    ):
+        """초기화.
+
+        Args:
+            semantic_cache: 유사 메시지 Intent 캐시 (peek으로 예측 보강, 선택)
+            ttl: 소비되지 않은 선행 결과 보관 시간 (초)
+        """
+        self._semantic_cache = semantic_cache
+        self._ttl = ttl
+        self._fetchers: dict[str, PrefetchFunc] = {}
+        self._jobs: dict[str, _JobPrefetches] = {}
+
+    def register(self, node_name: str, fetch: PrefetchFunc) -> None:
+        """노드의 선행 조회 함수 등록 (노드 팩토리에서 호출).
+
+        Args:
+            node_name: 그래프 노드 이름 (INTENT_TO_NODE 값)
+            fetch: state → Command 출력 (progress 이벤트 없이 순수 조회)
+        """
+        self._fetchers[node_name] = fetch
+
+    @property
+    def registered_nodes(self) -> frozenset[str]:
+        return frozenset(self._fetchers)
+
+    # ========== 예측 ==========
+
+    async def predict(self, state: dict[str, Any]) -> set[str]:
+        """저비용 휴리스틱으로 유력 노드 예측 (등록된 노드만)."""
+        # 이미지 입력은 vision 결과(classification)에 따라 검색이 달라지므로 제외
+        if state.get("image_url"):
+            return set()
+
+        message = state.get("message", "")
+        predicted = {
+            node
+            for node, keywords in SPECULATION_KEYWORDS.items()
+            if any(keyword in message for keyword in keywords)
+        }
+
+        # 별칭에는 품목명("페트", "종이")도 있으므로 공식 이름으로 불렀을 때만 예측
+        detected = get_character_name_detector().detect(message)
+        if detected is not None and detected.matched_alias == detected.name:
+            predicted.add("character")
+
+        if self._semantic_cache is not None:
+            try:
+                hit = await self._semantic_cache.peek(message)
+            except Exception as e:
+                logger.debug(f"Semantic cache peek failed: {e}")
+                hit = None
+            if hit is not None:
+                predicted.add(INTENT_TO_NODE.get(hit.intent, hit.intent))
+
+        return predicted & self._fetchers.keys()
+
+    # ========== 생명주기 ==========
+
+    async def start(self, state: dict[str, Any]) -> list[str]:
+        """예측 노드 선행 조회 시작 (intent 노드 진입 시).
+
+        Returns:
+            선행 조회를 시작한 노드 목록
+        """
+        self._sweep()
+        job_id = state.get("job_id", "")
+        if not job_id or job_id in self._jobs:
+            return []
+
+        predicted = await self.predict(state)
+        if not predicted:
+            return []
+
+        job = _JobPrefetches(created_at=time.monotonic())
+        # 선행 조회는 intent 노드 시점 state 스냅샷으로 실행
+        snapshot = dict(state)
+        for node_name in sorted(predicted):
+            prefetch = _Prefetch(started_at=time.monotonic())
+            prefetch.task = asyncio.create_task(self._run(node_name, snapshot, prefetch))
+            prefetch.task.add_done_callback(_consume_exception)
+            job.entries[node_name] = prefetch
+        self._jobs[job_id] = job
+
+        logger.debug(
+            "Speculative prefetch started",
+            extra={"job_id": job_id, "nodes": sorted(predicted)},
+        )
+        return sorted(predicted)
+
+    async def _run(self, node_name: str, state: dict[str, Any], prefetch: _Prefetch) -> Any:
+        try:
+            return await self._fetchers[node_name](state)
+        finally:
+            prefetch.finished_at = time.monotonic()
+
+    def settle(self, state: dict[str, Any]) -> None:
+        """실제 Intent와 예측 대조 (router 노드에서 호출).
+
+        라우팅되지 않을 노드의 선행 조회는 취소합니다.
+        """
+        job_id = state.get("job_id", "")
+        routed = {INTENT_TO_NODE.get(state.get("intent", "general"), "general")}
+        routed.update(
+            INTENT_TO_NODE.get(intent, intent) for intent in state.get("additional_intents") or []
+        )
+
+        job = self._jobs.get(job_id)
+        predicted = set(job.entries) if job else set()
+
+        for node_name in (routed & self._fetchers.keys()) - predicted:
+            _record_outcome(node_name, "unpredicted")
+
+        if job is None:
+            return
+        for node_name in predicted - routed:
+            job.entries.pop(node_name).cancel()
+            _record_outcome(node_name, "wasted")
+        if not job.entries:
+            self._jobs.pop(job_id, None)
+
+    async def take(self, job_id: str, node_name: str) -> Any | None:
+        """선행 조회 결과 소비 (서브에이전트 노드에서 호출).
+
+        Returns:
+            Command 출력 (선행 조회가 없거나 실패했으면 None → 노드가 직접 실행)
+        """
+        job = self._jobs.get(job_id)
+        prefetch = job.entries.pop(node_name, None) if job else None
+        if job is not None and not job.entries:
+            self._jobs.pop(job_id, None)
+        if prefetch is None or prefetch.task is None:
+            return None
+
+        waited_from = time.monotonic()
+        try:
+            result = await prefetch.task
+        except Exception as e:
+            logger.warning(
+                "Speculative prefetch failed, running node directly",
+                extra={"job_id": job_id, "node": node_name, "error": str(e)},
+            )
+            _record_outcome(node_name, "error")
+            return None
+
+        # 절감 시간 = 노드가 직접 실행했을 때 기다렸을 시간 - 실제 기다린 시간
+        finished_at = prefetch.finished_at or time.monotonic()
+        fetch_duration = finished_at - prefetch.started_at
+        waited = max(0.0, finished_at - waited_from)
+        _record_outcome(node_name, "hit", saved=max(0.0, fetch_duration - waited))
+        return result
+
+    def _sweep(self) -> None:
+        """TTL 지난 미소비 선행 조회 정리."""
+        now = time.monotonic()
+        for job_id in [j for j, job in self._jobs.items() if now - job.created_at > self._ttl]:
+            for prefetch in self._jobs.pop(job_id).entries.values():
+                prefetch.cancel()
+
+    def pending_jobs(self) -> int:
+        """미소비 선행 조회가 남은 job 수 (모니터링/테스트용)."""
+        return len(self._jobs)
+
+
+def _consume_exception(task: asyncio.Task) -> None:
+    """소비되지 않은 선행 조회 예외가 'never retrieved' 경고로 남지 않도록 조회."""
+    if not task.cancelled():
+        task.exception()
+
+
+def _record_outcome(node_name: str, outcome: str, saved: float | None = None) -> None:
+    """Prometheus 메트릭 기록."""
+    CHAT_SPECULATIVE_PREFETCH_TOTAL.labels(node=node_name, outcome=outcome).inc()
+    if saved is not None:
+        CHAT_SPECULATIVE_PREFETCH_SAVED_SECONDS.labels(node=node_name).observe(saved)
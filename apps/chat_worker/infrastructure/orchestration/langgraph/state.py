@@ -287,6 +287,12 @@ class ChatState(TypedDict, total=False):
     summary: str
     """압축된 이전 대화 요약 (SummarizationNode에서 사용)."""
 
+    context_token_count: int
+    """messages 채널 누적 토큰 수 (SummarizationNode 증분 계산)."""
+
+    context_token_cursor: str | None
+    """context_token_count에 마지막으로 반영된 메시지 id."""
+
     # ==================== Output Layer ====================
 
     answer: str
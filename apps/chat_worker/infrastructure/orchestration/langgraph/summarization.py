@@ -8,6 +8,8 @@ LangGraph 1.0+ pre_model_hook 패턴 지원.
 2. Structured Summary: 5개 섹션으로 구조화된 요약
 3. Dynamic Token Limit: 컨텍스트 윈도우의 15% 요약 토큰 (min 20K, max 65K)
 4. Context Preservation: 원문 요청 + 목표 + 작업 상태 보존
+5. Incremental Compaction: 누적 토큰 수 + cursor(마지막 계산 메시지 id)를 state에 유지
+   → 매 턴 새 메시지만 계산 (O(새 메시지)), 압축 시 이전 요약 + 새 메시지만 요약
 
 모델별 컨텍스트 윈도우:
 - gpt-5.2: 400,000 context / 128,000 output (OpenAI)
@@ -23,6 +25,7 @@ LangGraph 1.0+ pre_model_hook 패턴 지원.
 from __future__ import annotations
 
 import logging
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Callable
 
@@ -155,6 +158,8 @@ DEFAULT_MAX_TOKENS_BEFORE_SUMMARY = 3072  # 동적 계산으로 대체됨
 DEFAULT_MAX_SUMMARY_TOKENS = 1024  # 동적 계산으로 대체됨
 DEFAULT_KEEP_RECENT_MESSAGES = 6  # 동적 계산으로 대체됨
 
+SUMMARY_MESSAGE_ID = "summary"  # 요약 SystemMessage id (압축마다 제자리 교체)
+
 
 def count_tokens_approximately(messages: list["AnyMessage"]) -> int:
     """대략적인 토큰 수 계산 (다국어 대응).
@@ -183,6 +188,115 @@ def count_tokens_approximately(messages: list["AnyMessage"]) -> int:
     return total_chars // 2  # 한글 혼합 고려: 보수적으로 2자당 1토큰
 
 
+def _message_text(msg: "AnyMessage") -> str:
+    content = getattr(msg, "content", "")
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return "".join(
+            item["text"] for item in content if isinstance(item, dict) and "text" in item
+        )
+    return ""
+
+
+MESSAGE_TOKEN_OVERHEAD = 4  # 메시지당 role/구분자 토큰 (OpenAI chat 포맷 기준)
+DEFAULT_TOKENIZER_ENCODING = "o200k_base"  # gpt-5.x 계열
+DEFAULT_TOKEN_CACHE_SIZE = 50_000
+
+
+class CachedTokenCounter:
+    """메시지 id별 토큰 수를 캐시하는 토크나이저 기반 카운터.
+
+    - tiktoken 인코딩으로 정확히 계산 (인코딩 로드 실패 시 2자당 1토큰 근사)
+    - 캐시 키: (message id, 본문 길이) → 같은 id의 내용 교체(요약 갱신 등)는 재계산
+    - id 없는 메시지는 캐시하지 않음
+    """
+
+    def __init__(
+        self,
+        encoding_name: str = DEFAULT_TOKENIZER_ENCODING,
+        max_entries: int = DEFAULT_TOKEN_CACHE_SIZE,
+        encode: Callable[[str], list[int]] | None = None,
+    ):
+        """초기화.
+
+        Args:
+            encoding_name: tiktoken 인코딩 이름
+            max_entries: 캐시 최대 항목 수 (LRU)
+            encode: 인코더 주입 (테스트용, None이면 tiktoken 지연 로드)
+        """
+        self._encoding_name = encoding_name
+        self._max_entries = max_entries
+        self._encode = encode
+        self._encoder_loaded = encode is not None
+        self._cache: OrderedDict[tuple[str, int], int] = OrderedDict()
+
+    def __call__(self, messages: list["AnyMessage"]) -> int:
+        return sum(self.count_message(msg) for msg in messages)
+
+    def count_message(self, msg: "AnyMessage") -> int:
+        """메시지 1개 토큰 수 (캐시 우선)."""
+        text = _message_text(msg)
+        msg_id = getattr(msg, "id", None)
+        if not msg_id:
+            return self._count_text(text)
+
+        key = (msg_id, len(text))
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+
+        tokens = self._count_text(text)
+        self._cache[key] = tokens
+        if len(self._cache) > self._max_entries:
+            self._cache.popitem(last=False)
+        return tokens
+
+    def _count_text(self, text: str) -> int:
+        encode = self._get_encoder()
+        if encode is None:
+            return len(text) // 2 + MESSAGE_TOKEN_OVERHEAD
+        return len(encode(text)) + MESSAGE_TOKEN_OVERHEAD
+
+    def _get_encoder(self) -> Callable[[str], list[int]] | None:
+        if not self._encoder_loaded:
+            self._encoder_loaded = True
+            try:
+                import tiktoken
+
+                encoding = tiktoken.get_encoding(self._encoding_name)
+                self._encode = encoding.encode_ordinary
+            except Exception as e:
+                logger.warning(
+                    "Tokenizer unavailable, using approximate token count",
+                    extra={"encoding": self._encoding_name, "error": str(e)},
+                )
+        return self._encode
+
+
+def preload_tokenizer(encoding_name: str = DEFAULT_TOKENIZER_ENCODING) -> bool:
+    """tiktoken 인코딩 선행 로드 (블로킹 - 워커 시작 시 스레드에서 호출).
+
+    tiktoken은 인코딩을 프로세스 전역에 캐시하므로 이후 CachedTokenCounter의
+    지연 로드는 즉시 끝납니다 (첫 요약 턴에서 BPE 다운로드/파싱 없음).
+
+    Returns:
+        로드 성공 여부
+    """
+    try:
+        import tiktoken
+
+        tiktoken.get_encoding(encoding_name)
+    except Exception as e:
+        logger.warning(
+            "Tokenizer preload failed",
+            extra={"encoding": encoding_name, "error": str(e)},
+        )
+        return False
+    return True
+
+
 # 기본 프롬프트 (PromptLoader가 없을 때 사용)
 # oh-my-opencode 스타일 구조화된 요약
 DEFAULT_SUMMARIZATION_PROMPT = """다음 대화 내용을 구조화된 형식으로 요약해주세요.
@@ -458,7 +572,7 @@ class SummarizationNode:
         self,
         llm: "LLMClientPort",
         model_name: str | None = None,  # 신규: 동적 설정용
-        token_counter: Callable[[list["AnyMessage"]], int] = count_tokens_approximately,
+        token_counter: Callable[[list["AnyMessage"]], int] | None = None,
         max_tokens_before_summary: int | None = None,  # None이면 동적 계산
         max_summary_tokens: int | None = None,  # None이면 동적 계산
         keep_recent_messages: int | None = None,  # None이면 동적 계산
@@ -469,14 +583,14 @@ class SummarizationNode:
         Args:
             llm: 요약용 LLM 클라이언트
             model_name: 모델명 (동적 설정용, 예: "gpt-5.2")
-            token_counter: 토큰 카운터 함수
+            token_counter: 토큰 카운터 함수 (None이면 CachedTokenCounter)
             max_tokens_before_summary: 요약 트리거 임계값 (None이면 context-output 동적 계산)
             max_summary_tokens: 요약 최대 토큰 (None이면 15% 동적 계산)
             keep_recent_messages: 유지할 최근 메시지 수 (None이면 PRUNE_PROTECT 기반 계산)
             prompt_loader: 프롬프트 로더 (선택)
         """
         self.llm = llm
-        self.token_counter = token_counter
+        self.token_counter = token_counter or CachedTokenCounter()
         self.prompt_loader = prompt_loader
 
         # 동적 설정 계산
@@ -522,13 +636,33 @@ class SummarizationNode:
                 },
             )
 
+    def _running_token_count(self, state: dict[str, Any], messages: list["AnyMessage"]) -> int:
+        """누적 토큰 수 + cursor 이후 새 메시지만 계산.
+
+        cursor(마지막으로 계산한 메시지 id)를 뒤에서부터 찾아 그 이후만 더함.
+        cursor가 없거나 찾지 못하면(외부에서 메시지 삭제 등) 전체 재계산.
+        """
+        running = state.get("context_token_count")
+        cursor = state.get("context_token_cursor")
+        if running is None or not cursor:
+            return self.token_counter(messages)
+
+        new_messages: list["AnyMessage"] = []
+        for msg in reversed(messages):
+            if msg.id == cursor:
+                new_messages.reverse()
+                return running + self.token_counter(new_messages)
+            new_messages.append(msg)
+        return self.token_counter(messages)
+
     async def __call__(self, state: dict[str, Any]) -> dict[str, Any]:
-        """LangGraph 노드: 컨텍스트 압축 + RemoveMessage.
+        """LangGraph 노드: 증분 컨텍스트 압축 + RemoveMessage.
 
+        매 턴: 누적 토큰 수(context_token_count)에 새 메시지만 더해 갱신.
         임계값 초과 시:
-        1. older_messages를 요약
+        1. 이전 요약 + 마지막 압축 이후 older_messages만 요약
         2. RemoveMessage로 older_messages 삭제
-        3. 요약 SystemMessage 추가
+        3. 요약 SystemMessage 추가/교체 (id="summary")
         """
         from langchain_core.messages import RemoveMessage
 
@@ -537,9 +671,13 @@ class SummarizationNode:
         if not messages:
             return {}
 
-        current_tokens = self.token_counter(messages)
+        current_tokens = self._running_token_count(state, messages)
+        counted = {
+            "context_token_count": current_tokens,
+            "context_token_cursor": messages[-1].id,
+        }
 
-        # 임계값 미만이면 패스
+        # 임계값 미만이면 누적 카운트만 갱신
         if current_tokens <= self.max_tokens_before_summary:
             logger.debug(
                 "context_within_limit",
@@ -548,7 +686,7 @@ class SummarizationNode:
                     "threshold": self.max_tokens_before_summary,
                 },
             )
-            return {}
+            return counted
 
         logger.info(
             "context_compression_triggered",
@@ -558,13 +696,18 @@ class SummarizationNode:
             },
         )
 
-        # 최근 메시지 보호
-        older_messages = messages[: -self.keep_recent_messages]
+        # 최근 메시지 보호, 기존 요약 메시지는 existing_summary로 전달되므로 제외
+        recent_messages = [
+            m for m in messages[-self.keep_recent_messages :] if m.id != SUMMARY_MESSAGE_ID
+        ]
+        older_messages = [
+            m for m in messages[: -self.keep_recent_messages] if m.id != SUMMARY_MESSAGE_ID
+        ]
 
         if not older_messages:
-            return {}
+            return counted
 
-        # 요약 생성
+        # 요약 생성 (이전 요약 + 마지막 압축 이후 메시지만)
         existing_summary = state.get("summary", "")
         new_summary = await summarize_messages(
             older_messages,
@@ -579,10 +722,12 @@ class SummarizationNode:
         remove_msgs = [RemoveMessage(id=m.id) for m in older_messages if m.id]
         summary_msg = SystemMessage(
             content=f"[이전 대화 요약]\n{new_summary}",
-            id="summary",
+            id=SUMMARY_MESSAGE_ID,
         )
 
-        compressed_tokens = self.token_counter(messages[-self.keep_recent_messages :])
+        # 압축 후 채널: 기존 요약 메시지는 제자리 교체, 없으면 끝에 추가 (add_messages)
+        has_summary = any(m.id == SUMMARY_MESSAGE_ID for m in messages)
+        compressed_tokens = self.token_counter([summary_msg, *recent_messages])
         logger.info(
             "context_compressed",
             extra={
@@ -596,4 +741,6 @@ class SummarizationNode:
         return {
             "messages": remove_msgs + [summary_msg],
             "summary": new_summary,
+            "context_token_count": compressed_tokens,
+            "context_token_cursor": messages[-1].id if has_summary else SUMMARY_MESSAGE_ID,
         }
@@ -0,0 +1,193 @@
+"""Tool Call Memo - 에이전트 노드 Tool 호출 Job 단위 메모이제이션.
+
+에이전트 노드(location/weather/collection_point/bulk_waste/recyclable_price)는
+LLM이 여러 라운드에 걸쳐 Tool을 호출합니다. 같은 인자의 호출
+(라운드 간 반복된 search_places, multi-intent fan-out에서 weather와
+collection_point가 각자 부르는 geocode 등)이 매번 외부 API를 다시 호출하던 것을
+(tool, 정규화 인자) 키로 한 번만 실행해 공유합니다.
+
+- 범위: job_id (그래프 1회 실행) - 같은 job의 모든 에이전트 노드가 공유
+- 동시 호출: 같은 키는 하나의 실행을 함께 기다림 (single-flight)
+- 실패 결과(success=False)는 메모하지 않음 (다음 라운드 재시도)
+- 메모 미스는 각 Tool의 클라이언트 캐시(CachedWeatherClient, 스냅샷 등)로 이어짐
+
+Tool 이름은 노드 간 전역 키입니다. 여러 노드에 같은 이름의 Tool(geocode)이 있으면
+인자/결과 형식이 같아야 합니다.
+
+Usage (노드 팩토리):
+    tool_memo = ToolCallMemo()  # 그래프 단위로 하나, 에이전트 노드에 공유
+    executor = tool_memo.bind(job_id, tool_executor)
+    result = await executor.execute("geocode", {"place_name": "강남역"})
+
+LangSmith: 노드 run 메타데이터에 tool_calls / tool_calls_deduped 기록
+Prometheus: chat_agent_tool_calls_total{tool, outcome=executed|deduped}
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from chat_worker.infrastructure.metrics import CHAT_AGENT_TOOL_CALLS
+from chat_worker.infrastructure.telemetry import add_run_metadata
+
+logger = logging.getLogger(__name__)
+
+ExecuteFunc = Callable[[str, dict[str, Any]], Awaitable[Any]]
+
+# 완료된 job의 메모 보관 한도 (그래프 종료 신호가 없으므로 시간/개수로 정리)
+DEFAULT_MEMO_TTL = 120.0
+DEFAULT_MAX_JOBS = 1024
+
+
+def canonical_arguments(arguments: dict[str, Any] | None) -> str:
+    """Tool 인자 → 정규화 키.
+
+    키 순서, 공백 차이, None 인자, 정수/실수 표기(37 vs 37.0)를 무시합니다.
+    """
+
+    def normalize(value: Any) -> Any:
+        if isinstance(value, str):
+            return " ".join(value.split())
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, (int, float)):
+            return round(float(value), 6)
+        if isinstance(value, dict):
+            return {str(k): normalize(v) for k, v in value.items() if v is not None}
+        if isinstance(value, (list, tuple)):
+            return [normalize(v) for v in value]
+        return value
+
+    return json.dumps(
+        normalize(arguments or {}),
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        default=str,
+    )
+
+
+@dataclass
+class _JobMemo:
+    created_at: float
+    results: dict[tuple[str, str], asyncio.Future] = field(default_factory=dict)
+
+
+class ToolCallMemo:
+    """Job 단위 Tool 호출 메모 (프로세스 로컬)."""
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_MEMO_TTL,
+        max_jobs: int = DEFAULT_MAX_JOBS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """초기화.
+
+        Args:
+            ttl: job 메모 보관 시간 (초, 그래프 실행 시간보다 길게)
+            max_jobs: 보관 job 수 상한
+            clock: 시계 (테스트용)
+        """
+        self._ttl = ttl
+        self._max_jobs = max_jobs
+        self._clock = clock
+        self._jobs: OrderedDict[str, _JobMemo] = OrderedDict()
+
+    def bind(self, job_id: str, executor: Any) -> MemoizedToolExecutor:
+        """Tool 실행기를 job 메모로 감싸기 (노드 실행마다 호출)."""
+        return MemoizedToolExecutor(self, job_id, executor)
+
+    async def call(
+        self,
+        job_id: str,
+        tool_name: str,
+        arguments: dict[str, Any],
+        execute: ExecuteFunc,
+    ) -> tuple[Any, bool]:
+        """메모 우선 Tool 실행.
+
+        Returns:
+            (Tool 결과, 메모 재사용 여부)
+        """
+        if not job_id:
+            return await execute(tool_name, arguments), False
+
+        job = self._job(job_id)
+        key = (tool_name, canonical_arguments(arguments))
+        future = job.results.get(key)
+        deduped = future is not None
+        if future is None:
+            future = asyncio.ensure_future(execute(tool_name, arguments))
+            job.results[key] = future
+            future.add_done_callback(lambda f: self._forget_failure(job, key, f))
+        CHAT_AGENT_TOOL_CALLS.labels(
+            tool=tool_name, outcome="deduped" if deduped else "executed"
+        ).inc()
+        # 호출자 취소가 공유 실행을 취소하지 않도록 shield
+        return await asyncio.shield(future), deduped
+
+    def _job(self, job_id: str) -> _JobMemo:
+        now = self._clock()
+        while self._jobs:
+            oldest_id, oldest = next(iter(self._jobs.items()))
+            if now - oldest.created_at <= self._ttl and len(self._jobs) < self._max_jobs:
+                break
+            del self._jobs[oldest_id]
+
+        job = self._jobs.get(job_id)
+        if job is None:
+            job = self._jobs[job_id] = _JobMemo(created_at=now)
+        return job
+
+    @staticmethod
+    def _forget_failure(job: _JobMemo, key: tuple[str, str], future: asyncio.Future) -> None:
+        """실패한 호출은 메모에서 제거 (다음 호출이 다시 실행)."""
+        failed = future.cancelled() or future.exception() is not None
+        if not failed and getattr(future.result(), "success", True) is False:
+            failed = True
+        if failed and job.results.get(key) is future:
+            del job.results[key]
+
+    def pending_jobs(self) -> int:
+        """메모가 남은 job 수 (모니터링/테스트용)."""
+        return len(self._jobs)
+
+
+class MemoizedToolExecutor:
+    """Tool 실행기 래퍼 - execute()만 메모, 나머지 속성은 원본 위임."""
+
+    def __init__(self, memo: ToolCallMemo, job_id: str, executor: Any):
+        self._memo = memo
+        self._job_id = job_id
+        self._executor = executor
+        self.calls = 0
+        self.deduped = 0
+
+    async def execute(self, tool_name: str, arguments: dict[str, Any]) -> Any:
+        """Tool 실행 (같은 job의 동일 호출은 재사용)."""
+        self.calls += 1
+        result, deduped = await self._memo.call(
+            self._job_id, tool_name, arguments, self._executor.execute
+        )
+        if deduped:
+            self.deduped += 1
+        add_run_metadata(self.stats())  # 현재 노드 run에 누적 통계 반영
+        return result
+
+    def stats(self) -> dict[str, int]:
+        """노드 실행 단위 Tool 호출 통계 (LangSmith 메타데이터용)."""
+        return {"tool_calls": self.calls, "tool_calls_deduped": self.deduped}
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._executor, name)
+
+
+__all__ = ["MemoizedToolExecutor", "ToolCallMemo", "canonical_arguments"]
@@ -1,8 +1,25 @@
 """Rate Limiting - Redis 기반 요청 제한."""
 
+from chat_worker.infrastructure.ratelimit.gcra import (
+    GCRADecision,
+    GCRALimiter,
+    RateLimit,
+)
+from chat_worker.infrastructure.ratelimit.llm_admission import (
+    LLMAdmissionController,
+    LLMBudgetExhausted,
+)
 from chat_worker.infrastructure.ratelimit.redis_limiter import (
     RateLimiter,
     RateLimitExceeded,
 )
 
-__all__ = ["RateLimiter", "RateLimitExceeded"]
+__all__ = [
+    "GCRADecision",
+    "GCRALimiter",
+    "LLMAdmissionController",
+    "LLMBudgetExhausted",
+    "RateLimit",
+    "RateLimiter",
+    "RateLimitExceeded",
+]
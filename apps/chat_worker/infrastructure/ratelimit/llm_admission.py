@@ -0,0 +1,391 @@
+"""LLM Admission Controller - 클러스터 공유 RPM 예산 + 429 인지 AIMD 동시성 제어.
+
+프로세스마다 고정 HTTP_LIMITS로 provider를 호출하면 버스트 시 모든 replica가
+동시에 rate limit에 걸리고, 같은 타이밍에 재시도합니다.
+
+구조 (LLM 호출 1회):
+```
+admit(priority) ─▶ 로컬 동시성 슬롯 (AIMD limit, 우선순위 큐)
+               ─▶ 공유 예산 permit (로컬 선예약분 → 없으면 Redis Lua로 batch 예약)
+               ─▶ provider 호출 ─▶ 결과로 limit 조정
+```
+
+공유 예산 (Redis Token Bucket, Lua 원자 실행):
+- 키: chat:llm:admission:{scope} (HASH tokens/ts)
+- refill: rpm/60 per sec, 용량 burst
+- 시각은 Redis TIME 사용 (replica 간 clock skew 무관)
+- 로컬 선예약: permit을 reserve_batch개씩 받아 호출마다 왕복하지 않음
+  (reserve_ttl 지나면 폐기 → 유휴 replica의 예산 독점 방지)
+  선예약분은 floor별로 따로 보관 (낮은 우선순위가 answer 몫을 floor 없이 쓰지 않도록)
+- 우선순위 floor: 낮은 우선순위는 버킷 잔량이 floor 이하면 대기
+  → 예산이 부족할 때 answer가 weather 보강보다 먼저 통과
+
+AIMD (로컬 동시성):
+- 성공 + 지연 ≤ latency_target: limit += 1/limit (가법 증가)
+- 지연 > latency_target: limit *= latency_decrease_factor
+- 429: limit *= decrease_factor + 공유 버킷 비우기 (클러스터 전체 backoff)
+- 감소는 decrease_cooldown마다 최대 1회 (같은 버스트의 429 연쇄로 붕괴 방지)
+
+Fail-open: Redis 오류 시 로컬 동시성 제한만 적용하고 진행.
+max_wait 초과: floor 0 우선순위(answer/intent)만 진행, 나머지는 LLMBudgetExhausted
+(429 폭주 중 모든 replica가 보강 호출까지 보내지 않도록).
+
+메트릭:
+- chat_llm_admission_wait_seconds{priority}: 슬롯 + permit 대기 시간
+- chat_llm_admission_limit{scope}: 현재 동시성 limit
+- chat_llm_admission_events_total{scope, event=throttled|budget_timeout|redis_error}
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING
+
+from chat_worker.infrastructure.metrics import (
+    CHAT_LLM_ADMISSION_EVENTS,
+    CHAT_LLM_ADMISSION_LIMIT,
+    CHAT_LLM_ADMISSION_WAIT,
+)
+from chat_worker.infrastructure.orchestration.langgraph.priority import Priority
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+LLM_ADMISSION_PREFIX = "chat:llm:admission"
+
+# 공유 예산
+DEFAULT_RPM = 600
+DEFAULT_BURST = 50
+DEFAULT_RESERVE_BATCH = 4
+DEFAULT_RESERVE_TTL = 2.0  # 로컬 선예약 permit 유효 시간 (초)
+DEFAULT_MAX_WAIT = 10.0  # 공유 예산 대기 상한 (초)
+
+# AIMD
+DEFAULT_INITIAL_CONCURRENCY = 16
+DEFAULT_MIN_CONCURRENCY = 2
+DEFAULT_MAX_CONCURRENCY = 64
+DEFAULT_LATENCY_TARGET = 5.0  # 비스트리밍 호출 기준 (초)
+DEFAULT_DECREASE_FACTOR = 0.5
+DEFAULT_LATENCY_DECREASE_FACTOR = 0.9
+DEFAULT_DECREASE_COOLDOWN = 2.0
+
+# 우선순위별 버킷 floor 비율 (잔량이 burst * ratio 이하면 해당 우선순위는 대기)
+PRIORITY_FLOOR_RATIOS: tuple[tuple[int, float], ...] = (
+    (Priority.HIGH, 0.0),
+    (Priority.NORMAL, 0.1),
+    (Priority.BACKGROUND, 0.25),
+)
+
+# KEYS[1]: bucket, ARGV: capacity, refill_per_sec, requested, floor
+# Returns: {granted, wait_ms}
+RESERVE_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+local floor = tonumber(ARGV[4])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1])
+local ts = tonumber(state[2])
+if tokens == nil or ts == nil then
+    tokens = capacity
+    ts = now
+end
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+
+local granted = 0
+local available = math.floor(tokens - floor)
+if available > 0 then
+    granted = math.min(requested, available)
+end
+tokens = tokens - granted
+
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) * 2 + 1)
+
+local wait_ms = 0
+if granted == 0 then
+    wait_ms = math.ceil((floor + 1 - tokens) / rate * 1000)
+end
+return {granted, wait_ms}
+"""
+
+# KEYS[1]: bucket → 429 수신 시 잔량을 0으로 (모든 replica가 refill까지 대기)
+DRAIN_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+redis.call('HSET', KEYS[1], 'tokens', '0', 'ts', tostring(now))
+return 1
+"""
+
+
+class LLMBudgetExhausted(Exception):
+    """공유 예산 대기 상한 초과 (floor가 있는 우선순위 호출 거부)."""
+
+
+def is_rate_limited(error: BaseException) -> bool:
+    """provider 429 (rate limit / quota) 여부 - 상태 코드로만 판단.
+
+    openai RateLimitError(status_code), google-genai APIError(code),
+    httpx HTTPStatusError(response.status_code) 모두 429를 코드로 노출합니다.
+    """
+    for attr in ("status_code", "code", "status"):
+        if getattr(error, attr, None) == 429:
+            return True
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None) == 429
+
+
+def floor_ratio(priority: int) -> float:
+    """우선순위별 버킷 floor 비율."""
+    for threshold, ratio in PRIORITY_FLOOR_RATIOS:
+        if priority <= threshold:
+            return ratio
+    return PRIORITY_FLOOR_RATIOS[-1][1]
+
+
+class LLMAdmissionController:
+    """LLM 호출 승인 제어 (프로세스 단위, 예산은 클러스터 공유)."""
+
+    def __init__(
+        self,
+        redis: "Redis | None",
+        scope: str = "default",
+        rpm: int = DEFAULT_RPM,
+        burst: int = DEFAULT_BURST,
+        reserve_batch: int = DEFAULT_RESERVE_BATCH,
+        reserve_ttl: float = DEFAULT_RESERVE_TTL,
+        max_wait: float = DEFAULT_MAX_WAIT,
+        initial_concurrency: int = DEFAULT_INITIAL_CONCURRENCY,
+        min_concurrency: int = DEFAULT_MIN_CONCURRENCY,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        latency_target: float = DEFAULT_LATENCY_TARGET,
+        decrease_factor: float = DEFAULT_DECREASE_FACTOR,
+        latency_decrease_factor: float = DEFAULT_LATENCY_DECREASE_FACTOR,
+        decrease_cooldown: float = DEFAULT_DECREASE_COOLDOWN,
+    ):
+        """초기화.
+
+        Args:
+            redis: Redis 클라이언트 (None이면 공유 예산 없이 로컬 AIMD만)
+            scope: 예산 범위 (provider 등, Redis 키 접미사)
+            rpm: 클러스터 전체 분당 요청 예산
+            burst: 버킷 용량 (순간 허용 요청 수)
+            reserve_batch: Redis 왕복 1회당 선예약 permit 수
+            reserve_ttl: 선예약 permit 유효 시간 (초)
+            max_wait: 공유 예산 대기 상한 (초과 시 floor 0 우선순위만 진행)
+            initial_concurrency: 초기 동시성 limit
+            min_concurrency: 동시성 limit 하한
+            max_concurrency: 동시성 limit 상한
+            latency_target: 이 지연 이하일 때만 limit 증가 (초)
+            decrease_factor: 429 수신 시 limit 배수
+            latency_decrease_factor: 지연 초과 시 limit 배수
+            decrease_cooldown: limit 감소 최소 간격 (초)
+        """
+        self._redis = redis
+        self._scope = scope
+        self._key = f"{LLM_ADMISSION_PREFIX}:{scope}"
+        self._capacity = max(1, burst)
+        self._refill_per_sec = max(rpm, 1) / 60.0
+        self._reserve_batch = max(1, reserve_batch)
+        self._reserve_ttl = reserve_ttl
+        self._max_wait = max_wait
+        self._min = max(1, min_concurrency)
+        self._max = max(self._min, max_concurrency)
+        self._limit = float(min(self._max, max(self._min, initial_concurrency)))
+        self._latency_target = latency_target
+        self._decrease_factor = decrease_factor
+        self._latency_decrease_factor = latency_decrease_factor
+        self._decrease_cooldown = decrease_cooldown
+        self._last_decrease = float("-inf")
+
+        self._in_flight = 0
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+
+        # floor 비율 → (선예약 잔량, 만료 시각)
+        self._permits: dict[float, tuple[int, float]] = {}
+        self._reserve_lock = asyncio.Lock()
+        self._reserve_script = None
+        self._drain_script = None
+        if redis is not None:
+            # register_script는 로컬 캐싱만 수행 (EVALSHA, NOSCRIPT 시 자동 재로드)
+            self._reserve_script = redis.register_script(RESERVE_SCRIPT)
+            self._drain_script = redis.register_script(DRAIN_SCRIPT)
+
+    @property
+    def limit(self) -> int:
+        """현재 동시성 limit."""
+        return max(1, int(self._limit))
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @asynccontextmanager
+    async def admit(
+        self,
+        priority: int = Priority.NORMAL,
+        measure_latency: bool = True,
+    ) -> AsyncIterator[None]:
+        """LLM 호출 1회 승인.
+
+        Args:
+            priority: 호출 우선순위 (낮을수록 먼저)
+            measure_latency: 성공 지연으로 limit 조정 (스트리밍 호출은 False)
+
+        Raises:
+            LLMBudgetExhausted: floor가 있는 우선순위가 max_wait 안에 예산을 못 받음
+        """
+        waited_from = time.monotonic()
+        await self._acquire_slot(priority)
+        try:
+            await self._take_permit(priority)
+            CHAT_LLM_ADMISSION_WAIT.labels(priority=str(int(priority))).observe(
+                time.monotonic() - waited_from
+            )
+            started = time.monotonic()
+            try:
+                yield
+            except Exception as e:
+                if is_rate_limited(e):
+                    await self.on_throttled()
+                raise
+            if measure_latency:
+                self.on_latency(time.monotonic() - started)
+        finally:
+            self._release_slot()
+
+    # ========== AIMD ==========
+
+    def on_latency(self, latency: float) -> None:
+        """성공 호출 지연 반영."""
+        if latency <= self._latency_target:
+            self._limit = min(self._max, self._limit + 1.0 / self._limit)
+            self._wake()
+        else:
+            self._decrease(self._latency_decrease_factor)
+        CHAT_LLM_ADMISSION_LIMIT.labels(scope=self._scope).set(self.limit)
+
+    async def on_throttled(self) -> None:
+        """429 수신: limit 감소 + 공유 버킷 비우기."""
+        self._decrease(self._decrease_factor)
+        CHAT_LLM_ADMISSION_EVENTS.labels(scope=self._scope, event="throttled").inc()
+        CHAT_LLM_ADMISSION_LIMIT.labels(scope=self._scope).set(self.limit)
+        self._permits.clear()
+        if self._drain_script is not None:
+            try:
+                await self._drain_script(keys=[self._key], args=[])
+            except Exception as e:
+                logger.warning(
+                    "LLM admission drain failed", extra={"scope": self._scope, "error": str(e)}
+                )
+
+    def _decrease(self, factor: float) -> None:
+        now = time.monotonic()
+        if now - self._last_decrease < self._decrease_cooldown:
+            return
+        self._last_decrease = now
+        self._limit = max(float(self._min), self._limit * factor)
+        logger.info(
+            "LLM admission limit decreased",
+            extra={"scope": self._scope, "limit": round(self._limit, 2)},
+        )
+
+    # ========== 로컬 동시성 슬롯 (우선순위 큐) ==========
+
+    async def _acquire_slot(self, priority: int) -> None:
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._seq), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # 슬롯을 받은 직후 취소됨 → 반납
+                self._release_slot()
+            raise
+
+    def _release_slot(self) -> None:
+        self._in_flight = max(0, self._in_flight - 1)
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            _, _, future = heapq.heappop(self._waiters)
+            if future.done():
+                continue  # 대기 중 취소됨
+            self._in_flight += 1
+            future.set_result(None)
+
+    # ========== 공유 예산 permit ==========
+
+    def _take_local_permit(self, floor: float) -> bool:
+        permits, expires_at = self._permits.get(floor, (0, 0.0))
+        if permits > 0 and time.monotonic() < expires_at:
+            self._permits[floor] = (permits - 1, expires_at)
+            return True
+        return False
+
+    async def _take_permit(self, priority: int) -> None:
+        if self._reserve_script is None:
+            return
+
+        ratio = floor_ratio(priority)
+        deadline = time.monotonic() + self._max_wait
+        while True:
+            if self._take_local_permit(ratio):
+                return
+
+            async with self._reserve_lock:
+                if self._take_local_permit(ratio):
+                    return
+                try:
+                    granted, wait_ms = await self._reserve_script(
+                        keys=[self._key],
+                        args=[
+                            self._capacity,
+                            self._refill_per_sec,
+                            self._reserve_batch,
+                            self._capacity * ratio,
+                        ],
+                    )
+                except Exception as e:
+                    logger.warning(
+                        "LLM admission reserve failed, fail-open",
+                        extra={"scope": self._scope, "error": str(e)},
+                    )
+                    CHAT_LLM_ADMISSION_EVENTS.labels(scope=self._scope, event="redis_error").inc()
+                    return
+                granted = int(granted)
+                if granted > 0:
+                    # 같은 floor로 예약한 호출끼리만 나눠 씀
+                    self._permits[ratio] = (granted - 1, time.monotonic() + self._reserve_ttl)
+                    return
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                CHAT_LLM_ADMISSION_EVENTS.labels(scope=self._scope, event="budget_timeout").inc()
+                if ratio > 0:
+                    raise LLMBudgetExhausted(
+                        f"{self._scope} LLM budget exhausted (priority={int(priority)})"
+                    )
+                logger.warning(
+                    "LLM admission budget wait exceeded, fail-open",
+                    extra={"scope": self._scope, "priority": int(priority)},
+                )
+                return
+            await asyncio.sleep(min(remaining, max(int(wait_ms) / 1000, 0.01)))
@@ -1,25 +1,31 @@
-"""Redis Rate Limiter - Sliding Window 기반 요청 제한.
+"""Redis Rate Limiter - GCRA 기반 요청 제한.
 
-알고리즘: Sliding Window Counter
-- 현재 윈도우와 이전 윈도우의 가중 평균 사용
-- 정확도와 메모리 효율성의 균형
+알고리즘: GCRA (ratelimit/gcra.py 공용 엔진)
+- 판정 1회 = EVALSHA 1회 (조회 + 소비 원자적, 동시 요청에도 초과 허용 없음)
+- 기존 Sliding Window Counter(GET 2회 + INCR 별도 왕복)를 대체
 
 키 설계:
-- chat:ratelimit:{user_id}:{window_id}
-- window_id = timestamp // window_size
+- chat:ratelimit:{user_id} (TAT 값 하나, 버킷이 가득 차면 만료)
 
 제한 정책:
-- 분당 요청 수 제한 (기본 60/분)
+- 분당 요청 수 제한 (기본 60/분, 어떤 60초 구간에서도 초과 없음)
+- 순간 허용량 burst (기본 10), 나머지는 균등하게 회복
 - 사용자별 독립 제한
 """
 
 from __future__ import annotations
 
 import logging
-import time
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+from chat_worker.infrastructure.ratelimit.gcra import (
+    GCRADecision,
+    GCRALimiter,
+    RateLimit,
+    seconds_ceil,
+)
+
 if TYPE_CHECKING:
     from redis.asyncio import Redis
 
@@ -28,6 +34,7 @@ logger = logging.getLogger(__name__)
 RATE_LIMIT_PREFIX = "chat:ratelimit"
 DEFAULT_LIMIT = 60  # 분당 60 요청
 DEFAULT_WINDOW = 60  # 60초 윈도우
+DEFAULT_BURST = 10  # 연속 요청 허용량
 
 
 class RateLimitExceeded(Exception):
@@ -63,7 +70,7 @@ class RateLimitInfo:
 class RateLimiter:
     """Redis 기반 Rate Limiter.
 
-    Sliding Window Counter 알고리즘 사용.
+    GCRA 알고리즘 사용 (판정당 Redis 왕복 1회).
     """
 
     def __init__(
@@ -71,7 +78,9 @@ class RateLimiter:
         redis: "Redis",
         limit: int = DEFAULT_LIMIT,
         window: int = DEFAULT_WINDOW,
+        burst: int = DEFAULT_BURST,
         key_prefix: str = RATE_LIMIT_PREFIX,
+        engine: GCRALimiter | None = None,
     ):
         """초기화.
 
@@ -79,21 +88,40 @@ class RateLimiter:
             redis: Redis 클라이언트
             limit: 윈도우당 최대 요청 수 (기본 60)
             window: 윈도우 크기 초 (기본 60)
+            burst: 연속 요청 허용량 (기본 10, limit 이하로 보정)
             key_prefix: 키 프리픽스
+            engine: 공용 GCRA 엔진 (None이면 생성)
         """
         self._redis = redis
         self._limit = limit
         self._window = window
+        self._burst = burst
         self._key_prefix = key_prefix
+        self._engine = engine or GCRALimiter(redis)
 
-    def _get_window_id(self, timestamp: float | None = None) -> int:
-        """현재 윈도우 ID 계산."""
-        ts = timestamp or time.time()
-        return int(ts // self._window)
-
-    def _make_key(self, user_id: str, window_id: int) -> str:
+    def _make_key(self, user_id: str) -> str:
         """Rate Limit 키 생성."""
-        return f"{self._key_prefix}:{user_id}:{window_id}"
+        return f"{self._key_prefix}:{user_id}"
+
+    def rate_limit(self, user_id: str) -> RateLimit:
+        """사용자 제한 정의 (acquire_many 배치 판정용)."""
+        return RateLimit.windowed(
+            key=self._make_key(user_id),
+            limit=self._limit,
+            period=self._window,
+            burst=self._burst,
+        )
+
+    def _to_info(self, user_id: str, decision: GCRADecision) -> RateLimitInfo:
+        return RateLimitInfo(
+            user_id=user_id,
+            limit=self._limit,
+            remaining=decision.remaining,
+            reset_after=seconds_ceil(
+                decision.reset_after if decision.allowed else decision.retry_after
+            ),
+            allowed=decision.allowed,
+        )
 
     async def check(self, user_id: str) -> RateLimitInfo:
         """Rate Limit 확인 (요청 카운트 증가 없음).
@@ -104,41 +132,21 @@ class RateLimiter:
         Returns:
             RateLimitInfo 객체
         """
-        now = time.time()
-        current_window = self._get_window_id(now)
-        prev_window = current_window - 1
-
-        current_key = self._make_key(user_id, current_window)
-        prev_key = self._make_key(user_id, prev_window)
-
-        # 현재/이전 윈도우 카운트 조회
-        pipe = self._redis.pipeline()
-        pipe.get(current_key)
-        pipe.get(prev_key)
-        results = await pipe.execute()
-
-        current_count = int(results[0] or 0)
-        prev_count = int(results[1] or 0)
-
-        # Sliding Window 가중치 계산
-        elapsed_in_window = now - (current_window * self._window)
-        weight = 1 - (elapsed_in_window / self._window)
-        weighted_count = current_count + (prev_count * weight)
-
-        remaining = max(0, self._limit - int(weighted_count))
-        reset_after = self._window - int(elapsed_in_window)
-        allowed = remaining > 0
-
-        return RateLimitInfo(
-            user_id=user_id,
-            limit=self._limit,
-            remaining=remaining,
-            reset_after=reset_after,
-            allowed=allowed,
-        )
+        decision = await self._engine.peek(self.rate_limit(user_id))
+        info = self._to_info(user_id, decision)
+        # 조회 시점 기준: 남은 허용량이 없으면 다음 요청은 거부됨
+        if info.remaining <= 0:
+            return RateLimitInfo(
+                user_id=user_id,
+                limit=self._limit,
+                remaining=0,
+                reset_after=info.reset_after,
+                allowed=False,
+            )
+        return info
 
     async def acquire(self, user_id: str) -> RateLimitInfo:
-        """Rate Limit 획득 (요청 카운트 증가).
+        """Rate Limit 획득 (확인 + 카운트 증가를 원자적으로 1회 왕복).
 
         Args:
             user_id: 사용자 ID
@@ -149,7 +157,8 @@ class RateLimiter:
         Raises:
             RateLimitExceeded: 제한 초과 시
         """
-        info = await self.check(user_id)
+        decision = await self._engine.acquire(self.rate_limit(user_id))
+        info = self._to_info(user_id, decision)
 
         if not info.allowed:
             raise RateLimitExceeded(
@@ -158,25 +167,7 @@ class RateLimiter:
                 remaining=info.remaining,
                 reset_after=info.reset_after,
             )
-
-        # 카운트 증가
-        now = time.time()
-        current_window = self._get_window_id(now)
-        key = self._make_key(user_id, current_window)
-
-        pipe = self._redis.pipeline()
-        pipe.incr(key)
-        pipe.expire(key, self._window * 2)  # 2 윈도우 TTL
-        await pipe.execute()
-
-        # 업데이트된 정보 반환
-        return RateLimitInfo(
-            user_id=user_id,
-            limit=self._limit,
-            remaining=info.remaining - 1,
-            reset_after=info.reset_after,
-            allowed=True,
-        )
+        return info
 
     async def reset(self, user_id: str) -> bool:
         """사용자 Rate Limit 초기화.
@@ -187,10 +178,11 @@ class RateLimiter:
         Returns:
             성공 여부
         """
+        # 이전 Sliding Window 키(chat:ratelimit:{user_id}:{window_id})도 함께 정리
         pattern = f"{self._key_prefix}:{user_id}:*"
 
         try:
-            keys = []
+            keys = [self._make_key(user_id)]
             async for key in self._redis.scan_iter(match=pattern):
                 keys.append(key)
 
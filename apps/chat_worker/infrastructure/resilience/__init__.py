@@ -7,12 +7,16 @@ from chat_worker.infrastructure.resilience.circuit_breaker import (
     CircuitBreaker,
     CircuitBreakerOpen,
     CircuitBreakerRegistry,
+    CircuitBreakerStateSync,
     CircuitState,
+    DistributedCircuitBreaker,
 )
 
 __all__ = [
     "CircuitBreaker",
     "CircuitBreakerOpen",
     "CircuitBreakerRegistry",
+    "CircuitBreakerStateSync",
     "CircuitState",
+    "DistributedCircuitBreaker",
 ]
@@ -15,8 +15,19 @@ Clean Architecture:
 - Adapter: 이 파일 (구현체)
 
 Thread Safety:
-- CircuitBreaker: asyncio.Lock 사용 (async context)
+- CircuitBreaker: asyncio.Lock 사용 (async context), CLOSED 상태 allow_request는 lock 없음
 - CircuitBreakerRegistry: threading.Lock 사용 (sync get, async 호환)
+
+분산 모드 (opt-in, CircuitBreakerRegistry.enable_distributed):
+- 프로세스별 상태만 있으면 KMA/KECO 장애 시 replica마다 threshold만큼
+  느린 타임아웃을 각자 겪은 뒤에야 열림
+- DistributedCircuitBreaker: 실패 수를 Redis에 누적 (failure_window 내 합산),
+  임계값 도달 시 OPEN 상태 키 설정 + Pub/Sub 발행 (Lua 원자 실행)
+- CircuitBreakerStateSync: 채널 구독 → 로컬 breaker 상태 갱신 (로컬 캐시 무효화)
+  → 한 replica가 장애를 감지하면 1초 이내 전체 replica에서 OPEN
+- 로컬 상태가 캐시: CLOSED 요청 경로는 Redis 왕복 없음
+  (breaker 생성 후 첫 요청에서 1회 상태 조회로 warm-up)
+- Redis 오류 시 로컬 Circuit Breaker로 동작
 """
 
 from __future__ import annotations
@@ -26,20 +37,44 @@ import logging
 import threading
 import time
 from enum import Enum
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from chat_worker.application.ports.circuit_breaker import (
     CircuitBreakerPort,
     CircuitBreakerRegistryPort,
 )
+from chat_worker.infrastructure.metrics import CHAT_CIRCUIT_BREAKER_TRANSITIONS
 
 if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
     from chat_worker.infrastructure.orchestration.langgraph.policies.node_policy import (
         NodePolicy,
     )
 
 logger = logging.getLogger(__name__)
 
+CIRCUIT_BREAKER_PREFIX = "chat:cb"
+CIRCUIT_BREAKER_CHANNEL = "chat:cb:events"
+DEFAULT_FAILURE_WINDOW = 60.0  # 분산 실패 수 집계 윈도우 (초)
+
+# KEYS[1]: failures, KEYS[2]: state
+# ARGV: threshold, window_ms, open_ttl_ms, opened_at, name, channel
+# Returns: {failure_count, opened(0/1)}
+RECORD_FAILURE_SCRIPT = """
+local count = redis.call('INCR', KEYS[1])
+if count == 1 then
+    redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+if count >= tonumber(ARGV[1]) then
+    if redis.call('SET', KEYS[2], ARGV[4], 'NX', 'PX', ARGV[3]) then
+        redis.call('PUBLISH', ARGV[6], ARGV[5] .. '|open|' .. ARGV[4])
+        return {count, 1}
+    end
+end
+return {count, 0}
+"""
+
 
 class CircuitState(str, Enum):
     """Circuit Breaker 상태."""
@@ -123,6 +158,10 @@ class CircuitBreaker(CircuitBreakerPort):
         Returns:
             True if request is allowed, False otherwise
         """
+        # Fast path: CLOSED는 lock 없이 통과 (단일 이벤트 루프에서 읽기만 수행)
+        if self.state == CircuitState.CLOSED:
+            return True
+
         async with self._lock:
             current_state = self.state
 
@@ -173,7 +212,7 @@ class CircuitBreaker(CircuitBreakerPort):
                 logger.warning(
                     "Circuit breaker opened",
                     extra={
-                        "name": self.name,
+                        "cb_name": self.name,
                         "failure_count": self._failure_count,
                         "threshold": self.threshold,
                     },
@@ -202,6 +241,148 @@ class CircuitBreaker(CircuitBreakerPort):
         )
 
 
+class DistributedCircuitBreaker(CircuitBreaker):
+    """Redis로 상태를 공유하는 Circuit Breaker (replica 간).
+
+    로컬 상태 머신은 CircuitBreaker와 동일하며, 다음만 추가됩니다:
+    - record_failure: Redis 실패 수 누적 (failure_window 내), 임계값 도달 시 OPEN 발행
+    - HALF_OPEN 실패(재차단)/성공(복구)도 발행
+    - apply_remote: 다른 replica의 상태 전환 반영 (CircuitBreakerStateSync가 호출)
+
+    분산 실패 수는 "연속" 실패가 아닌 윈도우 내 실패 합계입니다.
+    (replica 간 성공/실패 순서를 맞추려면 성공마다 Redis 쓰기가 필요하므로)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        redis: "Redis",
+        threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        failure_window: float = DEFAULT_FAILURE_WINDOW,
+        channel: str = CIRCUIT_BREAKER_CHANNEL,
+        key_prefix: str = CIRCUIT_BREAKER_PREFIX,
+    ):
+        super().__init__(
+            name=name,
+            threshold=threshold,
+            recovery_timeout=recovery_timeout,
+            half_open_max_calls=half_open_max_calls,
+        )
+        self._redis = redis
+        self._failure_window = failure_window
+        self._channel = channel
+        self._failures_key = f"{key_prefix}:{name}:failures"
+        self._state_key = f"{key_prefix}:{name}:state"
+        self._failure_script = redis.register_script(RECORD_FAILURE_SCRIPT)
+        self._synced = False
+
+    async def allow_request(self) -> bool:
+        """요청 허용 여부 (첫 요청에서 공유 상태 1회 warm-up)."""
+        if not self._synced:
+            await self.sync_from_remote()
+        return await super().allow_request()
+
+    async def sync_from_remote(self) -> None:
+        """Redis의 현재 OPEN 상태를 로컬에 반영."""
+        self._synced = True
+        try:
+            opened_at = await self._redis.get(self._state_key)
+        except Exception as e:
+            logger.warning(
+                "Circuit breaker state sync failed",
+                extra={"cb_name": self.name, "error": str(e)},
+            )
+            return
+        if opened_at is not None:
+            self.apply_remote("open", float(opened_at))
+
+    def apply_remote(self, event: str, opened_at: float | None = None) -> None:
+        """다른 replica의 상태 전환 반영 (lock 불필요: 동기 필드 갱신만 수행)."""
+        if event == "open":
+            opened_at = opened_at or time.time()
+            if self._state == CircuitState.OPEN and self._last_failure_time >= opened_at:
+                return
+            self._state = CircuitState.OPEN
+            self._last_failure_time = opened_at
+            self._half_open_calls = 0
+            logger.warning(
+                "Circuit breaker opened by peer",
+                extra={"cb_name": self.name},
+            )
+            self._record_transition("open", "remote")
+        elif event == "closed" and self._state != CircuitState.CLOSED:
+            self._state = CircuitState.CLOSED
+            self._failure_count = 0
+            self._half_open_calls = 0
+            logger.info("Circuit breaker closed by peer", extra={"cb_name": self.name})
+            self._record_transition("closed", "remote")
+
+    async def record_success(self) -> None:
+        """성공 기록 - 복구(HALF_OPEN → CLOSED)면 전체 replica에 발행."""
+        recovering = self.state != CircuitState.CLOSED
+        await super().record_success()
+        if not recovering:
+            return
+        self._record_transition("closed", "local")
+        try:
+            pipe = self._redis.pipeline(transaction=True)
+            pipe.delete(self._failures_key, self._state_key)
+            pipe.publish(self._channel, f"{self.name}|closed|{time.time()}")
+            await pipe.execute()
+        except Exception as e:
+            logger.warning(
+                "Circuit breaker close publish failed",
+                extra={"cb_name": self.name, "error": str(e)},
+            )
+
+    async def record_failure(self) -> None:
+        """실패 기록 - 로컬 상태 머신 + Redis 실패 수 누적."""
+        was_half_open = self.state == CircuitState.HALF_OPEN
+        await super().record_failure()
+
+        try:
+            if was_half_open:
+                # 복구 시도 실패 → 다시 OPEN (recovery_timeout 재시작)
+                await self._publish_open(self._last_failure_time)
+                return
+
+            count, opened = await self._failure_script(
+                keys=[self._failures_key, self._state_key],
+                args=[
+                    self.threshold,
+                    int(self._failure_window * 1000),
+                    int(self.recovery_timeout * 1000),
+                    repr(self._last_failure_time),
+                    self.name,
+                    self._channel,
+                ],
+            )
+        except Exception as e:
+            logger.warning(
+                "Circuit breaker failure publish failed",
+                extra={"cb_name": self.name, "error": str(e)},
+            )
+            return
+
+        if int(opened) or int(count) >= self.threshold:
+            if self._state != CircuitState.OPEN:
+                self.apply_remote("open", self._last_failure_time)
+            else:
+                self._record_transition("open", "local")
+
+    async def _publish_open(self, opened_at: float) -> None:
+        pipe = self._redis.pipeline(transaction=True)
+        pipe.set(self._state_key, repr(opened_at), px=int(self.recovery_timeout * 1000))
+        pipe.publish(self._channel, f"{self.name}|open|{opened_at!r}")
+        await pipe.execute()
+        self._record_transition("open", "local")
+
+    def _record_transition(self, state: str, source: str) -> None:
+        CHAT_CIRCUIT_BREAKER_TRANSITIONS.labels(name=self.name, state=state, source=source).inc()
+
+
 class CircuitBreakerRegistry(CircuitBreakerRegistryPort):
     """Circuit Breaker 레지스트리 (싱글톤, CircuitBreakerRegistryPort Adapter).
 
@@ -228,6 +409,8 @@ class CircuitBreakerRegistry(CircuitBreakerRegistryPort):
                     instance = super().__new__(cls)
                     instance._breakers: dict[str, CircuitBreaker] = {}
                     instance._registry_lock = threading.Lock()
+                    instance._redis = None
+                    instance._failure_window = DEFAULT_FAILURE_WINDOW
                     cls._instance = instance
         return cls._instance
 
@@ -257,13 +440,60 @@ class CircuitBreakerRegistry(CircuitBreakerRegistryPort):
         with self._registry_lock:
             # Double-checked locking
             if name not in self._breakers:
-                self._breakers[name] = CircuitBreaker(
-                    name=name,
-                    threshold=threshold,
-                    recovery_timeout=recovery_timeout,
-                )
+                if self._redis is not None:
+                    self._breakers[name] = DistributedCircuitBreaker(
+                        name=name,
+                        redis=self._redis,
+                        threshold=threshold,
+                        recovery_timeout=recovery_timeout,
+                        failure_window=self._failure_window,
+                    )
+                else:
+                    self._breakers[name] = CircuitBreaker(
+                        name=name,
+                        threshold=threshold,
+                        recovery_timeout=recovery_timeout,
+                    )
             return self._breakers[name]
 
+    def enable_distributed(
+        self,
+        redis: "Redis",
+        failure_window: float = DEFAULT_FAILURE_WINDOW,
+    ) -> None:
+        """분산 모드 활성화 (이후 생성되는 breaker는 Redis로 상태 공유).
+
+        기존 로컬 breaker는 제거되어 다음 get()에서 분산 breaker로 재생성됩니다.
+
+        Args:
+            redis: Redis 클라이언트
+            failure_window: 분산 실패 수 집계 윈도우 (초)
+        """
+        with self._registry_lock:
+            self._redis = redis
+            self._failure_window = failure_window
+            self._breakers.clear()
+
+    @property
+    def is_distributed(self) -> bool:
+        return self._redis is not None
+
+    def apply_remote(self, name: str, event: str, opened_at: float | None = None) -> None:
+        """다른 replica의 상태 전환을 로컬 breaker에 반영.
+
+        아직 생성되지 않은 breaker는 무시 (생성 후 첫 요청에서 warm-up).
+        """
+        breaker = self._breakers.get(name)
+        if isinstance(breaker, DistributedCircuitBreaker):
+            breaker.apply_remote(event, opened_at)
+
+    def mark_unsynced(self) -> None:
+        """구독 재연결 시: 놓친 이벤트를 다음 요청에서 다시 조회하도록 표시."""
+        with self._registry_lock:
+            for breaker in self._breakers.values():
+                if isinstance(breaker, DistributedCircuitBreaker):
+                    breaker._synced = False
+
     def get_from_policy(self, policy: "NodePolicy") -> CircuitBreaker:
         """NodePolicy로 Circuit Breaker 조회 또는 생성.
 
@@ -298,9 +528,86 @@ class CircuitBreakerRegistry(CircuitBreakerRegistryPort):
             cls._instance = None
 
 
+class CircuitBreakerStateSync:
+    """Circuit Breaker 상태 전환 구독기 (프로세스당 1개).
+
+    CIRCUIT_BREAKER_CHANNEL 메시지("{name}|{open|closed}|{opened_at}")를 받아
+    레지스트리의 로컬 breaker에 반영합니다. 연결이 끊기면 재구독하고,
+    놓쳤을 수 있는 전환은 각 breaker의 다음 요청에서 다시 조회합니다.
+    """
+
+    RECONNECT_DELAY = 1.0
+
+    def __init__(
+        self,
+        redis: "Redis",
+        registry: CircuitBreakerRegistry | None = None,
+        channel: str = CIRCUIT_BREAKER_CHANNEL,
+    ):
+        self._redis = redis
+        self._registry = registry or CircuitBreakerRegistry()
+        self._channel = channel
+        self._task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        """구독 태스크 시작 (이미 실행 중이면 무시)."""
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """구독 태스크 종료."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            pubsub = self._redis.pubsub()
+            try:
+                await pubsub.subscribe(self._channel)
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        self.handle_message(message.get("data"))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(
+                    "Circuit breaker subscription lost, resubscribing",
+                    extra={"error": str(e)},
+                )
+                self._registry.mark_unsynced()
+                await asyncio.sleep(self.RECONNECT_DELAY)
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+
+    def handle_message(self, data: Any) -> None:
+        """발행 메시지 파싱 후 로컬 breaker 반영."""
+        if isinstance(data, bytes):
+            data = data.decode()
+        try:
+            name, event, opened_at = str(data).rsplit("|", 2)
+            self._registry.apply_remote(name, event, float(opened_at))
+        except ValueError:
+            logger.debug(f"Ignoring malformed circuit breaker event: {data!r}")
+
+
 __all__ = [
     "CircuitBreaker",
     "CircuitBreakerOpen",
     "CircuitBreakerRegistry",
+    "CircuitBreakerStateSync",
     "CircuitState",
+    "DistributedCircuitBreaker",
 ]
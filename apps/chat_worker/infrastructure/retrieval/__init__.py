@@ -2,13 +2,27 @@
 
 - LocalAssetRetriever: 로컬 JSON 파일 기반 검색
 - TagBasedRetriever: 태그 매칭 기반 컨텍스트 검색 (Anthropic Contextual Retrieval)
+- RegulationIndex: 규정 JSON 역색인 (로드 시점 빌드)
+- SemanticRetriever: 규정 섹션 벡터 검색 + 태그 검색 하이브리드 융합
+- VectorIndex: 규정 섹션 벡터 인덱스 (오프라인 빌드 .npz)
 """
 
 from chat_worker.infrastructure.retrieval.local_asset_retriever import (
     LocalAssetRetriever,
 )
+from chat_worker.infrastructure.retrieval.regulation_index import RegulationIndex
+from chat_worker.infrastructure.retrieval.semantic_retriever import (
+    SemanticRetriever,
+)
 from chat_worker.infrastructure.retrieval.tag_based_retriever import (
     TagBasedRetriever,
 )
+from chat_worker.infrastructure.retrieval.vector_index import VectorIndex
 
-__all__ = ["LocalAssetRetriever", "TagBasedRetriever"]
+__all__ = [
+    "LocalAssetRetriever",
+    "RegulationIndex",
+    "SemanticRetriever",
+    "TagBasedRetriever",
+    "VectorIndex",
+]
@@ -0,0 +1,34 @@
+"""규정 벡터 인덱스 오프라인 빌드 CLI.
+
+Usage:
+    python -m chat_worker.infrastructure.retrieval.build_vector_index [--source DIR] [--output PATH]
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+from chat_worker.infrastructure.retrieval.vector_index import (
+    DEFAULT_INDEX_PATH,
+    DEFAULT_SOURCE_DIR,
+    VectorIndex,
+    load_source_documents,
+)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """원본 규정 JSON → .npz 벡터 인덱스."""
+    parser = argparse.ArgumentParser(description="Build regulation vector index")
+    parser.add_argument("--source", type=Path, default=DEFAULT_SOURCE_DIR)
+    parser.add_argument("--output", type=Path, default=DEFAULT_INDEX_PATH)
+    args = parser.parse_args(argv)
+
+    documents = load_source_documents(args.source)
+    index = VectorIndex.build(documents)
+    index.save(args.output)
+    print(f"Built {len(index)} chunks from {len(documents)} documents -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
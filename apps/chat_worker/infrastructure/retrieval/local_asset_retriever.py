@@ -14,6 +14,7 @@ from pathlib import Path
 from typing import Any
 
 from chat_worker.application.ports.retrieval import RetrieverPort
+from chat_worker.infrastructure.retrieval.regulation_index import RegulationIndex
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +39,7 @@ class LocalAssetRetriever(RetrieverPort):
         self._data: dict[str, dict] = {}
         self._categories: list[str] = []
         self._load_data()
+        self._index = RegulationIndex(self._data)
 
         logger.info(
             "LocalAssetRetriever initialized",
@@ -131,20 +133,13 @@ class LocalAssetRetriever(RetrieverPort):
         Returns:
             검색 결과 리스트
         """
-        results = []
-        keyword_lower = keyword.lower()
-
-        for key, data in self._data.items():
-            # 파일명 매칭
-            if keyword_lower in key.lower():
-                results.append({"key": key, "data": data})
-                continue
-
-            # 내용 매칭
-            data_str = json.dumps(data, ensure_ascii=False).lower()
-            if keyword_lower in data_str:
-                results.append({"key": key, "data": data})
-
+        # 파일명 또는 내용 매칭 (내용은 역색인 조회)
+        matched_docs = self._index.docs_containing(keyword)
+        results = [
+            {"key": key, "data": data}
+            for key, data in self._data.items()
+            if key in matched_docs or self._index.key_contains(key, keyword)
+        ]
         return results[:limit]
 
     def get_all_categories(self) -> list[str]:
@@ -0,0 +1,185 @@
+"""Regulation Index - 분리배출 규정 역색인.
+
+assets/data/source/*.json 규정은 정적이므로 로드 시점에 한 번만 색인합니다.
+
+- 문서별 소문자화된 본문(json.dumps)을 미리 계산
+- 용어(품목/상황 태그) → 문서 집합 역색인
+- 용어 → (문서, 필드, 위치) 포스팅으로 인용문 추출을 dict 조회로 대체
+
+매 쿼리마다 규정 전체를 직렬화하던 기존 부분 문자열 검색과
+동일한 결과를 반환합니다 (tests/unit/infrastructure/retrieval 골든 테스트).
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable
+from typing import Any
+
+# 인용문 추출 우선순위: 배출방법_공통 → 배출불가_품목_안내 → 대상_설명 → 아이콘_절차
+QUOTE_PRIORITY_FIELDS: tuple[str, ...] = (
+    "배출방법_공통",
+    "배출불가_품목_안내",
+    "대상_설명",
+    "아이콘_절차",
+)
+
+QUOTE_MAX_LENGTH = 80
+
+# 어휘 밖 키워드(search_by_keyword 임의 입력) 메모이즈 상한
+_ADHOC_TERM_CACHE_SIZE = 1024
+
+
+class _QuoteField:
+    """인용 대상 필드의 사전 계산 결과."""
+
+    __slots__ = ("name", "kind", "raw", "lowered", "default_quote")
+
+    def __init__(self, name: str, value: Any):
+        self.name = name
+        self.raw = value
+        if isinstance(value, list):
+            self.kind = "list"
+            # 문자열이 아닌 항목은 태그 매칭 대상이 아님 (None으로 자리 유지)
+            self.lowered: list[str | None] = [
+                item.lower() if isinstance(item, str) else None for item in value
+            ]
+            self.default_quote = str(value[0])[:QUOTE_MAX_LENGTH]
+        else:
+            self.kind = "dict"
+            self.raw = list(value.items())
+            self.lowered = [str(k).lower() for k in value]
+            self.default_quote = ""
+
+
+class RegulationIndex:
+    """규정 문서 역색인.
+
+    Attributes:
+        keys: 문서 키 목록 (로드 순서 유지)
+    """
+
+    def __init__(
+        self,
+        documents: dict[str, dict[str, Any]],
+        vocabulary: Iterable[str] = (),
+    ):
+        """색인 빌드.
+
+        Args:
+            documents: {문서 키: 규정 데이터}
+            vocabulary: 미리 색인할 용어 (품목/상황 태그)
+        """
+        self.keys: list[str] = list(documents.keys())
+        self._key_lower: dict[str, str] = {k: k.lower() for k in self.keys}
+        self._text_lower: dict[str, str] = {
+            k: json.dumps(data, ensure_ascii=False).lower() for k, data in documents.items()
+        }
+        self._quote_fields: dict[str, list[_QuoteField]] = {
+            k: self._build_quote_fields(data) for k, data in documents.items()
+        }
+
+        # 용어 → 본문에 포함된 문서 키 집합
+        self._term_docs: dict[str, frozenset[str]] = {}
+        # (용어, 문서 키, 필드명) → 첫 매칭 위치
+        self._term_positions: dict[tuple[str, str, str], int] = {}
+        self._adhoc_terms: list[str] = []
+
+        for term in vocabulary:
+            self._index_term(term.lower())
+
+    @staticmethod
+    def _build_quote_fields(data: dict[str, Any]) -> list[_QuoteField]:
+        """인용 가능한 필드만 우선순위 순으로 추출."""
+        fields = []
+        for field_name in QUOTE_PRIORITY_FIELDS:
+            value = data.get(field_name)
+            if (isinstance(value, list) and value) or isinstance(value, dict):
+                fields.append(_QuoteField(field_name, value))
+        return fields
+
+    @property
+    def term_count(self) -> int:
+        """색인된 용어 수."""
+        return len(self._term_docs)
+
+    def _index_term(self, term: str) -> frozenset[str]:
+        """용어 하나를 색인 (이미 있으면 재사용)."""
+        cached = self._term_docs.get(term)
+        if cached is not None:
+            return cached
+
+        docs = frozenset(k for k, text in self._text_lower.items() if term in text)
+        self._term_docs[term] = docs
+
+        for key, fields in self._quote_fields.items():
+            for quote_field in fields:
+                for position, lowered in enumerate(quote_field.lowered):
+                    if lowered is not None and term in lowered:
+                        self._term_positions[(term, key, quote_field.name)] = position
+                        break
+        return docs
+
+    def _lookup(self, term: str) -> frozenset[str]:
+        """어휘 밖 용어는 색인 후 제한된 크기로 메모이즈."""
+        if term in self._term_docs:
+            return self._term_docs[term]
+
+        docs = self._index_term(term)
+        self._adhoc_terms.append(term)
+        if len(self._adhoc_terms) > _ADHOC_TERM_CACHE_SIZE:
+            self._evict(self._adhoc_terms.pop(0))
+        return docs
+
+    def _evict(self, term: str) -> None:
+        self._term_docs.pop(term, None)
+        for key, fields in self._quote_fields.items():
+            for quote_field in fields:
+                self._term_positions.pop((term, key, quote_field.name), None)
+
+    def docs_containing(self, term: str) -> frozenset[str]:
+        """본문에 용어가 포함된 문서 키 집합 (대소문자 무시)."""
+        return self._lookup(term.lower())
+
+    def key_contains(self, key: str, term: str) -> bool:
+        """문서 키(파일명)에 용어가 포함되는지."""
+        return term.lower() in self._key_lower[key]
+
+    def relevant_quote(self, key: str, tags: list[str]) -> str:
+        """규정에서 태그 관련 인용문 추출.
+
+        우선순위 필드 순으로:
+        - 리스트: 태그가 포함된 첫 항목, 없으면 첫 항목
+        - 딕셔너리: 태그 순서대로 처음 매칭되는 키의 "키: 값"
+
+        Args:
+            key: 문서 키
+            tags: 검색 태그
+
+        Returns:
+            관련 텍스트 (80자 이내)
+        """
+        terms = [tag.lower() for tag in tags]
+        for term in terms:
+            self._lookup(term)
+
+        for quote_field in self._quote_fields.get(key, ()):
+            name = quote_field.name
+            if quote_field.kind == "list":
+                positions = [
+                    self._term_positions[(term, key, name)]
+                    for term in terms
+                    if (term, key, name) in self._term_positions
+                ]
+                if not positions:
+                    return quote_field.default_quote
+                item = quote_field.raw[min(positions)]
+                return item[:QUOTE_MAX_LENGTH] + ("..." if len(item) > QUOTE_MAX_LENGTH else "")
+
+            for term in terms:
+                position = self._term_positions.get((term, key, name))
+                if position is not None:
+                    k, v = quote_field.raw[position]
+                    return f"{k}: {v}"[:QUOTE_MAX_LENGTH]
+
+        return ""
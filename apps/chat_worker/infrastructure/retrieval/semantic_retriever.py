@@ -0,0 +1,224 @@
+"""Semantic Retriever - 벡터 검색 + 태그 검색 하이브리드.
+
+TagBasedRetriever는 품목/상황 태그가 정확히 포함돼야 규정을 찾으므로
+"물병 라벨 떼야 돼?" 같은 표현 변형은 키워드 폴백까지 떨어집니다.
+SemanticRetriever는 규정 섹션 벡터 인덱스(VectorIndex)로 의미 검색을 수행하고
+태그 검색 결과와 가중 RRF(Reciprocal Rank Fusion)로 합칩니다.
+
+- 임베딩: HashingNgramVectorizer (CPU 전용, 모델 다운로드 없음)
+- 검색: NumPy 내적 top-k (청크 수백 개, 쿼리당 ~1ms)
+- 인덱스: 오프라인 빌드 .npz (vector_index.py), 없으면 로드 시 메모리 빌드
+
+Port: application/ports/retrieval/retriever.py
+"""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from typing import Any
+
+from chat_worker.application.ports.retrieval import (
+    ContextualSearchResult,
+    RetrievalContext,
+    RetrieverPort,
+)
+from chat_worker.infrastructure.retrieval.tag_based_retriever import TagBasedRetriever
+from chat_worker.infrastructure.retrieval.vector_index import (
+    DEFAULT_INDEX_PATH,
+    ScoredChunk,
+    VectorIndex,
+    index_checksum,
+    load_item_classes,
+)
+
+logger = logging.getLogger(__name__)
+
+# RRF 상수 (Cormack et al. 2009 기본값)
+RRF_K = 60
+
+# 의미 검색 결과 relevance 임계값 (코사인 유사도)
+SEMANTIC_MEDIUM_THRESHOLD = 0.2
+
+QUOTE_MAX_LENGTH = 80
+
+
+class SemanticRetriever(RetrieverPort):
+    """벡터 인덱스 기반 Retriever (태그 검색과 하이브리드 융합).
+
+    search / search_by_keyword / extract_context는 TagBasedRetriever에 위임하고,
+    search_with_context만 의미 검색 + 융합으로 확장합니다.
+    """
+
+    def __init__(
+        self,
+        assets_path: str | Path | None = None,
+        index_path: str | Path | None = None,
+        tag_retriever: TagBasedRetriever | None = None,
+        hybrid: bool = True,
+        top_k: int = 5,
+        semantic_weight: float = 0.5,
+        min_score: float = 0.08,
+    ):
+        """초기화.
+
+        Args:
+            assets_path: 규정 JSON 경로 (기본: infrastructure/assets/data/source)
+            index_path: 오프라인 빌드 인덱스 경로 (기본: assets/data/index/regulation_vectors.npz)
+            tag_retriever: 태그 검색 Retriever (없으면 생성)
+            hybrid: 태그 검색 결과와 융합 여부 (False면 의미 검색만)
+            top_k: 반환할 최대 규정 수
+            semantic_weight: RRF 융합 시 의미 검색 가중치 (0~1)
+            min_score: 의미 검색 최소 코사인 유사도
+        """
+        self._tag_retriever = tag_retriever or TagBasedRetriever(assets_path)
+        self._hybrid = hybrid
+        self._top_k = top_k
+        self._semantic_weight = semantic_weight
+        self._min_score = min_score
+        self._index = self._load_index(Path(index_path) if index_path else DEFAULT_INDEX_PATH)
+
+        logger.info(
+            "SemanticRetriever initialized",
+            extra={
+                "chunks": len(self._index),
+                "dim": self._index.vectorizer.dim,
+                "hybrid": hybrid,
+            },
+        )
+
+    def _load_index(self, index_path: Path) -> VectorIndex:
+        """오프라인 인덱스 로드, 없거나 오래됐으면 메모리 빌드."""
+        documents = self._tag_retriever.documents
+        item_classes = load_item_classes()
+        checksum = index_checksum(documents, item_classes)
+
+        if index_path.exists():
+            try:
+                index = VectorIndex.load(index_path)
+                if index.checksum == checksum:
+                    return index
+                logger.warning(
+                    "Vector index is stale, rebuilding in memory",
+                    extra={"path": str(index_path)},
+                )
+            except Exception as e:
+                logger.warning(
+                    "Failed to load vector index, rebuilding in memory",
+                    extra={"path": str(index_path), "error": str(e)},
+                )
+
+        return VectorIndex.build(documents, item_classes)
+
+    # ========== RetrieverPort 기본 구현 (위임) ==========
+
+    def search(
+        self,
+        category: str,
+        subcategory: str | None = None,
+    ) -> dict[str, Any] | None:
+        """분류 기반 검색."""
+        return self._tag_retriever.search(category, subcategory)
+
+    def search_by_keyword(
+        self,
+        keyword: str,
+        limit: int = 3,
+    ) -> list[dict[str, Any]]:
+        """키워드 검색."""
+        return self._tag_retriever.search_by_keyword(keyword, limit)
+
+    def get_all_categories(self) -> list[str]:
+        """카테고리 목록."""
+        return self._tag_retriever.get_all_categories()
+
+    def extract_context(self, message: str) -> RetrievalContext:
+        """메시지에서 컨텍스트 추출 (태그 매칭)."""
+        return self._tag_retriever.extract_context(message)
+
+    # ========== 의미 검색 ==========
+
+    def semantic_search(self, message: str) -> list[ScoredChunk]:
+        """규정별 최고 점수 청크 (점수 내림차순).
+
+        Args:
+            message: 사용자 메시지
+
+        Returns:
+            규정(doc_key)당 하나의 청크, min_score 이상만
+        """
+        best: dict[str, ScoredChunk] = {}
+        # 같은 규정의 여러 섹션이 상위를 차지할 수 있으므로 넉넉히 조회
+        for hit in self._index.search(message, top_k=self._top_k * 4):
+            if hit.score < self._min_score:
+                break
+            if hit.chunk.doc_key not in best:
+                best[hit.chunk.doc_key] = hit
+        return list(best.values())
+
+    def search_with_context(
+        self,
+        message: str,
+        context: RetrievalContext | None = None,
+    ) -> list[ContextualSearchResult]:
+        """의미 검색 + 태그 검색 융합.
+
+        Args:
+            message: 사용자 메시지
+            context: 추출된 컨텍스트 (없으면 자동 추출)
+
+        Returns:
+            융합 점수 순 검색 결과 (최대 top_k)
+        """
+        semantic_hits = self.semantic_search(message)
+        tag_results = (
+            self._tag_retriever.search_with_context(message, context) if self._hybrid else []
+        )
+
+        fused: dict[str, float] = {}
+        tag_weight = 1.0 - self._semantic_weight
+        for rank, result in enumerate(tag_results):
+            fused[result.chunk_id] = fused.get(result.chunk_id, 0.0) + tag_weight / (
+                RRF_K + rank + 1
+            )
+        for rank, hit in enumerate(semantic_hits):
+            key = hit.chunk.doc_key
+            fused[key] = fused.get(key, 0.0) + self._semantic_weight / (RRF_K + rank + 1)
+
+        by_tag = {result.chunk_id: result for result in tag_results}
+        by_semantic = {hit.chunk.doc_key: hit for hit in semantic_hits}
+        documents = self._tag_retriever.documents
+
+        results: list[ContextualSearchResult] = []
+        for key in sorted(fused, key=lambda k: fused[k], reverse=True)[: self._top_k]:
+            if key in by_tag:
+                results.append(by_tag[key])
+                continue
+            hit = by_semantic[key]
+            data = documents.get(key, {})
+            results.append(
+                ContextualSearchResult(
+                    chunk_id=key,
+                    category=data.get("category", key),
+                    data=data,
+                    quoted_text=self._quote(hit),
+                    relevance="medium" if hit.score >= SEMANTIC_MEDIUM_THRESHOLD else "low",
+                    matched_tags=[],
+                )
+            )
+
+        logger.info(
+            "Semantic search completed",
+            extra={
+                "results_count": len(results),
+                "semantic_hits": len(semantic_hits),
+                "tag_hits": len(tag_results),
+            },
+        )
+        return results
+
+    @staticmethod
+    def _quote(hit: ScoredChunk) -> str:
+        """청크 텍스트에서 규정 이름 접두를 뺀 인용문."""
+        text = hit.chunk.text.split(" | ", 1)[-1]
+        return text[:QUOTE_MAX_LENGTH] + ("..." if len(text) > QUOTE_MAX_LENGTH else "")
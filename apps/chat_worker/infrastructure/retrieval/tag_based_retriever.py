@@ -23,6 +23,7 @@ from chat_worker.application.ports.retrieval import (
     RetrievalContext,
     RetrieverPort,
 )
+from chat_worker.infrastructure.retrieval.regulation_index import RegulationIndex
 
 logger = logging.getLogger(__name__)
 
@@ -92,6 +93,9 @@ class TagBasedRetriever(RetrieverPort):
     1. 메시지에서 품목 태그 추출 (item_class_list)
     2. 메시지에서 상황 태그 추출 (situation_tags)
     3. 태그에 맞는 규정 섹션만 추출하여 Evidence 형식으로 반환
+
+    규정 JSON은 정적이므로 로드 시점에 RegulationIndex로 역색인하여
+    쿼리마다 규정 전체를 직렬화하지 않습니다.
     """
 
     def __init__(self, assets_path: str | Path | None = None):
@@ -109,7 +113,16 @@ class TagBasedRetriever(RetrieverPort):
         self._categories: list[str] = []
         self._item_index = _build_item_index()
         self._situation_tags = _load_situation_tags()
+        # 태그 정규화 변형 사전 계산 (언더스코어 → 공백/없음)
+        self._situation_variants = [
+            (tag, (tag.lower(), tag.lower().replace("_", " "), tag.lower().replace("_", "")))
+            for tag in self._situation_tags
+        ]
         self._load_data()
+        self._index = RegulationIndex(
+            self._data,
+            vocabulary=[*self._item_index, *self._situation_tags],
+        )
 
         logger.info(
             "TagBasedRetriever initialized",
@@ -118,6 +131,7 @@ class TagBasedRetriever(RetrieverPort):
                 "categories_count": len(self._categories),
                 "item_count": len(self._item_index),
                 "situation_tags_count": len(self._situation_tags),
+                "indexed_terms": self._index.term_count,
             },
         )
 
@@ -137,6 +151,11 @@ class TagBasedRetriever(RetrieverPort):
             except Exception as e:
                 logger.error(f"Failed to load {json_file}: {e}")
 
+    @property
+    def documents(self) -> dict[str, dict]:
+        """로드된 규정 문서 {키: 데이터} (읽기 전용으로 사용)."""
+        return self._data
+
     # ========== RetrieverPort 기본 구현 ==========
 
     def search(
@@ -178,18 +197,12 @@ class TagBasedRetriever(RetrieverPort):
         limit: int = 3,
     ) -> list[dict[str, Any]]:
         """키워드 검색."""
-        results = []
-        keyword_lower = keyword.lower()
-
-        for key, data in self._data.items():
-            if keyword_lower in key.lower():
-                results.append({"key": key, "data": data})
-                continue
-
-            data_str = json.dumps(data, ensure_ascii=False).lower()
-            if keyword_lower in data_str:
-                results.append({"key": key, "data": data})
-
+        matched_docs = self._index.docs_containing(keyword)
+        results = [
+            {"key": key, "data": data}
+            for key, data in self._data.items()
+            if key in matched_docs or self._index.key_contains(key, keyword)
+        ]
         return results[:limit]
 
     def get_all_categories(self) -> list[str]:
@@ -222,13 +235,7 @@ class TagBasedRetriever(RetrieverPort):
 
         # 2. 상황 태그 추출
         matched_situations = []
-        for tag in self._situation_tags:
-            # 태그 정규화 (언더스코어 → 공백/없음)
-            tag_variants = [
-                tag.lower(),
-                tag.lower().replace("_", " "),
-                tag.lower().replace("_", ""),
-            ]
+        for tag, tag_variants in self._situation_variants:
             for variant in tag_variants:
                 if variant in message_lower:
                     matched_situations.append(tag)
@@ -288,19 +295,16 @@ class TagBasedRetriever(RetrieverPort):
                 matched_tags.append(context.suggested_category)
                 relevance = "high"
 
-            # 규정 내용에서 태그 검색
-            data_str = json.dumps(data, ensure_ascii=False).lower()
-
+            # 규정 내용에서 태그 검색 (역색인 조회)
             for tag in all_tags:
-                tag_lower = tag.lower()
-                if tag_lower in data_str:
+                if key in self._index.docs_containing(tag):
                     matched_tags.append(tag)
                     if relevance != "high":
                         relevance = "medium"
 
             if matched_tags:
                 # 관련 텍스트 인용 추출
-                quoted_text = self._extract_relevant_quote(data, all_tags)
+                quoted_text = self._extract_relevant_quote(key, all_tags)
 
                 results.append(
                     ContextualSearchResult(
@@ -335,40 +339,17 @@ class TagBasedRetriever(RetrieverPort):
         normalized = re.sub(r"\s+", "", normalized)
         return normalized
 
-    def _extract_relevant_quote(self, data: dict, tags: list[str]) -> str:
+    def _extract_relevant_quote(self, key: str, tags: list[str]) -> str:
         """규정에서 관련 텍스트 인용 추출.
 
         Args:
-            data: 규정 데이터
+            key: 규정 키
             tags: 검색 태그
 
         Returns:
-            관련 텍스트 (50자 이내)
+            관련 텍스트 (80자 이내)
         """
-        # 우선순위: 배출방법_공통 → 배출불가_품목_안내 → 대상_설명
-        priority_fields = ["배출방법_공통", "배출불가_품목_안내", "대상_설명", "아이콘_절차"]
-
-        for field_name in priority_fields:
-            field_data = data.get(field_name)
-
-            if isinstance(field_data, list) and field_data:
-                # 태그가 포함된 항목 우선
-                for item in field_data:
-                    if isinstance(item, str):
-                        for tag in tags:
-                            if tag.lower() in item.lower():
-                                return item[:80] + ("..." if len(item) > 80 else "")
-                # 없으면 첫 번째 항목
-                return str(field_data[0])[:80]
-
-            elif isinstance(field_data, dict):
-                # 딕셔너리면 태그와 매칭되는 키 찾기
-                for tag in tags:
-                    for k, v in field_data.items():
-                        if tag.lower() in k.lower():
-                            return f"{k}: {v}"[:80]
-
-        return ""
+        return self._index.relevant_quote(key, tags)
 
     def _fallback_keyword_search(self, message: str) -> list[ContextualSearchResult]:
         """키워드 기반 폴백 검색.
@@ -0,0 +1,264 @@
+"""Regulation Vector Index - 규정 섹션 벡터 인덱스.
+
+assets/data/source/*.json 규정을 섹션 단위로 청킹하고
+HashingNgramVectorizer로 벡터화하여 .npz 파일로 저장합니다.
+
+청킹 규칙:
+- 리스트 필드 (배출방법_공통 등): 필드 하나 = 청크 하나
+- 딕셔너리 필드 (배출방법_세부 등): 하위 키 하나 = 청크 하나
+- item_class_list.yaml 품목 목록: 규정당 "품목_분류" 청크 하나
+- 모든 청크 앞에 규정 이름을 붙여 문맥 보존 (Contextual Retrieval)
+
+오프라인 빌드 (Docker 이미지 빌드 단계에서 실행):
+    python -m chat_worker.infrastructure.retrieval.build_vector_index [--output PATH]
+
+인덱스 파일이 없거나 원본 JSON과 체크섬이 다르면
+SemanticRetriever가 로드 시점에 메모리에서 재빌드합니다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import yaml
+
+from chat_worker.infrastructure.retrieval.vectorizer import HashingNgramVectorizer
+
+logger = logging.getLogger(__name__)
+
+ASSETS_DIR = Path(__file__).parent.parent / "assets" / "data"
+DEFAULT_SOURCE_DIR = ASSETS_DIR / "source"
+DEFAULT_INDEX_PATH = ASSETS_DIR / "index" / "regulation_vectors.npz"
+ITEM_CLASS_PATH = ASSETS_DIR / "item_class_list.yaml"
+ITEM_CLASS_SECTION = "품목_분류"
+
+INDEX_FORMAT_VERSION = 1
+
+# 청킹 제외 필드 (메타데이터)
+_META_FIELDS = frozenset({"key", "category", "이름", "source_url"})
+
+
+@dataclass(frozen=True)
+class RegulationChunk:
+    """규정 섹션 청크.
+
+    Attributes:
+        chunk_id: "{문서 키}#{필드}[/{하위 키}]"
+        doc_key: 규정 파일 키 (TagBasedRetriever chunk_id와 동일)
+        section: 필드명 (하위 키 포함)
+        text: 임베딩 대상 텍스트 (규정 이름 접두)
+    """
+
+    chunk_id: str
+    doc_key: str
+    section: str
+    text: str
+
+
+def _join_values(value: Any) -> str:
+    if isinstance(value, list):
+        return " / ".join(str(v) for v in value)
+    return str(value)
+
+
+def load_item_classes(path: Path = ITEM_CLASS_PATH) -> dict[str, list[str]]:
+    """item_class_list.yaml → {규정 키: 품목 목록}.
+
+    규정 파일명 규칙: "{대분류}_{중분류}" 또는 "{대분류}".
+    """
+    if not path.exists():
+        return {}
+    with open(path, encoding="utf-8") as f:
+        item_classes = (yaml.safe_load(f) or {}).get("item_class_list", {})
+
+    result: dict[str, list[str]] = {}
+    for major, sub in item_classes.items():
+        if isinstance(sub, dict):
+            for minor, items in sub.items():
+                if isinstance(items, list):
+                    result[f"{major}_{minor}"] = [str(i) for i in items]
+        elif isinstance(sub, list):
+            result[major] = [str(i) for i in sub]
+    return result
+
+
+def chunk_regulations(
+    documents: dict[str, dict[str, Any]],
+    item_classes: dict[str, list[str]] | None = None,
+) -> list[RegulationChunk]:
+    """규정 문서들을 섹션 청크로 분할.
+
+    Args:
+        documents: {규정 키: 데이터}
+        item_classes: {규정 키: 품목 목록} (load_item_classes)
+    """
+    chunks: list[RegulationChunk] = []
+    item_classes = item_classes or {}
+    for doc_key, data in documents.items():
+        title = str(data.get("이름") or data.get("category") or doc_key)
+        if item_classes.get(doc_key):
+            chunks.append(
+                RegulationChunk(
+                    chunk_id=f"{doc_key}#{ITEM_CLASS_SECTION}",
+                    doc_key=doc_key,
+                    section=ITEM_CLASS_SECTION,
+                    text=f"{title} | {_join_values(item_classes[doc_key])}",
+                )
+            )
+        for field_name, value in data.items():
+            if field_name in _META_FIELDS or not value:
+                continue
+            if isinstance(value, dict):
+                for sub_key, sub_value in value.items():
+                    section = f"{field_name}/{sub_key}"
+                    chunks.append(
+                        RegulationChunk(
+                            chunk_id=f"{doc_key}#{section}",
+                            doc_key=doc_key,
+                            section=section,
+                            text=f"{title} | {sub_key}: {_join_values(sub_value)}",
+                        )
+                    )
+            else:
+                chunks.append(
+                    RegulationChunk(
+                        chunk_id=f"{doc_key}#{field_name}",
+                        doc_key=doc_key,
+                        section=field_name,
+                        text=f"{title} | {_join_values(value)}",
+                    )
+                )
+    return chunks
+
+
+def load_source_documents(source_dir: Path = DEFAULT_SOURCE_DIR) -> dict[str, dict[str, Any]]:
+    """원본 규정 JSON 로드 (파일명 stem → 데이터, 파일명 순)."""
+    documents: dict[str, dict[str, Any]] = {}
+    for json_file in sorted(source_dir.glob("*.json")):
+        with open(json_file, encoding="utf-8") as f:
+            documents[json_file.stem] = json.load(f)
+    return documents
+
+
+def index_checksum(
+    documents: dict[str, dict[str, Any]],
+    item_classes: dict[str, list[str]],
+) -> str:
+    """원본(규정 JSON + 품목 분류) 변경 감지용 체크섬."""
+    payload = json.dumps([documents, item_classes], ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class ScoredChunk:
+    """벡터 검색 결과."""
+
+    chunk: RegulationChunk
+    score: float
+
+
+class VectorIndex:
+    """NumPy 기반 밀집 벡터 인덱스 (전수 내적 + argpartition top-k).
+
+    청크 수백 개 규모이므로 ANN 없이 행렬-벡터 곱 한 번으로 충분합니다.
+    """
+
+    def __init__(
+        self,
+        chunks: list[RegulationChunk],
+        matrix: np.ndarray,
+        vectorizer: HashingNgramVectorizer,
+        checksum: str = "",
+    ):
+        self.chunks = chunks
+        self.matrix = matrix
+        self.vectorizer = vectorizer
+        self.checksum = checksum
+
+    def __len__(self) -> int:
+        return len(self.chunks)
+
+    @classmethod
+    def build(
+        cls,
+        documents: dict[str, dict[str, Any]],
+        item_classes: dict[str, list[str]] | None = None,
+        vectorizer: HashingNgramVectorizer | None = None,
+    ) -> VectorIndex:
+        """문서에서 인덱스 빌드 (IDF 학습 포함).
+
+        Args:
+            documents: {규정 키: 데이터}
+            item_classes: {규정 키: 품목 목록} (None이면 item_class_list.yaml 로드)
+            vectorizer: 벡터라이저 (None이면 기본 설정)
+        """
+        vectorizer = vectorizer or HashingNgramVectorizer()
+        if item_classes is None:
+            item_classes = load_item_classes()
+        chunks = chunk_regulations(documents, item_classes)
+        texts = [chunk.text for chunk in chunks]
+        if texts:
+            vectorizer.fit_idf(texts)
+        matrix = vectorizer.transform(texts)
+        return cls(chunks, matrix, vectorizer, checksum=index_checksum(documents, item_classes))
+
+    def save(self, path: Path) -> None:
+        """인덱스를 .npz로 저장 (pickle 미사용)."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        meta = {
+            "format_version": INDEX_FORMAT_VERSION,
+            "dim": self.vectorizer.dim,
+            "ngram_range": list(self.vectorizer.ngram_range),
+            "checksum": self.checksum,
+            "chunks": [asdict(chunk) for chunk in self.chunks],
+        }
+        idf = self.vectorizer.idf
+        with open(path, "wb") as f:
+            np.savez_compressed(
+                f,
+                matrix=self.matrix,
+                idf=idf if idf is not None else np.ones(self.vectorizer.dim, dtype=np.float32),
+                meta=np.array(json.dumps(meta, ensure_ascii=False)),
+            )
+
+    @classmethod
+    def load(cls, path: Path) -> VectorIndex:
+        """저장된 인덱스 로드.
+
+        Raises:
+            ValueError: 포맷 버전 불일치
+        """
+        with np.load(path, allow_pickle=False) as archive:
+            meta = json.loads(str(archive["meta"]))
+            if meta.get("format_version") != INDEX_FORMAT_VERSION:
+                raise ValueError(f"Unsupported index format: {meta.get('format_version')}")
+            vectorizer = HashingNgramVectorizer(
+                dim=meta["dim"],
+                ngram_range=tuple(meta["ngram_range"]),
+                idf=archive["idf"].astype(np.float32),
+            )
+            matrix = archive["matrix"].astype(np.float32)
+        chunks = [RegulationChunk(**chunk) for chunk in meta["chunks"]]
+        return cls(chunks, matrix, vectorizer, checksum=meta.get("checksum", ""))
+
+    def search(self, query: str, top_k: int = 5) -> list[ScoredChunk]:
+        """쿼리와 코사인 유사도가 높은 청크 top-k."""
+        if not self.chunks or top_k <= 0:
+            return []
+        query_vector = self.vectorizer.transform_one(query)
+        if not query_vector.any():
+            return []
+
+        scores = self.matrix @ query_vector
+        k = min(top_k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [
+            ScoredChunk(chunk=self.chunks[i], score=float(scores[i])) for i in top if scores[i] > 0
+        ]
@@ -0,0 +1,98 @@
+"""Hashing N-gram Vectorizer - CPU 전용 경량 임베딩.
+
+모델 다운로드 없이 문자 n-gram을 고정 차원으로 해싱하여 벡터화합니다.
+한국어는 띄어쓰기가 일정하지 않으므로("페트 병" / "페트병")
+공백을 제거한 문자열에서 n-gram을 추출하고, 어절 단위 토큰을 함께 사용합니다.
+음절 하나도 의미를 갖는 경우가 많아("옷", "약", "캔") 1~2-gram을 기본으로 합니다
+(scripts/eval_regulation_retrieval.py 기준 recall@3이 2~3-gram보다 높음).
+
+- 해시: zlib.crc32 (프로세스 간 안정적, Python hash()는 랜덤 시드)
+- 가중치: sublinear TF (1 + log tf) × IDF (인덱스 빌드 시 계산)
+- 정규화: L2 (내적 = 코사인 유사도)
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import zlib
+from collections import Counter
+from collections.abc import Sequence
+
+import numpy as np
+
+DEFAULT_DIM = 8192
+DEFAULT_NGRAM_RANGE = (1, 2)
+
+_NON_WORD_PATTERN = re.compile(r"[^\w\s]")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+class HashingNgramVectorizer:
+    """문자 n-gram 해싱 벡터라이저.
+
+    Attributes:
+        dim: 벡터 차원
+        ngram_range: 문자 n-gram 범위 (min, max)
+        idf: 차원별 IDF 가중치 (fit_idf 전에는 None)
+    """
+
+    def __init__(
+        self,
+        dim: int = DEFAULT_DIM,
+        ngram_range: tuple[int, int] = DEFAULT_NGRAM_RANGE,
+        idf: np.ndarray | None = None,
+    ):
+        self.dim = dim
+        self.ngram_range = ngram_range
+        self.idf = idf
+
+    def features(self, text: str) -> Counter[str]:
+        """텍스트에서 특징(어절 + 문자 n-gram) 추출."""
+        normalized = _NON_WORD_PATTERN.sub(" ", text.lower())
+        normalized = _WHITESPACE_PATTERN.sub(" ", normalized).strip()
+        counts: Counter[str] = Counter()
+        if not normalized:
+            return counts
+
+        for token in normalized.split(" "):
+            counts[f"w:{token}"] += 1
+
+        compact = normalized.replace(" ", "")
+        min_n, max_n = self.ngram_range
+        for n in range(min_n, max_n + 1):
+            for i in range(len(compact) - n + 1):
+                counts[compact[i : i + n]] += 1
+        return counts
+
+    def _bucket(self, feature: str) -> int:
+        return zlib.crc32(feature.encode("utf-8")) % self.dim
+
+    def _raw_matrix(self, texts: Sequence[str]) -> np.ndarray:
+        """sublinear TF 행렬 (IDF/정규화 전)."""
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for feature, count in self.features(text).items():
+                matrix[row, self._bucket(feature)] += 1.0 + math.log(count)
+        return matrix
+
+    def fit_idf(self, texts: Sequence[str]) -> np.ndarray:
+        """코퍼스로 IDF 계산 (smooth idf)."""
+        raw = self._raw_matrix(texts)
+        doc_freq = np.count_nonzero(raw, axis=0).astype(np.float32)
+        n_docs = float(len(texts))
+        self.idf = (np.log((1.0 + n_docs) / (1.0 + doc_freq)) + 1.0).astype(np.float32)
+        return self.idf
+
+    def transform(self, texts: Sequence[str]) -> np.ndarray:
+        """텍스트 목록 → L2 정규화 벡터 행렬 (n, dim)."""
+        matrix = self._raw_matrix(texts)
+        if self.idf is not None:
+            matrix *= self.idf
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        np.divide(matrix, norms, out=matrix, where=norms > 0)
+        return matrix
+
+    def transform_one(self, text: str) -> np.ndarray:
+        """단일 텍스트 → (dim,) 벡터."""
+        return self.transform([text])[0]
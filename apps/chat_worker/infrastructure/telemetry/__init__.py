@@ -41,10 +41,12 @@ from chat_worker.infrastructure.telemetry.langsmith import (
     LANGSMITH_ENABLED,
     LANGSMITH_PROJECT,
     MODEL_PRICING,
+    add_run_metadata,
     calculate_cost,
     calculate_image_cost,
     configure_langsmith,
     create_feature_metadata,
+    extract_cached_tokens,
     get_feature_info,
     get_run_config,
     get_subagent_tags,
@@ -74,6 +76,7 @@ __all__ = [
     "traceable_tool",
     "traceable_image",
     "track_token_usage",
+    "extract_cached_tokens",
     # 비용 계산
     "calculate_cost",
     "calculate_image_cost",
@@ -81,6 +84,7 @@ __all__ = [
     "IMAGE_MODEL_PRICING",
     # LangSmith Config
     "get_run_config",
+    "add_run_metadata",
     "get_subagent_tags",
     "create_feature_metadata",
     "get_feature_info",
@@ -548,12 +548,37 @@ def traceable_image(
     return decorator
 
 
+def extract_cached_tokens(usage: Any) -> int:
+    """Provider usage 객체에서 prefix 캐시 히트 토큰 수 추출.
+
+    - OpenAI Chat Completions: usage.prompt_tokens_details.cached_tokens
+    - OpenAI Responses / Agents SDK: usage.input_tokens_details.cached_tokens
+    - Gemini: usage_metadata.cached_content_token_count
+
+    Args:
+        usage: provider usage 객체 (없거나 필드가 없으면 0)
+
+    Returns:
+        캐시된 입력 토큰 수
+    """
+    if usage is None:
+        return 0
+    for details_attr in ("prompt_tokens_details", "input_tokens_details"):
+        details = getattr(usage, details_attr, None)
+        cached = getattr(details, "cached_tokens", None) if details is not None else None
+        if isinstance(cached, int):
+            return cached
+    cached = getattr(usage, "cached_content_token_count", None)
+    return cached if isinstance(cached, int) else 0
+
+
 def track_token_usage(
     run_tree: Any,
     model: str,
     input_tokens: int,
     output_tokens: int,
     latency_ms: float | None = None,
+    cached_tokens: int = 0,
 ) -> None:
     """수동으로 토큰 사용량 추적.
 
@@ -565,6 +590,7 @@ def track_token_usage(
         input_tokens: 입력 토큰 수
         output_tokens: 출력 토큰 수
         latency_ms: 지연 시간 (ms)
+        cached_tokens: 입력 중 provider prefix 캐시 히트 토큰 수 (extract_cached_tokens)
 
     Example:
         ```python
@@ -585,11 +611,35 @@ def track_token_usage(
         "output_tokens": output_tokens,
         "total_tokens": input_tokens + output_tokens,
         "cost_usd": cost,
+        "cached_input_tokens": cached_tokens,
+        "cached_token_ratio": (round(cached_tokens / input_tokens, 4) if input_tokens > 0 else 0.0),
     }
     if latency_ms is not None:
         run_tree.extra["metrics"]["latency_ms"] = latency_ms
 
 
+def add_run_metadata(metadata: dict[str, Any]) -> None:
+    """현재 LangSmith run(노드 실행 등)에 메타데이터 추가.
+
+    LangSmith 비활성화/run 컨텍스트 없음이면 무시합니다.
+
+    Example:
+        ```python
+        add_run_metadata({"tool_calls": 3, "tool_calls_deduped": 1})
+        ```
+    """
+    if not is_langsmith_enabled():
+        return
+    try:
+        from langsmith.run_helpers import get_current_run_tree
+
+        run_tree = get_current_run_tree()
+        if run_tree is not None:
+            run_tree.add_metadata(metadata)
+    except Exception as e:
+        logger.debug(f"LangSmith metadata update failed: {e}")
+
+
 def get_run_config(
     job_id: str,
     session_id: str | None = None,
@@ -846,6 +896,7 @@ __all__ = [
     "traceable_tool",
     "traceable_image",
     "track_token_usage",
+    "extract_cached_tokens",
     # 비용 계산
     "calculate_cost",
     "calculate_image_cost",
@@ -0,0 +1,118 @@
+"""Public Data Snapshot Syncer.
+
+MOIS 생활쓰레기배출정보 / KECO 폐전자제품 수거함 전체 데이터셋을
+로컬 SQLite 스냅샷(CHAT_WORKER_PUBLIC_DATA_SNAPSHOT_PATH)으로 동기화.
+chat_worker 이미지의 별도 entrypoint로 실행 (worker와 볼륨 공유, 또는 CronJob).
+
+실행:
+    python -m chat_worker.public_data_syncer
+
+아키텍처:
+    이 프로세스 (PublicDataSnapshotSync)
+        ├─ MOIS/KECO 실시간 API 전체 페이지 순회
+        ├─ KECO 주소 → Kakao 키워드 검색 좌표 (이전 스냅샷 좌표 재사용)
+        └─ 임시 파일 기록 → os.replace
+    Worker (LocalFirst*Client) → 파일 교체 감지 후 재연결
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import signal
+import sys
+
+from chat_worker.setup.config import get_settings
+
+
+def configure_logging() -> None:
+    """로깅 설정."""
+    settings = get_settings()
+    logging.basicConfig(
+        level=getattr(logging, settings.log_level.upper(), logging.INFO),
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+        stream=sys.stdout,
+    )
+
+
+async def main() -> None:
+    """Syncer 메인 루프."""
+    settings = get_settings()
+
+    if not settings.public_data_snapshot_path:
+        logging.error(
+            "CHAT_WORKER_PUBLIC_DATA_SNAPSHOT_PATH is not configured. "
+            "Public data syncer cannot start without snapshot path."
+        )
+        sys.exit(1)
+
+    from chat_worker.infrastructure.integrations.bulk_waste import MoisWasteInfoHttpClient
+    from chat_worker.infrastructure.integrations.kakao import KakaoLocalHttpClient
+    from chat_worker.infrastructure.integrations.keco import KecoCollectionPointClient
+    from chat_worker.infrastructure.integrations.public_data import PublicDataSnapshotSync
+
+    logger = logging.getLogger(__name__)
+
+    clients = {
+        "bulk_waste_client": (
+            MoisWasteInfoHttpClient(
+                api_key=settings.mois_waste_api_key,
+                timeout=settings.mois_waste_api_timeout,
+            )
+            if settings.mois_waste_api_key
+            else None
+        ),
+        "collection_point_client": (
+            KecoCollectionPointClient(
+                api_key=settings.keco_api_key,
+                timeout=settings.keco_api_timeout,
+            )
+            if settings.keco_api_key
+            else None
+        ),
+        "geocoder": (
+            KakaoLocalHttpClient(
+                api_key=settings.kakao_rest_api_key,
+                timeout=settings.kakao_api_timeout,
+            )
+            if settings.kakao_rest_api_key
+            else None
+        ),
+    }
+    sync = PublicDataSnapshotSync(**clients)
+
+    stop_event = asyncio.Event()
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, stop_event.set)
+
+    interval = settings.public_data_sync_interval_hours * 3600
+    logger.info(
+        "Public data syncer ready (path=%s, interval=%.1fh)",
+        settings.public_data_snapshot_path,
+        settings.public_data_sync_interval_hours,
+    )
+
+    try:
+        while not stop_event.is_set():
+            try:
+                await sync.run(settings.public_data_snapshot_path)
+            except Exception as e:
+                logger.error("Public data sync failed", extra={"error": str(e)})
+            if interval <= 0:
+                break
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+    finally:
+        for client in clients.values():
+            if client is not None:
+                await client.close()
+        logger.info("Public data syncer stopped gracefully")
+
+
+if __name__ == "__main__":
+    configure_logging()
+    asyncio.run(main())
@@ -20,6 +20,7 @@ import logging
 import os
 
 from aio_pika import ExchangeType
+from taskiq import TaskiqEvents, TaskiqState
 from taskiq_aio_pika import AioPikaBroker
 
 from chat_worker.setup.config import get_settings
@@ -169,6 +170,27 @@ def _setup_langsmith_otel() -> None:
         logger.warning(f"LangSmith OTEL setup skipped: {e}")
 
 
+async def _run_warmup() -> None:
+    """Worker warmup (그래프/에셋/연결 풀 선행 준비).
+
+    실패해도 워커 시작은 계속합니다 (요청 경로에서 lazy 초기화).
+    """
+    if not settings.warmup_enabled:
+        return
+    try:
+        from chat_worker.setup.warmup import warmup
+
+        await warmup()
+    except Exception as e:
+        logger.warning(f"Worker warmup skipped: {e}")
+
+
+@broker.on_event(TaskiqEvents.WORKER_STARTUP)
+async def _on_worker_startup(state: TaskiqState) -> None:
+    """taskiq worker CLI 경로: 메시지 수신 시작 전 warmup 완료 대기."""
+    await _run_warmup()
+
+
 async def _check_redis_connectivity() -> None:
     """Redis 연결 확인 (fast-fail).
 
@@ -224,12 +246,32 @@ async def startup():
         broker.add_middlewares(TracingMiddleware())
         logger.info("Tracing middleware registered (trace context propagation enabled)")
 
-    # 5. 브로커 시작
+    # 5. Worker warmup (프롬프트/에셋/그래프/연결 풀/합성 턴, 참조 이미지 preload 포함)
+    await _run_warmup()
+
+    # 6. 브로커 시작
     await broker.startup()
     logger.info("Taskiq broker started")
 
 
+async def _run_cleanup() -> None:
+    """의존성 리소스 정리 (지연 평가 drain, 클라이언트 종료)."""
+    try:
+        from chat_worker.setup.dependencies import cleanup
+
+        await cleanup()
+    except Exception as e:
+        logger.warning(f"Dependency cleanup failed: {e}")
+
+
+@broker.on_event(TaskiqEvents.WORKER_SHUTDOWN)
+async def _on_worker_shutdown(state: TaskiqState) -> None:
+    """taskiq worker CLI 경로: 종료 시 리소스 정리."""
+    await _run_cleanup()
+
+
 async def shutdown():
     """브로커 종료."""
+    await _run_cleanup()
     await broker.shutdown()
     logger.info("Taskiq broker stopped")
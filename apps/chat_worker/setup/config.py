@@ -62,11 +62,41 @@ class Settings(BaseSettings):
     image_generation_default_size: str = "1024x1024"
     # 기본 이미지 품질 (low: ~$0.02, medium: ~$0.07, high: ~$0.19)
     image_generation_default_quality: str = "medium"
+    # 캐릭터 참조 이미지 캐시 (워커 시작 시 character_names.yaml 전체 preload)
+    reference_image_cache_enabled: bool = True
+    reference_image_cache_max_bytes: int = 32 * 1024 * 1024
+    # 디스크 캐시 디렉토리 (None이면 메모리만, 재시작 후 CDN 재다운로드)
+    reference_image_cache_dir: str | None = None
+    # ETag 조건부 재검증 주기 (초)
+    reference_image_revalidate_seconds: float = 3600.0
 
     # Images gRPC: 생성된 이미지 S3 업로드 (별도 Pod)
     images_grpc_host: str = "images-api"
     images_grpc_port: int = 50052
 
+    # LLM Hedging (opt-in): 구조화 호출(Intent 분류 등)이 p95 deadline을 넘기면
+    # 같은(또는 대체) provider/model로 두 번째 요청을 보내 먼저 온 응답 사용
+    llm_hedging_enabled: bool = False
+    llm_hedge_provider: Literal["openai", "google"] | None = None  # None = primary와 동일
+    llm_hedge_model: str | None = None
+    llm_hedge_initial_delay: float = 1.5  # 지연 표본 부족 시 deadline (초)
+    llm_hedge_min_delay: float = 0.25
+    llm_hedge_max_delay: float = 4.0
+    llm_hedge_budget_ratio: float = 0.1  # hedge 요청 비율 상한
+    llm_hedge_max_call_seconds: float = 20.0  # 호출 1회 총 대기 상한
+
+    # LLM Admission Control (opt-in): 클러스터 공유 RPM 예산(Redis Lua token bucket)
+    # + 429/지연 기반 AIMD 동시성, 노드 우선순위(answer > weather 보강) 적용
+    llm_admission_enabled: bool = False
+    llm_admission_rpm: int = 600  # provider별 클러스터 전체 분당 요청 예산
+    llm_admission_burst: int = 50
+    llm_admission_reserve_batch: int = 4  # Redis 왕복 1회당 선예약 permit 수
+    llm_admission_max_wait: float = 10.0  # 예산 대기 상한 (초과 시 fail-open)
+    llm_admission_initial_concurrency: int = 16
+    llm_admission_min_concurrency: int = 2
+    llm_admission_max_concurrency: int = 64
+    llm_admission_latency_target: float = 5.0
+
     # Gemini
     google_api_key: str | None = None
     gemini_default_model: str = "gemini-3-flash-preview"
@@ -74,10 +104,71 @@ class Settings(BaseSettings):
     # Assets
     assets_path: str | None = None
 
+    # RAG Retriever
+    # tag: TagBasedRetriever (품목/상황 태그 매칭)
+    # hybrid: SemanticRetriever (규정 섹션 벡터 검색 + 태그 검색 RRF 융합)
+    retriever_mode: Literal["tag", "hybrid"] = "tag"
+    # 오프라인 빌드 벡터 인덱스 경로 (None이면 assets/data/index/regulation_vectors.npz)
+    # 파일이 없거나 원본과 다르면 로드 시 메모리에서 빌드
+    semantic_index_path: str | None = None
+    semantic_weight: float = 0.5  # RRF 융합 시 의미 검색 가중치 (0~1)
+
+    # Semantic Intent Cache (어미/공백 정규화 + MinHash 근사 중복, 프로세스 로컬)
+    # "버려?" / "버려요" 같은 표면 변형에 LLM 재호출 없이 캐시된 Intent 반환
+    intent_semantic_cache_enabled: bool = True
+    intent_semantic_cache_threshold: float = 0.8  # 근사 히트 최소 Jaccard (문자 2-gram)
+    intent_semantic_cache_max_entries: int = 10000
+    intent_semantic_cache_audit_rate: float = 0.02  # 히트 중 LLM 재분류 감사 비율
+
+    # Multi-Intent 분해 쿼리 분류
+    intent_max_parallel_classifications: int = 4  # 쿼리별 분류 동시 실행 상한
+    # 감지 신뢰도가 높으면(≥0.85) 분해 + 쿼리별 분류를 LLM 1회 호출로 통합
+    intent_merged_classification: bool = False
+
+    # Speculative prefetch: intent 분류 LLM 호출과 병렬로 유력 서브에이전트
+    # (waste_rag, character) 컨텍스트를 선행 조회, 예측이 맞으면 router 이후 사용
+    enable_speculative_prefetch: bool = False
+
+    # answer 토큰 발행 큐 상한 (청크 수): 백그라운드 writer가 밀린 청크를 병합 발행
+    answer_token_queue_size: int = 256
+
+    # Answer 캐시: (intent, 정규화 메시지, 컨텍스트 해시, 캐릭터, 프롬프트 버전) 키
+    # 목록에서 Intent를 빼면 해당 Intent는 캐시 조회/저장 안함
+    answer_cache_enabled: bool = True
+    answer_cache_intents: list[str] = ["general", "greeting", "waste", "character"]
+    answer_cache_ttl: int = 3600
+    # 캐시 히트 시 토큰 재생 속도 (SSE UX 유지)
+    answer_cache_replay_chunk_chars: int = 4
+    answer_cache_replay_interval: float = 0.02
+
+    # Circuit Breaker 분산 모드: 실패 수/상태 전환을 Redis(+Pub/Sub)로 replica 간 공유
+    # → 한 replica가 외부 API(KMA/KECO 등) 장애를 감지하면 전체가 1초 내 OPEN
+    circuit_breaker_distributed: bool = False
+    circuit_breaker_failure_window: float = 60.0  # 분산 실패 수 집계 윈도우 (초)
+
+    # RAG Feedback (waste_rag → feedback → answer) 평가 모드
+    # off: feedback 노드 passthrough
+    # inline: Rule 평가 + (저품질 시) LLM 평가를 answer 전에 수행
+    # deferred: 빠른 로컬 평가(태그 커버리지/근거 수/섹션 매칭)로 Fallback 게이트,
+    #           LLM 평가는 answer 첫 토큰 이후 백그라운드 (결과는 메트릭/로그 기록만)
+    feedback_evaluation_mode: Literal["off", "inline", "deferred"] = "off"
+    feedback_drain_timeout: float = 10.0  # 종료 시 deferred 평가 완료 대기 (초)
+
+    # 파이프라인 astream 구독 모드 (ProcessChatCommand)
+    # "messages"는 모든 LLM 호출의 토큰마다 튜플을 만들므로 디버깅 시에만 추가
+    # "custom"은 get_stream_writer()로 이벤트를 보내는 노드가 생기면 추가
+    pipeline_stream_modes: list[str] = ["updates"]
+
     # Web Search (Subagent용)
     # Tavily API 키 (LLM 최적화 검색, 선택적)
     # 없으면 DuckDuckGo 사용 (무료, API 키 불필요)
     tavily_api_key: str | None = None
+    # 정규화 질의 캐시 (time_range별 TTL + stale-while-revalidate)
+    web_search_cache_enabled: bool = True
+    web_search_cache_max_entries: int = 1024
+    # 동기 검색 SDK 전용 thread pool (대기열 초과 시 즉시 빈 결과)
+    web_search_executor_workers: int = 4
+    web_search_executor_max_queue: int = 32
 
     # gRPC Clients (Subagent용)
     # Character gRPC: 캐릭터 정보 조회 (별도 Pod)
@@ -97,6 +188,12 @@ class Settings(BaseSettings):
     # 공공데이터포털 인증키 (Decoding 키 권장)
     kma_api_key: str | None = None
     kma_api_timeout: float = 10.0
+    # 격자(nx, ny)/발표시각 단위 캐시 (TTL = 다음 발표분 조회 가능 시각까지)
+    kma_cache_enabled: bool = True
+    kma_cache_max_cells: int = 2048
+    # base_time 변경 직후 조회 빈도 상위 N개 격자 미리 갱신 (0이면 비활성)
+    kma_prefetch_top_n: int = 0
+    kma_prefetch_delay: float = 60.0
 
     # 행정안전부 생활쓰레기배출정보 API (대형폐기물 정보)
     # 공공데이터포털 인증키 (Decoding 키 권장)
@@ -110,6 +207,32 @@ class Settings(BaseSettings):
     keco_api_key: str | None = None
     keco_api_timeout: float = 15.0
 
+    # MOIS/KECO 로컬 스냅샷 (SQLite, public_data_syncer가 주기적으로 갱신)
+    # 설정 시 스냅샷 우선 조회 + 실시간 API fallback, 주변 수거함 좌표 검색 지원
+    public_data_snapshot_path: str | None = None
+    public_data_snapshot_max_age_hours: float = 24 * 14
+    public_data_sync_interval_hours: float = 24.0  # syncer 주기 (0이면 1회 실행 후 종료)
+
+    # 좌표 → 지역 정보 해석 (weather/bulk_waste 노드 공유, 양자화 셀 캐시)
+    # auto: 카카오 coord2regioncode → 스냅샷 색인(fallback) 순, none: 격자/타일만 해석
+    geo_resolver_enabled: bool = True
+    geo_reverse_geocode_mode: Literal["auto", "offline", "kakao", "none"] = "auto"
+    geo_quantize_decimals: int = 3  # 소수점 3자리 (약 100m 셀)
+    geo_cache_ttl: int = 30 * 24 * 3600  # L2 TTL (행정구역은 거의 바뀌지 않음)
+    geo_cache_max_entries: int = 4096  # L1 셀 상한
+
+    # 재활용자원 시세 YAML (None이면 이미지 내장 에셋)
+    # ConfigMap 등으로 마운트하면 파일 교체만으로 시세 갱신 (재배포 불필요)
+    recyclable_price_data_path: str | None = None
+    recyclable_price_reload_seconds: float = 60.0  # 파일 변경 확인 주기 (0이면 매 조회)
+
+    # Worker warmup (taskiq WORKER_STARTUP, 완료 후 큐 소비 시작)
+    # 프롬프트/에셋 적재 → 그래프 컴파일 → 연결 선행 수립 → 합성 턴 (LLM 호출 없음)
+    warmup_enabled: bool = True
+    warmup_timeout_seconds: float = 60.0  # 전체 상한 (초과 시 남은 단계 생략)
+    warmup_connect_timeout: float = 5.0  # 연결 대상별 상한
+    warmup_prewarm_llm: bool = True  # LLM provider 연결 선행 수립 (models.list 1회)
+
     # Multi-turn 대화 컨텍스트 압축 (OpenCode 스타일)
     # 동적 설정: context_window - max_output 초과 시 압축 트리거
     enable_summarization: bool = True  # 기본 활성화
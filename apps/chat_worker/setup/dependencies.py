@@ -36,7 +36,7 @@ from chat_worker.application.ports import (
     ProgressNotifierPort,
     RetrieverPort,
 )
-from chat_worker.application.ports.cache import CachePort
+from chat_worker.application.ports.cache import CachePort, SemanticIntentCachePort
 from chat_worker.application.ports.character_client import CharacterClientPort
 from chat_worker.application.ports.input_requester import InputRequesterPort
 from chat_worker.application.ports.interaction_state_store import (
@@ -57,8 +57,13 @@ from chat_worker.application.ports.recyclable_price_client import (
 from chat_worker.application.ports.collection_point_client import (
     CollectionPointClientPort,
 )
+from chat_worker.application.ports.geo_resolver import GeoResolverPort
+from chat_worker.application.services.deferred_feedback_evaluator import (
+    DeferredFeedbackEvaluator,
+)
 from chat_worker.infrastructure.assets.prompt_loader import get_prompt_loader
-from chat_worker.infrastructure.cache import RedisCacheAdapter
+from chat_worker.infrastructure.assets.reference_image_cache import ReferenceImageCache
+from chat_worker.infrastructure.cache import RedisCacheAdapter, SemanticIntentCache
 from chat_worker.infrastructure.events import (
     RedisProgressNotifier,
     RedisStreamDomainEventBus,
@@ -67,13 +72,20 @@ from chat_worker.infrastructure.integrations import (
     CharacterGrpcClient,
     LocationGrpcClient,
 )
-from chat_worker.infrastructure.integrations.web_search import DuckDuckGoSearchClient
+from chat_worker.infrastructure.integrations.web_search import (
+    BoundedSearchExecutor,
+    CachedWebSearchClient,
+    DuckDuckGoSearchClient,
+)
 from chat_worker.infrastructure.interaction import (
     RedisInputRequester,
     RedisInteractionStateStore,
 )
 from chat_worker.infrastructure.llm import (
+    AdmissionControlledLLMClient,
     GeminiLLMClient,
+    HedgedLLMClient,
+    HedgingPolicy,
     LangChainLLMAdapter,
     LangChainOpenAIRunnable,
     OpenAILLMClient,
@@ -87,9 +99,14 @@ from chat_worker.infrastructure.metrics import (
     PrometheusMetricsAdapter,
 )
 from chat_worker.infrastructure.orchestration.langgraph import create_chat_graph
+from chat_worker.infrastructure.ratelimit import LLMAdmissionController
+from chat_worker.infrastructure.resilience import (
+    CircuitBreakerRegistry,
+    CircuitBreakerStateSync,
+)
 
 # Infrastructure Layer
-from chat_worker.infrastructure.retrieval import TagBasedRetriever
+from chat_worker.infrastructure.retrieval import SemanticRetriever, TagBasedRetriever
 from chat_worker.setup.config import get_settings
 
 # Domain Layer
@@ -120,22 +137,29 @@ _character_client: CharacterClientPort | None = None
 _location_client: LocationClientPort | None = None
 _kakao_local_client: KakaoLocalClientPort | None = None
 _web_search_client: WebSearchPort | None = None
+_web_search_executor: BoundedSearchExecutor | None = None
 _weather_client: WeatherClientPort | None = None
 _bulk_waste_client: BulkWasteClientPort | None = None
 _recyclable_price_client: RecyclablePriceClientPort | None = None
 _collection_point_client: CollectionPointClientPort | None = None
+_geo_resolver: GeoResolverPort | None = None
 _interaction_state_store: InteractionStateStorePort | None = None
 _input_requester: InputRequesterPort | None = None
 _checkpointer = None  # BaseCheckpointSaver
 _cache: CachePort | None = None
 _metrics: MetricsPort | None = None
 _image_generator: ImageGeneratorPort | None = None
+_reference_image_cache: ReferenceImageCache | None = None
 _image_storage: ImageStoragePort | None = None
 _image_storage_checked: bool = False  # 캐싱 상태 플래그
 # Raw SDK clients for Location Agent (Function Calling)
 _openai_async_client = None  # openai.AsyncOpenAI
 _gemini_client = None  # google.genai.Client
+_circuit_breaker_sync: CircuitBreakerStateSync | None = None
+_llm_admission_controllers: dict[str, LLMAdmissionController] = {}  # provider → controller
 _graph_cache: dict[tuple[str, str | None], object] = {}  # (provider, model) → compiled graph
+_graph_llm_clients: dict[tuple[str, str | None], list[object]] = {}  # warmup 연결 대상
+_deferred_feedback_evaluators: list[DeferredFeedbackEvaluator] = []  # 종료 시 drain 대상
 
 
 async def get_redis() -> Redis:
@@ -231,12 +255,21 @@ async def get_domain_event_bus() -> RedisStreamDomainEventBus:
 
 @lru_cache
 def get_retriever() -> RetrieverPort:
-    """Retriever 싱글톤 (TagBasedRetriever 사용).
+    """Retriever 싱글톤.
 
     Anthropic Contextual Retrieval 패턴 적용:
     - item_class_list.yaml: 품목 매칭
     - situation_tags.yaml: 상황 태그 매칭
+
+    retriever_mode="hybrid"이면 SemanticRetriever로 규정 섹션 벡터 검색을
+    태그 검색과 융합 (표현이 달라 태그가 안 걸리는 질문 대응).
     """
+    settings = get_settings()
+    if settings.retriever_mode == "hybrid":
+        return SemanticRetriever(
+            index_path=settings.semantic_index_path,
+            semantic_weight=settings.semantic_weight,
+        )
     return TagBasedRetriever()
 
 
@@ -259,6 +292,19 @@ async def get_cache() -> CachePort:
     return _cache
 
 
+@lru_cache
+def get_intent_semantic_cache() -> SemanticIntentCachePort | None:
+    """유사 메시지 Intent 캐시 싱글톤 (프로세스 로컬, 비활성화 시 None)."""
+    settings = get_settings()
+    if not settings.intent_semantic_cache_enabled:
+        return None
+    return SemanticIntentCache(
+        threshold=settings.intent_semantic_cache_threshold,
+        max_entries=settings.intent_semantic_cache_max_entries,
+        audit_rate=settings.intent_semantic_cache_audit_rate,
+    )
+
+
 # ============================================================
 # Metrics Factory (Clean Architecture)
 # ============================================================
@@ -339,6 +385,83 @@ def create_llm_client(
             )
 
 
+async def get_llm_admission_controller(
+    provider: Literal["openai", "google"] = "openai",
+) -> LLMAdmissionController:
+    """provider별 LLM 승인 제어기 싱글톤 (예산은 Redis로 클러스터 공유)."""
+    if provider not in _llm_admission_controllers:
+        settings = get_settings()
+        _llm_admission_controllers[provider] = LLMAdmissionController(
+            redis=await get_redis(),
+            scope=provider,
+            rpm=settings.llm_admission_rpm,
+            burst=settings.llm_admission_burst,
+            reserve_batch=settings.llm_admission_reserve_batch,
+            max_wait=settings.llm_admission_max_wait,
+            initial_concurrency=settings.llm_admission_initial_concurrency,
+            min_concurrency=settings.llm_admission_min_concurrency,
+            max_concurrency=settings.llm_admission_max_concurrency,
+            latency_target=settings.llm_admission_latency_target,
+        )
+        logger.info(
+            "LLMAdmissionController created",
+            extra={"provider": provider, "rpm": settings.llm_admission_rpm},
+        )
+    return _llm_admission_controllers[provider]
+
+
+async def with_llm_admission(
+    llm: LLMClientPort,
+    provider: Literal["openai", "google"] = "openai",
+) -> LLMClientPort:
+    """LLM 승인 제어 래핑 (llm_admission_enabled일 때만)."""
+    if not get_settings().llm_admission_enabled:
+        return llm
+    return AdmissionControlledLLMClient(llm, await get_llm_admission_controller(provider))
+
+
+async def with_llm_hedging(
+    llm: LLMClientPort,
+    provider: Literal["openai", "google"] = "openai",
+) -> LLMClientPort:
+    """의도 분류용 구조화 호출 hedging 래핑 (llm_hedging_enabled일 때만).
+
+    hedge 요청은 llm_hedge_provider/llm_hedge_model이 설정되면 대체 클라이언트로,
+    아니면 같은 클라이언트로 재요청합니다.
+    """
+    settings = get_settings()
+    if not settings.llm_hedging_enabled:
+        return llm
+
+    hedge = None
+    if settings.llm_hedge_provider or settings.llm_hedge_model:
+        hedge_provider = settings.llm_hedge_provider or provider
+        hedge = await with_llm_admission(
+            create_llm_client(
+                hedge_provider,
+                settings.llm_hedge_model,
+                enable_token_streaming=False,
+            ),
+            hedge_provider,
+        )
+
+    policy = HedgingPolicy(
+        initial_delay=settings.llm_hedge_initial_delay,
+        min_delay=settings.llm_hedge_min_delay,
+        max_delay=settings.llm_hedge_max_delay,
+        budget_ratio=settings.llm_hedge_budget_ratio,
+        max_call_seconds=settings.llm_hedge_max_call_seconds,
+    )
+    logger.info(
+        "LLM hedging enabled",
+        extra={
+            "hedge_provider": settings.llm_hedge_provider or provider,
+            "hedge_model": settings.llm_hedge_model,
+        },
+    )
+    return HedgedLLMClient(llm, hedge=hedge, policy=policy)
+
+
 def create_vision_client(
     provider: Literal["openai", "google"] = "openai",
     model: str | None = None,
@@ -468,12 +591,64 @@ def get_image_generator() -> ImageGeneratorPort | None:
         _image_generator = GeminiNativeImageGenerator(
             model="gemini-3-pro-image-preview",
             api_key=settings.google_api_key,
+            reference_cache=get_reference_image_cache(),
         )
         logger.info("Gemini Image Generator created (model=gemini-3-pro-image-preview)")
 
     return _image_generator
 
 
+def get_reference_image_cache() -> ReferenceImageCache | None:
+    """캐릭터 참조 이미지 캐시 싱글톤.
+
+    reference_image_cache_enabled=False면 None (매 요청 CDN 다운로드).
+
+    환경변수:
+    - CHAT_WORKER_REFERENCE_IMAGE_CACHE_DIR: 디스크 캐시 디렉토리 (선택)
+    """
+    global _reference_image_cache
+    if _reference_image_cache is None:
+        settings = get_settings()
+        if not settings.reference_image_cache_enabled:
+            return None
+
+        _reference_image_cache = ReferenceImageCache(
+            max_bytes=settings.reference_image_cache_max_bytes,
+            disk_dir=settings.reference_image_cache_dir,
+            revalidate_after=settings.reference_image_revalidate_seconds,
+        )
+        logger.info(
+            "Reference image cache created (max_bytes=%d, disk=%s)",
+            settings.reference_image_cache_max_bytes,
+            settings.reference_image_cache_dir or "disabled",
+        )
+
+    return _reference_image_cache
+
+
+async def preload_reference_images() -> int:
+    """character_names.yaml의 전체 캐릭터 이미지를 참조 이미지 캐시에 적재.
+
+    이미지 생성이 비활성이거나 캐시가 꺼져 있으면 아무것도 하지 않음.
+
+    Returns:
+        적재된 이미지 수
+    """
+    settings = get_settings()
+    if not settings.enable_image_generation:
+        return 0
+
+    cache = get_reference_image_cache()
+    if cache is None:
+        return 0
+
+    from chat_worker.infrastructure.assets.character_name_detector import (
+        get_character_name_detector,
+    )
+
+    return await cache.preload(get_character_name_detector().get_cdn_urls())
+
+
 def get_image_storage() -> ImageStoragePort | None:
     """이미지 저장소 클라이언트 싱글톤.
 
@@ -578,19 +753,25 @@ async def get_location_client() -> LocationClientPort:
 # ============================================================
 
 
-def get_web_search_client() -> WebSearchPort:
+def get_web_search_client(cache: CachePort | None = None) -> WebSearchPort:
     """웹 검색 클라이언트 싱글톤.
 
     웹 검색 서브에이전트에서 사용.
     기본: DuckDuckGo (무료, API 키 불필요)
     선택: Tavily (LLM 최적화, API 키 필요)
+    web_search_cache_enabled면 CachedWebSearchClient로 감쌈
+    (cache가 주어지면 replica 간 공유 L2로 사용).
 
     환경변수:
     - TAVILY_API_KEY: 설정 시 Tavily 사용
     """
-    global _web_search_client
+    global _web_search_client, _web_search_executor
     if _web_search_client is None:
         settings = get_settings()
+        executor = _web_search_executor = BoundedSearchExecutor(
+            max_workers=settings.web_search_executor_workers,
+            max_queue=settings.web_search_executor_max_queue,
+        )
 
         # Tavily API 키가 있으면 Tavily 사용
         if settings.tavily_api_key:
@@ -598,13 +779,23 @@ def get_web_search_client() -> WebSearchPort:
                 TavilySearchClient,
             )
 
-            _web_search_client = TavilySearchClient(api_key=settings.tavily_api_key)
+            _web_search_client = TavilySearchClient(
+                api_key=settings.tavily_api_key, executor=executor
+            )
             logger.info("Tavily web search client created (LLM-optimized)")
         else:
             # 기본: DuckDuckGo
-            _web_search_client = DuckDuckGoSearchClient()
+            _web_search_client = DuckDuckGoSearchClient(executor=executor)
             logger.info("DuckDuckGo web search client created (free, no API key)")
 
+        if settings.web_search_cache_enabled:
+            _web_search_client = CachedWebSearchClient(
+                _web_search_client,
+                cache=cache,
+                max_entries=settings.web_search_cache_max_entries,
+            )
+            logger.info("Web search cache enabled (stale-while-revalidate)")
+
     return _web_search_client
 
 
@@ -652,11 +843,13 @@ def get_kakao_local_client() -> KakaoLocalClientPort | None:
 # ============================================================
 
 
-def get_weather_client() -> WeatherClientPort | None:
+def get_weather_client(cache: CachePort | None = None) -> WeatherClientPort | None:
     """기상청 날씨 클라이언트 싱글톤.
 
     기상청 단기예보 API를 사용한 현재 날씨/예보 조회.
     API 키가 없으면 None 반환 (선택적 기능).
+    kma_cache_enabled면 격자/발표시각 단위 캐시(CachedWeatherClient)로 감쌈
+    (cache가 주어지면 replica 간 공유 L2로 사용).
 
     환경변수:
     - CHAT_WORKER_KMA_API_KEY: 공공데이터포털 인증키
@@ -670,6 +863,7 @@ def get_weather_client() -> WeatherClientPort | None:
 
         if settings.kma_api_key:
             from chat_worker.infrastructure.integrations.kma import (
+                CachedWeatherClient,
                 KmaWeatherHttpClient,
             )
 
@@ -678,6 +872,19 @@ def get_weather_client() -> WeatherClientPort | None:
                 timeout=settings.kma_api_timeout,
             )
             logger.info("KMA Weather HTTP client created")
+
+            if settings.kma_cache_enabled:
+                _weather_client = CachedWeatherClient(
+                    _weather_client,
+                    cache=cache,
+                    max_cells=settings.kma_cache_max_cells,
+                    prefetch_top_n=settings.kma_prefetch_top_n,
+                    prefetch_delay=settings.kma_prefetch_delay,
+                )
+                logger.info(
+                    "KMA weather cache enabled",
+                    extra={"prefetch_top_n": settings.kma_prefetch_top_n},
+                )
         else:
             logger.warning("KMA_API_KEY not set, weather feature disabled")
             return None
@@ -698,6 +905,7 @@ def get_bulk_waste_client() -> BulkWasteClientPort | None:
 
     환경변수:
     - CHAT_WORKER_MOIS_WASTE_API_KEY: 공공데이터포털 인증키
+    - CHAT_WORKER_PUBLIC_DATA_SNAPSHOT_PATH: 로컬 스냅샷 경로 (설정 시 스냅샷 우선)
 
     참고:
     - https://www.data.go.kr/data/15155080/openapi.do
@@ -716,6 +924,19 @@ def get_bulk_waste_client() -> BulkWasteClientPort | None:
                 timeout=settings.mois_waste_api_timeout,
             )
             logger.info("MOIS Bulk Waste HTTP client created")
+
+            if settings.public_data_snapshot_path:
+                from chat_worker.infrastructure.integrations.public_data import (
+                    LocalFirstBulkWasteClient,
+                    PublicDataSnapshotStore,
+                )
+
+                _bulk_waste_client = LocalFirstBulkWasteClient(
+                    _bulk_waste_client,
+                    PublicDataSnapshotStore(settings.public_data_snapshot_path),
+                    max_age=settings.public_data_snapshot_max_age_hours * 3600,
+                )
+                logger.info("MOIS local snapshot enabled (live fallback)")
         else:
             logger.warning("MOIS_WASTE_API_KEY not set, bulk waste feature disabled")
             return None
@@ -747,7 +968,11 @@ def get_recyclable_price_client() -> RecyclablePriceClientPort:
             LocalRecyclablePriceClient,
         )
 
-        _recyclable_price_client = LocalRecyclablePriceClient()
+        settings = get_settings()
+        _recyclable_price_client = LocalRecyclablePriceClient(
+            data_path=settings.recyclable_price_data_path,
+            reload_interval=settings.recyclable_price_reload_seconds,
+        )
         logger.info("Local Recyclable Price client created")
 
     return _recyclable_price_client
@@ -766,6 +991,7 @@ def get_collection_point_client() -> CollectionPointClientPort | None:
 
     환경변수:
     - CHAT_WORKER_KECO_API_KEY: 공공데이터포털 인증키
+    - CHAT_WORKER_PUBLIC_DATA_SNAPSHOT_PATH: 로컬 스냅샷 경로 (설정 시 스냅샷 우선, 주변 검색)
 
     참고:
     - https://www.data.go.kr/data/15106385/fileData.do
@@ -784,6 +1010,19 @@ def get_collection_point_client() -> CollectionPointClientPort | None:
                 timeout=settings.keco_api_timeout,
             )
             logger.info("KECO Collection Point HTTP client created")
+
+            if settings.public_data_snapshot_path:
+                from chat_worker.infrastructure.integrations.public_data import (
+                    LocalFirstCollectionPointClient,
+                    PublicDataSnapshotStore,
+                )
+
+                _collection_point_client = LocalFirstCollectionPointClient(
+                    _collection_point_client,
+                    PublicDataSnapshotStore(settings.public_data_snapshot_path),
+                    max_age=settings.public_data_snapshot_max_age_hours * 3600,
+                )
+                logger.info("KECO local snapshot enabled (live fallback, nearby search)")
         else:
             logger.warning("KECO_API_KEY not set, collection point feature disabled")
             return None
@@ -791,6 +1030,70 @@ def get_collection_point_client() -> CollectionPointClientPort | None:
     return _collection_point_client
 
 
+# ============================================================
+# Geo Resolver Factory (좌표 → 지역 정보)
+# ============================================================
+
+
+def get_geo_resolver(cache: CachePort | None = None) -> GeoResolverPort | None:
+    """좌표 해석기 싱글톤.
+
+    weather/bulk_waste 노드가 user_location에서 각자 구하던 지역 정보
+    (시도/시군구, 기상청 격자, 타일)를 양자화 셀 단위로 한 번만 계산해 공유.
+    cache가 주어지면 replica 간 공유 L2로 사용.
+
+    역지오코딩 체인 (geo_reverse_geocode_mode):
+    - offline: 공공데이터 스냅샷 region_cell 색인 (스냅샷 경로 필요)
+    - kakao: 카카오 coord2regioncode (REST API 키 필요)
+    - auto: kakao → offline (카카오 장애/키 없음 시에만 근사 색인), none: 격자/타일만
+
+    환경변수:
+    - CHAT_WORKER_GEO_RESOLVER_ENABLED: 비활성화 시 None (노드별 기존 방식)
+    - CHAT_WORKER_GEO_REVERSE_GEOCODE_MODE: auto | offline | kakao | none
+    """
+    global _geo_resolver
+    if _geo_resolver is None:
+        settings = get_settings()
+        if not settings.geo_resolver_enabled:
+            return None
+
+        from chat_worker.infrastructure.geo import (
+            CachedGeoResolver,
+            KakaoReverseGeocoder,
+            SnapshotReverseGeocoder,
+        )
+
+        mode = settings.geo_reverse_geocode_mode
+        geocoders = []
+        # 카카오가 정확한 행정구역 (스냅샷 색인은 주변 수거함 기준 근사치라 fallback)
+        if mode in ("auto", "kakao"):
+            kakao_client = get_kakao_local_client()
+            if kakao_client is not None:
+                geocoders.append(KakaoReverseGeocoder(kakao_client))
+        if mode in ("auto", "offline") and settings.public_data_snapshot_path:
+            from chat_worker.infrastructure.integrations.public_data import (
+                PublicDataSnapshotStore,
+            )
+
+            geocoders.append(
+                SnapshotReverseGeocoder(PublicDataSnapshotStore(settings.public_data_snapshot_path))
+            )
+
+        _geo_resolver = CachedGeoResolver(
+            reverse_geocoders=geocoders,
+            cache=cache,
+            precision=settings.geo_quantize_decimals,
+            max_entries=settings.geo_cache_max_entries,
+            cache_ttl=settings.geo_cache_ttl,
+        )
+        logger.info(
+            "Geo resolver created",
+            extra={"geocoders": [type(g).__name__ for g in geocoders]},
+        )
+
+    return _geo_resolver
+
+
 # ============================================================
 # Interaction Factory (Human-in-the-Loop)
 # ============================================================
@@ -898,6 +1201,21 @@ async def get_checkpointer():
 # ============================================================
 
 
+async def setup_distributed_circuit_breakers() -> None:
+    """Circuit Breaker 분산 모드 활성화 + 상태 구독 시작 (설정 시 1회)."""
+    global _circuit_breaker_sync
+    settings = get_settings()
+    if not settings.circuit_breaker_distributed or _circuit_breaker_sync is not None:
+        return
+
+    redis = await get_redis()
+    registry = CircuitBreakerRegistry()
+    registry.enable_distributed(redis, failure_window=settings.circuit_breaker_failure_window)
+    _circuit_breaker_sync = CircuitBreakerStateSync(redis, registry)
+    await _circuit_breaker_sync.start()
+    logger.info("Distributed circuit breakers enabled")
+
+
 async def get_chat_graph(
     provider: Literal["openai", "google"] = "openai",
     model: str | None = None,
@@ -917,25 +1235,49 @@ async def get_chat_graph(
         return _graph_cache[cache_key]
 
     settings = get_settings()
-    llm = create_llm_client(provider, model)
+    await setup_distributed_circuit_breakers()
+    llm = await with_llm_admission(create_llm_client(provider, model), provider)
+    # hedging은 지연이 체감되는 의도 분류에만 (평가/분해 등 다른 구조화 호출은 제외)
+    intent_llm = await with_llm_hedging(llm, provider)
     vision_model = create_vision_client(provider, model)
     retriever = get_retriever()
     prompt_loader = get_prompt_loader()  # 프롬프트 로더
     cache = await get_cache()  # P2: Intent 캐싱용 (CachePort)
+    intent_semantic_cache = get_intent_semantic_cache()  # 유사 메시지 Intent 캐시
     progress_notifier = await get_progress_notifier()
     character_client = await get_character_client()
     location_client = await get_location_client()
     kakao_client = get_kakao_local_client()  # 카카오 장소 검색
-    web_search_client = get_web_search_client()
+    web_search_client = get_web_search_client(cache)
     bulk_waste_client = get_bulk_waste_client()  # 대형폐기물 정보
     recyclable_price_client = get_recyclable_price_client()  # 재활용자원 시세
-    weather_client = get_weather_client()  # 날씨 정보 (기상청 API)
+    weather_client = get_weather_client(cache)  # 날씨 정보 (기상청 API, 격자 캐시)
     collection_point_client = get_collection_point_client()  # 수거함 위치 (KECO API)
+    geo_resolver = get_geo_resolver(cache)  # 좌표 → 시군구/격자 (노드 간 공유)
     image_generator = get_image_generator()  # 이미지 생성 (Responses API)
     image_storage = get_image_storage()  # 이미지 업로드 (gRPC)
     input_requester = await get_input_requester()
     checkpointer = await get_checkpointer()
 
+    # RAG Feedback (선택): Fallback 체인 + LLM 정밀 평가
+    fallback_orchestrator = None
+    llm_evaluator = None
+    if settings.feedback_evaluation_mode != "off":
+        from chat_worker.application.services.fallback_orchestrator import FallbackOrchestrator
+        from chat_worker.infrastructure.llm.evaluators.feedback_evaluator import (
+            LLMFeedbackEvaluator,
+        )
+
+        fallback_orchestrator = FallbackOrchestrator()
+        llm_evaluator = LLMFeedbackEvaluator(llm)
+
+    deferred_feedback_evaluator = None
+    if settings.feedback_evaluation_mode == "deferred":
+        deferred_feedback_evaluator = DeferredFeedbackEvaluator(
+            llm_evaluator, metrics=get_metrics()
+        )
+        _deferred_feedback_evaluators.append(deferred_feedback_evaluator)
+
     # Location Agent용 raw SDK 클라이언트
     openai_async_client = get_openai_async_client()
     gemini_client = get_gemini_client()
@@ -954,13 +1296,30 @@ async def get_chat_graph(
         recyclable_price_client=recyclable_price_client,
         weather_client=weather_client,
         collection_point_client=collection_point_client,
+        geo_resolver=geo_resolver,
         image_generator=image_generator,
         image_storage=image_storage,
         image_default_size=settings.image_generation_default_size,
         image_default_quality=settings.image_generation_default_quality,
         cache=cache,
+        intent_semantic_cache=intent_semantic_cache,
+        metrics=get_metrics(),
+        intent_max_parallel_classifications=settings.intent_max_parallel_classifications,
+        enable_merged_intent_classification=settings.intent_merged_classification,
+        enable_speculative_prefetch=settings.enable_speculative_prefetch,
+        answer_token_queue_size=settings.answer_token_queue_size,
+        enable_answer_cache=settings.answer_cache_enabled,
+        answer_cache_intents=settings.answer_cache_intents,
+        answer_cache_ttl=settings.answer_cache_ttl,
+        answer_cache_replay_chunk_chars=settings.answer_cache_replay_chunk_chars,
+        answer_cache_replay_interval=settings.answer_cache_replay_interval,
         input_requester=input_requester,
         checkpointer=checkpointer,
+        fallback_orchestrator=fallback_orchestrator,
+        llm_evaluator=llm_evaluator,
+        feedback_evaluation_mode=settings.feedback_evaluation_mode,
+        deferred_feedback_evaluator=deferred_feedback_evaluator,
+        intent_llm=intent_llm,
         enable_summarization=settings.enable_summarization,
         summarization_model=settings.openai_default_model,
         max_tokens_before_summary=settings.max_tokens_before_summary,
@@ -975,10 +1334,38 @@ async def get_chat_graph(
     )
 
     _graph_cache[cache_key] = graph
+    _graph_llm_clients[cache_key] = [llm, vision_model]
     logger.info("Chat graph compiled and cached", extra={"provider": provider, "model": model})
     return graph
 
 
+def get_warmup_targets() -> dict[str, object]:
+    """생성된 외부 연결 클라이언트 목록 (warmup 연결 선행 수립용).
+
+    싱글톤/그래프 생성 이후 호출해야 합니다 (아직 생성되지 않은 클라이언트는 제외).
+
+    Returns:
+        이름 → 클라이언트 (Redis, LLM SDK, HTTP/gRPC 어댑터 또는 이를 감싼 클라이언트)
+    """
+    targets: dict[str, object | None] = {
+        "redis": _redis,
+        "redis_streams": _redis_streams,
+        "openai_sdk": _openai_async_client,
+        "gemini_sdk": _gemini_client,
+        "kakao": _kakao_local_client,
+        "kma": _weather_client,
+        "mois": _bulk_waste_client,
+        "keco": _collection_point_client,
+        "character_grpc": _character_client,
+        "location_grpc": _location_client,
+        "images_grpc": _image_storage,
+    }
+    for (provider, model), clients in _graph_llm_clients.items():
+        for kind, client in zip(("llm", "vision"), clients):
+            targets[f"{kind}:{provider}:{model or 'default'}"] = client
+    return {name: client for name, client in targets.items() if client is not None}
+
+
 # ============================================================
 # Command Factory (CQRS)
 # ============================================================
@@ -1064,6 +1451,7 @@ async def get_process_chat_command(
         metrics=metrics,
         telemetry=telemetry,
         provider=actual_provider,
+        stream_modes=settings.pipeline_stream_modes,
     )
 
 
@@ -1078,6 +1466,12 @@ async def cleanup():
     global _progress_notifier, _domain_event_bus, _interaction_state_store, _input_requester, _image_generator, _image_storage
     global _graph_cache
 
+    # 지연 feedback 평가 완료 대기 (남은 평가 유실 방지, 클라이언트 종료 전)
+    settings = get_settings()
+    for evaluator in _deferred_feedback_evaluators:
+        await evaluator.drain(timeout=settings.feedback_drain_timeout)
+    _deferred_feedback_evaluators.clear()
+
     # Graph 캐시 정리
     _graph_cache.clear()
 
@@ -1125,11 +1519,25 @@ async def cleanup():
         _collection_point_client = None
         logger.info("KECO Collection Point HTTP client closed")
 
+    # 웹 검색 전용 스레드 풀 종료 (클라이언트가 executor를 참조하므로 함께 폐기)
+    global _web_search_client, _web_search_executor
+    if _web_search_executor is not None:
+        _web_search_executor.shutdown()
+        _web_search_executor = None
+        _web_search_client = None
+        logger.info("Web search executor shut down")
+
     # Image Generator 정리
     if _image_generator is not None:
         _image_generator = None
         logger.info("Image generator cleared")
 
+    global _reference_image_cache
+    if _reference_image_cache is not None:
+        await _reference_image_cache.close()
+        _reference_image_cache = None
+        logger.info("Reference image cache closed")
+
     # Image Storage gRPC 클라이언트 종료
     global _image_storage_checked
     if _image_storage and hasattr(_image_storage, "close"):
@@ -1138,6 +1546,16 @@ async def cleanup():
         logger.info("Image Storage gRPC client closed")
     _image_storage_checked = False
 
+    # LLM 승인 제어기 정리 (Redis 연결 공유)
+    _llm_admission_controllers.clear()
+
+    # Circuit Breaker 상태 구독 종료
+    global _circuit_breaker_sync
+    if _circuit_breaker_sync is not None:
+        await _circuit_breaker_sync.stop()
+        _circuit_breaker_sync = None
+        logger.info("Circuit breaker state sync stopped")
+
     # Redis 종료
     if _redis:
         await _redis.close()
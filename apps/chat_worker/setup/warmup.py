@@ -0,0 +1,277 @@
+"""Worker Warmup - 첫 요청 전 cold-start 비용 선행 처리.
+
+새 파드의 첫 job은 그래프 컴파일, 프롬프트/에셋 파일 로드, 각 provider와의
+TLS 핸드셰이크를 모두 요청 경로에서 부담합니다. 워커 프로세스 시작 시
+(taskiq WORKER_STARTUP) 이 비용을 미리 치르고, 끝난 뒤에 큐 소비를 시작합니다.
+
+단계 (순서대로, 단계별 실패는 기록 후 계속):
+1. prompts: assets/prompts/ 전체 파일 캐시 적재
+2. tokenizer: 요약 토큰 카운터의 tiktoken 인코딩 로드 (요약 활성 시)
+3. assets: 캐릭터 이름/CDN 목록, 캐릭터 참조 이미지
+4. graph: 기본 provider 그래프 컴파일 (클라이언트 싱글톤 생성 포함)
+5. connections: Redis/LLM SDK/HTTP/gRPC 연결 선행 수립 (대상별 병렬, 타임아웃)
+6. dry_run: 합성 턴 - LLM/이벤트 발행 없이 결정적 경로 실행
+   (태그 매칭/규정 검색, 시세 context, 캐릭터 감지, Intent별 시스템 프롬프트)
+
+Readiness:
+- taskiq는 WORKER_STARTUP 핸들러가 끝난 뒤 메시지 수신을 시작하므로
+  warmup 완료 전에는 job을 받지 않음 (실패해도 완료 후 수신 시작)
+
+메트릭:
+- chat_worker_startup_phase_seconds{phase}: 단계별 소요 시간 (total 포함)
+- chat_worker_startup_phase_failures_total{phase}
+- chat_worker_warm: warm 상태 여부 (graph 컴파일 실패 또는 타임아웃 시 0)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from chat_worker.infrastructure.metrics import (
+    CHAT_WORKER_STARTUP_PHASE_FAILURES,
+    CHAT_WORKER_STARTUP_PHASE_SECONDS,
+    CHAT_WORKER_WARM,
+)
+from chat_worker.setup.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# 합성 턴 메시지 (분리배출 + 시세 + 캐릭터 경로를 한 번씩 통과)
+DRY_RUN_MESSAGE = "페트병 라벨 떼고 버려야 돼? 요즘 페트 시세도 알려줘 페티"
+
+# 실패 시 첫 요청이 cold-start 비용을 그대로 부담하는 단계 (chat_worker_warm=0)
+COLD_FAILURE_PHASES = frozenset({"graph", "timeout"})
+
+
+@dataclass
+class WarmupReport:
+    """Warmup 결과.
+
+    Attributes:
+        phases: 단계 → 소요 시간 (초)
+        failures: 단계/대상 → 에러 메시지
+        connections: 연결 대상 → 성공 여부
+    """
+
+    phases: dict[str, float] = field(default_factory=dict)
+    failures: dict[str, str] = field(default_factory=dict)
+    connections: dict[str, bool] = field(default_factory=dict)
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(self.phases.values())
+
+
+_report: WarmupReport | None = None
+_lock: asyncio.Lock | None = None
+
+
+def is_warm() -> bool:
+    """현재 프로세스 warmup 완료 여부."""
+    return _report is not None
+
+
+async def warmup() -> WarmupReport:
+    """Warmup 실행 (프로세스당 1회, 이후 호출은 이전 결과 반환)."""
+    global _report, _lock
+    if _report is not None:
+        return _report
+    if _lock is None:
+        _lock = asyncio.Lock()
+
+    async with _lock:
+        if _report is not None:
+            return _report
+
+        settings = get_settings()
+        report = WarmupReport()
+        phases: list[tuple[str, Callable[[], Awaitable[Any]]]] = [
+            ("prompts", _warm_prompts),
+            ("tokenizer", _warm_tokenizer),
+            ("assets", _warm_assets),
+            ("graph", _warm_graph),
+            ("connections", lambda: _warm_connections(report)),
+            ("dry_run", _dry_run),
+        ]
+
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(
+                _run_phases(phases, report), timeout=settings.warmup_timeout_seconds
+            )
+        except asyncio.TimeoutError:
+            report.failures["timeout"] = f"exceeded {settings.warmup_timeout_seconds}s"
+            CHAT_WORKER_STARTUP_PHASE_FAILURES.labels(phase="timeout").inc()
+        total = time.perf_counter() - started
+
+        CHAT_WORKER_STARTUP_PHASE_SECONDS.labels(phase="total").set(total)
+        CHAT_WORKER_WARM.set(0 if COLD_FAILURE_PHASES & report.failures.keys() else 1)
+        _report = report
+        logger.info(
+            "Worker warmup completed",
+            extra={
+                "total_seconds": round(total, 3),
+                "phases": {name: round(sec, 3) for name, sec in report.phases.items()},
+                "failures": report.failures,
+                "connections": report.connections,
+            },
+        )
+        return report
+
+
+async def _run_phases(
+    phases: list[tuple[str, Callable[[], Awaitable[Any]]]],
+    report: WarmupReport,
+) -> None:
+    for name, run in phases:
+        started = time.perf_counter()
+        try:
+            await run()
+        except Exception as e:
+            report.failures[name] = str(e) or type(e).__name__
+            CHAT_WORKER_STARTUP_PHASE_FAILURES.labels(phase=name).inc()
+            logger.warning(f"Warmup phase '{name}' failed: {e}")
+        finally:
+            report.phases[name] = time.perf_counter() - started
+            CHAT_WORKER_STARTUP_PHASE_SECONDS.labels(phase=name).set(report.phases[name])
+
+
+# ============================================================
+# Phases
+# ============================================================
+
+
+async def _warm_prompts() -> None:
+    from chat_worker.infrastructure.assets.prompt_loader import preload_prompt_files
+
+    count = await asyncio.to_thread(preload_prompt_files)
+    logger.debug(f"Warmup: {count} prompt files loaded")
+
+
+async def _warm_tokenizer() -> None:
+    from chat_worker.infrastructure.orchestration.langgraph.summarization import (
+        preload_tokenizer,
+    )
+
+    if not get_settings().enable_summarization:
+        return
+    if not await asyncio.to_thread(preload_tokenizer):
+        raise RuntimeError("tokenizer encoding unavailable")
+
+
+async def _warm_assets() -> None:
+    from chat_worker.infrastructure.assets.character_name_detector import (
+        get_character_name_detector,
+    )
+    from chat_worker.setup.dependencies import preload_reference_images
+
+    await asyncio.to_thread(get_character_name_detector)
+    await preload_reference_images()
+
+
+async def _warm_graph() -> None:
+    from chat_worker.setup.dependencies import get_chat_graph
+
+    await get_chat_graph(provider=get_settings().default_provider)
+
+
+async def _warm_connections(report: WarmupReport) -> None:
+    from chat_worker.setup.dependencies import get_warmup_targets
+
+    settings = get_settings()
+    targets = get_warmup_targets()
+    if not settings.warmup_prewarm_llm:
+        targets = {
+            name: client
+            for name, client in targets.items()
+            if not name.startswith(("llm:", "vision:", "openai_sdk", "gemini_sdk"))
+        }
+
+    async def prewarm(name: str, client: object) -> None:
+        try:
+            await asyncio.wait_for(
+                prewarm_connection(client), timeout=settings.warmup_connect_timeout
+            )
+            report.connections[name] = True
+        except Exception as e:
+            report.connections[name] = False
+            logger.warning(
+                "Warmup connection failed",
+                extra={"target": name, "error": str(e) or type(e).__name__},
+            )
+
+    await asyncio.gather(*(prewarm(name, client) for name, client in targets.items()))
+
+
+async def _dry_run() -> None:
+    """합성 턴: LLM 호출/이벤트 발행 없는 결정적 경로 실행."""
+    from chat_worker.application.ports.recyclable_price_client import RecyclableCategory
+    from chat_worker.infrastructure.assets.character_name_detector import (
+        get_character_name_detector,
+    )
+    from chat_worker.infrastructure.assets.prompt_loader import (
+        INTENT_FILE_MAP,
+        PromptBuilder,
+    )
+    from chat_worker.setup.dependencies import (
+        get_recyclable_price_client,
+        get_retriever,
+    )
+
+    def run_sync() -> None:
+        retriever = get_retriever()
+        retriever.extract_context(DRY_RUN_MESSAGE)
+        retriever.search_by_keyword("페트병")
+        get_character_name_detector().detect(DRY_RUN_MESSAGE)
+        builder = PromptBuilder()
+        for intent in INTENT_FILE_MAP:
+            builder.build(intent)
+
+    await asyncio.to_thread(run_sync)
+
+    price_client = get_recyclable_price_client()
+    await price_client.search_price("페트병")
+    await price_client.get_category_prices(RecyclableCategory.PLASTIC)
+
+
+# ============================================================
+# Connection Prewarm
+# ============================================================
+
+
+async def prewarm_connection(client: object) -> None:
+    """클라이언트의 커넥션 풀에 연결 하나를 선행 수립 (DNS/TCP/TLS).
+
+    어댑터/래퍼는 포트의 prewarm() 훅으로 위임하고 (래퍼는 내부 클라이언트까지 전달),
+    서드파티 클라이언트(Redis, LLM SDK)만 직접 처리합니다.
+    응답 코드는 확인하지 않습니다 (연결 수립이 목적).
+    """
+    if client is None:
+        return
+
+    # Redis
+    if hasattr(client, "ping") and hasattr(client, "connection_pool"):
+        await client.ping()
+        return
+
+    # LLM SDK
+    module = type(client).__module__
+    if module.startswith("openai"):
+        await client.models.list()
+        return
+    if module.startswith("google.genai"):
+        await client.aio.models.list(config={"page_size": 1})
+        return
+
+    # 포트 구현체 (HTTP/gRPC 어댑터, LLM 클라이언트, 캐시/local-first/admission/hedging 래퍼)
+    prewarm = getattr(client, "prewarm", None)
+    if prewarm is not None:
+        await prewarm()
+
+
+__all__ = ["WarmupReport", "is_warm", "prewarm_connection", "warmup"]
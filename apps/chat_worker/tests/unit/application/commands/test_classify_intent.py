@@ -1,5 +1,6 @@
 """ClassifyIntentCommand Unit Tests."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -10,8 +11,13 @@ from chat_worker.application.commands.classify_intent_command import (
     ClassifyIntentOutput,
 )
 from chat_worker.application.services.intent_classifier_service import (
+    ClassifiedSubQuerySchema,
+    DecomposedIntentsSchema,
     IntentClassificationSchema,
+    MultiIntentDetectionSchema,
+    QueryDecompositionSchema,
 )
+from chat_worker.infrastructure.cache import SemanticIntentCache
 
 
 class TestClassifyIntentInput:
@@ -292,6 +298,93 @@ class TestClassifyIntentCommand:
         assert "cache_saved" in result.events
 
 
+class TestClassifyIntentCommandSemanticCache:
+    """유사 메시지 Intent 캐시 테스트."""
+
+    @pytest.fixture
+    def mock_llm(self) -> AsyncMock:
+        """LLM 클라이언트 Mock."""
+        llm = AsyncMock()
+        llm.generate_structured = AsyncMock(
+            return_value=IntentClassificationSchema(
+                intent="waste",
+                confidence=0.9,
+                reasoning="분리배출 방법 문의",
+            )
+        )
+        return llm
+
+    @pytest.fixture
+    def command(self, mock_llm: AsyncMock) -> ClassifyIntentCommand:
+        """SemanticIntentCache를 주입한 Command."""
+        loader = MagicMock()
+        loader.load = MagicMock(return_value="prompt_template")
+        return ClassifyIntentCommand(
+            llm=mock_llm,
+            prompt_loader=loader,
+            enable_multi_intent=False,
+            semantic_cache=SemanticIntentCache(audit_rate=0.0),
+        )
+
+    @pytest.mark.anyio
+    async def test_ending_variant_skips_llm(
+        self,
+        command: ClassifyIntentCommand,
+        mock_llm: AsyncMock,
+    ) -> None:
+        """어미만 다른 재질문은 LLM 호출 없이 캐시 Intent 반환."""
+        await command.execute(ClassifyIntentInput(job_id="j1", message="페트병 어떻게 버려?"))
+        result = await command.execute(
+            ClassifyIntentInput(job_id="j2", message="페트병 어떻게 버려요")
+        )
+
+        assert result.intent == "waste"
+        assert result.confidence == 0.9
+        assert "semantic_cache_hit" in result.events
+        mock_llm.generate_structured.assert_called_once()
+
+    @pytest.mark.anyio
+    async def test_context_bypasses_semantic_cache(
+        self,
+        command: ClassifyIntentCommand,
+        mock_llm: AsyncMock,
+    ) -> None:
+        """멀티턴 context가 있으면 캐시 미사용 (맥락에 따라 Intent가 달라짐)."""
+        await command.execute(ClassifyIntentInput(job_id="j1", message="페트병 어떻게 버려?"))
+        result = await command.execute(
+            ClassifyIntentInput(
+                job_id="j2",
+                message="페트병 어떻게 버려요",
+                previous_intents=["location"],
+            )
+        )
+
+        assert "semantic_cache_hit" not in result.events
+        assert mock_llm.generate_structured.call_count == 2
+
+    @pytest.mark.anyio
+    async def test_audit_runs_in_background(self, mock_llm: AsyncMock) -> None:
+        """감사 샘플링 시 백그라운드 LLM 재분류 결과를 기록."""
+        loader = MagicMock()
+        loader.load = MagicMock(return_value="prompt_template")
+        semantic_cache = SemanticIntentCache(audit_rate=1.0)
+        command = ClassifyIntentCommand(
+            llm=mock_llm,
+            prompt_loader=loader,
+            enable_multi_intent=False,
+            semantic_cache=semantic_cache,
+        )
+
+        await command.execute(ClassifyIntentInput(job_id="j1", message="페트병 어떻게 버려?"))
+        result = await command.execute(
+            ClassifyIntentInput(job_id="j2", message="페트병 어떻게 버려요")
+        )
+        assert "semantic_cache_hit" in result.events
+
+        await asyncio.gather(*command._audit_tasks)
+        assert semantic_cache.get_stats()["audit_match"] == 1
+
+
 class TestClassifyIntentCommandMultiIntent:
     """Multi-Intent 처리 테스트."""
 
@@ -347,3 +440,162 @@ class TestClassifyIntentCommandMultiIntent:
         # Multi-Intent 감지 없이 바로 분류
         assert result.intent == "waste"
         assert "multi_intent_candidate" not in result.events
+
+    @staticmethod
+    def _detection(confidence: float = 0.8) -> MultiIntentDetectionSchema:
+        return MultiIntentDetectionSchema(
+            is_multi=True,
+            reason="복수 요청",
+            detected_categories=["waste", "location"],
+            confidence=confidence,
+        )
+
+    @pytest.mark.anyio
+    async def test_subqueries_classified_concurrently_in_order(
+        self,
+        mock_prompt_loader: MagicMock,
+    ) -> None:
+        """분해된 쿼리는 동시에 분류되고 원문 순서대로 조립."""
+        in_flight = 0
+        max_in_flight = 0
+        delays = {"페트병 버리는 법": 0.03, "근처 재활용센터": 0.0, "오늘 날씨": 0.01}
+        intents = {
+            "페트병 버리는 법": "waste",
+            "근처 재활용센터": "location",
+            "오늘 날씨": "general",
+        }
+
+        async def generate_structured(prompt, response_schema, **kwargs):
+            nonlocal in_flight, max_in_flight
+            if response_schema is MultiIntentDetectionSchema:
+                return self._detection()
+            if response_schema is QueryDecompositionSchema:
+                return QueryDecompositionSchema(is_compound=True, queries=list(delays))
+            query = next(q for q in delays if q in prompt)
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(delays[query])
+            in_flight -= 1
+            return IntentClassificationSchema(
+                intent=intents[query], confidence=0.9, reasoning="test"
+            )
+
+        llm = AsyncMock()
+        llm.generate_structured = AsyncMock(side_effect=generate_structured)
+        mock_prompt_loader.load = MagicMock(return_value="{message}")
+        command = ClassifyIntentCommand(
+            llm=llm,
+            prompt_loader=mock_prompt_loader,
+            max_parallel_classifications=2,
+        )
+
+        result = await command.execute(
+            ClassifyIntentInput(
+                job_id="job-123",
+                message="페트병 버리는 법이랑 근처 재활용센터, 그리고 오늘 날씨",
+            )
+        )
+
+        assert result.intent == "waste"
+        assert result.additional_intents == ["location", "general"]
+        assert result.decomposed_queries == list(delays)
+        assert max_in_flight == 2  # 동시 실행 + 상한 준수
+
+    @pytest.mark.anyio
+    async def test_subquery_cache_batched_lookup(
+        self,
+        mock_llm: AsyncMock,
+        mock_prompt_loader: MagicMock,
+    ) -> None:
+        """쿼리별 캐시는 get_many 한 번으로 조회, 히트는 LLM 생략."""
+        cache = AsyncMock()
+        cache.get_many = AsyncMock(
+            return_value=[
+                '{"intent": "waste", "confidence": 0.95, "is_complex": false}',
+                None,
+            ]
+        )
+        mock_llm.generate_structured = AsyncMock(
+            side_effect=[
+                self._detection(),
+                QueryDecompositionSchema(
+                    is_compound=True, queries=["페트병 버리는 법", "근처 재활용센터"]
+                ),
+                IntentClassificationSchema(intent="location", confidence=0.9, reasoning="위치"),
+            ]
+        )
+        command = ClassifyIntentCommand(
+            llm=mock_llm,
+            prompt_loader=mock_prompt_loader,
+            cache=cache,
+        )
+
+        result = await command.execute(
+            ClassifyIntentInput(job_id="job-123", message="페트병 버리는 법이랑 근처 재활용센터")
+        )
+
+        cache.get_many.assert_awaited_once()
+        cache.get.assert_not_called()
+        assert len(cache.get_many.call_args.args[0]) == 2
+        assert result.intent == "waste"
+        assert result.additional_intents == ["location"]
+        assert mock_llm.generate_structured.call_count == 3
+
+    @pytest.mark.anyio
+    async def test_merged_classification_on_high_confidence(
+        self,
+        mock_llm: AsyncMock,
+        mock_prompt_loader: MagicMock,
+    ) -> None:
+        """감지 신뢰도가 높으면 분해 + 분류를 한 번에 호출."""
+        mock_llm.generate_structured = AsyncMock(
+            side_effect=[
+                self._detection(confidence=0.95),
+                DecomposedIntentsSchema(
+                    queries=[
+                        ClassifiedSubQuerySchema(
+                            query="페트병 버리는 법", intent="waste", confidence=0.9
+                        ),
+                        ClassifiedSubQuerySchema(
+                            query="근처 재활용센터", intent="location", confidence=0.85
+                        ),
+                    ]
+                ),
+            ]
+        )
+        command = ClassifyIntentCommand(
+            llm=mock_llm,
+            prompt_loader=mock_prompt_loader,
+            enable_merged_classification=True,
+        )
+
+        result = await command.execute(
+            ClassifyIntentInput(job_id="job-123", message="페트병 버리는 법이랑 근처 재활용센터")
+        )
+
+        assert mock_llm.generate_structured.call_count == 2
+        assert "merged_classification_called" in result.events
+        assert result.decomposed_queries == ["페트병 버리는 법", "근처 재활용센터"]
+        assert result.additional_intents == ["location"]
+
+    @pytest.mark.anyio
+    async def test_tracks_latency_per_query_count(
+        self,
+        mock_llm: AsyncMock,
+        mock_prompt_loader: MagicMock,
+    ) -> None:
+        """종단 분류 지연을 쿼리 수와 함께 기록."""
+        metrics = MagicMock()
+        mock_llm.generate_structured = AsyncMock(
+            return_value=IntentClassificationSchema(intent="waste", confidence=0.9, reasoning="x")
+        )
+        command = ClassifyIntentCommand(
+            llm=mock_llm,
+            prompt_loader=mock_prompt_loader,
+            metrics=metrics,
+        )
+
+        await command.execute(ClassifyIntentInput(job_id="job-123", message="플라스틱"))
+
+        metrics.track_intent_latency.assert_called_once()
+        assert metrics.track_intent_latency.call_args.kwargs["query_count"] == 1
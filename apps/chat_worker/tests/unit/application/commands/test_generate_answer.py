@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from chat_worker.application.commands.generate_answer_command import (
+    CachedAnswer,
     GenerateAnswerCommand,
     GenerateAnswerInput,
     GenerateAnswerOutput,
@@ -233,6 +234,29 @@ class TestGenerateAnswerCommand:
         assert result.answer == "플라스틱은 재활용 가능해요."
         mock_prompt_builder.build.assert_called_with("waste")
 
+    @pytest.mark.anyio
+    async def test_prepare_orders_static_context_first(
+        self,
+        command: GenerateAnswerCommand,
+    ) -> None:
+        """prepare: 규정(정적) → 대화 히스토리 → 질문(동적) 순서, compact 직렬화."""
+        input_dto = GenerateAnswerInput(
+            job_id="job-123",
+            message="플라스틱 버리는 법",
+            intent="waste",
+            disposal_rules={"data": {"method": "분리배출", "bin": "플라스틱"}},
+            conversation_history=[{"role": "user", "content": "안녕"}],
+        )
+
+        prepared = await command.prepare(input_dto)
+
+        assert prepared.prompt.startswith("## Disposal Rules\nbin: 플라스틱\nmethod: 분리배출")
+        assert prepared.prompt.index("## Recent Conversation") < prepared.prompt.index(
+            "## User Question"
+        )
+        assert prepared.static_prefix_tokens > 0
+        assert "disposal_rules" in prepared.section_tokens
+
     @pytest.mark.anyio
     async def test_execute_multi_intent(
         self,
@@ -331,3 +355,166 @@ class TestGenerateAnswerCommand:
 
         assert result.answer == "플라스틱은 재활용 가능해요."
         assert "cache_hit" not in result.events
+
+
+class InMemoryCache:
+    """테스트용 str 기반 캐시."""
+
+    def __init__(self):
+        self.store: dict[str, str] = {}
+
+    async def get(self, key: str):
+        return self.store.get(key)
+
+    async def set(self, key: str, value: str, ttl: int | None = None) -> bool:
+        self.store[key] = value
+        return True
+
+
+class TestContextKeyedAnswerCache:
+    """컨텍스트 키 Answer 캐시 테스트."""
+
+    RULES = {"data": {"category": "스티로폼", "method": "이물질 제거 후 배출"}}
+
+    @pytest.fixture
+    def llm(self) -> MagicMock:
+        llm = MagicMock()
+        llm.calls = 0
+
+        async def stream(prompt: str, system_prompt: str):
+            llm.calls += 1
+            for token in ["스티로폼은 ", "깨끗이 ", "버려요."]:
+                yield token
+
+        llm.generate_stream = stream
+        return llm
+
+    @pytest.fixture
+    def prompt_builder(self) -> MagicMock:
+        builder = MagicMock()
+        builder.build = MagicMock(side_effect=lambda intent: f"system:{intent}")
+        return builder
+
+    def _command(self, llm, prompt_builder, **kwargs) -> GenerateAnswerCommand:
+        return GenerateAnswerCommand(
+            llm=llm,
+            prompt_builder=prompt_builder,
+            cache=kwargs.pop("cache", InMemoryCache()),
+            **kwargs,
+        )
+
+    def _waste(self, message: str = "스티로폼 어떻게 버려?", **overrides) -> GenerateAnswerInput:
+        fields = {
+            "job_id": "job-1",
+            "message": message,
+            "intent": "waste",
+            "disposal_rules": self.RULES,
+            "conversation_history": [{"role": "human", "content": message}],
+        }
+        fields.update(overrides)
+        return GenerateAnswerInput(**fields)
+
+    @pytest.mark.anyio
+    async def test_waste_with_rules_hits_on_normalized_message(self, llm, prompt_builder):
+        """같은 규정 + 문장부호만 다른 질문 → LLM 재호출 없이 히트."""
+        metrics = MagicMock()
+        command = self._command(llm, prompt_builder, metrics=metrics)
+
+        first = await command.execute_full(self._waste())
+        second = await command.execute_full(self._waste("스티로폼  어떻게 버려!!"))
+
+        assert first.cache_hit is False
+        assert second.cache_hit is True
+        assert second.answer == "스티로폼은 깨끗이 버려요."
+        assert llm.calls == 1
+        intent, result, saved_tokens, _ = metrics.track_answer_cache.call_args.args
+        assert (intent, result) == ("waste", "hit")
+        assert saved_tokens > 0
+
+    @pytest.mark.anyio
+    async def test_key_changes_with_context_and_prompt(self, llm, prompt_builder):
+        """규정/캐릭터/프롬프트 버전이 바뀌면 다른 키."""
+        command = self._command(llm, prompt_builder)
+        base = await command.prepare(self._waste())
+
+        other_rules = await command.prepare(
+            self._waste(disposal_rules={"data": {"category": "스티로폼", "method": "다름"}})
+        )
+        with_character = await command.prepare(self._waste(character_context={"name": "페티"}))
+        prompt_builder.build = MagicMock(return_value="system:waste:v2")
+        new_prompt = await command.prepare(self._waste())
+
+        keys = {base.cache_key, other_rules.cache_key, with_character.cache_key}
+        assert len(keys | {new_prompt.cache_key}) == 4
+
+    @pytest.mark.anyio
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {"weather_context": "비 예보"},
+            {"location_context": {"address": "강남구"}},
+            {"conversation_summary": "이전 대화"},
+            {
+                "conversation_history": [
+                    {"role": "human", "content": "페트병은?"},
+                    {"role": "ai", "content": "라벨 제거"},
+                    {"role": "human", "content": "스티로폼 어떻게 버려?"},
+                ]
+            },
+            {"disposal_rules": None},
+        ],
+    )
+    async def test_not_cacheable(self, llm, prompt_builder, overrides):
+        """시점/위치 의존 컨텍스트, 이전 대화, 규정 없음 → 캐시 안함."""
+        command = self._command(llm, prompt_builder)
+
+        prepared = await command.prepare(self._waste(**overrides))
+
+        assert prepared.is_cacheable is False
+
+    @pytest.mark.anyio
+    async def test_intent_can_be_disabled(self, llm, prompt_builder):
+        """cacheable_intents에서 빠진 Intent는 조회/저장 안함."""
+        cache = InMemoryCache()
+        command = self._command(llm, prompt_builder, cache=cache, cacheable_intents=["general"])
+
+        await command.execute_full(self._waste())
+
+        assert cache.store == {}
+
+    @pytest.mark.anyio
+    async def test_payload_records_generation_stats(self, llm, prompt_builder):
+        """저장 페이로드에 출력 토큰/생성 시간 포함."""
+        cache = InMemoryCache()
+        command = self._command(llm, prompt_builder, cache=cache)
+
+        await command.execute_full(self._waste())
+
+        cached = CachedAnswer.decode(next(iter(cache.store.values())))
+        assert cached is not None
+        assert cached.answer == "스티로폼은 깨끗이 버려요."
+        assert cached.output_tokens > 0
+        assert cached.generation_seconds is not None
+
+    @pytest.mark.anyio
+    async def test_cache_failures_reported_in_events(self, llm, prompt_builder):
+        """조회/저장 실패 → cache_error, cache_save_error 이벤트."""
+        cache = AsyncMock()
+        cache.get = AsyncMock(side_effect=ConnectionError("redis down"))
+        cache.set = AsyncMock(side_effect=ConnectionError("redis down"))
+        command = self._command(llm, prompt_builder, cache=cache)
+
+        result = await command.execute_full(self._waste())
+
+        assert result.answer == "스티로폼은 깨끗이 버려요."
+        assert "cache_error" in result.events
+        assert "cache_save_error" in result.events
+        assert "cache_saved" not in result.events
+
+    @pytest.mark.anyio
+    async def test_save_to_cache_returns_success(self, llm, prompt_builder):
+        """save_to_cache는 저장 성공 여부를 반환."""
+        command = self._command(llm, prompt_builder)
+
+        assert await command.save_to_cache("key", "답변") is True
+        assert await command.save_to_cache("key", "") is False
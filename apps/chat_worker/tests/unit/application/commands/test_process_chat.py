@@ -26,6 +26,7 @@ class MockPipeline:
             "answer": "페트병은 라벨을 제거해주세요.",
         }
         self.ainvoke = AsyncMock(return_value=self._result)
+        self.stream_modes: list[str] = []
 
     async def astream(
         self,
@@ -36,18 +37,25 @@ class MockPipeline:
     ) -> AsyncIterator[tuple[str, Any]]:
         """Mock astream for stream_mode based streaming.
 
-        stream_mode=["messages", "updates"] 시:
+        구독한 모드의 이벤트만 생성 (LangGraph와 동일):
         - "messages": (AIMessageChunk, metadata) 튜플
         - "updates": {node_name: state_update} 딕셔너리
+        - "custom": 노드가 get_stream_writer()로 보낸 이벤트
         """
+        modes = [stream_mode] if isinstance(stream_mode, str) else list(stream_mode or [])
+        self.stream_modes = modes
         answer = self._result.get("answer", "")
 
         # Intent node update
         yield ("updates", {"intent": {"intent": self._result.get("intent", "unknown")}})
 
+        if "custom" in modes:
+            yield ("custom", {"stage": "waste_rag", "status": "processing", "message": "검색 중"})
+
         # Answer node - token streaming
-        for char in answer[:5]:  # Simulate first 5 chars as tokens
-            yield ("messages", (MockChunk(char), {"langgraph_node": "answer"}))
+        if "messages" in modes:
+            for char in answer[:5]:  # Simulate first 5 chars as tokens
+                yield ("messages", (MockChunk(char), {"langgraph_node": "answer"}))
 
         # Answer node update (completed)
         yield ("updates", {"answer": {"answer": answer}})
@@ -442,7 +450,7 @@ class TestProcessChatCommand:
     @pytest.mark.anyio
     async def test_streaming_skips_all_message_tokens(
         self,
-        streaming_command: ProcessChatCommand,
+        mock_pipeline: MockPipeline,
         mock_notifier: MockProgressNotifier,
         sample_request: ProcessChatRequest,
     ):
@@ -458,12 +466,49 @@ class TestProcessChatCommand:
         1. answer_node와의 토큰 중복 방지
         2. intent_node 분류 결과가 토큰으로 노출되는 것 방지
         """
-        await streaming_command.execute(sample_request)
+        # "messages"를 명시적으로 구독해도 토큰은 발행하지 않음
+        command = ProcessChatCommand(
+            pipeline=mock_pipeline,
+            progress_notifier=mock_notifier,
+            stream_modes=["messages", "updates"],
+        )
+        await command.execute(sample_request)
 
         # ProcessChatCommand는 모든 메시지 토큰을 건너뜀
         # 실제 토큰은 각 노드(특히 answer_node)에서 직접 발행됨
         assert len(mock_notifier.tokens) == 0
 
+    @pytest.mark.anyio
+    async def test_streaming_does_not_subscribe_messages_by_default(
+        self,
+        streaming_command: ProcessChatCommand,
+        mock_pipeline: MockPipeline,
+        sample_request: ProcessChatRequest,
+    ):
+        """기본 구독 모드는 소비하는 이벤트(updates)만."""
+        await streaming_command.execute(sample_request)
+
+        assert mock_pipeline.stream_modes == ["updates"]
+
+    @pytest.mark.anyio
+    async def test_streaming_forwards_custom_progress_events(
+        self,
+        mock_pipeline: MockPipeline,
+        mock_notifier: MockProgressNotifier,
+        sample_request: ProcessChatRequest,
+    ):
+        """custom 구독 시 이벤트(get_stream_writer)는 stage 이벤트로 전달."""
+        command = ProcessChatCommand(
+            pipeline=mock_pipeline,
+            progress_notifier=mock_notifier,
+            stream_modes=["updates", "custom"],
+        )
+        await command.execute(sample_request)
+
+        custom = [e for e in mock_notifier.events if e["stage"] == "waste_rag"]
+        assert custom and custom[0]["status"] == "processing"
+        assert custom[0]["message"] == "검색 중"
+
     @pytest.mark.anyio
     async def test_streaming_notifies_stage_events(
         self,
@@ -0,0 +1,80 @@
+"""SearchBulkWasteCommand 단위 테스트.
+
+Command(UseCase) 레이어 테스트.
+
+테스트 대상:
+- 좌표 → 시군구 해석 위임 (GeoResolverPort)
+- 해석 실패 시 HITL (needs_location)
+"""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from chat_worker.application.commands.search_bulk_waste_command import (
+    SearchBulkWasteCommand,
+    SearchBulkWasteInput,
+)
+from chat_worker.application.ports.bulk_waste_client import WasteInfoSearchResponse
+from chat_worker.application.ports.geo_resolver import AdminRegion, GeoResolution
+
+LOCATION = {"latitude": 37.5172, "longitude": 127.0473}
+
+
+def _client() -> AsyncMock:
+    client = AsyncMock()
+    client.get_bulk_waste_info.return_value = None
+    client.search_disposal_info.return_value = WasteInfoSearchResponse(results=[], total_count=0)
+    return client
+
+
+def _resolver(region: AdminRegion | None) -> AsyncMock:
+    resolver = AsyncMock()
+    resolver.resolve.return_value = GeoResolution(
+        lat=37.517, lon=127.047, nx=61, ny=126, tile="375:1270", region=region
+    )
+    return resolver
+
+
+class TestSearchBulkWasteCommandGeo:
+    """좌표 기반 시군구 해석 테스트."""
+
+    @pytest.mark.anyio
+    async def test_sigungu_resolved_from_coordinates(self):
+        client = _client()
+        resolver = _resolver(AdminRegion(sido="서울특별시", sigungu="강남구"))
+        command = SearchBulkWasteCommand(bulk_waste_client=client, geo_resolver=resolver)
+
+        output = await command.execute(
+            SearchBulkWasteInput(job_id="job-1", user_location=LOCATION, search_type="collection")
+        )
+
+        assert output.success is True
+        assert output.needs_location is False
+        assert "sigungu_resolved_from_coordinates" in output.events
+        resolver.resolve.assert_awaited_once_with(37.5172, 127.0473)
+        client.get_bulk_waste_info.assert_awaited_once_with(sigungu="강남구")
+
+    @pytest.mark.anyio
+    async def test_unresolved_coordinates_request_location(self):
+        client = _client()
+        command = SearchBulkWasteCommand(bulk_waste_client=client, geo_resolver=_resolver(None))
+
+        output = await command.execute(SearchBulkWasteInput(job_id="job-1", user_location=LOCATION))
+
+        assert output.needs_location is True
+        assert "location_required" in output.events
+        client.get_bulk_waste_info.assert_not_awaited()
+
+    @pytest.mark.anyio
+    async def test_explicit_sigungu_skips_resolver(self):
+        resolver = _resolver(AdminRegion(sido="서울특별시", sigungu="강남구"))
+        command = SearchBulkWasteCommand(bulk_waste_client=_client(), geo_resolver=resolver)
+
+        await command.execute(
+            SearchBulkWasteInput(job_id="job-1", sigungu="성동구", user_location=LOCATION)
+        )
+
+        resolver.resolve.assert_not_awaited()
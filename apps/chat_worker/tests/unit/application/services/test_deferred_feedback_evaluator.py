@@ -0,0 +1,129 @@
+"""DeferredFeedbackEvaluator / 지연 모드 EvaluateFeedbackCommand 단위 테스트."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from chat_worker.application.commands.evaluate_feedback_command import (
+    EvaluateFeedbackCommand,
+    EvaluateFeedbackInput,
+)
+from chat_worker.application.dto.feedback_result import FeedbackResult
+from chat_worker.application.services.deferred_feedback_evaluator import (
+    DeferredFeedbackEvaluator,
+)
+from chat_worker.application.services.feedback_evaluator import FeedbackEvaluatorService
+
+RAG_RESULTS = {
+    "key": "plastic_pet",
+    "category": "플라스틱",
+    "data": {"disposal_info": ["라벨 제거", "압착"], "item": "페트병"},
+    "evidence": [
+        {"chunk_id": "plastic_pet", "relevance": "high", "matched_tags": ["페트병"]},
+    ],
+}
+
+
+def _evaluator(score: float = 0.9) -> MagicMock:
+    evaluator = MagicMock()
+    evaluator.evaluate = AsyncMock(return_value=FeedbackResult.from_score(score))
+    return evaluator
+
+
+class TestEvaluateFast:
+    """근거 기반 빠른 로컬 평가 테스트."""
+
+    def test_tag_coverage_and_section_match(self):
+        service = FeedbackEvaluatorService()
+
+        good = service.evaluate_fast("페트병 어떻게 버려?", RAG_RESULTS)
+        off_topic = service.evaluate_fast(
+            "건전지 어떻게 버려?",
+            {**RAG_RESULTS, "evidence": [{"relevance": "low", "matched_tags": []}]},
+        )
+
+        assert good.metadata["tag_coverage"] == 1.0
+        assert not good.needs_fallback
+        assert off_topic.metadata["tag_coverage"] == 0.0
+        assert off_topic.score < good.score
+
+    def test_no_result_needs_fallback(self):
+        assert FeedbackEvaluatorService().evaluate_fast("페트병", None).needs_fallback
+
+
+class TestDeferredFeedbackEvaluator:
+    """답변 시작 후 백그라운드 평가 테스트."""
+
+    @pytest.mark.anyio
+    async def test_waits_for_release_then_records(self):
+        llm_evaluator = _evaluator(0.3)
+        metrics = MagicMock()
+        deferred = DeferredFeedbackEvaluator(llm_evaluator, metrics=metrics)
+
+        deferred.schedule("job-1", "페트병", "waste", RAG_RESULTS, FeedbackResult.from_score(0.8))
+        await asyncio.sleep(0.01)
+        assert llm_evaluator.evaluate.await_count == 0
+
+        deferred.release("job-1")
+        await deferred.drain(timeout=1.0)
+
+        llm_evaluator.evaluate.assert_awaited_once()
+        kwargs = metrics.track_feedback_evaluation.call_args.kwargs
+        assert (kwargs["mode"], kwargs["evaluator"]) == ("deferred", "llm")
+        assert deferred.pending == 0
+
+    @pytest.mark.anyio
+    async def test_starts_after_timeout_without_release(self):
+        llm_evaluator = _evaluator()
+        deferred = DeferredFeedbackEvaluator(llm_evaluator, release_timeout=0.01)
+
+        deferred.schedule("job-1", "q", "waste", RAG_RESULTS, FeedbackResult.from_score(0.5))
+        await asyncio.sleep(0.05)
+
+        llm_evaluator.evaluate.assert_awaited_once()
+
+    @pytest.mark.anyio
+    async def test_drops_when_too_many_pending(self):
+        deferred = DeferredFeedbackEvaluator(_evaluator(), max_pending=1)
+        gate = FeedbackResult.from_score(0.5)
+
+        assert deferred.schedule("job-1", "q", "waste", None, gate) is True
+        assert deferred.schedule("job-2", "q", "waste", None, gate) is False
+        await deferred.drain(timeout=1.0)
+
+
+class TestDeferredFeedbackCommand:
+    """지연 모드 Command: LLM 평가를 critical path에서 제외."""
+
+    @pytest.mark.anyio
+    async def test_llm_evaluation_not_awaited_inline(self):
+        llm_evaluator = _evaluator()
+        deferred = DeferredFeedbackEvaluator(llm_evaluator)
+        command = EvaluateFeedbackCommand(
+            fallback_orchestrator=MagicMock(),
+            llm_evaluator=llm_evaluator,
+            deferred_evaluator=deferred,
+        )
+        # 태그 절반만 일치 → PARTIAL: LLM 평가 대상이지만 Fallback은 불필요
+        rag_results = {**RAG_RESULTS, "evidence": [{"relevance": "medium", "matched_tags": []}]}
+
+        output = await command.execute(
+            EvaluateFeedbackInput(
+                job_id="job-1",
+                query="건전지랑 페트병 같이 버려?",
+                intent="waste",
+                rag_results=rag_results,
+            )
+        )
+
+        assert command.mode == "deferred"
+        assert "llm_evaluation_deferred" in output.events
+        assert not output.fallback_executed
+        assert llm_evaluator.evaluate.await_count == 0
+
+        deferred.release("job-1")
+        await deferred.drain(timeout=1.0)
+        llm_evaluator.evaluate.assert_awaited_once()
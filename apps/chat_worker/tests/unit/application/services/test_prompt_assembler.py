@@ -0,0 +1,126 @@
+"""PromptAssembler 단위 테스트."""
+
+from __future__ import annotations
+
+import json
+
+from chat_worker.application.dto.answer_context import AnswerContext
+from chat_worker.application.services.prompt_assembler import (
+    TRUNCATION_MARKER,
+    PromptAssembler,
+    compact_serialize,
+    estimate_tokens,
+)
+
+RULES = {
+    "category": "plastic",
+    "rules": ["내용물을 비운다", "라벨을 제거한다"],
+    "detail": {"bin": "플라스틱", "note": None},
+}
+
+
+class TestCompactSerialize:
+    """compact 직렬화 테스트."""
+
+    def test_sorted_key_value_lines(self):
+        """키 정렬 + 빈 값 생략 + 중첩 들여쓰기."""
+        assert compact_serialize(RULES) == (
+            "category: plastic\n"
+            "detail:\n"
+            " bin: 플라스틱\n"
+            "rules:\n"
+            " - 내용물을 비운다\n"
+            " - 라벨을 제거한다"
+        )
+
+    def test_deterministic_regardless_of_key_order(self):
+        """키 순서가 달라도 같은 문자열 (prefix 안정성)."""
+        reordered = {"rules": RULES["rules"], "detail": RULES["detail"], "category": "plastic"}
+        assert compact_serialize(reordered) == compact_serialize(RULES)
+
+    def test_smaller_than_indented_json(self):
+        """indent=2 JSON보다 짧음."""
+        indented = json.dumps(RULES, ensure_ascii=False, indent=2)
+        assert len(compact_serialize(RULES)) < len(indented)
+
+
+class TestPromptAssembler:
+    """섹션 순서/예산 테스트."""
+
+    def _context(self, **overrides) -> AnswerContext:
+        fields = {
+            "disposal_rules": RULES,
+            "classification": {"category": "plastic"},
+            "weather_context": "맑음, 분리배출 최적",
+            "conversation_summary": "플라스틱 분류에 관심",
+            "conversation_history": [
+                {"role": "user", "content": "안녕"},
+                {"role": "assistant", "content": "반갑습니다!"},
+            ],
+            "user_input": "페트병은?",
+        }
+        fields.update(overrides)
+        return AnswerContext(**fields)
+
+    def test_static_sections_before_dynamic(self):
+        """규정 → 분류 → 도구 결과 → 요약 → 히스토리 → 질문 순서."""
+        prompt = PromptAssembler().assemble(self._context()).prompt
+
+        order = [
+            "## Disposal Rules",
+            "## Classification",
+            "## Weather Info",
+            "## Previous Conversation Summary",
+            "## Recent Conversation",
+            "## User Question",
+        ]
+        positions = [prompt.index(title) for title in order]
+        assert positions == sorted(positions)
+        assert prompt.endswith("## User Question\n페트병은?")
+
+    def test_static_prefix_shared_across_users(self):
+        """다른 사용자/대화여도 정적 prefix는 동일."""
+        assembler = PromptAssembler()
+        a = assembler.assemble(self._context())
+        b = assembler.assemble(
+            self._context(
+                conversation_summary=None,
+                conversation_history=[{"role": "user", "content": "다른 대화"}],
+                user_input="라벨은 어떻게 해?",
+            )
+        )
+
+        prefix = a.prompt[: a.prompt.index("## Previous Conversation Summary")]
+        assert b.prompt.startswith(prefix)
+        assert a.static_prefix_tokens == b.static_prefix_tokens > 0
+
+    def test_section_budget_truncates(self):
+        """예산 초과 섹션은 잘리고 표시."""
+        long_text = "\n".join(f"{i}번 검색 결과 내용" for i in range(200))
+        assembled = PromptAssembler(section_budgets={"web_search": 50}).assemble(
+            self._context(web_search_results=long_text)
+        )
+
+        assert "web_search" in assembled.truncated_sections
+        assert TRUNCATION_MARKER in assembled.prompt
+        body = assembled.prompt.split("## Web Search Results\n", 1)[1].split("\n\n", 1)[0]
+        assert estimate_tokens(body) <= 50
+
+    def test_history_keeps_most_recent(self):
+        """히스토리 예산 초과 시 오래된 메시지부터 제외."""
+        history = [{"role": "user", "content": f"메시지{i} " + "가" * 40} for i in range(10)]
+        assembled = PromptAssembler(section_budgets={"history": 60}).assemble(
+            self._context(conversation_history=history)
+        )
+
+        assert "history" in assembled.truncated_sections
+        assert "메시지9" in assembled.prompt
+        assert "메시지0" not in assembled.prompt
+
+    def test_user_question_never_truncated(self):
+        """질문은 예산 없음."""
+        question = "질문 " * 2000
+        assembled = PromptAssembler().assemble(self._context(user_input=question))
+
+        assert "user_question" not in assembled.truncated_sections
+        assert assembled.prompt.endswith(question)
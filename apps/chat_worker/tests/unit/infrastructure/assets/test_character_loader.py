@@ -161,6 +161,19 @@ class TestGetAsset:
                 await loader.get_asset("battery")
             assert exc_info.value.code == "battery"
 
+    @pytest.mark.asyncio
+    async def test_uses_injected_image_cache(self):
+        """image_cache 주입 시 공유 캐시에서 바이트 조회."""
+        image_cache = MagicMock()
+        image_cache.get = AsyncMock(return_value=b"cached_png")
+        loader = CDNCharacterAssetLoader(image_cache=image_cache)
+
+        result = await loader.get_asset("pet")
+
+        assert result.image_bytes == b"cached_png"
+        image_cache.get.assert_awaited_once_with("https://images.dev.growbin.app/character/pet.png")
+        assert loader._cache == {}
+
 
 class TestGetAssetUrl:
     """get_asset_url() 테스트."""
@@ -307,3 +320,14 @@ class TestGetCharacterAssetLoader:
         loader1 = get_character_asset_loader()
         loader2 = get_character_asset_loader()
         assert loader1 is loader2
+
+    def test_shares_reference_image_cache(self):
+        """참조 이미지 캐시 싱글톤 주입."""
+        get_character_asset_loader.cache_clear()
+        cache = MagicMock()
+
+        with patch("chat_worker.setup.dependencies.get_reference_image_cache", return_value=cache):
+            loader = get_character_asset_loader()
+
+        get_character_asset_loader.cache_clear()
+        assert loader._image_cache is cache
@@ -12,6 +12,7 @@ from chat_worker.infrastructure.assets.prompt_loader import (
     PromptBuilder,
     get_prompt_builder,
     load_prompt_file,
+    preload_prompt_files,
 )
 
 
@@ -139,6 +140,17 @@ class TestLoadPromptFile:
         with pytest.raises(FileNotFoundError):
             load_prompt_file("global", "nonexistent_file")
 
+    def test_preload_caches_all_prompt_files(self):
+        """preload 후 모든 프롬프트 파일이 캐시에 적재."""
+        load_prompt_file.cache_clear()
+
+        count = preload_prompt_files()
+
+        assert count > 0
+        assert load_prompt_file.cache_info().currsize == count
+        load_prompt_file("global", "eco_character")
+        assert load_prompt_file.cache_info().misses == count
+
 
 class TestGetPromptBuilder:
     """get_prompt_builder 싱글톤 테스트."""
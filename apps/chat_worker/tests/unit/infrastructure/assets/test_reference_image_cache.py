@@ -0,0 +1,174 @@
+"""ReferenceImageCache Tests."""
+
+import asyncio
+import hashlib
+
+import httpx
+import pytest
+
+from chat_worker.infrastructure.assets.reference_image_cache import ReferenceImageCache
+
+URL = "https://images.dev.growbin.app/character/pet.png"
+PNG = b"\x89PNG-pet"
+
+
+class FakeCDN:
+    """ETag을 지원하는 가짜 CDN."""
+
+    def __init__(self, body: bytes = PNG, etag: str = '"v1"'):
+        self.body = body
+        self.etag = etag
+        self.requests: list[httpx.Request] = []
+        self.fail = False
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.fail:
+            raise httpx.ConnectError("cdn down", request=request)
+        if request.url.path.endswith("missing.png"):
+            return httpx.Response(404)
+        if request.headers.get("if-none-match") == self.etag:
+            return httpx.Response(304, headers={"etag": self.etag})
+        return httpx.Response(200, content=self.body, headers={"etag": self.etag})
+
+    def client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=httpx.MockTransport(self.handler))
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_cache(cdn: FakeCDN, clock: Clock | None = None, **kwargs) -> ReferenceImageCache:
+    return ReferenceImageCache(
+        http_client=cdn.client(),
+        clock=clock or Clock(),
+        revalidate_after=60.0,
+        **kwargs,
+    )
+
+
+class TestReferenceImageCache:
+    """메모리 캐시 + 조건부 재검증."""
+
+    @pytest.mark.asyncio
+    async def test_hit_skips_cdn(self):
+        cdn = FakeCDN()
+        cache = make_cache(cdn)
+
+        assert await cache.get(URL) == PNG
+        assert await cache.get(URL) == PNG
+        assert len(cdn.requests) == 1
+        assert cache.size_bytes == len(PNG)
+
+    @pytest.mark.asyncio
+    async def test_revalidates_with_etag_after_interval(self):
+        cdn = FakeCDN()
+        clock = Clock()
+        cache = make_cache(cdn, clock)
+        await cache.get(URL)
+
+        clock.now += 61
+        assert await cache.get(URL) == PNG
+        assert cdn.requests[-1].headers["if-none-match"] == '"v1"'
+
+        # 304 이후 다시 주기 내 hit
+        await cache.get(URL)
+        assert len(cdn.requests) == 2
+
+        # 내용 변경 시 새 바이트로 교체
+        cdn.body, cdn.etag = b"\x89PNG-pet-v2", '"v2"'
+        clock.now += 61
+        assert await cache.get(URL) == b"\x89PNG-pet-v2"
+
+    @pytest.mark.asyncio
+    async def test_serves_cached_bytes_when_cdn_down(self):
+        cdn = FakeCDN()
+        clock = Clock()
+        cache = make_cache(cdn, clock)
+        await cache.get(URL)
+
+        cdn.fail = True
+        clock.now += 61
+        assert await cache.get(URL) == PNG
+
+    @pytest.mark.asyncio
+    async def test_miss_errors_propagate(self):
+        cdn = FakeCDN()
+        cache = make_cache(cdn)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await cache.get("https://images.dev.growbin.app/character/missing.png")
+
+        cdn.fail = True
+        with pytest.raises(httpx.ConnectError):
+            await cache.get(URL)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_gets_single_flight(self):
+        cdn = FakeCDN()
+        cache = make_cache(cdn)
+
+        results = await asyncio.gather(*(cache.get(URL) for _ in range(5)))
+
+        assert results == [PNG] * 5
+        assert len(cdn.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used_by_size(self):
+        cdn = FakeCDN(body=b"x" * 10)
+        cache = make_cache(cdn, max_bytes=25)
+        urls = [f"https://cdn.example.com/character/{i}.png" for i in range(3)]
+
+        await cache.get(urls[0])
+        await cache.get(urls[1])
+        await cache.get(urls[0])  # 0번을 최근 사용으로
+        await cache.get(urls[2])
+
+        assert urls[0] in cache
+        assert urls[1] not in cache
+        assert cache.size_bytes == 20
+
+    @pytest.mark.asyncio
+    async def test_preload_reports_failures(self):
+        cdn = FakeCDN()
+        cache = make_cache(cdn)
+
+        loaded = await cache.preload(
+            [URL, URL, "https://images.dev.growbin.app/character/missing.png"]
+        )
+
+        assert loaded == 1
+        assert URL in cache
+
+
+class TestDiskCache:
+    """디스크(L2) 캐시."""
+
+    @pytest.mark.asyncio
+    async def test_restores_from_disk_without_cdn(self, tmp_path):
+        cdn = FakeCDN()
+        clock = Clock()
+        await make_cache(cdn, clock, disk_dir=tmp_path).get(URL)
+
+        blob = tmp_path / "blobs" / hashlib.sha256(PNG).hexdigest()
+        assert blob.read_bytes() == PNG
+
+        restarted = make_cache(cdn, clock, disk_dir=tmp_path)
+        assert await restarted.get(URL) == PNG
+        assert len(cdn.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_corrupted_blob_is_refetched(self, tmp_path):
+        cdn = FakeCDN()
+        clock = Clock()
+        await make_cache(cdn, clock, disk_dir=tmp_path).get(URL)
+        (tmp_path / "blobs" / hashlib.sha256(PNG).hexdigest()).write_bytes(b"broken")
+
+        restarted = make_cache(cdn, clock, disk_dir=tmp_path)
+        assert await restarted.get(URL) == PNG
+        assert len(cdn.requests) == 2
@@ -0,0 +1,135 @@
+"""SemanticIntentCache 단위 테스트."""
+
+from __future__ import annotations
+
+import pytest
+
+from chat_worker.application.ports.cache import SemanticIntentHit
+from chat_worker.infrastructure.cache import SemanticIntentCache
+from chat_worker.infrastructure.cache.semantic_intent_cache import normalize_intent_message
+
+
+class TestNormalizeIntentMessage:
+    """메시지 정규화 테스트."""
+
+    @pytest.mark.parametrize(
+        "message",
+        [
+            "페트병 어떻게 버려?",
+            "페트병 어떻게 버려요",
+            "페트병   어떻게 버려요?!",
+            "페트병 어떻게 버려ㅠㅠ",
+            "혹시 페트병 어떻게 버려요?",
+        ],
+    )
+    def test_surface_variants_collapse(self, message: str):
+        """문장부호/자모/공백/존댓말 '요'/군말 차이는 같은 정규화 결과."""
+        assert normalize_intent_message(message) == "페트병 어떻게 버려"
+
+    def test_particles_preserved(self):
+        """조사/어간은 건드리지 않음."""
+        assert normalize_intent_message("종이") == "종이"
+        assert normalize_intent_message("요") == "요"
+
+
+class TestSemanticIntentCache:
+    """SemanticIntentCache 테스트."""
+
+    @pytest.fixture
+    def cache(self) -> SemanticIntentCache:
+        return SemanticIntentCache(audit_rate=0.0)
+
+    @pytest.mark.anyio
+    async def test_exact_normalized_hit(self, cache: SemanticIntentCache):
+        """정규화 후 동일하면 similarity 1.0 히트."""
+        await cache.store("페트병 어떻게 버려?", "waste", 0.9, False)
+
+        hit = await cache.lookup("페트병 어떻게 버려요")
+
+        assert hit is not None
+        assert hit.intent == "waste"
+        assert hit.confidence == 0.9
+        assert hit.similarity == 1.0
+
+    @pytest.mark.anyio
+    async def test_near_duplicate_hit(self, cache: SemanticIntentCache):
+        """띄어쓰기만 다른 메시지는 근사 히트."""
+        await cache.store("근처 재활용 센터 어디 있어", "location", 0.85, False)
+
+        hit = await cache.lookup("근처 재활용센터 어디있어")
+
+        assert hit is not None
+        assert hit.intent == "location"
+        assert hit.similarity >= 0.8
+
+    @pytest.mark.anyio
+    async def test_dissimilar_message_misses(self, cache: SemanticIntentCache):
+        """다른 요청은 미스."""
+        await cache.store("캐릭터 알려줘", "character", 0.9, False)
+
+        assert await cache.lookup("캐릭터 그려줘") is None
+        assert cache.get_stats()["miss"] == 1
+
+    @pytest.mark.anyio
+    async def test_short_message_requires_exact(self, cache: SemanticIntentCache):
+        """짧은 메시지는 근사 매칭 안함."""
+        await cache.store("안녕", "general", 0.9, False)
+
+        assert await cache.lookup("안녕!") is not None
+        assert await cache.lookup("안녕하") is None
+
+    @pytest.mark.anyio
+    async def test_lru_eviction(self):
+        """max_entries 초과 시 오래된 항목 제거."""
+        cache = SemanticIntentCache(max_entries=2, audit_rate=0.0)
+        await cache.store("페트병 버리는 법", "waste", 0.9, False)
+        await cache.store("근처 재활용센터", "location", 0.9, False)
+        await cache.store("오늘 날씨 어때", "weather", 0.9, False)
+
+        assert len(cache) == 2
+        assert await cache.lookup("페트병 버리는 법") is None
+        assert not cache._buckets or all(
+            "페트병 버리는 법" not in bucket for bucket in cache._buckets.values()
+        )
+
+    @pytest.mark.anyio
+    async def test_ttl_expiry(self):
+        """TTL 지난 항목은 미스."""
+        cache = SemanticIntentCache(ttl=0, audit_rate=0.0)
+        await cache.store("페트병 버리는 법", "waste", 0.9, False)
+
+        assert await cache.lookup("페트병 버리는 법") is None
+
+    @pytest.mark.anyio
+    async def test_audit_mismatch_evicts(self, cache: SemanticIntentCache):
+        """감사 불일치 항목은 제거되고 정밀도에 반영."""
+        await cache.store("페트병 버리는 법", "waste", 0.9, False)
+        hit = await cache.lookup("페트병 버리는 법")
+        assert isinstance(hit, SemanticIntentHit)
+
+        cache.record_audit(hit, "general")
+
+        stats = cache.get_stats()
+        assert stats["audit_mismatch"] == 1
+        assert stats["audit_precision"] == 0.0
+        assert await cache.lookup("페트병 버리는 법") is None
+
+    def test_should_audit_sampling(self):
+        """audit_rate 0/1 경계."""
+        assert SemanticIntentCache(audit_rate=0.0).should_audit() is False
+        assert SemanticIntentCache(audit_rate=1.0).should_audit() is True
+
+    @pytest.mark.anyio
+    async def test_stats_track_latency(self, cache: SemanticIntentCache):
+        """LLM 지연 EWMA와 히트율 집계."""
+        await cache.store("페트병 버리는 법", "waste", 0.9, False, llm_latency=0.8)
+        await cache.lookup("페트병 버리는 법요")
+
+        stats = cache.get_stats()
+        assert stats["hit_rate"] == 1.0
+        assert stats["llm_latency_ewma"] == pytest.approx(0.8)
+
+    def test_invalid_bands(self):
+        """num_perm이 bands로 나누어떨어지지 않으면 에러."""
+        with pytest.raises(ValueError):
+            SemanticIntentCache(num_perm=10, bands=3)
@@ -0,0 +1,103 @@
+"""TokenStreamWriter 단위 테스트."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from chat_worker.infrastructure.events import TokenStreamWriter
+
+
+class SlowPublisher:
+    """발행마다 지연이 있는 Mock Publisher (Redis 지연 모사)."""
+
+    def __init__(self, delay: float = 0.0, fail: bool = False):
+        self.delay = delay
+        self.fail = fail
+        self.published: list[str] = []
+        self.finalized: list[str] = []
+
+    async def notify_token_v2(self, task_id: str, content: str, node: str | None = None) -> str:
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise ConnectionError("redis timeout")
+        self.published.append(content)
+        return "1-0"
+
+    async def finalize_token_stream(self, task_id: str) -> None:
+        self.finalized.append(task_id)
+
+
+class TestTokenStreamWriter:
+    """비동기 토큰 발행기 테스트."""
+
+    @pytest.mark.anyio
+    async def test_push_does_not_wait_for_publish(self):
+        """발행 지연과 무관하게 push는 즉시 반환."""
+        publisher = SlowPublisher(delay=0.05)
+        writer = TokenStreamWriter(publisher, "job-1")
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        for chunk in "안녕하세요":
+            await writer.push(chunk)
+        assert loop.time() - started < 0.05
+
+        await writer.finalize()
+
+        assert "".join(publisher.published) == "안녕하세요"
+        assert publisher.finalized == ["job-1"]
+
+    @pytest.mark.anyio
+    async def test_backlog_coalesced_in_order(self):
+        """밀린 청크는 순서대로 병합 발행."""
+        publisher = SlowPublisher(delay=0.01)
+        writer = TokenStreamWriter(publisher, "job-2", max_batch_chunks=4)
+
+        for i in range(10):
+            await writer.push(str(i))
+        await writer.finalize()
+
+        assert "".join(publisher.published) == "0123456789"
+        assert len(publisher.published) < 10
+        assert all(len(event) <= 4 for event in publisher.published)
+        assert writer.max_queue_depth == 10
+
+    @pytest.mark.anyio
+    async def test_bounded_queue_applies_backpressure(self):
+        """큐가 가득 차면 push가 대기 (메모리 상한)."""
+        publisher = SlowPublisher(delay=0.01)
+        writer = TokenStreamWriter(publisher, "job-3", max_queue_size=2, max_batch_chunks=1)
+
+        for i in range(6):
+            await writer.push(str(i))
+        await writer.finalize()
+
+        assert writer.max_queue_depth <= 2
+        assert publisher.published == ["0", "1", "2", "3", "4", "5"]
+
+    @pytest.mark.anyio
+    async def test_publish_failure_does_not_block(self):
+        """발행 실패해도 스트림은 계속, finalize까지 도달."""
+        publisher = SlowPublisher(fail=True)
+        writer = TokenStreamWriter(publisher, "job-4")
+
+        await writer.push("a")
+        await writer.push("b")
+        await writer.finalize()
+
+        assert publisher.finalized == ["job-4"]
+
+    @pytest.mark.anyio
+    async def test_abort_skips_finalize(self):
+        """에러 경로: writer 정리, finalize 미호출."""
+        publisher = SlowPublisher(delay=1.0)
+        writer = TokenStreamWriter(publisher, "job-5")
+
+        await writer.push("a")
+        await writer.abort()
+        await writer.push("b")
+
+        assert publisher.finalized == []
+        assert publisher.published == []
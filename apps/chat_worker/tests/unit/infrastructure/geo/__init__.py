@@ -0,0 +1 @@
+"""Geo Resolution Tests."""
@@ -0,0 +1,164 @@
+"""CachedGeoResolver 단위 테스트."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from chat_worker.application.ports.geo_resolver import AdminRegion, ReverseGeocoderPort
+from chat_worker.application.ports.kakao_local_client import KakaoRegionDTO
+from chat_worker.infrastructure.geo import CachedGeoResolver, KakaoReverseGeocoder
+
+
+class FakeGeocoder(ReverseGeocoderPort):
+    """호출 수를 기록하는 가짜 역지오코더."""
+
+    def __init__(self, region: AdminRegion | None = None, delay: float = 0.0):
+        self.region = region
+        self.delay = delay
+        self.fail = False
+        self.calls: list[tuple[float, float]] = []
+
+    async def reverse_geocode(self, lat: float, lon: float) -> AdminRegion | None:
+        self.calls.append((lat, lon))
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("HTTP 500")
+        return self.region
+
+
+class FakeCache:
+    """CachePort JSON 메서드만 구현한 인메모리 캐시."""
+
+    def __init__(self):
+        self.data: dict[str, dict[str, Any]] = {}
+
+    async def get_json(self, key: str) -> dict[str, Any] | None:
+        return self.data.get(key)
+
+    async def set_json(self, key: str, value: dict[str, Any], ttl: int | None = None) -> bool:
+        self.data[key] = value
+        return True
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+GANGNAM = AdminRegion(sido="서울특별시", sigungu="강남구", source="offline")
+
+
+class TestCachedGeoResolver:
+    """셀 캐시 + 역지오코딩 체인 테스트."""
+
+    @pytest.mark.anyio
+    async def test_same_cell_resolved_once(self):
+        geocoder = FakeGeocoder(GANGNAM)
+        resolver = CachedGeoResolver([geocoder])
+
+        first = await resolver.resolve(37.51721, 127.04731)
+        second = await resolver.resolve(37.51749, 127.04712)  # 같은 0.001° 셀
+
+        assert first is second
+        assert first.region_name == "서울특별시 강남구"
+        assert (first.nx, first.ny) == (61, 126)
+        assert len(geocoder.calls) == 1
+
+    @pytest.mark.anyio
+    async def test_concurrent_requests_single_flight(self):
+        geocoder = FakeGeocoder(GANGNAM, delay=0.01)
+        resolver = CachedGeoResolver([geocoder])
+
+        results = await asyncio.gather(*(resolver.resolve(37.5172, 127.0473) for _ in range(10)))
+
+        assert len(geocoder.calls) == 1
+        assert all(result is results[0] for result in results)
+
+    @pytest.mark.anyio
+    async def test_chain_falls_back_on_miss_and_error(self):
+        offline = FakeGeocoder(None)
+        broken = FakeGeocoder(GANGNAM)
+        broken.fail = True
+        kakao = FakeGeocoder(AdminRegion(sido="서울특별시", sigungu="강남구", source="kakao"))
+        resolver = CachedGeoResolver([offline, broken, kakao])
+
+        resolution = await resolver.resolve(37.5172, 127.0473)
+
+        assert resolution.sigungu == "강남구"
+        assert resolution.region.source == "kakao"
+        assert [len(g.calls) for g in (offline, broken, kakao)] == [1, 1, 1]
+
+    @pytest.mark.anyio
+    async def test_unresolved_expires_and_is_not_shared(self):
+        geocoder = FakeGeocoder(None)
+        cache = FakeCache()
+        clock = Clock()
+        resolver = CachedGeoResolver([geocoder], cache=cache, unresolved_ttl=60, clock=clock)
+
+        first = await resolver.resolve(37.5172, 127.0473)
+        await resolver.resolve(37.5172, 127.0473)
+        geocoder.region = GANGNAM
+        clock.now = 61
+        retried = await resolver.resolve(37.5172, 127.0473)
+
+        assert first.region is None and first.nx == 61  # 격자는 행정구역 없이도 해석
+        assert retried.sigungu == "강남구"
+        assert len(geocoder.calls) == 2
+        assert list(cache.data) == ["geo:3:37.517:127.047"]
+
+    @pytest.mark.anyio
+    async def test_l2_shared_between_replicas(self):
+        cache = FakeCache()
+        geocoder = FakeGeocoder(GANGNAM)
+        await CachedGeoResolver([geocoder], cache=cache).resolve(37.5172, 127.0473)
+
+        other = FakeGeocoder(None)
+        resolution = await CachedGeoResolver([other], cache=cache).resolve(37.5172, 127.0473)
+
+        assert resolution.region == GANGNAM
+        assert other.calls == []
+
+    @pytest.mark.anyio
+    async def test_lru_bounded(self):
+        resolver = CachedGeoResolver([FakeGeocoder(GANGNAM)], max_entries=2)
+
+        for lon in (127.001, 127.002, 127.003):
+            await resolver.resolve(37.5, lon)
+
+        assert list(resolver._entries) == [(37.5, 127.002), (37.5, 127.003)]
+
+    @pytest.mark.anyio
+    async def test_locate_never_waits_on_geocoding(self):
+        geocoder = FakeGeocoder(GANGNAM)
+        resolver = CachedGeoResolver([geocoder])
+
+        grid_only = resolver.locate(37.51721, 127.04731)
+        resolved = await resolver.resolve(37.51721, 127.04731)
+
+        assert (grid_only.nx, grid_only.ny) == (61, 126)
+        assert grid_only.region is None
+        assert resolver.locate(37.51749, 127.04712) is resolved  # 해석된 셀은 그대로 재사용
+        assert len(geocoder.calls) == 1
+
+
+class TestKakaoReverseGeocoder:
+    """카카오 coord2regioncode 어댑터 테스트."""
+
+    @pytest.mark.anyio
+    async def test_prefers_legal_region(self):
+        class FakeKakao:
+            async def coord_to_region(self, x: float, y: float) -> list[KakaoRegionDTO]:
+                return [
+                    KakaoRegionDTO(region_type="H", sido="서울특별시", sigungu="강남구 H"),
+                    KakaoRegionDTO(region_type="B", sido="서울특별시", sigungu="강남구"),
+                ]
+
+        region = await KakaoReverseGeocoder(FakeKakao()).reverse_geocode(37.5172, 127.0473)
+
+        assert region == AdminRegion(sido="서울특별시", sigungu="강남구", source="kakao")
@@ -125,6 +125,20 @@ class TestCharacterGrpcClient:
         assert client._channel is None
         assert client._stub is None
 
+    @pytest.mark.asyncio
+    async def test_prewarm_waits_for_channel_ready(self, client):
+        """prewarm은 채널 연결 수립까지 대기."""
+        mock_channel = AsyncMock()
+
+        async def get_stub():
+            client._channel = mock_channel
+            return MagicMock()
+
+        with patch.object(client, "_get_stub", side_effect=get_stub):
+            await client.prewarm()
+
+        mock_channel.channel_ready.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_close_when_not_connected(self, client):
         """연결 전 종료 시도."""
@@ -0,0 +1 @@
+"""Image Storage Integration Tests."""
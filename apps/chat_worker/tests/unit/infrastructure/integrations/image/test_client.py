@@ -0,0 +1,98 @@
+"""ImageStorageClient Tests."""
+
+import hashlib
+
+import grpc
+import pytest
+
+from chat_worker.infrastructure.integrations.image.client import (
+    STREAM_CHUNK_SIZE,
+    ImageStorageClient,
+)
+from chat_worker.infrastructure.integrations.image.proto import UploadBytesResponse
+
+
+class FakeStub:
+    """UploadStream/UploadBytes를 기록하는 가짜 stub."""
+
+    def __init__(self, stream_supported: bool = True, existing: set[str] | None = None):
+        self.stream_supported = stream_supported
+        self.existing = existing or set()
+        self.stream_calls: list[list] = []
+        self.bytes_calls = 0
+
+    async def UploadStream(self, request_iterator, timeout=None):
+        if not self.stream_supported:
+            raise grpc.aio.AioRpcError(
+                grpc.StatusCode.UNIMPLEMENTED,
+                grpc.aio.Metadata(),
+                grpc.aio.Metadata(),
+                details="Method not found",
+            )
+        messages = []
+        async for message in request_iterator:
+            messages.append(message)
+            if message.WhichOneof("payload") == "header" and message.header.sha256 in self.existing:
+                break  # 서버가 청크 수신 전에 응답
+        self.stream_calls.append(messages)
+        sha = messages[0].header.sha256
+        return UploadBytesResponse(
+            success=True,
+            cdn_url=f"https://cdn.test/generated/{sha}.png",
+            key=f"generated/{sha}.png",
+            deduplicated=sha in self.existing,
+        )
+
+    async def UploadBytes(self, request, timeout=None):
+        self.bytes_calls += 1
+        return UploadBytesResponse(success=True, cdn_url="https://cdn.test/x.png", key="x.png")
+
+
+def make_client(stub: FakeStub) -> ImageStorageClient:
+    client = ImageStorageClient()
+    client._channel = object()
+    client._stub = stub
+    return client
+
+
+class TestUploadBytes:
+    """upload_bytes() 스트리밍 경로."""
+
+    @pytest.mark.anyio
+    async def test_streams_header_with_sha256_then_chunks(self):
+        stub = FakeStub()
+        data = b"x" * (STREAM_CHUNK_SIZE * 2 + 10)
+
+        result = await make_client(stub).upload_bytes(data, metadata={"job_id": "job-1"})
+
+        messages = stub.stream_calls[0]
+        header = messages[0].header
+        assert header.sha256 == hashlib.sha256(data).hexdigest()
+        assert header.metadata["job_id"] == "job-1"
+        assert b"".join(m.chunk for m in messages[1:]) == data
+        assert len(messages) == 4
+        assert result.success is True
+        assert result.key == f"generated/{header.sha256}.png"
+
+    @pytest.mark.anyio
+    async def test_existing_content_skips_chunks(self):
+        data = b"same-image"
+        stub = FakeStub(existing={hashlib.sha256(data).hexdigest()})
+
+        result = await make_client(stub).upload_bytes(data)
+
+        assert result.deduplicated is True
+        assert len(stub.stream_calls[0]) == 1
+
+    @pytest.mark.anyio
+    async def test_falls_back_to_upload_bytes_when_unimplemented(self):
+        stub = FakeStub(stream_supported=False)
+        client = make_client(stub)
+
+        first = await client.upload_bytes(b"data")
+        second = await client.upload_bytes(b"data")
+
+        assert first.success is True
+        assert second.success is True
+        assert stub.bytes_calls == 2
+        assert client._stream_supported is False
@@ -263,6 +263,17 @@ class TestKecoCollectionPointClient:
         mock_http_client.aclose.assert_called_once()
         assert client._client is None
 
+    @pytest.mark.asyncio
+    async def test_prewarm_opens_connection(self, client: KecoCollectionPointClient):
+        """prewarm은 base_url로 연결 하나를 선행 수립."""
+        mock_http_client = AsyncMock()
+        mock_http_client.base_url = client.BASE_URL
+
+        with patch.object(client, "_get_client", return_value=mock_http_client):
+            await client.prewarm()
+
+        mock_http_client.head.assert_awaited_once_with(client.BASE_URL)
+
     @pytest.mark.asyncio
     async def test_has_next_pagination(self):
         """페이지네이션 has_next 테스트."""
@@ -0,0 +1 @@
+"""KMA Integration Tests."""
@@ -0,0 +1,167 @@
+"""CachedWeatherClient 단위 테스트."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+from typing import Any
+
+import pytest
+
+from chat_worker.application.ports.weather_client import (
+    CurrentWeatherDTO,
+    PrecipitationType,
+    SkyStatus,
+    WeatherClientPort,
+    WeatherResponse,
+)
+from chat_worker.infrastructure.integrations.kma import CachedWeatherClient
+from chat_worker.infrastructure.integrations.kma.kma_weather_http_client import (
+    next_base_change,
+    next_forecast_base_change,
+)
+
+
+class FakeWeatherClient(WeatherClientPort):
+    """호출 수를 기록하는 가짜 기상청 클라이언트."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls: list[tuple[str, int, int]] = []
+        self.fail = False
+
+    async def get_current_weather(self, nx: int, ny: int) -> WeatherResponse:
+        self.calls.append(("ncst", nx, ny))
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            return WeatherResponse(success=False, error_message="HTTP 500", nx=nx, ny=ny)
+        current = CurrentWeatherDTO(
+            temperature=float(len(self.calls)),
+            precipitation=0.0,
+            precipitation_type=PrecipitationType.RAIN,
+            humidity=60,
+            sky_status=SkyStatus.CLOUDY,
+        )
+        return WeatherResponse(success=True, current=current, nx=nx, ny=ny)
+
+    async def get_forecast(self, nx: int, ny: int, hours: int = 24) -> WeatherResponse:
+        self.calls.append(("fcst", nx, ny))
+        return WeatherResponse(success=True, nx=nx, ny=ny)
+
+    async def close(self) -> None:
+        pass
+
+
+class FakeCache:
+    """CachePort JSON 메서드만 구현한 인메모리 캐시."""
+
+    def __init__(self):
+        self.data: dict[str, dict[str, Any]] = {}
+        self.ttls: dict[str, int | None] = {}
+
+    async def get_json(self, key: str) -> dict[str, Any] | None:
+        return self.data.get(key)
+
+    async def set_json(self, key: str, value: dict[str, Any], ttl: int | None = None) -> bool:
+        self.data[key] = value
+        self.ttls[key] = ttl
+        return True
+
+
+class Clock:
+    def __init__(self, now: datetime):
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+class TestBaseTimeSlots:
+    """발표 시각 정렬 테스트."""
+
+    def test_next_base_change(self):
+        assert next_base_change(datetime(2026, 1, 1, 14, 10)) == datetime(2026, 1, 1, 14, 40)
+        assert next_base_change(datetime(2026, 1, 1, 14, 40)) == datetime(2026, 1, 1, 15, 40)
+        assert next_forecast_base_change(datetime(2026, 1, 1, 14, 10)) == datetime(
+            2026, 1, 1, 15, 0
+        )
+        assert next_forecast_base_change(datetime(2026, 1, 1, 22, 30)) == datetime(2026, 1, 2, 0, 0)
+
+
+class TestCachedWeatherClient:
+    """격자/발표시각 캐시 테스트."""
+
+    @pytest.mark.anyio
+    async def test_same_base_hits_and_new_base_refetches(self):
+        inner = FakeWeatherClient()
+        clock = Clock(datetime(2026, 1, 1, 14, 45))
+        client = CachedWeatherClient(inner, clock=clock)
+
+        first = await client.get_current_weather(60, 127)
+        clock.now = datetime(2026, 1, 1, 15, 30)  # 아직 14시 발표분
+        second = await client.get_current_weather(60, 127)
+        clock.now = datetime(2026, 1, 1, 15, 41)  # 15시 발표분 조회 가능
+        third = await client.get_current_weather(60, 127)
+
+        assert first is second
+        assert third.current.temperature == 2.0
+        assert len(inner.calls) == 2
+
+    @pytest.mark.anyio
+    async def test_concurrent_identical_fetches_collapsed(self):
+        inner = FakeWeatherClient(delay=0.01)
+        client = CachedWeatherClient(inner, clock=Clock(datetime(2026, 1, 1, 14, 45)))
+
+        results = await asyncio.gather(*(client.get_current_weather(60, 127) for _ in range(10)))
+
+        assert len(inner.calls) == 1
+        assert all(r is results[0] for r in results)
+
+    @pytest.mark.anyio
+    async def test_shared_cache_ttl_aligned_to_next_slot(self):
+        cache = FakeCache()
+        clock = Clock(datetime(2026, 1, 1, 14, 45))
+        await CachedWeatherClient(
+            FakeWeatherClient(), cache=cache, clock=clock
+        ).get_current_weather(60, 127)
+
+        # 다른 replica: L2에서 복원 (API 호출 없음)
+        other = FakeWeatherClient()
+        restored = await CachedWeatherClient(other, cache=cache, clock=clock).get_current_weather(
+            60, 127
+        )
+
+        assert other.calls == []
+        assert restored.current.precipitation_type is PrecipitationType.RAIN
+        assert cache.ttls == {"kma:ncst:60:127:0:202601011400": 55 * 60 + 60}
+
+    @pytest.mark.anyio
+    async def test_failure_serves_previous_base(self):
+        inner = FakeWeatherClient()
+        clock = Clock(datetime(2026, 1, 1, 14, 45))
+        client = CachedWeatherClient(inner, clock=clock)
+        previous = await client.get_current_weather(60, 127)
+
+        inner.fail = True
+        clock.now = datetime(2026, 1, 1, 15, 45)
+
+        assert await client.get_current_weather(60, 127) is previous
+
+    @pytest.mark.anyio
+    async def test_prefetch_refreshes_hottest_cells(self):
+        inner = FakeWeatherClient()
+        clock = Clock(datetime(2026, 1, 1, 14, 45))
+        client = CachedWeatherClient(inner, prefetch_top_n=1, clock=clock)
+        client._ensure_prefetch = lambda: None  # 루프 대신 prefetch() 직접 호출
+
+        for _ in range(3):
+            await client.get_current_weather(60, 127)
+        await client.get_current_weather(98, 76)
+        inner.calls.clear()
+
+        clock.now = datetime(2026, 1, 1, 15, 41)
+        assert await client.prefetch() == 1
+        assert inner.calls == [("ncst", 60, 127)]
+
+        await client.get_current_weather(60, 127)
+        assert len(inner.calls) == 1  # prefetch 결과로 응답
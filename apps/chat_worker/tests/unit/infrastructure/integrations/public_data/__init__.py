@@ -0,0 +1 @@
+"""Public Data Snapshot Tests."""
@@ -0,0 +1,273 @@
+"""공공데이터 스냅샷 (저장/동기화/local-first) 단위 테스트."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from chat_worker.application.ports.bulk_waste_client import (
+    WasteDisposalInfoDTO,
+    WasteInfoSearchResponse,
+)
+from chat_worker.application.ports.collection_point_client import (
+    CollectionPointDTO,
+    CollectionPointSearchResponse,
+)
+from chat_worker.application.ports.kakao_local_client import KakaoPlaceDTO, KakaoSearchResponse
+from chat_worker.infrastructure.integrations.public_data import (
+    LocalFirstBulkWasteClient,
+    LocalFirstCollectionPointClient,
+    PublicDataSnapshotStore,
+    PublicDataSnapshotSync,
+    SnapshotWriter,
+)
+from chat_worker.infrastructure.integrations.public_data.snapshot_store import (
+    parse_admin_region,
+)
+
+POINTS = [
+    CollectionPointDTO(
+        id=1,
+        name="이마트 용산점",
+        collection_types=("폐휴대폰", "소형가전"),
+        address="서울특별시 용산구 한강대로23길 55",
+        lat=37.5298,
+        lon=126.9648,
+    ),
+    CollectionPointDTO(
+        id=2,
+        name="용산구청",
+        address="서울특별시 용산구 녹사평대로 150",
+        lat=37.5326,
+        lon=126.9905,
+    ),
+    CollectionPointDTO(
+        id=3,
+        name="강남구청",
+        address="서울특별시 강남구 학동로 426",
+        lat=37.5172,
+        lon=127.0473,
+    ),
+]
+DISPOSAL = [
+    WasteDisposalInfoDTO(region_code="3220000", sido="서울특별시", sigungu="강남구", dong="역삼동"),
+    WasteDisposalInfoDTO(region_code="3220000", sido="서울특별시", sigungu="강남구", dong="삼성동"),
+    WasteDisposalInfoDTO(region_code="3030000", sido="서울특별시", sigungu="성동구"),
+]
+
+
+@pytest.fixture
+def snapshot_path(tmp_path) -> str:
+    path = str(tmp_path / "public_data.sqlite")
+    writer = SnapshotWriter(path)
+    writer.write_disposal_info(DISPOSAL)
+    writer.write_collection_points(POINTS)
+    writer.close()
+    return path
+
+
+class TestPublicDataSnapshotStore:
+    """스냅샷 조회 테스트."""
+
+    def test_search_collection_points_by_token_prefix(self, snapshot_path):
+        store = PublicDataSnapshotStore(snapshot_path)
+
+        by_address, total = store.search_collection_points(address_keyword="용산")
+        by_both, _ = store.search_collection_points(address_keyword="용산구", name_keyword="이마트")
+        substring, _ = store.search_collection_points(name_keyword="마트")
+
+        assert total == 2
+        assert [p.id for p in by_address] == [1, 2]
+        assert [p.id for p in by_both] == [1]
+        assert by_both[0].collection_types == ("폐휴대폰", "소형가전")
+        assert [p.id for p in substring] == [1]
+
+    def test_search_disposal_info_by_sigungu(self, snapshot_path):
+        store = PublicDataSnapshotStore(snapshot_path)
+
+        results, total = store.search_disposal_info(sigungu="강남구", page_size=1)
+        partial, _ = store.search_disposal_info(sigungu="성동")
+
+        assert total == 2
+        assert results[0].dong == "역삼동"
+        assert [r.sigungu for r in partial] == ["성동구"]
+
+    def test_nearby_sorted_by_distance(self, snapshot_path):
+        store = PublicDataSnapshotStore(snapshot_path)
+
+        points = store.get_nearby_collection_points(37.5299, 126.9650, radius_km=3.0)
+
+        assert [p.id for p in points] == [1, 2]
+
+    def test_missing_file(self, tmp_path):
+        store = PublicDataSnapshotStore(str(tmp_path / "none.sqlite"))
+
+        assert store.synced_at("keco_point") is None
+
+    def test_reverse_geocode_from_point_addresses(self, snapshot_path):
+        store = PublicDataSnapshotStore(snapshot_path)
+
+        assert store.reverse_geocode(37.5299, 126.9650) == ("서울특별시", "용산구")
+        assert store.reverse_geocode(37.5170, 127.0470) == ("서울특별시", "강남구")
+        assert store.reverse_geocode(35.1796, 129.0756) is None  # 색인 셀 없음
+
+    def test_parse_admin_region(self):
+        assert parse_admin_region("경기도 수원시 장안구 정자로 1") == ("경기도", "수원시 장안구")
+        assert parse_admin_region("서울특별시 강남구 학동로 426") == ("서울특별시", "강남구")
+        assert parse_admin_region("세종특별자치시 한누리대로 2130") == ("세종특별자치시", None)
+        assert parse_admin_region("") is None
+
+
+class TestPublicDataSnapshotSync:
+    """동기화 작업 테스트."""
+
+    @pytest.mark.anyio
+    async def test_sync_geocodes_and_reuses_previous_coordinates(self, snapshot_path):
+        keco = MagicMock()
+        keco.search_collection_points = AsyncMock(
+            return_value=CollectionPointSearchResponse(
+                results=[
+                    CollectionPointDTO(id=1, name="이마트 용산점", address=POINTS[0].address),
+                    CollectionPointDTO(
+                        id=9, name="성동구청", address="서울특별시 성동구 고산자로 270"
+                    ),
+                ],
+                total_count=2,
+            )
+        )
+        geocoder = MagicMock()
+        geocoder.search_keyword = AsyncMock(
+            return_value=KakaoSearchResponse(
+                places=[
+                    KakaoPlaceDTO(
+                        id="1",
+                        place_name="성동구청",
+                        category_name="",
+                        category_group_code="",
+                        category_group_name="",
+                        phone=None,
+                        address_name="",
+                        road_address_name=None,
+                        x="127.0368",
+                        y="37.5634",
+                        place_url="",
+                    )
+                ]
+            )
+        )
+
+        counts = await PublicDataSnapshotSync(collection_point_client=keco, geocoder=geocoder).run(
+            snapshot_path
+        )
+
+        store = PublicDataSnapshotStore(snapshot_path)
+        points, _ = store.search_collection_points()
+        assert counts == {"mois_disposal": 3, "keco_point": 2}
+        assert geocoder.search_keyword.await_count == 1  # id=1은 이전 좌표 재사용
+        assert [(p.id, p.lat) for p in points] == [(1, 37.5298), (9, 37.5634)]
+
+    @pytest.mark.anyio
+    async def test_incomplete_download_keeps_previous_dataset(self, snapshot_path):
+        mois = MagicMock()
+        mois.search_disposal_info = AsyncMock(
+            return_value=WasteInfoSearchResponse(results=[], total_count=0)
+        )
+
+        counts = await PublicDataSnapshotSync(bulk_waste_client=mois).run(snapshot_path)
+
+        results, total = PublicDataSnapshotStore(snapshot_path).search_disposal_info()
+        assert counts == {"mois_disposal": 3, "keco_point": 3}
+        assert total == 3
+
+    @pytest.mark.anyio
+    async def test_unconfigured_dataset_copied_from_previous(self, snapshot_path):
+        mois = MagicMock()
+        mois.search_disposal_info = AsyncMock(
+            return_value=WasteInfoSearchResponse(results=DISPOSAL[:1], total_count=1)
+        )
+
+        counts = await PublicDataSnapshotSync(bulk_waste_client=mois).run(snapshot_path)
+
+        store = PublicDataSnapshotStore(snapshot_path)
+        points, _ = store.search_collection_points()
+        assert counts == {"mois_disposal": 1, "keco_point": 3}
+        assert [p.id for p in points] == [1, 2, 3]
+
+
+class TestLocalFirstClients:
+    """스냅샷 우선 + 실시간 fallback 테스트."""
+
+    @pytest.mark.anyio
+    async def test_collection_points_served_locally(self, snapshot_path):
+        live = MagicMock()
+        live.search_collection_points = AsyncMock()
+        client = LocalFirstCollectionPointClient(live, PublicDataSnapshotStore(snapshot_path))
+
+        response = await client.search_collection_points(address_keyword="강남구")
+        nearby = await client.get_nearby_collection_points(37.5172, 127.0473, radius_km=1.0)
+
+        assert [p.id for p in response.results] == [3]
+        assert response.query == {"address": "강남구"}
+        assert [p.id for p in nearby] == [3]
+        live.search_collection_points.assert_not_awaited()
+
+    @pytest.mark.anyio
+    async def test_falls_back_to_live_when_no_local_match(self, snapshot_path):
+        live = MagicMock()
+        live.search_disposal_info = AsyncMock(
+            return_value=WasteInfoSearchResponse(results=[DISPOSAL[0]], total_count=1)
+        )
+        client = LocalFirstBulkWasteClient(live, PublicDataSnapshotStore(snapshot_path))
+
+        response = await client.search_disposal_info(sigungu="해운대구")
+
+        assert response.total_count == 1
+        live.search_disposal_info.assert_awaited_once()
+
+    @pytest.mark.anyio
+    async def test_stale_snapshot_used_only_when_live_empty(self, snapshot_path):
+        live = MagicMock()
+        live.search_disposal_info = AsyncMock(return_value=WasteInfoSearchResponse())
+        store = PublicDataSnapshotStore(snapshot_path)
+        client = LocalFirstBulkWasteClient(live, store, max_age=0.0)
+        time.sleep(0.01)
+
+        response = await client.search_disposal_info(sigungu="강남구")
+
+        live.search_disposal_info.assert_awaited_once()
+        assert response.total_count == 2
+
+    @pytest.mark.anyio
+    async def test_falls_back_to_live_on_sqlite_error(self, tmp_path):
+        corrupt = tmp_path / "corrupt.sqlite"
+        corrupt.write_bytes(b"not a sqlite database" * 100)
+        live = MagicMock()
+        live.search_disposal_info = AsyncMock(
+            return_value=WasteInfoSearchResponse(results=[DISPOSAL[0]], total_count=1)
+        )
+        client = LocalFirstBulkWasteClient(live, PublicDataSnapshotStore(str(corrupt)))
+
+        response = await client.search_disposal_info(sigungu="강남구")
+
+        assert response.total_count == 1
+        live.search_disposal_info.assert_awaited_once()
+
+    @pytest.mark.anyio
+    async def test_freshness_check_does_not_block_event_loop(self, snapshot_path):
+        live = MagicMock()
+        store = PublicDataSnapshotStore(snapshot_path)
+        client = LocalFirstBulkWasteClient(live, store)
+
+        store._lock.acquire()  # 진행 중인 긴 스캔 흉내
+        try:
+            task = asyncio.ensure_future(client.search_disposal_info(sigungu="강남구"))
+            await asyncio.sleep(0.05)  # 루프가 막히면 여기서 진행 불가
+            assert not task.done()
+        finally:
+            store._lock.release()
+
+        response = await task
+        assert response.total_count == 2
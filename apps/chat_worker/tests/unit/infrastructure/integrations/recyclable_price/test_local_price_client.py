@@ -57,23 +57,23 @@ class TestLocalRecyclablePriceClient:
 
     def test_load_data_success(self, client: LocalRecyclablePriceClient):
         """데이터 로드 성공."""
-        client._load_data()
+        store = client._load_data()
 
-        assert client._raw_data is not None
-        assert len(client._items) > 0
-        assert len(client._synonym_index) > 0
+        assert store.raw_data
+        assert len(store.items) > 0
+        assert len(store.synonym_index) > 0
 
     def test_load_data_builds_indices(self, client: LocalRecyclablePriceClient):
         """인덱스 빌드 확인."""
-        client._load_data()
+        store = client._load_data()
 
         # 아이템 인덱스
-        assert "metal_aluminum_can" in client._item_index
-        assert "plastic_pet" in client._item_index
+        assert "metal_aluminum_can" in store.item_index
+        assert "plastic_pet" in store.item_index
 
         # 동의어 인덱스 (소문자)
-        assert "캔" in client._synonym_index
-        assert "페트" in client._synonym_index or "pet" in client._synonym_index
+        assert "캔" in store.synonym_index
+        assert "페트" in store.synonym_index or "pet" in store.synonym_index
 
     # ==========================================================
     # 품목 검색 테스트
@@ -291,3 +291,106 @@ class TestLocalRecyclablePriceClient:
         context_id = client.get_context_id("metal_aluminum_can")
 
         assert context_id == "recyclable_price:metal_aluminum_can"
+
+
+PRICE_YAML = """
+survey_info:
+  date: "{date}"
+categories:
+- id: metal
+  name: 폐금속류
+  items:
+  - id: metal_aluminum_can
+    name: 알루미늄캔
+    synonyms: [캔]
+    prices:
+      nationwide: {price}
+      capital: 1200
+"""
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCompiledPriceStore:
+    """사전 계산 뷰 / 핫 리로드 테스트."""
+
+    @pytest.fixture
+    def price_file(self, tmp_path: Path) -> Path:
+        path = tmp_path / "recyclable_prices.yaml"
+        path.write_text(PRICE_YAML.format(date="2025-01", price=1000), encoding="utf-8")
+        return path
+
+    def _rewrite(self, path: Path, date: str, price: int) -> None:
+        path.write_text(PRICE_YAML.format(date=date, price=price), encoding="utf-8")
+
+    @pytest.mark.anyio
+    async def test_precomputed_context_matches_service_format(self):
+        """미리 포맷한 context는 Service 포맷과 동일."""
+        from dataclasses import replace
+
+        from chat_worker.application.services.recyclable_price_service import (
+            RecyclablePriceService,
+        )
+
+        client = LocalRecyclablePriceClient()
+        for response in (
+            await client.search_price("캔", region=RecyclableRegion.CAPITAL),
+            await client.get_category_prices(RecyclableCategory.PLASTIC),
+            await client.get_all_prices(region=RecyclableRegion.GYEONGNAM),
+        ):
+            assert response.context
+            expected = RecyclablePriceService.build_context_string(replace(response, context=None))
+            assert response.context == expected
+
+    @pytest.mark.anyio
+    async def test_category_view_is_shared_snapshot(self):
+        """카테고리 뷰는 조회마다 다시 만들지 않음."""
+        client = LocalRecyclablePriceClient()
+        first = await client.get_category_prices(RecyclableCategory.METAL)
+        second = await client.get_category_prices(RecyclableCategory.METAL)
+
+        assert first.items is not second.items
+        assert all(a is b for a, b in zip(first.items, second.items))
+
+    @pytest.mark.anyio
+    async def test_hot_reload_on_change(self, price_file: Path):
+        """확인 주기가 지나면 변경된 파일로 스냅샷 교체."""
+        clock = FakeClock()
+        client = LocalRecyclablePriceClient(data_path=price_file, reload_interval=60, clock=clock)
+        assert (await client.search_price("캔")).items[0].price_per_kg == 1000
+
+        self._rewrite(price_file, "2025-02", 1100)
+        clock.now = 30
+        assert (await client.search_price("캔")).items[0].price_per_kg == 1000
+
+        clock.now = 61
+        response = await client.search_price("캔")
+        assert response.items[0].price_per_kg == 1100
+        assert response.survey_date == "2025-02"
+
+    @pytest.mark.anyio
+    async def test_unchanged_content_keeps_snapshot(self, price_file: Path):
+        """내용이 같으면 (touch) 재컴파일하지 않음."""
+        client = LocalRecyclablePriceClient(data_path=price_file, reload_interval=0)
+        store = client._load_data()
+
+        self._rewrite(price_file, "2025-01", 1000)
+
+        assert client._load_data() is store
+
+    @pytest.mark.anyio
+    async def test_invalid_file_keeps_previous_snapshot(self, price_file: Path):
+        """파싱 실패 시 이전 스냅샷 유지."""
+        client = LocalRecyclablePriceClient(data_path=price_file, reload_interval=0)
+        await client.search_price("캔")
+
+        price_file.write_text("categories: [unclosed", encoding="utf-8")
+
+        response = await client.search_price("캔")
+        assert response.items[0].price_per_kg == 1000
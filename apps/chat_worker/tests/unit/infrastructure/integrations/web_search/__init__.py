@@ -0,0 +1 @@
+"""Web Search Integration Tests."""
@@ -0,0 +1,187 @@
+"""CachedWebSearchClient / BoundedSearchExecutor 단위 테스트."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any
+
+import pytest
+
+from chat_worker.application.ports.web_search import (
+    SearchResult,
+    WebSearchPort,
+    WebSearchResponse,
+)
+from chat_worker.infrastructure.integrations.web_search import (
+    BoundedSearchExecutor,
+    CachedWebSearchClient,
+    SearchExecutorSaturated,
+)
+from chat_worker.infrastructure.integrations.web_search.cached_search import normalize_query
+
+
+class FakeSearchClient(WebSearchPort):
+    """호출 수를 기록하는 가짜 검색 클라이언트."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls: list[str] = []
+        self.empty = False
+
+    async def search(self, query, max_results=5, region="kr-kr", time_range="all"):
+        self.calls.append(query)
+        await asyncio.sleep(self.delay)
+        if self.empty:
+            return WebSearchResponse(query=query, search_engine="fake")
+        result = SearchResult(title=f"v{len(self.calls)}", url="https://a.kr", snippet="")
+        return WebSearchResponse(
+            query=query, results=[result], total_results=1, search_engine="fake"
+        )
+
+    async def search_news(self, query, max_results=5, region="kr-kr"):
+        return await self.search(query, max_results, region, "day")
+
+
+class FakeCache:
+    def __init__(self):
+        self.data: dict[str, dict[str, Any]] = {}
+
+    async def get_json(self, key: str) -> dict[str, Any] | None:
+        return self.data.get(key)
+
+    async def set_json(self, key: str, value: dict[str, Any], ttl: int | None = None) -> bool:
+        self.data[key] = value
+        return True
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCachedWebSearchClient:
+    """질의 캐시 테스트."""
+
+    def test_normalize_query(self):
+        assert normalize_query("  분리배출   정책 변경?? ") == "분리배출 정책 변경"
+        assert normalize_query("ＰＥＴ 병") == "pet 병"
+
+    @pytest.mark.anyio
+    async def test_normalized_queries_share_entry(self):
+        inner = FakeSearchClient()
+        client = CachedWebSearchClient(inner, clock=Clock())
+
+        first = await client.search("분리배출 정책 변경", time_range="week")
+        second = await client.search("분리배출  정책 변경?", time_range="week")
+
+        assert inner.calls == ["분리배출 정책 변경"]
+        assert second.results == first.results
+        assert second.query == "분리배출  정책 변경?"
+
+    @pytest.mark.anyio
+    async def test_stale_while_revalidate(self):
+        inner = FakeSearchClient()
+        clock = Clock()
+        client = CachedWebSearchClient(inner, clock=clock)
+        await client.search("q", time_range="day")
+
+        clock.now += 601  # fresh 10분 경과, stale 허용 구간
+        stale = await client.search("q", time_range="day")
+        await asyncio.sleep(0.01)  # 백그라운드 갱신 완료
+        refreshed = await client.search("q", time_range="day")
+
+        assert stale.results[0].title == "v1"
+        assert refreshed.results[0].title == "v2"
+        assert len(inner.calls) == 2
+
+        clock.now += 600 + 1800 + 1  # stale 허용도 지나면 동기 조회
+        expired = await client.search("q", time_range="day")
+        assert expired.results[0].title == "v3"
+
+    @pytest.mark.anyio
+    async def test_single_flight_and_empty_not_cached(self):
+        inner = FakeSearchClient(delay=0.01)
+        client = CachedWebSearchClient(inner, clock=Clock())
+
+        await asyncio.gather(*(client.search_news("속보") for _ in range(5)))
+        assert len(inner.calls) == 1
+
+        inner.empty = True
+        await client.search("없는 질의")
+        await client.search("없는 질의")
+        assert inner.calls.count("없는 질의") == 2
+
+    @pytest.mark.anyio
+    async def test_shared_cache_across_replicas(self):
+        cache = FakeCache()
+        clock = Clock()
+        await CachedWebSearchClient(FakeSearchClient(), cache=cache, clock=clock).search("q")
+
+        other = FakeSearchClient()
+        response = await CachedWebSearchClient(other, cache=cache, clock=clock).search("q")
+
+        assert other.calls == []
+        assert response.results[0].title == "v1"
+
+    @pytest.mark.anyio
+    async def test_shared_cache_load_respects_max_entries(self):
+        cache = FakeCache()
+        clock = Clock()
+        writer = CachedWebSearchClient(FakeSearchClient(), cache=cache, clock=clock)
+        for query in ("a", "b", "c"):
+            await writer.search(query)
+
+        reader = CachedWebSearchClient(FakeSearchClient(), cache=cache, max_entries=2, clock=clock)
+        for query in ("a", "b", "c"):
+            await reader.search(query)
+
+        assert len(reader._entries) == 2
+
+
+class TestBoundedSearchExecutor:
+    """전용 thread pool 테스트."""
+
+    @pytest.mark.anyio
+    async def test_rejects_when_queue_full(self):
+        executor = BoundedSearchExecutor(max_workers=1, max_queue=1)
+        gate = threading.Event()
+
+        running = asyncio.ensure_future(executor.run(gate.wait, 1.0))
+        await asyncio.sleep(0.05)  # 첫 작업이 스레드에서 실행 시작
+        queued = asyncio.ensure_future(executor.run(lambda: "ok"))
+        await asyncio.sleep(0)
+
+        assert (executor.active, executor.queued) == (1, 1)
+        with pytest.raises(SearchExecutorSaturated):
+            await executor.run(lambda: "rejected")
+
+        gate.set()
+        assert await queued == "ok"
+        await running
+        assert (executor.active, executor.queued) == (0, 0)
+        executor.shutdown()
+
+    @pytest.mark.anyio
+    async def test_cancelled_caller_keeps_active_until_thread_finishes(self):
+        executor = BoundedSearchExecutor(max_workers=1, max_queue=1)
+        gate = threading.Event()
+
+        running = asyncio.ensure_future(executor.run(gate.wait, 1.0))
+        await asyncio.sleep(0.05)
+        queued = asyncio.ensure_future(executor.run(lambda: "never"))
+        await asyncio.sleep(0)
+        running.cancel()
+        queued.cancel()
+        await asyncio.gather(running, queued, return_exceptions=True)
+
+        # 스레드는 아직 실행 중, 대기 작업은 취소로 빠짐
+        assert (executor.active, executor.queued) == (1, 0)
+
+        gate.set()
+        await asyncio.sleep(0.05)
+        assert (executor.active, executor.queued) == (0, 0)
+        executor.shutdown()
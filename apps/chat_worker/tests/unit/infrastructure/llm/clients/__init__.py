@@ -0,0 +1 @@
+"""LLM client unit tests."""
@@ -0,0 +1,59 @@
+"""AdmissionControlledLLMClient 단위 테스트."""
+
+from __future__ import annotations
+
+from typing import TypedDict
+
+import pytest
+from langgraph.graph import END, START, StateGraph
+
+from chat_worker.infrastructure.llm.clients.admission_client import (
+    AdmissionControlledLLMClient,
+    current_llm_priority,
+)
+from chat_worker.infrastructure.orchestration.langgraph.priority import Priority
+from chat_worker.infrastructure.ratelimit.llm_admission import LLMAdmissionController
+
+
+class _State(TypedDict):
+    priority: int
+
+
+class FakeLLM:
+    async def generate(self, prompt, **kwargs):
+        return current_llm_priority()
+
+
+async def _run_in_node(node_name: str, client) -> int:
+    async def node(state):
+        return {"priority": await client.generate("q")}
+
+    graph = StateGraph(_State)
+    graph.add_node(node_name, node)
+    graph.add_edge(START, node_name)
+    graph.add_edge(node_name, END)
+    result = await graph.compile().ainvoke({"priority": -1})
+    return result["priority"]
+
+
+class TestAdmissionControlledLLMClient:
+    """노드 기반 우선순위 + 승인 경유 테스트."""
+
+    @pytest.mark.anyio
+    async def test_priority_resolved_from_langgraph_node(self):
+        """호출 노드로 우선순위 결정 (answer > weather, 그래프 밖은 NORMAL)."""
+        client = AdmissionControlledLLMClient(FakeLLM(), LLMAdmissionController(None))
+
+        assert await _run_in_node("answer", client) == Priority.CRITICAL
+        assert await _run_in_node("weather", client) == Priority.LOW
+        assert await client.generate("q") == Priority.NORMAL
+
+    @pytest.mark.anyio
+    async def test_admit_exposed_for_direct_streaming(self):
+        """LangChain astream 경로용 admit()이 슬롯을 점유/반납."""
+        controller = LLMAdmissionController(None)
+        client = AdmissionControlledLLMClient(FakeLLM(), controller)
+
+        async with client.admit():
+            assert controller.in_flight == 1
+        assert controller.in_flight == 0
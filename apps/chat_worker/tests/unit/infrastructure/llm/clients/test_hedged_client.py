@@ -0,0 +1,150 @@
+"""HedgedLLMClient 단위 테스트 (느린 가짜 provider)."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from pydantic import BaseModel
+
+from chat_worker.infrastructure.llm.clients.hedged_client import (
+    HedgedLLMClient,
+    HedgingPolicy,
+)
+
+
+class IntentResult(BaseModel):
+    intent: str
+
+
+class FakeProvider:
+    """호출마다 지정된 지연/실패를 적용하는 가짜 LLM provider."""
+
+    def __init__(self, name: str, delays: list[float], fail: bool = False):
+        self.name = name
+        self.delays = list(delays)
+        self.fail = fail
+        self.calls = 0
+        self.cancelled = 0
+
+    async def generate_structured(self, prompt, response_schema, **kwargs):
+        delay = self.delays[min(self.calls, len(self.delays) - 1)]
+        self.calls += 1
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.fail:
+            raise ConnectionError(f"{self.name} unavailable")
+        return response_schema(intent=self.name)
+
+    def get_langchain_llm(self):
+        return "langchain-llm"
+
+
+def _policy(**overrides) -> HedgingPolicy:
+    options = dict(
+        initial_delay=0.05,
+        min_delay=0.01,
+        max_delay=0.5,
+        budget_ratio=1.0,
+        budget_burst=1.0,
+        max_call_seconds=2.0,
+    )
+    options.update(overrides)
+    return HedgingPolicy(**options)
+
+
+class TestHedgedLLMClient:
+    """Hedging 경합 테스트."""
+
+    @pytest.mark.anyio
+    async def test_fast_primary_does_not_hedge(self):
+        """deadline 안에 응답하면 hedge 요청 없음."""
+        primary = FakeProvider("primary", [0.0])
+        hedge = FakeProvider("hedge", [0.0])
+        client = HedgedLLMClient(primary, hedge=hedge, policy=_policy())
+
+        result = await client.generate_structured("q", IntentResult)
+
+        assert result.intent == "primary"
+        assert hedge.calls == 0
+
+    @pytest.mark.anyio
+    async def test_slow_primary_loses_to_hedge_and_is_cancelled(self):
+        """deadline 초과 시 hedge 발행, 먼저 온 응답 채택 + 느린 요청 취소."""
+        primary = FakeProvider("primary", [1.0])
+        hedge = FakeProvider("hedge", [0.0])
+        client = HedgedLLMClient(primary, hedge=hedge, policy=_policy())
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        result = await client.generate_structured("q", IntentResult)
+        await asyncio.sleep(0)
+
+        assert result.intent == "hedge"
+        assert loop.time() - started < 0.5
+        assert primary.cancelled == 1
+
+    @pytest.mark.anyio
+    async def test_primary_failure_triggers_hedge_immediately(self):
+        """primary가 deadline 전에 실패하면 즉시 hedge."""
+        primary = FakeProvider("primary", [0.0], fail=True)
+        hedge = FakeProvider("hedge", [0.0])
+        client = HedgedLLMClient(primary, hedge=hedge, policy=_policy(initial_delay=0.5))
+
+        result = await client.generate_structured("q", IntentResult)
+
+        assert result.intent == "hedge"
+
+    @pytest.mark.anyio
+    async def test_both_fail_raises_primary_error(self):
+        """모든 요청 실패 시 primary 예외 전파."""
+        primary = FakeProvider("primary", [0.0], fail=True)
+        hedge = FakeProvider("hedge", [0.0], fail=True)
+        client = HedgedLLMClient(primary, hedge=hedge, policy=_policy())
+
+        with pytest.raises(ConnectionError, match="primary"):
+            await client.generate_structured("q", IntentResult)
+
+    @pytest.mark.anyio
+    async def test_budget_exhausted_waits_for_primary(self):
+        """hedge 예산 소진 시 추가 요청 없이 primary 대기."""
+        primary = FakeProvider("primary", [0.1])
+        hedge = FakeProvider("hedge", [0.0])
+        client = HedgedLLMClient(
+            primary, hedge=hedge, policy=_policy(budget_ratio=0.0, budget_burst=1.0)
+        )
+
+        first = await client.generate_structured("q", IntentResult)
+        second = await client.generate_structured("q", IntentResult)
+
+        assert first.intent == "hedge"  # 초기 burst 1회 사용
+        assert second.intent == "primary"
+        assert hedge.calls == 1
+
+    @pytest.mark.anyio
+    async def test_max_call_seconds_caps_total_wait(self):
+        """호출 1회 총 대기 상한 초과 시 TimeoutError."""
+        primary = FakeProvider("primary", [1.0])
+        hedge = FakeProvider("hedge", [1.0])
+        client = HedgedLLMClient(primary, hedge=hedge, policy=_policy(max_call_seconds=0.1))
+
+        with pytest.raises(asyncio.TimeoutError):
+            await client.generate_structured("q", IntentResult)
+
+    def test_deadline_tracks_primary_p95(self):
+        """표본이 쌓이면 p95를 deadline으로 사용 (clamp 적용)."""
+        policy = _policy(initial_delay=1.0, min_delay=0.01, max_delay=0.5)
+        assert policy.deadline("IntentResult") == 0.5  # 표본 부족 → initial (clamp)
+
+        for i in range(100):
+            policy.observe("IntentResult", 0.1 if i < 95 else 0.3)
+        assert policy.deadline("IntentResult") == pytest.approx(0.1)
+
+    def test_delegates_unknown_attributes_to_primary(self):
+        """get_langchain_llm 등 구현체 속성은 primary로 위임."""
+        client = HedgedLLMClient(FakeProvider("primary", [0.0]))
+
+        assert client.get_langchain_llm() == "langchain-llm"
@@ -86,6 +86,78 @@ class TestAnswerNodeBasic:
         assert result["answer"] == "안녕하세요!"
         assert mock_llm.call_count == 1
 
+    @pytest.mark.asyncio
+    async def test_tokens_published_in_order_before_finalize(self, mock_llm: MockLLMClient):
+        """백그라운드 writer 발행: 모든 토큰이 순서대로 발행된 뒤 finalize."""
+        mock_llm.set_responses(["안녕하세요!"])
+        events: list[tuple[str, str]] = []
+
+        class RecordingPublisher:
+            async def notify_token_v2(self, task_id, content, node=None):
+                events.append(("token", content))
+                return "1-0"
+
+            async def finalize_token_stream(self, task_id):
+                events.append(("finalize", task_id))
+
+        node = create_answer_node(mock_llm, event_publisher=RecordingPublisher())
+
+        result = await node({"job_id": "test-job-2", "message": "안녕", "intent": "general"})
+
+        assert result["answer"] == "안녕하세요!"
+        assert events[-1] == ("finalize", "test-job-2")
+        assert "".join(content for kind, content in events[:-1]) == "안녕하세요!"
+
+
+class TestAnswerCacheReplay:
+    """Answer 캐시 히트 재생 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_replays_tokens_without_llm(self):
+        """두 번째 동일 요청은 LLM 없이 캐시 답변을 토큰 스트림으로 재생."""
+        store: dict[str, str] = {}
+        published: list[str] = []
+
+        class DictCache:
+            async def get(self, key):
+                return store.get(key)
+
+            async def set(self, key, value, ttl=None):
+                store[key] = value
+                return True
+
+        class RecordingPublisher:
+            async def notify_token_v2(self, task_id, content, node=None):
+                published.append(content)
+                return "1-0"
+
+            async def finalize_token_stream(self, task_id):
+                pass
+
+        llm = MockLLMClient()
+        llm.set_responses(["스티로폼은 깨끗이 버려요."])
+        node = create_answer_node(
+            llm,
+            event_publisher=RecordingPublisher(),
+            cache=DictCache(),
+            replay_chunk_chars=3,
+            replay_interval=0,
+        )
+        state = {
+            "job_id": "job-1",
+            "message": "스티로폼 어떻게 버려?",
+            "intent": "waste",
+            "disposal_rules": {"data": {"category": "스티로폼"}},
+        }
+
+        first = await node(state)
+        published.clear()
+        second = await node({**state, "job_id": "job-2"})
+
+        assert llm.call_count == 1
+        assert second["answer"] == first["answer"] == "스티로폼은 깨끗이 버려요."
+        assert "".join(published) == "스티로폼은 깨끗이 버려요."
+
 
 class TestMultiIntentAnswer:
     """P2: Multi-Intent Policy 조합 주입 테스트."""
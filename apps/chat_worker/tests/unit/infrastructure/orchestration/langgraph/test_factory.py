@@ -0,0 +1,37 @@
+"""create_chat_graph 조립 단위 테스트."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from chat_worker.infrastructure.orchestration.langgraph import factory
+
+
+class StopBuild(Exception):
+    """intent 노드 생성 시점에서 조립 중단."""
+
+
+@pytest.mark.parametrize("use_intent_llm", [True, False])
+def test_intent_node_gets_intent_llm(monkeypatch, use_intent_llm):
+    """hedging 클라이언트(intent_llm)는 의도 분류 노드에만 전달."""
+    llm, intent_llm = MagicMock(name="llm"), MagicMock(name="intent_llm")
+    received = []
+
+    def create_intent_node(node_llm, *args, **kwargs):
+        received.append(node_llm)
+        raise StopBuild
+
+    monkeypatch.setattr(factory, "create_intent_node", create_intent_node)
+
+    with pytest.raises(StopBuild):
+        factory.create_chat_graph(
+            llm=llm,
+            retriever=MagicMock(),
+            event_publisher=MagicMock(),
+            prompt_loader=MagicMock(),
+            intent_llm=intent_llm if use_intent_llm else None,
+        )
+
+    assert received == [intent_llm if use_intent_llm else llm]
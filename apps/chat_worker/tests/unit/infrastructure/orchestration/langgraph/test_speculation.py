@@ -0,0 +1,129 @@
+"""SpeculativePrefetcher 단위 테스트."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from chat_worker.infrastructure.cache import SemanticIntentCache
+from chat_worker.infrastructure.orchestration.langgraph.speculation import (
+    SpeculativePrefetcher,
+)
+
+
+def _prefetcher(**kwargs) -> tuple[SpeculativePrefetcher, list[str]]:
+    """waste_rag / character 조회를 기록하는 prefetcher."""
+    calls: list[str] = []
+    prefetcher = SpeculativePrefetcher(**kwargs)
+
+    async def fetch_rag(state):
+        calls.append("waste_rag")
+        await asyncio.sleep(0.01)
+        return {"rules": state["message"]}
+
+    async def fetch_character(state):
+        calls.append("character")
+        await asyncio.sleep(0.01)
+        return {"character": "페티"}
+
+    prefetcher.register("waste_rag", fetch_rag)
+    prefetcher.register("character", fetch_character)
+    return prefetcher, calls
+
+
+class TestPredict:
+    """예측 휴리스틱 테스트."""
+
+    @pytest.mark.anyio
+    async def test_keyword_prediction(self):
+        """분리배출 키워드 → waste_rag."""
+        prefetcher, _ = _prefetcher()
+        assert await prefetcher.predict({"message": "페트병 어떻게 버려?"}) == {"waste_rag"}
+
+    @pytest.mark.anyio
+    async def test_image_input_skipped(self):
+        """이미지 입력은 vision 결과에 의존하므로 예측 안함."""
+        prefetcher, _ = _prefetcher()
+        state = {"message": "이거 어떻게 버려?", "image_url": "https://x/y.png"}
+        assert await prefetcher.predict(state) == set()
+
+    @pytest.mark.anyio
+    async def test_semantic_cache_peek(self):
+        """유사 메시지 캐시의 Intent로 예측 보강 (통계 변화 없음)."""
+        cache = SemanticIntentCache(audit_rate=0.0)
+        await cache.store("페티 알려줘", "character", 0.9, False)
+        prefetcher, _ = _prefetcher(semantic_cache=cache)
+
+        assert "character" in await prefetcher.predict({"message": "페티 알려줘요"})
+        assert cache.get_stats()["exact"] == 0
+
+    @pytest.mark.anyio
+    async def test_unregistered_nodes_excluded(self):
+        """등록되지 않은 노드는 예측에서 제외."""
+        prefetcher = SpeculativePrefetcher()
+        assert await prefetcher.predict({"message": "페트병 어떻게 버려?"}) == set()
+
+
+class TestLifecycle:
+    """start → settle → take 흐름 테스트."""
+
+    @pytest.mark.anyio
+    async def test_hit_consumed_by_node(self):
+        """예측이 맞으면 노드가 선행 결과를 그대로 사용."""
+        prefetcher, calls = _prefetcher()
+        state = {"job_id": "job-1", "message": "페트병 어떻게 버려?"}
+
+        assert await prefetcher.start(state) == ["waste_rag"]
+        prefetcher.settle({**state, "intent": "waste"})
+        result = await prefetcher.take("job-1", "waste_rag")
+
+        assert result == {"rules": "페트병 어떻게 버려?"}
+        assert calls == ["waste_rag"]
+        assert prefetcher.pending_jobs() == 0
+
+    @pytest.mark.anyio
+    async def test_miss_cancelled_on_settle(self):
+        """예측이 틀리면 settle에서 취소, 노드는 직접 실행."""
+        prefetcher, _ = _prefetcher()
+        state = {"job_id": "job-2", "message": "페트병 어떻게 버려?"}
+
+        await prefetcher.start(state)
+        prefetcher.settle({**state, "intent": "location"})
+
+        assert prefetcher.pending_jobs() == 0
+        assert await prefetcher.take("job-2", "waste_rag") is None
+
+    @pytest.mark.anyio
+    async def test_additional_intents_keep_prefetch(self):
+        """additional_intents에 포함된 노드도 유지."""
+        prefetcher, _ = _prefetcher()
+        state = {"job_id": "job-3", "message": "페트병 버리고 캐릭터도 알려줘"}
+
+        assert await prefetcher.start(state) == ["character", "waste_rag"]
+        prefetcher.settle({**state, "intent": "waste", "additional_intents": ["character"]})
+
+        assert await prefetcher.take("job-3", "character") == {"character": "페티"}
+        assert await prefetcher.take("job-3", "waste_rag") is not None
+
+    @pytest.mark.anyio
+    async def test_failed_prefetch_falls_back(self):
+        """선행 조회 실패 시 None (노드가 직접 실행)."""
+        prefetcher = SpeculativePrefetcher()
+
+        async def failing(state):
+            raise RuntimeError("gRPC unavailable")
+
+        prefetcher.register("waste_rag", failing)
+        await prefetcher.start({"job_id": "job-4", "message": "분리배출 방법"})
+
+        assert await prefetcher.take("job-4", "waste_rag") is None
+
+    @pytest.mark.anyio
+    async def test_stale_jobs_swept(self):
+        """settle되지 않은 job은 TTL 후 정리."""
+        prefetcher, _ = _prefetcher(ttl=0.0)
+        await prefetcher.start({"job_id": "job-5", "message": "분리배출 방법"})
+        await prefetcher.start({"job_id": "job-6", "message": "안녕"})
+
+        assert prefetcher.pending_jobs() == 0
@@ -1,16 +1,23 @@
 """Summarization 단위 테스트.
 
-summarize_messages의 입력 크기 제한 검증.
+summarize_messages의 입력 크기 제한, SummarizationNode 증분 압축 검증.
 """
 
 from __future__ import annotations
 
+import sys
+from types import SimpleNamespace
 from unittest.mock import AsyncMock
 
 import pytest
-from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.messages import AIMessage, HumanMessage, RemoveMessage, SystemMessage
 
 from chat_worker.infrastructure.orchestration.langgraph.summarization import (
+    MESSAGE_TOKEN_OVERHEAD,
+    SUMMARY_MESSAGE_ID,
+    CachedTokenCounter,
+    SummarizationNode,
+    preload_tokenizer,
     summarize_messages,
 )
 
@@ -112,3 +119,119 @@ class TestSummarizeMessagesTruncation:
             existing_summary="fallback 요약",
         )
         assert result == "fallback 요약"
+
+
+class CountingEncoder:
+    """글자 수 = 토큰 수, 호출 횟수 기록."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, text: str) -> list[int]:
+        self.calls += 1
+        return [0] * len(text)
+
+
+def _turn(i: int) -> list:
+    return [HumanMessage(content="q" * 10, id=f"h{i}"), AIMessage(content="a" * 10, id=f"a{i}")]
+
+
+class TestCachedTokenCounter:
+    """메시지 id별 토큰 캐시 테스트."""
+
+    def test_counts_each_message_once(self):
+        encoder = CountingEncoder()
+        counter = CachedTokenCounter(encode=encoder)
+        messages = _turn(0) + _turn(1)
+
+        assert counter(messages) == 4 * (10 + MESSAGE_TOKEN_OVERHEAD)
+        counter(messages)
+
+        assert encoder.calls == 4
+
+    def test_content_change_recounts(self):
+        encoder = CountingEncoder()
+        counter = CachedTokenCounter(encode=encoder)
+
+        counter([SystemMessage(content="old", id=SUMMARY_MESSAGE_ID)])
+        tokens = counter([SystemMessage(content="new summary", id=SUMMARY_MESSAGE_ID)])
+
+        assert tokens == 11 + MESSAGE_TOKEN_OVERHEAD
+        assert encoder.calls == 2
+
+    def test_preload_tokenizer_loads_encoding(self, monkeypatch):
+        loaded: list[str] = []
+        monkeypatch.setitem(sys.modules, "tiktoken", SimpleNamespace(get_encoding=loaded.append))
+
+        assert preload_tokenizer() is True
+        assert loaded == ["o200k_base"]
+
+    def test_preload_tokenizer_failure_is_reported(self, monkeypatch):
+        def unavailable(name: str):
+            raise OSError("network unreachable")
+
+        monkeypatch.setitem(sys.modules, "tiktoken", SimpleNamespace(get_encoding=unavailable))
+
+        assert preload_tokenizer() is False
+
+
+class TestIncrementalSummarizationNode:
+    """누적 토큰 수 + cursor 기반 증분 압축 테스트."""
+
+    def _node(self, encoder: CountingEncoder, threshold: int = 10_000) -> SummarizationNode:
+        return SummarizationNode(
+            llm=MockLLM("새 요약"),
+            token_counter=CachedTokenCounter(encode=encoder),
+            max_tokens_before_summary=threshold,
+            keep_recent_messages=2,
+        )
+
+    @pytest.mark.anyio
+    async def test_counts_only_messages_after_cursor(self):
+        """매 턴 새 메시지만 토큰화 (프로세스 캐시가 비어 있어도)."""
+        encoder = CountingEncoder()
+        history = [m for i in range(50) for m in _turn(i)]
+        state = {
+            "messages": history + _turn(50),
+            "context_token_count": 1400,
+            "context_token_cursor": history[-1].id,
+        }
+
+        update = await self._node(encoder)(state)
+
+        assert update["context_token_count"] == 1400 + 2 * (10 + MESSAGE_TOKEN_OVERHEAD)
+        assert update["context_token_cursor"] == "a50"
+        assert encoder.calls == 2
+
+    @pytest.mark.anyio
+    async def test_missing_cursor_recounts_everything(self):
+        encoder = CountingEncoder()
+        state = {
+            "messages": _turn(0) + _turn(1),
+            "context_token_count": 999,
+            "context_token_cursor": "gone",
+        }
+
+        update = await self._node(encoder)(state)
+
+        assert update["context_token_count"] == 4 * (10 + MESSAGE_TOKEN_OVERHEAD)
+
+    @pytest.mark.anyio
+    async def test_compaction_summarizes_only_new_messages(self):
+        """기존 요약 메시지는 재요약하지 않고, 누적 수는 압축 결과로 재설정."""
+        encoder = CountingEncoder()
+        node = self._node(encoder, threshold=50)
+        existing = SystemMessage(content="[이전 대화 요약]\nOLD_SUMMARY", id=SUMMARY_MESSAGE_ID)
+        messages = _turn(0) + [existing] + _turn(1) + _turn(2)
+
+        update = await node({"messages": messages, "summary": "OLD_SUMMARY"})
+
+        prompt = node.llm.last_prompt
+        assert prompt.count("OLD_SUMMARY") == 1  # existing_summary 섹션에만
+        removed = {m.id for m in update["messages"] if isinstance(m, RemoveMessage)}
+        assert removed == {"h0", "a0", "h1", "a1"}
+        assert update["summary"] == "새 요약"
+        assert update["context_token_cursor"] == "a2"
+        assert update["context_token_count"] == node.token_counter(
+            [update["messages"][-1], *_turn(2)]
+        )
@@ -0,0 +1,165 @@
+"""ToolCallMemo 단위 테스트."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from chat_worker.application.ports.kakao_local_client import KakaoPlaceDTO, KakaoSearchResponse
+from chat_worker.infrastructure.orchestration.langgraph.nodes.collection_point_agent_node import (
+    CollectionPointToolExecutor,
+)
+from chat_worker.infrastructure.orchestration.langgraph.nodes.weather_agent_node import (
+    WeatherToolExecutor,
+)
+from chat_worker.infrastructure.orchestration.langgraph.tool_memo import (
+    ToolCallMemo,
+    canonical_arguments,
+)
+
+
+class FakeResult:
+    def __init__(self, success: bool, data: Any = None):
+        self.success = success
+        self.data = data
+
+
+class FakeExecutor:
+    """호출을 기록하는 가짜 Tool 실행기."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.success = True
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+
+    async def execute(self, tool_name: str, arguments: dict[str, Any]) -> FakeResult:
+        self.calls.append((tool_name, arguments))
+        await asyncio.sleep(self.delay)
+        return FakeResult(self.success, {"n": len(self.calls)})
+
+    def helper(self) -> str:
+        return "delegated"
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCanonicalArguments:
+    """인자 정규화 테스트."""
+
+    def test_ignores_order_whitespace_none_and_number_form(self):
+        a = canonical_arguments({"query": " 강남역  카페", "radius": 500, "x": None})
+        b = canonical_arguments({"radius": 500.0, "query": "강남역 카페"})
+
+        assert a == b
+        assert a != canonical_arguments({"query": "강남역 카페", "radius": 1000})
+
+
+class TestToolCallMemo:
+    """Job 단위 메모 테스트."""
+
+    @pytest.mark.anyio
+    async def test_repeated_call_across_rounds_executes_once(self):
+        inner = FakeExecutor()
+        executor = ToolCallMemo().bind("job-1", inner)
+
+        first = await executor.execute("search_places", {"query": "강남역 카페"})
+        second = await executor.execute("search_places", {"query": "강남역  카페"})
+
+        assert first is second
+        assert len(inner.calls) == 1
+        assert executor.stats() == {"tool_calls": 2, "tool_calls_deduped": 1}
+        assert executor.helper() == "delegated"
+
+    @pytest.mark.anyio
+    async def test_concurrent_fanout_single_flight(self):
+        memo = ToolCallMemo()
+        inner = FakeExecutor(delay=0.01)
+        weather = memo.bind("job-1", inner)
+        collection = memo.bind("job-1", inner)
+
+        results = await asyncio.gather(
+            weather.execute("geocode", {"place_name": "강남역"}),
+            collection.execute("geocode", {"place_name": "강남역"}),
+        )
+
+        assert results[0] is results[1]
+        assert len(inner.calls) == 1
+        assert collection.stats()["tool_calls_deduped"] == 1
+
+    @pytest.mark.anyio
+    async def test_scoped_per_job(self):
+        memo = ToolCallMemo()
+        inner = FakeExecutor()
+
+        await memo.bind("job-1", inner).execute("geocode", {"place_name": "강남역"})
+        await memo.bind("job-2", inner).execute("geocode", {"place_name": "강남역"})
+
+        assert len(inner.calls) == 2
+
+    @pytest.mark.anyio
+    async def test_failed_result_not_memoized(self):
+        inner = FakeExecutor()
+        inner.success = False
+        executor = ToolCallMemo().bind("job-1", inner)
+
+        await executor.execute("get_weather", {"latitude": 37.5, "longitude": 127.0})
+        inner.success = True
+        retried = await executor.execute("get_weather", {"latitude": 37.5, "longitude": 127.0})
+
+        assert retried.success is True
+        assert len(inner.calls) == 2
+
+    @pytest.mark.anyio
+    async def test_expired_jobs_swept(self):
+        clock = Clock()
+        memo = ToolCallMemo(ttl=60, clock=clock)
+        inner = FakeExecutor()
+
+        await memo.bind("job-1", inner).execute("geocode", {"place_name": "강남역"})
+        clock.now = 61
+        await memo.bind("job-2", inner).execute("geocode", {"place_name": "강남역"})
+
+        assert memo.pending_jobs() == 1
+
+    @pytest.mark.anyio
+    async def test_geocode_shared_between_agent_executors(self):
+        kakao = MagicMock()
+        kakao.search_keyword = AsyncMock(
+            return_value=KakaoSearchResponse(
+                places=[
+                    KakaoPlaceDTO(
+                        id="1",
+                        place_name="강남역 2호선",
+                        category_name="",
+                        category_group_code="",
+                        category_group_name="",
+                        phone=None,
+                        address_name="서울 강남구 역삼동 858",
+                        road_address_name="서울 강남구 강남대로 396",
+                        x="127.0276",
+                        y="37.4979",
+                        place_url="",
+                    )
+                ]
+            )
+        )
+        memo = ToolCallMemo()
+        weather = memo.bind("job-1", WeatherToolExecutor(MagicMock(), kakao_client=kakao))
+        collection = memo.bind(
+            "job-1", CollectionPointToolExecutor(MagicMock(), kakao_client=kakao)
+        )
+
+        from_weather = await weather.execute("geocode", {"place_name": "강남역"})
+        from_collection = await collection.execute("geocode", {"place_name": "강남역"})
+
+        assert from_collection.data == from_weather.data
+        kakao.search_keyword.assert_awaited_once()
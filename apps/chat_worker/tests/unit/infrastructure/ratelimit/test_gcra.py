@@ -0,0 +1,183 @@
+"""GCRALimiter / RateLimiter 단위 테스트."""
+
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from chat_worker.infrastructure.ratelimit.gcra import GCRA_SCRIPT, GCRALimiter, RateLimit
+from chat_worker.infrastructure.ratelimit.redis_limiter import RateLimiter, RateLimitExceeded
+
+
+class FakeGCRARedis:
+    """GCRA_SCRIPT를 파이썬으로 재현한 가짜 Redis (시각 수동 제어)."""
+
+    def __init__(self):
+        self.now_ms = 1_000_000.0
+        self.data: dict[str, float] = {}
+        self.evals = 0
+
+    def register_script(self, script):
+        assert script == GCRA_SCRIPT
+        return self._run
+
+    async def _run(self, keys, args):
+        self.evals += 1
+        quantity, partial = int(args[0]), int(args[1]) == 1
+        now = self.now_ms
+        states = []
+        granted, denied = quantity, False
+        for i, key in enumerate(keys):
+            interval, burst = float(args[2 + i * 2]), float(args[3 + i * 2])
+            tat = max(self.data.get(key, now), now)
+            states.append((key, tat, interval, burst))
+            available = math.floor((now + interval * burst - tat) / interval + 1e-6)
+            if partial:
+                granted = min(granted, max(available, 0))
+            elif available < quantity:
+                denied = True
+        if denied or granted < 0:
+            granted = 0
+
+        result = []
+        for key, tat, interval, burst in states:
+            capacity = interval * burst
+            if granted > 0:
+                tat += interval * granted
+                self.data[key] = tat
+            remaining = max(0, math.floor((now + capacity - tat) / interval + 1e-6))
+            retry = 0
+            if granted == 0 and quantity > 0:
+                retry = max(0, math.ceil(tat + interval * quantity - capacity - now))
+            result += [granted, remaining, retry, max(0, math.ceil(tat - now))]
+        return result
+
+    async def unlink(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+    async def scan_iter(self, match):
+        for key in []:
+            yield key
+
+    def advance(self, seconds: float) -> None:
+        self.now_ms += seconds * 1000
+
+
+class TestGCRALimiter:
+    """GCRA 엔진 테스트."""
+
+    @pytest.mark.anyio
+    async def test_single_round_trip_and_refill(self):
+        """판정당 EVALSHA 1회, 한도 초과 시 retry_after 후 다시 허용."""
+        redis = FakeGCRARedis()
+        limiter = GCRALimiter(redis)
+        limit = RateLimit(key="u1", limit=3, period=3.0)
+
+        decisions = [await limiter.acquire(limit) for _ in range(4)]
+
+        assert [d.allowed for d in decisions] == [True, True, True, False]
+        assert decisions[2].remaining == 0
+        assert decisions[3].retry_after == pytest.approx(1.0)
+        assert redis.evals == 4
+
+        redis.advance(1.0)
+        assert (await limiter.acquire(limit)).allowed
+
+    @pytest.mark.anyio
+    async def test_acquire_many_is_all_or_nothing(self):
+        """여러 제한 중 하나라도 거부면 어느 것도 소비하지 않음."""
+        redis = FakeGCRARedis()
+        limiter = GCRALimiter(redis)
+        user = RateLimit(key="user:1", limit=10, period=60)
+        provider = RateLimit(key="provider:kma", limit=1, period=60)
+
+        first = await limiter.acquire_many([user, provider])
+        second = await limiter.acquire_many([user, provider])
+
+        assert all(d.allowed for d in first)
+        assert not any(d.allowed for d in second)
+        assert second[0].remaining == 9  # user 제한은 소비되지 않음
+        assert redis.evals == 2
+
+    @pytest.mark.anyio
+    async def test_peek_does_not_consume(self):
+        redis = FakeGCRARedis()
+        limiter = GCRALimiter(redis)
+        limit = RateLimit(key="u1", limit=2, period=2)
+
+        await limiter.peek(limit)
+        peeked = await limiter.peek(limit)
+
+        assert peeked.remaining == 2
+        assert "u1" not in redis.data
+
+    @pytest.mark.anyio
+    async def test_lease_serves_hot_key_locally(self):
+        """lease 모드: Redis에서 묶음으로 받아 로컬 소진, 부분 허용."""
+        redis = FakeGCRARedis()
+        limiter = GCRALimiter(redis, lease_ttl=10.0)
+        limit = RateLimit(key="hot", limit=6, period=6)
+
+        decisions = [await limiter.acquire_leased(limit, lease_size=4) for _ in range(7)]
+
+        assert [d.allowed for d in decisions] == [True] * 6 + [False]
+        assert redis.evals == 3  # 4개 lease → 남은 2개 부분 lease → 거부
+
+
+class TestRateLimiter:
+    """사용자 Rate Limiter (GCRA 엔진 사용) 테스트."""
+
+    @pytest.mark.anyio
+    async def test_never_exceeds_limit_in_any_window(self):
+        """burst 후 계속 요청해도 어떤 60초 구간에서도 limit 이하."""
+        redis = FakeGCRARedis()
+        limiter = RateLimiter(redis, limit=60, window=60, burst=10)
+
+        async def attempt() -> bool:
+            try:
+                await limiter.acquire("u1")
+                return True
+            except RateLimitExceeded:
+                return False
+
+        assert [await attempt() for _ in range(11)] == [True] * 10 + [False]
+
+        admitted = [0.0] * 10
+        for tick in range(1, 1800):  # 0.1초 간격, 3분
+            redis.advance(0.1)
+            if await attempt():
+                admitted.append(tick / 10)
+
+        for start in admitted:
+            assert len([t for t in admitted if start <= t < start + 60]) <= 60
+
+    @pytest.mark.anyio
+    async def test_acquire_raises_when_exceeded(self):
+        redis = FakeGCRARedis()
+        limiter = RateLimiter(redis, limit=2, window=60)
+
+        await limiter.acquire("u1")
+        info = await limiter.acquire("u1")
+        assert info.remaining == 0
+
+        with pytest.raises(RateLimitExceeded) as exc_info:
+            await limiter.acquire("u1")
+        assert exc_info.value.reset_after == 60
+        assert redis.evals == 3
+
+    @pytest.mark.anyio
+    async def test_check_and_headers(self):
+        redis = FakeGCRARedis()
+        limiter = RateLimiter(redis, limit=2, window=60)
+
+        await limiter.acquire("u1")
+        headers = await limiter.get_headers("u1")
+
+        assert headers == {
+            "X-RateLimit-Limit": "2",
+            "X-RateLimit-Remaining": "1",
+            "X-RateLimit-Reset": "60",
+        }
+        assert (await limiter.check("u2")).allowed
@@ -0,0 +1,216 @@
+"""LLMAdmissionController 단위 테스트."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+
+import pytest
+
+from chat_worker.infrastructure.orchestration.langgraph.priority import Priority
+from chat_worker.infrastructure.ratelimit.llm_admission import (
+    DRAIN_SCRIPT,
+    RESERVE_SCRIPT,
+    LLMAdmissionController,
+    LLMBudgetExhausted,
+    is_rate_limited,
+)
+
+
+class FakeScriptRedis:
+    """Lua token bucket을 파이썬으로 재현한 가짜 Redis (여러 replica가 공유)."""
+
+    def __init__(self, tokens: float | None = None):
+        self.tokens = tokens
+        self.ts = time.monotonic()
+        self.reserve_calls = 0
+
+    def register_script(self, script: str):
+        if script == RESERVE_SCRIPT:
+            return self._reserve
+        if script == DRAIN_SCRIPT:
+            return self._drain
+        raise AssertionError("unknown script")
+
+    async def _reserve(self, keys, args):
+        self.reserve_calls += 1
+        capacity, rate, requested, floor = (float(a) for a in args)
+        now = time.monotonic()
+        if self.tokens is None:
+            self.tokens = capacity
+        self.tokens = min(capacity, self.tokens + (now - self.ts) * rate)
+        self.ts = now
+        available = math.floor(self.tokens - floor)
+        granted = int(min(requested, available)) if available > 0 else 0
+        self.tokens -= granted
+        wait_ms = 0 if granted else math.ceil((floor + 1 - self.tokens) / rate * 1000)
+        return [granted, wait_ms]
+
+    async def _drain(self, keys, args):
+        self.tokens = 0
+        self.ts = time.monotonic()
+        return 1
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+
+class TestLLMAdmissionController:
+    """공유 예산 + AIMD 동시성 테스트."""
+
+    @pytest.mark.anyio
+    async def test_local_reservation_avoids_round_trip_per_call(self):
+        """batch 선예약: 호출마다 Redis 왕복하지 않음."""
+        redis = FakeScriptRedis()
+        controller = LLMAdmissionController(redis, rpm=600, burst=20, reserve_batch=4)
+
+        for _ in range(8):
+            async with controller.admit(Priority.HIGH):
+                pass
+
+        assert redis.reserve_calls == 2
+
+    @pytest.mark.anyio
+    async def test_budget_shared_across_replicas(self):
+        """replica 두 개가 같은 버킷을 나눠 씀."""
+        redis = FakeScriptRedis()
+        replica_a = LLMAdmissionController(redis, rpm=60, burst=4, reserve_batch=2, max_wait=0.05)
+        replica_b = LLMAdmissionController(redis, rpm=60, burst=4, reserve_batch=2, max_wait=0.05)
+
+        for controller in (replica_a, replica_b):
+            for _ in range(2):
+                async with controller.admit(Priority.HIGH):
+                    pass
+
+        assert redis.tokens < 1
+        started = time.monotonic()
+        async with replica_a.admit(Priority.HIGH):
+            pass
+        # 예산 소진 → max_wait 동안 대기 후 fail-open
+        assert time.monotonic() - started >= 0.04
+
+    @pytest.mark.anyio
+    async def test_low_priority_rejected_at_floor_while_critical_passes(self):
+        """잔량이 floor 이하면 낮은 우선순위만 대기 후 거부 (fail-open 없음)."""
+        redis = FakeScriptRedis(tokens=2)
+        controller = LLMAdmissionController(redis, rpm=1, burst=10, reserve_batch=1, max_wait=0.05)
+
+        started = time.monotonic()
+        async with controller.admit(Priority.CRITICAL):
+            pass
+        assert time.monotonic() - started < 0.04
+
+        started = time.monotonic()
+        with pytest.raises(LLMBudgetExhausted):
+            async with controller.admit(Priority.LOW):
+                pass
+        assert time.monotonic() - started >= 0.04
+        assert controller.in_flight == 0
+
+    @pytest.mark.anyio
+    async def test_reserved_permits_not_shared_across_floors(self):
+        """answer가 선예약한 permit을 낮은 우선순위가 floor 없이 쓰지 않음."""
+        redis = FakeScriptRedis(tokens=4)
+        controller = LLMAdmissionController(redis, rpm=1, burst=10, reserve_batch=4, max_wait=0.05)
+
+        async with controller.admit(Priority.CRITICAL):
+            pass  # 4개 예약, 3개 로컬 보관
+
+        with pytest.raises(LLMBudgetExhausted):
+            async with controller.admit(Priority.LOW):
+                pass
+
+        calls = redis.reserve_calls
+        async with controller.admit(Priority.CRITICAL):
+            pass
+        assert redis.reserve_calls == calls  # CRITICAL 몫은 로컬에 그대로 남아 있음
+
+    @pytest.mark.anyio
+    async def test_throttled_halves_limit_and_drains_bucket(self):
+        """429 수신: limit 절반 + 공유 버킷 비우기 (cooldown 내 1회만 감소)."""
+        redis = FakeScriptRedis()
+        controller = LLMAdmissionController(redis, initial_concurrency=16)
+
+        for _ in range(3):
+            with pytest.raises(RateLimitError):
+                async with controller.admit():
+                    raise RateLimitError("429 Too Many Requests")
+
+        assert controller.limit == 8
+        assert redis.tokens == 0
+        assert controller.in_flight == 0
+
+    @pytest.mark.anyio
+    async def test_additive_increase_on_fast_calls(self):
+        """목표 지연 이하 성공은 limit 가법 증가, 초과는 감소."""
+        controller = LLMAdmissionController(None, initial_concurrency=4, latency_target=1.0)
+
+        for _ in range(4):
+            controller.on_latency(0.1)
+        assert controller.limit == 4  # 4 + 4*(≈1/4) → 4.9
+
+        controller.on_latency(0.1)
+        assert controller.limit == 5
+
+        controller.on_latency(2.0)
+        assert controller.limit == 4
+
+    @pytest.mark.anyio
+    async def test_waiters_admitted_by_priority(self):
+        """슬롯이 부족하면 우선순위 순으로 승인 (answer > weather)."""
+        controller = LLMAdmissionController(None, initial_concurrency=1, min_concurrency=1)
+        order: list[str] = []
+        gate = asyncio.Event()
+
+        async def call(name: str, priority: int):
+            async with controller.admit(priority):
+                order.append(name)
+                await gate.wait()
+
+        holder = asyncio.create_task(call("holder", Priority.NORMAL))
+        await asyncio.sleep(0)
+        weather = asyncio.create_task(call("weather", Priority.LOW))
+        await asyncio.sleep(0)
+        answer = asyncio.create_task(call("answer", Priority.CRITICAL))
+        await asyncio.sleep(0)
+
+        gate.set()
+        await asyncio.gather(holder, weather, answer)
+
+        assert order == ["holder", "answer", "weather"]
+
+    @pytest.mark.anyio
+    async def test_redis_error_fails_open(self):
+        """Redis 오류 시 로컬 동시성만 적용하고 진행."""
+
+        class BrokenRedis:
+            def register_script(self, script):
+                async def run(keys, args):
+                    raise ConnectionError("redis down")
+
+                return run
+
+        controller = LLMAdmissionController(BrokenRedis())
+
+        async with controller.admit():
+            pass
+
+        assert controller.in_flight == 0
+
+
+def test_is_rate_limited():
+    assert is_rate_limited(RateLimitError("x"))
+    assert not is_rate_limited(Exception("upstream returned 429 in body"))
+    assert not is_rate_limited(TimeoutError("read timeout"))
+
+
+def test_is_rate_limited_http_status_error():
+    class Response:
+        status_code = 429
+
+    class HTTPStatusError(Exception):
+        response = Response()
+
+    assert is_rate_limited(HTTPStatusError("Too Many Requests"))
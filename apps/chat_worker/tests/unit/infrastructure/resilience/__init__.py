@@ -0,0 +1 @@
+"""Resilience unit tests."""
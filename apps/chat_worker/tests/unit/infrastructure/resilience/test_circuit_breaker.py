@@ -0,0 +1,170 @@
+"""DistributedCircuitBreaker / CircuitBreakerStateSync 단위 테스트."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from chat_worker.infrastructure.resilience.circuit_breaker import (
+    CIRCUIT_BREAKER_CHANNEL,
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitBreakerStateSync,
+    CircuitState,
+    DistributedCircuitBreaker,
+)
+
+
+class FakeRedis:
+    """RECORD_FAILURE_SCRIPT / pipeline / publish를 재현한 가짜 Redis (replica 공유)."""
+
+    def __init__(self):
+        self.data: dict[str, str] = {}
+        self.published: list[tuple[str, str]] = []
+        self.fail = False
+
+    def register_script(self, script):
+        async def record_failure(keys, args):
+            self._check()
+            failures_key, state_key = keys
+            threshold, _, _, opened_at, name, channel = args
+            count = int(self.data.get(failures_key, 0)) + 1
+            self.data[failures_key] = str(count)
+            if count >= int(threshold) and state_key not in self.data:
+                self.data[state_key] = str(opened_at)
+                self.published.append((channel, f"{name}|open|{opened_at}"))
+                return [count, 1]
+            return [count, 0]
+
+        return record_failure
+
+    async def get(self, key):
+        self._check()
+        return self.data.get(key)
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def _check(self):
+        if self.fail:
+            raise ConnectionError("redis down")
+
+
+class FakePipeline:
+    def __init__(self, redis: FakeRedis):
+        self._redis = redis
+        self._ops = []
+
+    def delete(self, *keys):
+        self._ops.append(lambda: [self._redis.data.pop(k, None) for k in keys])
+
+    def set(self, key, value, px=None):
+        self._ops.append(lambda: self._redis.data.__setitem__(key, value))
+
+    def publish(self, channel, message):
+        self._ops.append(lambda: self._redis.published.append((channel, message)))
+
+    async def execute(self):
+        self._redis._check()
+        for op in self._ops:
+            op()
+
+
+def _breaker(redis: FakeRedis, **kwargs) -> DistributedCircuitBreaker:
+    options = dict(name="weather", redis=redis, threshold=3, recovery_timeout=30.0)
+    options.update(kwargs)
+    return DistributedCircuitBreaker(**options)
+
+
+@pytest.fixture
+def registry():
+    CircuitBreakerRegistry.reset_instance()
+    yield CircuitBreakerRegistry()
+    CircuitBreakerRegistry.reset_instance()
+
+
+class TestDistributedCircuitBreaker:
+    """replica 간 상태 공유 테스트."""
+
+    @pytest.mark.anyio
+    async def test_failures_aggregate_across_replicas(self):
+        """replica별 실패가 합산되어 임계값 도달 시 OPEN 발행."""
+        redis = FakeRedis()
+        replica_a, replica_b = _breaker(redis), _breaker(redis)
+
+        await replica_a.record_failure()
+        await replica_b.record_failure()
+        assert replica_b.state == CircuitState.CLOSED
+
+        await replica_b.record_failure()
+
+        assert replica_b.state == CircuitState.OPEN
+        assert redis.published[0][0] == CIRCUIT_BREAKER_CHANNEL
+        assert redis.published[0][1].startswith("weather|open|")
+
+    @pytest.mark.anyio
+    async def test_peer_open_event_blocks_requests(self, registry):
+        """발행된 OPEN 이벤트를 받은 replica는 즉시 요청 거부."""
+        redis = FakeRedis()
+        registry.enable_distributed(redis)
+        local = registry.get("weather", threshold=3)
+        assert await local.allow_request() is True
+
+        sync = CircuitBreakerStateSync(redis, registry)
+        sync.handle_message(f"weather|open|{time.time()}".encode())
+
+        assert await local.allow_request() is False
+        assert local.retry_after() > 0
+
+    @pytest.mark.anyio
+    async def test_new_breaker_warms_from_shared_state(self):
+        """이벤트 이후 생성된 breaker도 첫 요청에서 OPEN 상태 반영."""
+        redis = FakeRedis()
+        redis.data["chat:cb:weather:state"] = repr(time.time())
+
+        late = _breaker(redis)
+
+        assert await late.allow_request() is False
+
+    @pytest.mark.anyio
+    async def test_half_open_success_closes_all_replicas(self, registry):
+        """복구 성공은 상태 키 삭제 + CLOSED 발행."""
+        redis = FakeRedis()
+        breaker = _breaker(redis, recovery_timeout=0.0)
+        breaker.apply_remote("open", time.time() - 1)
+        redis.data["chat:cb:weather:state"] = "1"
+
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert await breaker.allow_request() is True
+        await breaker.record_success()
+
+        assert breaker.state == CircuitState.CLOSED
+        assert "chat:cb:weather:state" not in redis.data
+        assert redis.published[-1][1].startswith("weather|closed|")
+
+    @pytest.mark.anyio
+    async def test_closed_allow_request_is_lock_free(self):
+        """CLOSED 상태 allow_request는 lock을 잡지 않음."""
+        breaker = CircuitBreaker("weather")
+        breaker._lock = None  # lock 사용 시 AttributeError
+
+        assert await breaker.allow_request() is True
+
+    @pytest.mark.anyio
+    async def test_redis_failure_falls_back_to_local(self):
+        """Redis 오류 시 로컬 Circuit Breaker로 동작."""
+        redis = FakeRedis()
+        redis.fail = True
+        breaker = _breaker(redis)
+
+        assert await breaker.allow_request() is True
+        for _ in range(3):
+            await breaker.record_failure()
+
+        assert breaker.state == CircuitState.OPEN
+
+    def test_malformed_event_ignored(self, registry):
+        sync = CircuitBreakerStateSync(FakeRedis(), registry)
+
+        sync.handle_message("garbage")
@@ -0,0 +1,176 @@
+"""SemanticRetriever / VectorIndex 단위 테스트."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from chat_worker.infrastructure.retrieval import (
+    SemanticRetriever,
+    TagBasedRetriever,
+    VectorIndex,
+)
+from chat_worker.infrastructure.retrieval.vector_index import chunk_regulations
+from chat_worker.infrastructure.retrieval.vectorizer import HashingNgramVectorizer
+
+
+@pytest.fixture(scope="module")
+def tag_retriever() -> TagBasedRetriever:
+    """실제 에셋 기반 태그 Retriever."""
+    return TagBasedRetriever()
+
+
+class TestHashingNgramVectorizer:
+    """HashingNgramVectorizer 테스트."""
+
+    def test_spacing_invariant(self):
+        """띄어쓰기가 달라도 n-gram 특징이 대부분 겹침."""
+        vectorizer = HashingNgramVectorizer()
+        a = vectorizer.transform_one("페트병 버리기")
+        b = vectorizer.transform_one("페트 병버리기")
+        assert float(a @ b) > 0.7
+
+    def test_l2_normalized(self):
+        """출력 벡터는 L2 정규화."""
+        vector = HashingNgramVectorizer().transform_one("스티로폼 상자")
+        assert np.linalg.norm(vector) == pytest.approx(1.0, rel=1e-5)
+
+    def test_empty_text(self):
+        """빈 텍스트는 영벡터."""
+        vector = HashingNgramVectorizer().transform_one("?!")
+        assert not vector.any()
+
+    def test_stable_hashing(self):
+        """해시 버킷이 프로세스와 무관하게 고정 (crc32)."""
+        vectorizer = HashingNgramVectorizer(dim=64)
+        assert vectorizer._bucket("페트") == vectorizer._bucket("페트")
+        assert 0 <= vectorizer._bucket("페트") < 64
+
+
+class TestVectorIndex:
+    """VectorIndex 테스트."""
+
+    @pytest.fixture
+    def documents(self) -> dict:
+        return {
+            "재활용폐기물_무색페트병": {
+                "이름": "무색페트병",
+                "배출방법_공통": ["라벨과 내용물을 제거하고 물로 헹군 후 압착"],
+                "배출불가_품목_안내": {"유색의 페트병": "플라스틱류로 배출"},
+            },
+            "대형폐기물": {
+                "이름": "대형폐기물",
+                "배출방법_공통": ["대형폐기물 스티커를 구매하여 부착 후 배출"],
+                "대상_설명": [],
+            },
+        }
+
+    def test_chunking(self, documents: dict):
+        """리스트 필드는 필드당, 딕셔너리 필드는 하위 키당 청크."""
+        chunks = chunk_regulations(documents, {"대형폐기물": ["소파", "침대"]})
+        ids = [c.chunk_id for c in chunks]
+
+        assert "재활용폐기물_무색페트병#배출방법_공통" in ids
+        assert "재활용폐기물_무색페트병#배출불가_품목_안내/유색의 페트병" in ids
+        assert "대형폐기물#품목_분류" in ids
+        # 빈 필드는 제외
+        assert "대형폐기물#대상_설명" not in ids
+
+    def test_search_ranks_relevant_chunk(self, documents: dict):
+        """관련 청크가 상위."""
+        index = VectorIndex.build(documents, item_classes={"대형폐기물": ["소파", "침대"]})
+        hits = index.search("소파 버리는 법", top_k=2)
+
+        assert hits[0].chunk.doc_key == "대형폐기물"
+        assert hits[0].score >= hits[-1].score
+
+    def test_save_and_load_roundtrip(self, documents: dict, tmp_path: Path):
+        """저장 후 로드해도 검색 결과 동일."""
+        index = VectorIndex.build(documents, item_classes={})
+        path = tmp_path / "index.npz"
+        index.save(path)
+
+        loaded = VectorIndex.load(path)
+        assert loaded.checksum == index.checksum
+        assert [c.chunk_id for c in loaded.chunks] == [c.chunk_id for c in index.chunks]
+        query = "라벨 제거"
+        assert [h.chunk.chunk_id for h in loaded.search(query)] == [
+            h.chunk.chunk_id for h in index.search(query)
+        ]
+
+
+class TestSemanticRetriever:
+    """SemanticRetriever 테스트 (실제 에셋)."""
+
+    @pytest.fixture
+    def retriever(self, tag_retriever: TagBasedRetriever) -> SemanticRetriever:
+        return SemanticRetriever(
+            index_path="/nonexistent/index.npz",
+            tag_retriever=tag_retriever,
+        )
+
+    def test_paraphrase_found_without_tags(
+        self, retriever: SemanticRetriever, tag_retriever: TagBasedRetriever
+    ):
+        """태그가 안 걸리는 표현도 의미 검색으로 규정을 찾음."""
+        message = "침대 매트리스 버리는 법"
+        assert tag_retriever.search_with_context(message) == []
+
+        results = retriever.search_with_context(message)
+        assert results
+        assert "대형폐기물" in [r.chunk_id for r in results[:3]]
+
+    def test_tag_results_preserved_in_hybrid(self, retriever: SemanticRetriever):
+        """태그 매칭 결과는 그대로 유지 (matched_tags 포함)."""
+        results = retriever.search_with_context("우유팩 씻어서 버려야 해?")
+
+        tagged = [r for r in results if r.matched_tags]
+        assert tagged
+        assert results[0].chunk_id == "재활용폐기물_종이팩"
+
+    def test_semantic_only_mode(self, tag_retriever: TagBasedRetriever):
+        """hybrid=False면 의미 검색 결과만."""
+        retriever = SemanticRetriever(
+            index_path="/nonexistent/index.npz",
+            tag_retriever=tag_retriever,
+            hybrid=False,
+        )
+        results = retriever.search_with_context("우유팩 씻어서 버려야 해?")
+
+        assert results
+        assert all(r.matched_tags == [] for r in results)
+        assert all(r.quoted_text for r in results)
+
+    def test_top_k_limit(self, tag_retriever: TagBasedRetriever):
+        """결과 수는 top_k 이하."""
+        retriever = SemanticRetriever(
+            index_path="/nonexistent/index.npz",
+            tag_retriever=tag_retriever,
+            top_k=2,
+        )
+        assert len(retriever.search_with_context("플라스틱 용기 씻어서 버려")) <= 2
+
+    def test_loads_offline_index(self, tag_retriever: TagBasedRetriever, tmp_path: Path):
+        """체크섬이 맞는 오프라인 인덱스를 재사용."""
+        path = tmp_path / "regulation_vectors.npz"
+        VectorIndex.build(tag_retriever.documents).save(path)
+
+        retriever = SemanticRetriever(index_path=path, tag_retriever=tag_retriever)
+        assert retriever._index.checksum == VectorIndex.load(path).checksum
+
+    def test_stale_offline_index_rebuilt(self, tag_retriever: TagBasedRetriever, tmp_path: Path):
+        """원본과 체크섬이 다르면 메모리 재빌드."""
+        path = tmp_path / "regulation_vectors.npz"
+        VectorIndex.build({"다른문서": {"배출방법_공통": ["x"]}}).save(path)
+
+        retriever = SemanticRetriever(index_path=path, tag_retriever=tag_retriever)
+        assert len(retriever._index) > 1
+
+    def test_delegates_port_methods(self, retriever: SemanticRetriever):
+        """기본 Port 메서드는 태그 Retriever에 위임."""
+        assert retriever.get_all_categories()
+        assert retriever.search("대형") is not None
+        assert json.dumps(retriever.search_by_keyword("페트병"), ensure_ascii=False)
@@ -0,0 +1,206 @@
+"""TagBasedRetriever 단위 테스트.
+
+역색인(RegulationIndex) 도입 전 구현(매 쿼리 json.dumps + 부분 문자열 검색)을
+레퍼런스로 두고 실제 규정 에셋에서 결과가 동일한지 검증하는 골든 테스트.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import pytest
+
+from chat_worker.infrastructure.retrieval import (
+    LocalAssetRetriever,
+    RegulationIndex,
+    TagBasedRetriever,
+)
+
+GOLDEN_QUERIES = [
+    "페트병 어떻게 버려?",
+    "스티로폼 버리는 법 알려줘",
+    "깨진 유리병은 어디에 버려?",
+    "다 쓴 건전지 버리는 곳",
+    "냉장고 버리고 싶어",
+    "라면 봉지 분리수거",
+    "음식물 쓰레기에 뼈 넣어도 돼?",
+    "형광등 깨졌어",
+    "우유팩이랑 종이컵",
+    "헌 옷 버리기",
+    "인테리어 공사 폐기물",
+    "우유팩 씻어서 버려야 해?",
+    "종이컵이랑 신문지",
+    "음료PET병 라벨",
+    "PP용기 기름기 오염 심해",
+    "깨진유리 조각",
+    "내용물 있음",
+    "안녕",
+    "",
+]
+
+GOLDEN_KEYWORDS = ["페트병", "플라스틱", "비닐", "형광등", "재활용", "PET", "xyz없음", ""]
+
+
+def _reference_quote(data: dict, tags: list[str]) -> str:
+    """기존 _extract_relevant_quote 구현."""
+    priority_fields = ["배출방법_공통", "배출불가_품목_안내", "대상_설명", "아이콘_절차"]
+
+    for field_name in priority_fields:
+        field_data = data.get(field_name)
+
+        if isinstance(field_data, list) and field_data:
+            for item in field_data:
+                if isinstance(item, str):
+                    for tag in tags:
+                        if tag.lower() in item.lower():
+                            return item[:80] + ("..." if len(item) > 80 else "")
+            return str(field_data[0])[:80]
+
+        elif isinstance(field_data, dict):
+            for tag in tags:
+                for k, v in field_data.items():
+                    if tag.lower() in k.lower():
+                        return f"{k}: {v}"[:80]
+
+    return ""
+
+
+def _reference_search_by_keyword(
+    documents: dict[str, dict], keyword: str, limit: int = 3
+) -> list[dict[str, Any]]:
+    """기존 search_by_keyword 구현."""
+    results = []
+    keyword_lower = keyword.lower()
+    for key, data in documents.items():
+        if keyword_lower in key.lower():
+            results.append({"key": key, "data": data})
+            continue
+        data_str = json.dumps(data, ensure_ascii=False).lower()
+        if keyword_lower in data_str:
+            results.append({"key": key, "data": data})
+    return results[:limit]
+
+
+def _reference_fallback(retriever: TagBasedRetriever, message: str) -> list[tuple]:
+    """기존 _fallback_keyword_search 구현."""
+    keywords = ["페트병", "플라스틱", "유리병", "캔", "종이", "비닐"]
+    keywords += ["스티로폼", "음식물", "건전지", "형광등", "가전", "의류"]
+    for keyword in keywords:
+        if keyword in message.lower():
+            return [
+                (r["key"], "low", (keyword,), "")
+                for r in _reference_search_by_keyword(retriever._data, keyword, limit=1)
+            ]
+    return []
+
+
+def _reference_search_with_context(retriever: TagBasedRetriever, message: str) -> list[tuple]:
+    """기존 search_with_context 구현."""
+    context = retriever.extract_context(message)
+    all_tags = context.matched_items + context.matched_situations
+    if not all_tags:
+        return _reference_fallback(retriever, message)
+
+    results = []
+    for key, data in retriever._data.items():
+        matched_tags = []
+        relevance = "low"
+        if context.suggested_category and context.suggested_category in key:
+            matched_tags.append(context.suggested_category)
+            relevance = "high"
+        data_str = json.dumps(data, ensure_ascii=False).lower()
+        for tag in all_tags:
+            if tag.lower() in data_str:
+                matched_tags.append(tag)
+                if relevance != "high":
+                    relevance = "medium"
+        if matched_tags:
+            results.append((key, relevance, tuple(matched_tags), _reference_quote(data, all_tags)))
+    order = {"high": 0, "medium": 1, "low": 2}
+    results.sort(key=lambda x: order.get(x[1], 3))
+    return results
+
+
+@pytest.fixture(scope="module")
+def retriever() -> TagBasedRetriever:
+    """실제 에셋 기반 Retriever."""
+    return TagBasedRetriever()
+
+
+class TestGoldenParity:
+    """역색인 도입 전후 결과 동일성."""
+
+    def test_assets_loaded(self, retriever: TagBasedRetriever):
+        """실제 규정 에셋이 로드되어야 골든 테스트가 의미 있음."""
+        assert len(retriever.get_all_categories()) > 0
+
+    @pytest.mark.parametrize("message", GOLDEN_QUERIES)
+    def test_search_with_context_parity(self, retriever: TagBasedRetriever, message: str):
+        """search_with_context 결과가 기존 구현과 동일."""
+        expected = _reference_search_with_context(retriever, message)
+        actual = [
+            (r.chunk_id, r.relevance, tuple(r.matched_tags), r.quoted_text)
+            for r in retriever.search_with_context(message)
+        ]
+        assert actual == expected
+
+    @pytest.mark.parametrize("keyword", GOLDEN_KEYWORDS)
+    @pytest.mark.parametrize("limit", [1, 3, 100])
+    def test_search_by_keyword_parity(self, retriever: TagBasedRetriever, keyword: str, limit: int):
+        """search_by_keyword 결과가 기존 구현과 동일."""
+        expected = _reference_search_by_keyword(retriever._data, keyword, limit)
+        assert retriever.search_by_keyword(keyword, limit=limit) == expected
+
+    @pytest.mark.parametrize("keyword", GOLDEN_KEYWORDS)
+    def test_local_asset_retriever_parity(self, keyword: str):
+        """LocalAssetRetriever도 동일 색인 사용."""
+        local = LocalAssetRetriever()
+        expected = _reference_search_by_keyword(local._data, keyword)
+        assert local.search_by_keyword(keyword) == expected
+
+
+class TestRegulationIndex:
+    """RegulationIndex 단위 테스트."""
+
+    @pytest.fixture
+    def index(self) -> RegulationIndex:
+        documents = {
+            "재활용폐기물_플라스틱류": {
+                "배출방법_공통": ["내용물을 비우고 헹궈서 배출", "PET 라벨 제거 후 배출"],
+                "대상_설명": ["플라스틱 용기"],
+            },
+            "대형폐기물": {
+                "배출방법_공통": [],
+                "배출불가_품목_안내": {"냉장고": "가전 무상수거 이용", "소파": "스티커 부착"},
+            },
+        }
+        return RegulationIndex(documents, vocabulary=["pet", "냉장고"])
+
+    def test_vocabulary_preindexed(self, index: RegulationIndex):
+        """어휘 용어는 빌드 시점에 색인."""
+        assert index.term_count == 2
+        assert index.docs_containing("PET") == {"재활용폐기물_플라스틱류"}
+
+    def test_adhoc_term_indexed_on_demand(self, index: RegulationIndex):
+        """어휘 밖 용어는 첫 조회 시 색인."""
+        assert index.docs_containing("스티커") == {"대형폐기물"}
+        assert index.term_count == 3
+
+    def test_list_quote_prefers_first_matching_item(self, index: RegulationIndex):
+        """리스트 필드는 태그가 포함된 첫 항목."""
+        assert index.relevant_quote("재활용폐기물_플라스틱류", ["pet"]) == "PET 라벨 제거 후 배출"
+
+    def test_list_quote_defaults_to_first_item(self, index: RegulationIndex):
+        """매칭 항목이 없으면 첫 항목."""
+        assert (
+            index.relevant_quote("재활용폐기물_플라스틱류", ["캔"]) == "내용물을 비우고 헹궈서 배출"
+        )
+
+    def test_dict_quote_matches_key(self, index: RegulationIndex):
+        """딕셔너리 필드는 태그가 포함된 키."""
+        assert index.relevant_quote("대형폐기물", ["소파", "냉장고"]) == "소파: 스티커 부착"
+
+    def test_no_quote(self, index: RegulationIndex):
+        """매칭 없음."""
+        assert index.relevant_quote("대형폐기물", ["캔"]) == ""
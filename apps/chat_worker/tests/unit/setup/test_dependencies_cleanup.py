@@ -0,0 +1,46 @@
+"""dependencies.cleanup() 단위 테스트."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from chat_worker.setup import dependencies
+
+
+class SlowEvaluator:
+    def __init__(self):
+        self.done = False
+
+    async def evaluate(self, **kwargs):
+        await asyncio.sleep(0.01)
+        self.done = True
+
+
+class TestCleanup:
+    @pytest.mark.anyio
+    async def test_drains_deferred_feedback_before_shutdown(self, monkeypatch):
+        """종료 시 대기 중인 지연 feedback 평가를 실행 후 완료까지 대기."""
+        llm_evaluator = SlowEvaluator()
+        evaluator = dependencies.DeferredFeedbackEvaluator(llm_evaluator, release_timeout=60)
+        monkeypatch.setattr(dependencies, "_deferred_feedback_evaluators", [evaluator])
+
+        evaluator.schedule("job-1", "페트병?", "waste", None, gate_feedback=None)
+        await dependencies.cleanup()
+
+        assert llm_evaluator.done
+        assert evaluator.pending == 0
+        assert dependencies._deferred_feedback_evaluators == []
+
+    @pytest.mark.anyio
+    async def test_shuts_down_web_search_executor(self, monkeypatch):
+        executor = dependencies.BoundedSearchExecutor(max_workers=1)
+        monkeypatch.setattr(dependencies, "_web_search_executor", executor)
+        monkeypatch.setattr(dependencies, "_web_search_client", object())
+
+        await dependencies.cleanup()
+
+        assert executor._pool._shutdown
+        assert dependencies._web_search_executor is None
+        assert dependencies._web_search_client is None
@@ -0,0 +1,43 @@
+"""dependencies.get_geo_resolver() 단위 테스트."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from chat_worker.infrastructure.geo import KakaoReverseGeocoder, SnapshotReverseGeocoder
+from chat_worker.setup import dependencies
+from chat_worker.setup.config import Settings
+
+
+@pytest.fixture
+def resolver_factory(monkeypatch, tmp_path):
+    def build(mode: str, kakao: bool = True):
+        settings = Settings(
+            geo_reverse_geocode_mode=mode,
+            public_data_snapshot_path=str(tmp_path / "public_data.sqlite"),
+        )
+        monkeypatch.setattr(dependencies, "_geo_resolver", None)
+        monkeypatch.setattr(dependencies, "get_settings", lambda: settings)
+        monkeypatch.setattr(
+            dependencies, "get_kakao_local_client", lambda: MagicMock() if kakao else None
+        )
+        return dependencies.get_geo_resolver()
+
+    return build
+
+
+class TestGetGeoResolver:
+    def test_auto_tries_kakao_before_offline_index(self, resolver_factory):
+        resolver = resolver_factory("auto")
+
+        assert [type(g) for g in resolver._geocoders] == [
+            KakaoReverseGeocoder,
+            SnapshotReverseGeocoder,
+        ]
+
+    def test_auto_without_kakao_uses_offline_index(self, resolver_factory):
+        resolver = resolver_factory("auto", kakao=False)
+
+        assert [type(g) for g in resolver._geocoders] == [SnapshotReverseGeocoder]
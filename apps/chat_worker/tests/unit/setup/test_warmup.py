@@ -0,0 +1,148 @@
+"""Worker Warmup 단위 테스트."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from chat_worker.setup import warmup as warmup_module
+from chat_worker.setup.warmup import prewarm_connection
+
+
+class FakeRedis:
+    def __init__(self):
+        self.connection_pool = object()
+        self.pinged = 0
+
+    async def ping(self):
+        self.pinged += 1
+        return True
+
+
+class FakeAdapter:
+    """prewarm() 훅을 구현한 포트 어댑터 흉내."""
+
+    def __init__(self):
+        self.prewarmed = 0
+
+    async def prewarm(self):
+        self.prewarmed += 1
+
+
+class FakeOpenAIModels:
+    def __init__(self):
+        self.listed = 0
+
+    async def list(self):
+        self.listed += 1
+
+
+class TestPrewarmConnection:
+    @pytest.mark.anyio
+    async def test_redis_ping(self):
+        redis = FakeRedis()
+        await prewarm_connection(redis)
+        assert redis.pinged == 1
+
+    @pytest.mark.anyio
+    async def test_calls_prewarm_hook(self):
+        adapter = FakeAdapter()
+        await prewarm_connection(adapter)
+        assert adapter.prewarmed == 1
+
+    @pytest.mark.anyio
+    async def test_wrappers_delegate_prewarm(self):
+        from chat_worker.infrastructure.llm.clients.admission_client import (
+            AdmissionControlledLLMClient,
+        )
+        from chat_worker.infrastructure.llm.clients.hedged_client import HedgedLLMClient
+
+        primary, hedge = FakeAdapter(), FakeAdapter()
+        wrapped = HedgedLLMClient(
+            AdmissionControlledLLMClient(primary, controller=object()), hedge=hedge
+        )
+
+        await prewarm_connection(wrapped)
+
+        assert (primary.prewarmed, hedge.prewarmed) == (1, 1)
+
+    @pytest.mark.anyio
+    async def test_openai_sdk_lists_models(self):
+        sdk = type("AsyncOpenAI", (), {"__module__": "openai._client"})()
+        sdk.models = FakeOpenAIModels()
+        await prewarm_connection(sdk)
+        assert sdk.models.listed == 1
+
+    @pytest.mark.anyio
+    async def test_unknown_client_is_noop(self):
+        await prewarm_connection(object())
+        await prewarm_connection(None)
+
+
+class TestWarmup:
+    @pytest.fixture(autouse=True)
+    def reset_state(self, monkeypatch):
+        monkeypatch.setattr(warmup_module, "_report", None)
+        monkeypatch.setattr(warmup_module, "_lock", None)
+
+    @pytest.fixture
+    def calls(self, monkeypatch) -> list[str]:
+        calls: list[str] = []
+
+        def phase(name: str, fail: bool = False):
+            async def run(*args):
+                calls.append(name)
+                if fail:
+                    raise RuntimeError(f"{name} broken")
+
+            return run
+
+        monkeypatch.setattr(warmup_module, "_warm_prompts", phase("prompts"))
+        monkeypatch.setattr(warmup_module, "_warm_tokenizer", phase("tokenizer"))
+        monkeypatch.setattr(warmup_module, "_warm_assets", phase("assets", fail=True))
+        monkeypatch.setattr(warmup_module, "_warm_graph", phase("graph"))
+        monkeypatch.setattr(warmup_module, "_warm_connections", phase("connections"))
+        monkeypatch.setattr(warmup_module, "_dry_run", phase("dry_run"))
+        return calls
+
+    @pytest.mark.anyio
+    async def test_runs_all_phases_in_order_despite_failure(self, calls):
+        report = await warmup_module.warmup()
+
+        assert calls == ["prompts", "tokenizer", "assets", "graph", "connections", "dry_run"]
+        assert list(report.phases) == calls
+        assert report.failures == {"assets": "assets broken"}
+        assert warmup_module.is_warm()
+
+    @pytest.mark.anyio
+    async def test_runs_once_per_process(self, calls):
+        first = await warmup_module.warmup()
+        second = await warmup_module.warmup()
+
+        assert first is second
+        assert len(calls) == 6
+
+    @pytest.mark.anyio
+    async def test_warm_gauge_tracks_graph_failure(self, calls, monkeypatch):
+        gauge = MagicMock()
+        monkeypatch.setattr(warmup_module, "CHAT_WORKER_WARM", gauge)
+
+        async def broken_graph():
+            raise RuntimeError("graph broken")
+
+        monkeypatch.setattr(warmup_module, "_warm_graph", broken_graph)
+
+        report = await warmup_module.warmup()
+
+        assert "graph" in report.failures
+        gauge.set.assert_called_once_with(0)
+
+    @pytest.mark.anyio
+    async def test_warm_gauge_set_despite_non_graph_failure(self, calls, monkeypatch):
+        gauge = MagicMock()
+        monkeypatch.setattr(warmup_module, "CHAT_WORKER_WARM", gauge)
+
+        await warmup_module.warmup()
+
+        gauge.set.assert_called_once_with(1)
@@ -4,18 +4,27 @@
 
 RPC Methods:
 - UploadBytes: 바이트 데이터를 S3에 업로드하고 CDN URL 반환
+- UploadStream: 청크 스트리밍 업로드 (S3 multipart, 파트 하나 분량만 버퍼링)
+
+오브젝트 키는 내용의 SHA-256 기반({channel}/{sha256}{ext})입니다.
+동일 바이트(재생성된 캐릭터 이미지, 재시도)는 다시 업로드하지 않고
+기존 CDN URL을 반환합니다 (deduplicated=True).
 
 aioboto3를 사용하여 진정한 비동기 I/O로 S3 업로드를 처리합니다.
 """
 
 from __future__ import annotations
 
+import hashlib
 import logging
-from typing import TYPE_CHECKING
+import re
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING, Any
 from uuid import uuid4
 
 import aioboto3
 import grpc
+from botocore.exceptions import ClientError
 
 from images.proto import image_pb2, image_pb2_grpc
 
@@ -44,9 +53,31 @@ CONTENT_TYPE_TO_EXT = {
     "image/webp": ".webp",
 }
 
-# 최대 이미지 크기 (10MB)
+# 최대 이미지 크기 (10MB, 단일/스트리밍 업로드 공통)
 MAX_IMAGE_SIZE = 10 * 1024 * 1024
 
+# S3 multipart 파트 크기 (S3 최소 5MB, 마지막 파트 제외)
+# 이보다 작은 이미지는 단일 put_object로 처리
+MULTIPART_PART_SIZE = 8 * 1024 * 1024
+
+# SHA-256을 미리 알 수 없는 multipart 업로드의 임시 키 prefix
+STAGING_PREFIX = "_staging"
+
+# header.sha256 형식 (소문자 변환 후, S3 키에 그대로 들어가므로 엄격히 검증)
+SHA256_PATTERN = re.compile(r"[0-9a-f]{64}")
+
+_NOT_FOUND_CODES = frozenset({"404", "NoSuchKey", "NotFound"})
+
+
+class UploadRejectedError(Exception):
+    """요청 검증 실패 (응답 error로 그대로 전달)."""
+
+
+def build_object_key(channel: str, digest: str, content_type: str) -> str:
+    """내용 기반 S3 오브젝트 키."""
+    ext = CONTENT_TYPE_TO_EXT.get(content_type, ".bin")
+    return f"{channel}/{digest}{ext}"
+
 
 class ImageServicer(image_pb2_grpc.ImageServiceServicer):
     """Image gRPC Servicer.
@@ -108,30 +139,27 @@ class ImageServicer(image_pb2_grpc.ImageServiceServicer):
 
             channel = request.channel or "generated"
 
-            # 2. S3 키 생성
-            ext = CONTENT_TYPE_TO_EXT.get(request.content_type, ".bin")
-            identifier = uuid4().hex
-            key = f"{channel}/{identifier}{ext}"
+            # 2. 내용 기반 S3 키 생성
+            digest = hashlib.sha256(request.image_data).hexdigest()
+            key = build_object_key(channel, digest, request.content_type)
 
-            # 3. S3 업로드 (aioboto3 - 진정한 비동기 I/O)
+            # 3. S3 업로드 (aioboto3 - 진정한 비동기 I/O), 동일 내용이면 생략
             async with self._session.client(
                 "s3",
                 region_name=self._settings.aws_region,
             ) as s3:
-                await s3.put_object(
-                    Bucket=self._settings.s3_bucket,
-                    Key=key,
-                    Body=request.image_data,
-                    ContentType=request.content_type,
-                    Metadata={
-                        "uploader_id": request.uploader_id or "system",
-                        **dict(request.metadata),
-                    },
-                )
+                deduplicated = await self._object_exists(s3, key)
+                if not deduplicated:
+                    await s3.put_object(
+                        Bucket=self._settings.s3_bucket,
+                        Key=key,
+                        Body=request.image_data,
+                        ContentType=request.content_type,
+                        Metadata=self._object_metadata(request.uploader_id, request.metadata),
+                    )
 
             # 4. CDN URL 생성
-            cdn_domain = str(self._settings.cdn_domain).rstrip("/")
-            cdn_url = f"{cdn_domain}/{key}"
+            cdn_url = self._cdn_url(key)
 
             logger.info(
                 "Image uploaded via gRPC (aioboto3)",
@@ -141,6 +169,7 @@ class ImageServicer(image_pb2_grpc.ImageServiceServicer):
                     "content_type": request.content_type,
                     "size_bytes": len(request.image_data),
                     "uploader_id": request.uploader_id,
+                    "deduplicated": deduplicated,
                 },
             )
 
@@ -148,6 +177,7 @@ class ImageServicer(image_pb2_grpc.ImageServiceServicer):
                 success=True,
                 cdn_url=cdn_url,
                 key=key,
+                deduplicated=deduplicated,
             )
 
         except Exception as e:
@@ -163,3 +193,258 @@ class ImageServicer(image_pb2_grpc.ImageServiceServicer):
                 success=False,
                 error=f"Upload failed: {str(e)}",
             )
+
+    async def UploadStream(
+        self,
+        request_iterator: AsyncIterator[image_pb2.UploadStreamRequest],
+        context: grpc.aio.ServicerContext,
+    ) -> image_pb2.UploadBytesResponse:
+        """청크 스트림을 S3에 업로드합니다.
+
+        첫 메시지는 header, 이후 chunk. 전체 이미지를 메모리에 모으지 않고
+        MULTIPART_PART_SIZE 단위로 S3 multipart 업로드합니다.
+        header.sha256이 있으면 청크를 받기 전에 중복을 확인하고,
+        없으면 수신하며 계산한 SHA-256으로 마지막에 확인합니다.
+
+        Args:
+            request_iterator: 업로드 요청 스트림 (header, chunk...)
+            context: gRPC 컨텍스트
+
+        Returns:
+            UploadBytesResponse: CDN URL, S3 키, 중복 여부
+        """
+        header: image_pb2.UploadStreamHeader | None = None
+        try:
+            # 1. 헤더 검증
+            iterator = request_iterator.__aiter__()
+            first = await anext(iterator, None)
+            if first is None or first.WhichOneof("payload") != "header":
+                raise UploadRejectedError("First message must be header")
+            header = first.header
+
+            if header.content_type not in ALLOWED_CONTENT_TYPES:
+                raise UploadRejectedError(f"Invalid content_type: {header.content_type}")
+
+            channel = header.channel or "generated"
+            expected = header.sha256.lower() or None
+            if expected is not None and not SHA256_PATTERN.fullmatch(expected):
+                message = "Invalid sha256: expected 64 hex characters"
+                context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+                context.set_details(message)
+                raise UploadRejectedError(message)
+
+            async with self._session.client(
+                "s3",
+                region_name=self._settings.aws_region,
+            ) as s3:
+                # 2. 해시를 미리 알면 청크 수신 전에 중복 확인
+                if expected is not None:
+                    key = build_object_key(channel, expected, header.content_type)
+                    if await self._object_exists(s3, key):
+                        return self._stream_response(header, channel, key, 0, True)
+
+                # 3. 청크 수신 + multipart 업로드
+                key, size, deduplicated = await self._upload_chunks(
+                    s3, self._iter_chunks(iterator), header, channel, expected
+                )
+
+            return self._stream_response(header, channel, key, size, deduplicated)
+
+        except UploadRejectedError as e:
+            return image_pb2.UploadBytesResponse(success=False, error=str(e))
+
+        except Exception as e:
+            logger.exception(
+                "Failed to upload image stream via gRPC",
+                extra={
+                    "channel": header.channel if header else None,
+                    "content_type": header.content_type if header else None,
+                    "error": str(e),
+                },
+            )
+            return image_pb2.UploadBytesResponse(
+                success=False,
+                error=f"Upload failed: {str(e)}",
+            )
+
+    async def _upload_chunks(
+        self,
+        s3: Any,
+        chunks: AsyncIterator[bytes],
+        header: image_pb2.UploadStreamHeader,
+        channel: str,
+        expected: str | None,
+    ) -> tuple[str, int, bool]:
+        """청크를 파트 단위로 업로드하고 (key, size, deduplicated) 반환.
+
+        - 파트 하나 미만: 해시 확인 후 단일 put_object
+        - expected 있음: 최종 키로 바로 multipart, 해시 불일치 시 abort
+        - expected 없음: 임시 키로 multipart → 해시 확인 → 중복이면 abort,
+          아니면 complete 후 최종 키로 copy
+        """
+        bucket = self._settings.s3_bucket
+        hasher = hashlib.sha256()
+        buffer = bytearray()
+        size = 0
+        upload: dict[str, Any] | None = None
+
+        try:
+            async for chunk in chunks:
+                size += len(chunk)
+                if size > MAX_IMAGE_SIZE:
+                    raise UploadRejectedError(f"Image too large: > {MAX_IMAGE_SIZE} bytes")
+                hasher.update(chunk)
+                buffer += chunk
+                if len(buffer) >= MULTIPART_PART_SIZE:
+                    if upload is None:
+                        upload_key = (
+                            build_object_key(channel, expected, header.content_type)
+                            if expected is not None
+                            else f"{STAGING_PREFIX}/{uuid4().hex}"
+                        )
+                        upload = await self._create_multipart(s3, upload_key, header)
+                    await self._upload_part(s3, upload, bytes(buffer))
+                    buffer.clear()
+
+            if size == 0:
+                raise UploadRejectedError("image data is required")
+
+            digest = hasher.hexdigest()
+            if expected is not None and digest != expected:
+                raise UploadRejectedError(f"sha256 mismatch: expected {expected}, got {digest}")
+            key = build_object_key(channel, digest, header.content_type)
+
+            if upload is None:
+                if await self._object_exists(s3, key):
+                    return key, size, True
+                await s3.put_object(
+                    Bucket=bucket,
+                    Key=key,
+                    Body=bytes(buffer),
+                    ContentType=header.content_type,
+                    Metadata=self._object_metadata(header.uploader_id, header.metadata),
+                )
+                return key, size, False
+
+            if upload["key"] != key and await self._object_exists(s3, key):
+                await self._abort_multipart(s3, upload)
+                upload = None
+                return key, size, True
+
+            if buffer:
+                await self._upload_part(s3, upload, bytes(buffer))
+            await s3.complete_multipart_upload(
+                Bucket=bucket,
+                Key=upload["key"],
+                UploadId=upload["upload_id"],
+                MultipartUpload={"Parts": upload["parts"]},
+            )
+            staging_key = upload["key"]
+            upload = None
+
+            if staging_key != key:
+                await s3.copy_object(
+                    Bucket=bucket,
+                    Key=key,
+                    CopySource={"Bucket": bucket, "Key": staging_key},
+                    MetadataDirective="COPY",
+                )
+                await s3.delete_object(Bucket=bucket, Key=staging_key)
+            return key, size, False
+
+        finally:
+            # 완료되지 않은 multipart는 파트 비용이 남지 않도록 abort
+            if upload is not None:
+                await self._abort_multipart(s3, upload)
+
+    async def _create_multipart(
+        self,
+        s3: Any,
+        key: str,
+        header: image_pb2.UploadStreamHeader,
+    ) -> dict[str, Any]:
+        response = await s3.create_multipart_upload(
+            Bucket=self._settings.s3_bucket,
+            Key=key,
+            ContentType=header.content_type,
+            Metadata=self._object_metadata(header.uploader_id, header.metadata),
+        )
+        return {"key": key, "upload_id": response["UploadId"], "parts": []}
+
+    async def _upload_part(self, s3: Any, upload: dict[str, Any], body: bytes) -> None:
+        part_number = len(upload["parts"]) + 1
+        response = await s3.upload_part(
+            Bucket=self._settings.s3_bucket,
+            Key=upload["key"],
+            UploadId=upload["upload_id"],
+            PartNumber=part_number,
+            Body=body,
+        )
+        upload["parts"].append({"ETag": response["ETag"], "PartNumber": part_number})
+
+    async def _abort_multipart(self, s3: Any, upload: dict[str, Any]) -> None:
+        try:
+            await s3.abort_multipart_upload(
+                Bucket=self._settings.s3_bucket,
+                Key=upload["key"],
+                UploadId=upload["upload_id"],
+            )
+        except Exception as e:
+            logger.warning(
+                "Failed to abort multipart upload",
+                extra={"key": upload["key"], "error": str(e)},
+            )
+
+    async def _object_exists(self, s3: Any, key: str) -> bool:
+        """S3 오브젝트 존재 여부 (내용 기반 키라 존재 = 동일 내용)."""
+        try:
+            await s3.head_object(Bucket=self._settings.s3_bucket, Key=key)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in _NOT_FOUND_CODES:
+                return False
+            raise
+        return True
+
+    @staticmethod
+    async def _iter_chunks(
+        iterator: AsyncIterator[image_pb2.UploadStreamRequest],
+    ) -> AsyncIterator[bytes]:
+        async for message in iterator:
+            if message.WhichOneof("payload") != "chunk":
+                raise UploadRejectedError("Only chunk messages are allowed after header")
+            if message.chunk:
+                yield message.chunk
+
+    @staticmethod
+    def _object_metadata(uploader_id: str, metadata: Any) -> dict[str, str]:
+        return {"uploader_id": uploader_id or "system", **dict(metadata)}
+
+    def _cdn_url(self, key: str) -> str:
+        cdn_domain = str(self._settings.cdn_domain).rstrip("/")
+        return f"{cdn_domain}/{key}"
+
+    def _stream_response(
+        self,
+        header: image_pb2.UploadStreamHeader,
+        channel: str,
+        key: str,
+        size: int,
+        deduplicated: bool,
+    ) -> image_pb2.UploadBytesResponse:
+        logger.info(
+            "Image stream uploaded via gRPC (aioboto3)",
+            extra={
+                "channel": channel,
+                "key": key,
+                "content_type": header.content_type,
+                "size_bytes": size,
+                "uploader_id": header.uploader_id,
+                "deduplicated": deduplicated,
+            },
+        )
+        return image_pb2.UploadBytesResponse(
+            success=True,
+            cdn_url=self._cdn_url(key),
+            key=key,
+            deduplicated=deduplicated,
+        )
@@ -3,6 +3,8 @@
 from images.proto.image_pb2 import (
     UploadBytesRequest,
     UploadBytesResponse,
+    UploadStreamHeader,
+    UploadStreamRequest,
 )
 from images.proto.image_pb2_grpc import (
     ImageServiceServicer,
@@ -13,6 +15,8 @@ from images.proto.image_pb2_grpc import (
 __all__ = [
     "UploadBytesRequest",
     "UploadBytesResponse",
+    "UploadStreamHeader",
+    "UploadStreamRequest",
     "ImageServiceServicer",
     "ImageServiceStub",
     "add_ImageServiceServicer_to_server",
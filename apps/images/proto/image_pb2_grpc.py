@@ -41,6 +41,11 @@ class ImageServiceStub(object):
                 request_serializer=image__pb2.UploadBytesRequest.SerializeToString,
                 response_deserializer=image__pb2.UploadBytesResponse.FromString,
                 _registered_method=True)
+        self.UploadStream = channel.stream_unary(
+                '/image.v1.ImageService/UploadStream',
+                request_serializer=image__pb2.UploadStreamRequest.SerializeToString,
+                response_deserializer=image__pb2.UploadBytesResponse.FromString,
+                _registered_method=True)
 
 
 class ImageServiceServicer(object):
@@ -55,6 +60,15 @@ class ImageServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def UploadStream(self, request_iterator, context):
+        """청크 스트리밍 업로드 (서버는 S3 multipart 파트 하나 분량만 버퍼링)
+        첫 메시지는 header, 이후 chunk. 오브젝트 키는 SHA-256 기반이라
+        동일 내용은 다시 업로드하지 않고 기존 CDN URL 반환
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_ImageServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -63,6 +77,11 @@ def add_ImageServiceServicer_to_server(servicer, server):
                     request_deserializer=image__pb2.UploadBytesRequest.FromString,
                     response_serializer=image__pb2.UploadBytesResponse.SerializeToString,
             ),
+            'UploadStream': grpc.stream_unary_rpc_method_handler(
+                    servicer.UploadStream,
+                    request_deserializer=image__pb2.UploadStreamRequest.FromString,
+                    response_serializer=image__pb2.UploadBytesResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'image.v1.ImageService', rpc_method_handlers)
@@ -102,3 +121,30 @@ class ImageService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def UploadStream(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(
+            request_iterator,
+            target,
+            '/image.v1.ImageService/UploadStream',
+            image__pb2.UploadStreamRequest.SerializeToString,
+            image__pb2.UploadBytesResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -1,10 +1,13 @@
 """Unit tests for ImageServicer (gRPC)."""
 
+import hashlib
 import sys
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
 
+import grpc
 import pytest
+from botocore.exceptions import ClientError
 
 # apps/ 디렉토리를 PYTHONPATH에 추가 (from images.* 가능하게)
 APPS_DIR = Path(__file__).resolve().parents[2]
@@ -15,11 +18,17 @@ from images.core.config import Settings  # noqa: E402
 from images.presentation.grpc.servicers.image_servicer import (  # noqa: E402
     ALLOWED_CONTENT_TYPES,
     MAX_IMAGE_SIZE,
+    MULTIPART_PART_SIZE,
+    STAGING_PREFIX,
     ImageServicer,
 )
 from images.proto import image_pb2  # noqa: E402
 
 
+def _not_found() -> ClientError:
+    return ClientError({"Error": {"Code": "404", "Message": "Not Found"}}, "HeadObject")
+
+
 @pytest.fixture
 def test_settings():
     """Test settings."""
@@ -110,6 +119,7 @@ class TestUploadBytesSuccess:
         # Mock S3 client context manager
         mock_s3 = AsyncMock()
         mock_s3.put_object = AsyncMock()
+        mock_s3.head_object = AsyncMock(side_effect=_not_found())
 
         mock_client_cm = AsyncMock()
         mock_client_cm.__aenter__ = AsyncMock(return_value=mock_s3)
@@ -147,6 +157,7 @@ class TestUploadBytesSuccess:
         """채널이 없으면 'generated'를 사용합니다."""
         mock_s3 = AsyncMock()
         mock_s3.put_object = AsyncMock()
+        mock_s3.head_object = AsyncMock(side_effect=_not_found())
 
         mock_client_cm = AsyncMock()
         mock_client_cm.__aenter__ = AsyncMock(return_value=mock_s3)
@@ -172,6 +183,7 @@ class TestUploadBytesSuccess:
         """메타데이터가 S3에 포함됩니다."""
         mock_s3 = AsyncMock()
         mock_s3.put_object = AsyncMock()
+        mock_s3.head_object = AsyncMock(side_effect=_not_found())
 
         mock_client_cm = AsyncMock()
         mock_client_cm.__aenter__ = AsyncMock(return_value=mock_s3)
@@ -208,6 +220,7 @@ class TestUploadBytesError:
         """S3 오류를 처리합니다."""
         mock_s3 = AsyncMock()
         mock_s3.put_object = AsyncMock(side_effect=Exception("S3 connection failed"))
+        mock_s3.head_object = AsyncMock(side_effect=_not_found())
 
         mock_client_cm = AsyncMock()
         mock_client_cm.__aenter__ = AsyncMock(return_value=mock_s3)
@@ -229,6 +242,221 @@ class TestUploadBytesError:
         assert "S3 connection failed" in response.error
 
 
+class FakeS3:
+    """multipart/copy를 흉내 내는 인메모리 S3."""
+
+    def __init__(self, objects: dict[str, bytes] | None = None):
+        self.objects = dict(objects or {})
+        self.uploads: dict[str, dict] = {}
+        self.calls: list[str] = []
+
+    async def head_object(self, Bucket, Key):
+        self.calls.append("head_object")
+        if Key not in self.objects:
+            raise _not_found()
+        return {}
+
+    async def put_object(self, Bucket, Key, Body, ContentType, Metadata):
+        self.calls.append("put_object")
+        self.objects[Key] = Body
+
+    async def create_multipart_upload(self, Bucket, Key, ContentType, Metadata):
+        self.calls.append("create_multipart_upload")
+        upload_id = f"upload-{len(self.uploads)}"
+        self.uploads[upload_id] = {"key": Key, "parts": {}}
+        return {"UploadId": upload_id}
+
+    async def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):
+        self.calls.append("upload_part")
+        self.uploads[UploadId]["parts"][PartNumber] = Body
+        return {"ETag": f"etag-{PartNumber}"}
+
+    async def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        self.calls.append("complete_multipart_upload")
+        upload = self.uploads.pop(UploadId)
+        numbers = [p["PartNumber"] for p in MultipartUpload["Parts"]]
+        self.objects[Key] = b"".join(upload["parts"][n] for n in numbers)
+
+    async def abort_multipart_upload(self, Bucket, Key, UploadId):
+        self.calls.append("abort_multipart_upload")
+        self.uploads.pop(UploadId)
+
+    async def copy_object(self, Bucket, Key, CopySource, MetadataDirective):
+        self.calls.append("copy_object")
+        self.objects[Key] = self.objects[CopySource["Key"]]
+
+    async def delete_object(self, Bucket, Key):
+        self.calls.append("delete_object")
+        del self.objects[Key]
+
+
+def _stream_servicer(fake_s3, test_settings):
+    session = MagicMock()
+    client_cm = AsyncMock()
+    client_cm.__aenter__ = AsyncMock(return_value=fake_s3)
+    client_cm.__aexit__ = AsyncMock(return_value=None)
+    session.client = MagicMock(return_value=client_cm)
+    return ImageServicer(session=session, settings=test_settings)
+
+
+async def _stream(data: bytes, chunk_size: int = 1024 * 1024, sha256: str = ""):
+    yield image_pb2.UploadStreamRequest(
+        header=image_pb2.UploadStreamHeader(
+            channel="generated",
+            content_type="image/png",
+            uploader_id="chat_worker",
+            sha256=sha256,
+        )
+    )
+    for i in range(0, len(data), chunk_size):
+        yield image_pb2.UploadStreamRequest(chunk=data[i : i + chunk_size])
+
+
+class TestContentAddressedUpload:
+    """SHA-256 기반 키와 중복 업로드 생략."""
+
+    @pytest.mark.asyncio
+    async def test_upload_bytes_uses_sha256_key(self, test_settings, mock_grpc_context):
+        """UploadBytes 키는 내용의 SHA-256입니다."""
+        fake_s3 = FakeS3()
+        servicer = _stream_servicer(fake_s3, test_settings)
+        digest = hashlib.sha256(b"fake-png-data").hexdigest()
+
+        request = image_pb2.UploadBytesRequest(
+            channel="generated", image_data=b"fake-png-data", content_type="image/png"
+        )
+        first = await servicer.UploadBytes(request, mock_grpc_context)
+        second = await servicer.UploadBytes(request, mock_grpc_context)
+
+        assert first.key == f"generated/{digest}.png"
+        assert first.deduplicated is False
+        assert second.key == first.key
+        assert second.deduplicated is True
+        assert fake_s3.calls.count("put_object") == 1
+
+    @pytest.mark.asyncio
+    async def test_stream_small_image_single_put(self, test_settings, mock_grpc_context):
+        """파트 크기 미만 스트림은 단일 put_object로 업로드합니다."""
+        fake_s3 = FakeS3()
+        servicer = _stream_servicer(fake_s3, test_settings)
+        data = b"p" * (3 * 1024 * 1024)
+
+        response = await servicer.UploadStream(_stream(data), mock_grpc_context)
+
+        digest = hashlib.sha256(data).hexdigest()
+        assert response.success is True
+        assert response.key == f"generated/{digest}.png"
+        cdn_domain = str(test_settings.cdn_domain).rstrip("/")
+        assert response.cdn_url == f"{cdn_domain}/generated/{digest}.png"
+        assert fake_s3.objects[response.key] == data
+        assert "create_multipart_upload" not in fake_s3.calls
+
+    @pytest.mark.asyncio
+    async def test_stream_large_image_multipart_via_staging(self, test_settings, mock_grpc_context):
+        """해시 없이 큰 스트림은 임시 키 multipart 후 최종 키로 복사합니다."""
+        fake_s3 = FakeS3()
+        servicer = _stream_servicer(fake_s3, test_settings)
+        data = bytes(range(256)) * (MULTIPART_PART_SIZE // 256 + 10)
+
+        response = await servicer.UploadStream(_stream(data), mock_grpc_context)
+
+        assert response.success is True
+        assert fake_s3.objects == {response.key: data}
+        assert fake_s3.calls.count("upload_part") == 2
+        assert "copy_object" in fake_s3.calls
+        assert not any(key.startswith(STAGING_PREFIX) for key in fake_s3.objects)
+
+    @pytest.mark.asyncio
+    async def test_stream_large_duplicate_aborts_multipart(self, test_settings, mock_grpc_context):
+        """이미 있는 내용이면 multipart를 abort하고 기존 URL을 반환합니다."""
+        data = b"d" * (MULTIPART_PART_SIZE + 100)
+        key = f"generated/{hashlib.sha256(data).hexdigest()}.png"
+        fake_s3 = FakeS3({key: data})
+        servicer = _stream_servicer(fake_s3, test_settings)
+
+        response = await servicer.UploadStream(_stream(data), mock_grpc_context)
+
+        assert response.deduplicated is True
+        assert response.key == key
+        assert "abort_multipart_upload" in fake_s3.calls
+        assert fake_s3.uploads == {}
+
+    @pytest.mark.asyncio
+    async def test_stream_known_sha256_skips_transfer(self, test_settings, mock_grpc_context):
+        """header.sha256이 기존 오브젝트와 같으면 청크를 받지 않습니다."""
+        data = b"known-image"
+        digest = hashlib.sha256(data).hexdigest()
+        fake_s3 = FakeS3({f"generated/{digest}.png": data})
+        servicer = _stream_servicer(fake_s3, test_settings)
+
+        async def header_only():
+            async for message in _stream(data, sha256=digest):
+                if message.WhichOneof("payload") == "chunk":
+                    raise AssertionError("chunk should not be consumed")
+                yield message
+
+        response = await servicer.UploadStream(header_only(), mock_grpc_context)
+
+        assert response.success is True
+        assert response.deduplicated is True
+        assert fake_s3.calls == ["head_object"]
+
+    @pytest.mark.asyncio
+    async def test_stream_sha256_mismatch_rejected(self, test_settings, mock_grpc_context):
+        """header.sha256과 내용이 다르면 거부하고 multipart를 정리합니다."""
+        fake_s3 = FakeS3()
+        servicer = _stream_servicer(fake_s3, test_settings)
+        data = b"m" * (MULTIPART_PART_SIZE + 1)
+
+        response = await servicer.UploadStream(_stream(data, sha256="0" * 64), mock_grpc_context)
+
+        assert response.success is False
+        assert "sha256 mismatch" in response.error
+        assert fake_s3.objects == {}
+        assert fake_s3.uploads == {}
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("sha256", ["../../etc/passwd", "g" * 64, "0" * 63, "0" * 64 + "\n"])
+    async def test_stream_invalid_sha256_rejected(self, sha256, test_settings, mock_grpc_context):
+        """header.sha256이 64자리 hex가 아니면 S3 접근 전에 INVALID_ARGUMENT로 거부합니다."""
+        fake_s3 = FakeS3()
+        servicer = _stream_servicer(fake_s3, test_settings)
+
+        response = await servicer.UploadStream(_stream(b"data", sha256=sha256), mock_grpc_context)
+
+        assert response.success is False
+        assert "Invalid sha256" in response.error
+        mock_grpc_context.set_code.assert_called_once_with(grpc.StatusCode.INVALID_ARGUMENT)
+        assert fake_s3.calls == []
+
+    @pytest.mark.asyncio
+    async def test_stream_too_large_rejected(self, test_settings, mock_grpc_context):
+        """스트리밍도 MAX_IMAGE_SIZE를 넘으면 거부하고 multipart를 정리합니다."""
+        fake_s3 = FakeS3()
+        servicer = _stream_servicer(fake_s3, test_settings)
+        data = b"x" * (MAX_IMAGE_SIZE + 1)
+
+        response = await servicer.UploadStream(_stream(data), mock_grpc_context)
+
+        assert response.success is False
+        assert "too large" in response.error
+        assert fake_s3.objects == {}
+        assert fake_s3.uploads == {}
+
+    @pytest.mark.asyncio
+    async def test_stream_requires_header_first(self, test_settings, mock_grpc_context):
+        """첫 메시지가 header가 아니면 거부합니다."""
+        servicer = _stream_servicer(FakeS3(), test_settings)
+
+        async def chunk_first():
+            yield image_pb2.UploadStreamRequest(chunk=b"data")
+
+        response = await servicer.UploadStream(chunk_first(), mock_grpc_context)
+
+        assert response.success is False
+        assert "header" in response.error
+
+
 class TestAllowedContentTypes:
     """Tests for allowed content types."""
 
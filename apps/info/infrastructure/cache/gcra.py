@@ -0,0 +1,279 @@
+"""GCRA Rate Limiter Engine - 단일 Lua 스크립트 기반 원자적 판정.
+
+chat_worker/infrastructure/ratelimit/gcra.py와 동일한 스크립트/판정 규칙
+(서비스별 독립 배포이므로 각자 보유).
+
+GCRA (Generic Cell Rate Algorithm):
+- 키당 값 하나(TAT: Theoretical Arrival Time)만 저장
+- emission_interval T = period / limit, 허용 버스트 = burst * T
+- 판정: new_tat = max(tat, now) + T * quantity
+        allow_at = new_tat - T * burst
+        now >= allow_at 이면 허용 (TAT 갱신), 아니면 retry_after = allow_at - now
+- sliding window와 같은 평활 효과, 윈도우 경계 버스트 없음
+- 단, period 구간 허용량은 최대 burst + period / T - 1
+  → 할당량(어떤 period 구간에서도 limit 이하)은 RateLimit.windowed()로 정의
+
+왕복/원자성:
+- 판정 1회 = EVALSHA 1회 (check-and-consume 원자적, 시각은 Redis TIME)
+- acquire_many: 여러 제한(user/IP/provider)을 한 번에 판정
+  → 모두 허용될 때만 소비 (all-or-nothing)
+- peek: quantity=0 (소비 없이 상태 조회)
+
+로컬 토큰 lease (hot key):
+- acquire_leased(limit, lease_size): Redis에서 최대 lease_size개를 부분 허용으로 받아
+  로컬에서 소진 (lease_ttl 지나면 남은 토큰 폐기 → 다른 replica 몫을 오래 잡지 않음)
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+DEFAULT_LEASE_TTL = 1.0  # 로컬 lease 유효 시간 (초)
+
+# KEYS: 제한별 키
+# ARGV: quantity, partial(0/1), 이후 제한별 (emission_interval_ms, burst) 쌍
+# Returns: 제한별 {granted, remaining, retry_after_ms, reset_after_ms} 평탄화
+GCRA_SCRIPT = """
+local quantity = tonumber(ARGV[1])
+local partial = tonumber(ARGV[2]) == 1
+-- interval이 정수가 아니면 (now + capacity - tat) / interval이 n 대신 n - 1e-12가 되므로 보정
+local epsilon = 1e-6
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + tonumber(t[2]) / 1000
+
+local n = #KEYS
+local tats = {}
+local intervals = {}
+local bursts = {}
+local granted = quantity
+local denied = false
+
+for i = 1, n do
+    local interval = tonumber(ARGV[1 + i * 2])
+    local burst = tonumber(ARGV[2 + i * 2])
+    local tat = tonumber(redis.call('GET', KEYS[i]) or now)
+    if tat < now then
+        tat = now
+    end
+    intervals[i] = interval
+    bursts[i] = burst
+    tats[i] = tat
+    local available = math.floor((now + interval * burst - tat) / interval + epsilon)
+    if partial then
+        granted = math.min(granted, math.max(available, 0))
+    elseif available < quantity then
+        denied = true
+    end
+end
+if denied or granted < 0 then
+    granted = 0
+end
+
+local result = {}
+for i = 1, n do
+    local tat = tats[i]
+    local interval = intervals[i]
+    local capacity = interval * bursts[i]
+    if granted > 0 then
+        tat = tat + interval * granted
+        redis.call('SET', KEYS[i], tostring(tat), 'PX', math.max(1, math.ceil(tat - now)))
+    end
+    local remaining = math.max(0, math.floor((now + capacity - tat) / interval + epsilon))
+    local retry_after = 0
+    if granted == 0 and quantity > 0 then
+        retry_after = math.max(0, math.ceil(tat + interval * quantity - capacity - now))
+    end
+    table.insert(result, granted)
+    table.insert(result, remaining)
+    table.insert(result, retry_after)
+    table.insert(result, math.max(0, math.ceil(tat - now)))
+end
+return result
+"""
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """제한 정의.
+
+    Attributes:
+        key: Redis 키 (제한 대상 식별)
+        limit: period 동안 허용 요청 수
+        period: 기간 (초)
+        burst: 순간 허용량 (None이면 limit)
+    """
+
+    key: str
+    limit: int
+    period: float
+    burst: int | None = None
+
+    @classmethod
+    def windowed(cls, key: str, limit: int, period: float, burst: int) -> RateLimit:
+        """어떤 period 구간에서도 limit을 넘지 않는 제한 (할당량용).
+
+        버스트를 먼저 쓰고 나머지는 회복분으로 채우므로, 회복 속도를
+        (limit - burst + 1) / period로 낮춰 burst + 회복분 <= limit을 보장합니다.
+
+        Args:
+            key: Redis 키
+            limit: period 구간 최대 허용 수
+            period: 기간 (초)
+            burst: 순간 허용량 (1 ~ limit으로 보정)
+        """
+        burst = max(1, min(burst, limit))
+        return cls(key=key, limit=limit - burst + 1, period=period, burst=burst)
+
+    @property
+    def emission_interval_ms(self) -> float:
+        return self.period * 1000 / max(1, self.limit)
+
+    @property
+    def capacity(self) -> int:
+        return self.burst if self.burst is not None else self.limit
+
+
+@dataclass(frozen=True)
+class GCRADecision:
+    """판정 결과.
+
+    Attributes:
+        key: 제한 키
+        limit: 제한 수
+        allowed: 허용 여부
+        granted: 허용된 수량 (lease 부분 허용 시 요청보다 작을 수 있음)
+        remaining: 남은 허용량
+        retry_after: 다음 허용까지 대기 (초, 허용 시 0)
+        reset_after: 버킷이 가득 찰 때까지 (초)
+    """
+
+    key: str
+    limit: int
+    allowed: bool
+    granted: int
+    remaining: int
+    retry_after: float
+    reset_after: float
+
+
+@dataclass
+class _Lease:
+    tokens: int
+    expires_at: float
+    decision: GCRADecision
+
+
+class GCRALimiter:
+    """GCRA 판정 엔진 (limiter들이 공유)."""
+
+    def __init__(self, redis: "Redis", lease_ttl: float = DEFAULT_LEASE_TTL):
+        """초기화.
+
+        Args:
+            redis: Redis 클라이언트
+            lease_ttl: 로컬 lease 유효 시간 (초)
+        """
+        self._redis = redis
+        # register_script: EVALSHA 사용, NOSCRIPT 시 자동 재로드
+        self._script = redis.register_script(GCRA_SCRIPT)
+        self._lease_ttl = lease_ttl
+        self._leases: dict[str, _Lease] = {}
+
+    async def acquire(self, limit: RateLimit, quantity: int = 1) -> GCRADecision:
+        """단일 제한 판정 + 소비."""
+        return (await self.acquire_many([limit], quantity))[0]
+
+    async def peek(self, limit: RateLimit) -> GCRADecision:
+        """소비 없이 상태 조회."""
+        return (await self._evaluate([limit], 0, partial=False))[0]
+
+    async def acquire_many(
+        self,
+        limits: Sequence[RateLimit],
+        quantity: int = 1,
+    ) -> list[GCRADecision]:
+        """여러 제한을 한 번에 판정 (모두 허용될 때만 소비).
+
+        Returns:
+            제한별 판정 (입력 순서)
+        """
+        return await self._evaluate(limits, quantity, partial=False)
+
+    async def acquire_leased(self, limit: RateLimit, lease_size: int) -> GCRADecision:
+        """hot key용: 로컬 lease에서 1개 소비, 없으면 Redis에서 최대 lease_size개 확보."""
+        now = time.monotonic()
+        lease = self._leases.get(limit.key)
+        if lease is not None and lease.tokens > 0 and now < lease.expires_at:
+            lease.tokens -= 1
+            return _with_remaining(lease.decision, lease.tokens)
+
+        decision = (await self._evaluate([limit], max(1, lease_size), partial=True))[0]
+        if not decision.allowed:
+            self._leases.pop(limit.key, None)
+            return decision
+
+        leftover = decision.granted - 1
+        self._leases[limit.key] = _Lease(
+            tokens=leftover, expires_at=now + self._lease_ttl, decision=decision
+        )
+        return _with_remaining(decision, leftover)
+
+    async def reset(self, key: str) -> None:
+        """제한 초기화."""
+        self._leases.pop(key, None)
+        await self._redis.unlink(key)
+
+    async def _evaluate(
+        self,
+        limits: Sequence[RateLimit],
+        quantity: int,
+        partial: bool,
+    ) -> list[GCRADecision]:
+        args: list[float | int] = [quantity, 1 if partial else 0]
+        for limit in limits:
+            args.extend([limit.emission_interval_ms, limit.capacity])
+
+        raw = await self._script(keys=[limit.key for limit in limits], args=args)
+
+        decisions = []
+        for i, limit in enumerate(limits):
+            granted, remaining, retry_after_ms, reset_after_ms = (
+                int(v) for v in raw[i * 4 : i * 4 + 4]
+            )
+            decisions.append(
+                GCRADecision(
+                    key=limit.key,
+                    limit=limit.limit,
+                    allowed=granted > 0 or quantity == 0,
+                    granted=granted,
+                    remaining=remaining,
+                    retry_after=retry_after_ms / 1000,
+                    reset_after=reset_after_ms / 1000,
+                )
+            )
+        return decisions
+
+
+def _with_remaining(decision: GCRADecision, local_tokens: int) -> GCRADecision:
+    """lease 소비 결과 (remaining = 로컬 잔량 + Redis 잔량)."""
+    return GCRADecision(
+        key=decision.key,
+        limit=decision.limit,
+        allowed=True,
+        granted=1,
+        remaining=decision.remaining + local_tokens,
+        retry_after=0.0,
+        reset_after=decision.reset_after,
+    )
+
+
+def seconds_ceil(value: float) -> int:
+    """헤더용 초 단위 올림."""
+    return int(math.ceil(value))
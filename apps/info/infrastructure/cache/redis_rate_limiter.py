@@ -1,16 +1,22 @@
 """Redis Rate Limiter Implementation.
 
-Sliding Window Counter 알고리즘을 사용한 Rate Limiter.
+GCRA 알고리즘(cache/gcra.py)을 사용한 Rate Limiter.
+- 판정 1회 = EVALSHA 1회 (조회 + 소비 원자적)
+- 어떤 window_seconds 구간에서도 daily_limit 이하 (RateLimit.windowed)
+- 순간 허용량은 daily_limit의 1% (최소 1), 나머지는 균등하게 회복
+  (버스트를 daily_limit만큼 주면 첫 소진 + 회복분으로 하루 최대 2배까지 허용됨)
 
 데이터 구조:
 - rate_limit:config:{source} → Hash (daily_limit, window_seconds)
-- rate_limit:counter:{source}:{window_id} → String (호출 카운트)
+- rate_limit:gcra:{source} → String (TAT, 버킷이 가득 차면 만료)
 """
 
 from __future__ import annotations
 
 import logging
+import math
 import time
+from collections.abc import Sequence
 
 from redis.asyncio import Redis
 
@@ -19,12 +25,16 @@ from info.application.ports.rate_limiter import (
     RateLimiterPort,
     RateLimitStatus,
 )
+from info.infrastructure.cache.gcra import GCRADecision, GCRALimiter, RateLimit
 
 logger = logging.getLogger(__name__)
 
 # Redis 키 프리픽스
 CONFIG_KEY_PREFIX = "rate_limit:config:"
-COUNTER_KEY_PREFIX = "rate_limit:counter:"
+GCRA_KEY_PREFIX = "rate_limit:gcra:"
+
+# 순간 허용량 비율 (daily_limit 대비)
+QUOTA_BURST_RATIO = 0.01
 
 # 기본 설정
 DEFAULT_LIMITS: dict[str, RateLimitConfig] = {
@@ -36,34 +46,47 @@ DEFAULT_LIMITS: dict[str, RateLimitConfig] = {
 class RedisRateLimiter(RateLimiterPort):
     """Redis 기반 Rate Limiter.
 
-    Sliding Window Counter 알고리즘을 사용하여 정확한 rate limiting 수행.
+    GCRA 알고리즘으로 판정당 Redis 왕복 1회, 원자적 check-and-consume.
     """
 
-    def __init__(self, redis: Redis, default_configs: dict[str, RateLimitConfig] | None = None):
+    def __init__(
+        self,
+        redis: Redis,
+        default_configs: dict[str, RateLimitConfig] | None = None,
+        engine: GCRALimiter | None = None,
+    ):
         """초기화.
 
         Args:
             redis: Redis 클라이언트
             default_configs: 소스별 기본 설정 (없으면 DEFAULT_LIMITS 사용)
+            engine: GCRA 엔진 (None이면 생성)
         """
         self._redis = redis
         self._configs = default_configs or DEFAULT_LIMITS.copy()
+        self._engine = engine or GCRALimiter(redis)
 
     def _config_key(self, source: str) -> str:
         """설정 키 생성."""
         return f"{CONFIG_KEY_PREFIX}{source}"
 
-    def _counter_key(self, source: str, window_id: int) -> str:
-        """카운터 키 생성."""
-        return f"{COUNTER_KEY_PREFIX}{source}:{window_id}"
-
-    def _get_window_id(self, window_seconds: int) -> int:
-        """현재 윈도우 ID 계산."""
-        return int(time.time()) // window_seconds
+    def _rate_limit(self, config: RateLimitConfig) -> RateLimit:
+        """소스 설정 → GCRA 제한 정의 (window_seconds 구간 할당량)."""
+        return RateLimit.windowed(
+            key=f"{GCRA_KEY_PREFIX}{config.source}",
+            limit=config.daily_limit,
+            period=config.window_seconds,
+            burst=int(config.daily_limit * QUOTA_BURST_RATIO),
+        )
 
-    def _get_reset_at(self, window_id: int, window_seconds: int) -> int:
-        """윈도우 리셋 시간 계산."""
-        return (window_id + 1) * window_seconds
+    def _to_status(self, source: str, decision: GCRADecision) -> RateLimitStatus:
+        wait = decision.reset_after if decision.allowed else decision.retry_after
+        return RateLimitStatus(
+            source=source,
+            remaining=decision.remaining,
+            reset_at=int(time.time() + math.ceil(wait)),
+            is_allowed=decision.allowed,
+        )
 
     async def configure(self, config: RateLimitConfig) -> None:
         """Rate Limit 설정 저장.
@@ -116,7 +139,7 @@ class RedisRateLimiter(RateLimiterPort):
     async def check_and_consume(self, source: str) -> RateLimitStatus:
         """호출 가능 여부 확인 및 카운터 증가.
 
-        Lua 스크립트로 원자적 처리.
+        GCRA Lua 스크립트로 원자적 처리 (EVALSHA 1회).
 
         Args:
             source: 소스 식별자
@@ -125,60 +148,35 @@ class RedisRateLimiter(RateLimiterPort):
             Rate Limit 상태
         """
         config = await self._get_config(source)
-        window_id = self._get_window_id(config.window_seconds)
-        counter_key = self._counter_key(source, window_id)
-        reset_at = self._get_reset_at(window_id, config.window_seconds)
-
-        # Lua 스크립트로 원자적 처리
-        lua_script = """
-        local counter_key = KEYS[1]
-        local limit = tonumber(ARGV[1])
-        local window_seconds = tonumber(ARGV[2])
-
-        local current = tonumber(redis.call('GET', counter_key) or '0')
-
-        if current >= limit then
-            return {0, current, 0}  -- not allowed
-        end
-
-        local new_count = redis.call('INCR', counter_key)
-        if new_count == 1 then
-            redis.call('EXPIRE', counter_key, window_seconds)
-        end
-
-        return {1, new_count, limit - new_count}  -- allowed, count, remaining
-        """
-
-        result = await self._redis.eval(
-            lua_script,
-            1,
-            counter_key,
-            config.daily_limit,
-            config.window_seconds,
-        )
+        decision = await self._engine.acquire(self._rate_limit(config))
+        status = self._to_status(source, decision)
 
-        is_allowed, current, remaining = result
-
-        status = RateLimitStatus(
-            source=source,
-            remaining=int(remaining),
-            reset_at=reset_at,
-            is_allowed=bool(is_allowed),
-        )
-
-        if not is_allowed:
+        if not status.is_allowed:
             logger.warning(
                 "Rate limit exceeded",
                 extra={
                     "source": source,
-                    "current": current,
                     "limit": config.daily_limit,
-                    "reset_at": reset_at,
+                    "retry_after": decision.retry_after,
+                    "reset_at": status.reset_at,
                 },
             )
 
         return status
 
+    async def check_and_consume_many(self, sources: Sequence[str]) -> list[RateLimitStatus]:
+        """여러 소스 제한을 한 번에 판정 (모두 허용될 때만 소비).
+
+        Args:
+            sources: 소스 식별자 목록
+
+        Returns:
+            소스별 Rate Limit 상태 (입력 순서)
+        """
+        configs = [await self._get_config(source) for source in sources]
+        decisions = await self._engine.acquire_many([self._rate_limit(c) for c in configs])
+        return [self._to_status(s, d) for s, d in zip(sources, decisions)]
+
     async def get_status(self, source: str) -> RateLimitStatus:
         """현재 Rate Limit 상태 조회.
 
@@ -189,19 +187,11 @@ class RedisRateLimiter(RateLimiterPort):
             Rate Limit 상태
         """
         config = await self._get_config(source)
-        window_id = self._get_window_id(config.window_seconds)
-        counter_key = self._counter_key(source, window_id)
-        reset_at = self._get_reset_at(window_id, config.window_seconds)
-
-        current = await self._redis.get(counter_key)
-        current_count = int(current) if current else 0
-
-        remaining = config.daily_limit - current_count
-        is_allowed = remaining > 0
-
+        decision = await self._engine.peek(self._rate_limit(config))
+        status = self._to_status(source, decision)
         return RateLimitStatus(
             source=source,
-            remaining=max(0, remaining),
-            reset_at=reset_at,
-            is_allowed=is_allowed,
+            remaining=status.remaining,
+            reset_at=status.reset_at,
+            is_allowed=status.remaining > 0,
         )
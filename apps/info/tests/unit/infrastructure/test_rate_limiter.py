@@ -1,14 +1,18 @@
 """Rate Limiter Unit Tests.
 
 Rate Limiter는 info_worker로 이전됨.
-이 테스트는 Port 인터페이스만 검증.
+Port 인터페이스 + GCRA 기반 RedisRateLimiter 검증.
 """
 
 from __future__ import annotations
 
+import math
+
 import pytest
 
 from info.application.ports.rate_limiter import RateLimitConfig, RateLimitStatus
+from info.infrastructure.cache.gcra import GCRA_SCRIPT
+from info.infrastructure.cache.redis_rate_limiter import RedisRateLimiter
 
 
 class TestRateLimiterPort:
@@ -59,3 +63,93 @@ class TestRateLimiterPort:
 # Note: FetchNewsCommand Rate Limiter 통합 테스트는 삭제됨
 # Rate Limiter 기능이 info_worker로 이전되었기 때문
 # info API는 Read-Only (Redis 캐시 → Postgres Fallback)
+
+
+class FakeGCRARedis:
+    """GCRA_SCRIPT를 파이썬으로 재현한 가짜 Redis."""
+
+    def __init__(self):
+        self.now_ms = 1_000_000.0
+        self.data: dict[str, float] = {}
+        self.evals = 0
+
+    def register_script(self, script):
+        assert script == GCRA_SCRIPT
+        return self._run
+
+    async def _run(self, keys, args):
+        self.evals += 1
+        quantity = int(args[0])
+        now = self.now_ms
+        states = []
+        denied = False
+        for i, key in enumerate(keys):
+            interval, burst = float(args[2 + i * 2]), float(args[3 + i * 2])
+            tat = max(self.data.get(key, now), now)
+            states.append((key, tat, interval, burst))
+            if math.floor((now + interval * burst - tat) / interval + 1e-6) < quantity:
+                denied = True
+        granted = 0 if denied else quantity
+
+        result = []
+        for key, tat, interval, burst in states:
+            capacity = interval * burst
+            if granted > 0:
+                tat += interval * granted
+                self.data[key] = tat
+            remaining = max(0, math.floor((now + capacity - tat) / interval + 1e-6))
+            retry = 0
+            if granted == 0 and quantity > 0:
+                retry = max(0, math.ceil(tat + interval * quantity - capacity - now))
+            result += [granted, remaining, retry, max(0, math.ceil(tat - now))]
+        return result
+
+
+class TestRedisRateLimiter:
+    """GCRA 기반 RedisRateLimiter 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_check_and_consume_single_round_trip(self) -> None:
+        """판정당 EVALSHA 1회, 순간 허용량(daily_limit의 1%) 소진 시 거부."""
+        redis = FakeGCRARedis()
+        limiter = RedisRateLimiter(
+            redis,  # type: ignore[arg-type]
+            default_configs={"naver": RateLimitConfig(source="naver", daily_limit=200)},
+        )
+
+        results = [await limiter.check_and_consume("naver") for _ in range(3)]
+
+        assert [r.is_allowed for r in results] == [True, True, False]
+        assert results[1].remaining == 0
+        assert redis.evals == 3
+
+    @pytest.mark.asyncio
+    async def test_get_status_does_not_consume(self) -> None:
+        redis = FakeGCRARedis()
+        limiter = RedisRateLimiter(
+            redis,  # type: ignore[arg-type]
+            default_configs={"naver": RateLimitConfig(source="naver", daily_limit=200)},
+        )
+
+        await limiter.get_status("naver")
+        status = await limiter.get_status("naver")
+
+        assert status.remaining == 2  # 순간 허용량: daily_limit의 1%
+        assert status.is_allowed
+        assert redis.data == {}
+
+    @pytest.mark.asyncio
+    async def test_daily_quota_never_exceeded(self) -> None:
+        """분당 1회씩 48시간 요청해도 어떤 24시간 구간에서도 daily_limit 이하."""
+        redis = FakeGCRARedis()
+        limiter = RedisRateLimiter(redis)  # type: ignore[arg-type]
+
+        admitted: list[int] = []
+        for minute in range(48 * 60):
+            if (await limiter.check_and_consume("newsdata")).is_allowed:
+                admitted.append(minute)
+            redis.now_ms += 60_000
+
+        assert len([m for m in admitted if m < 24 * 60]) <= 200
+        for start in admitted:
+            assert len([m for m in admitted if start <= m < start + 24 * 60]) <= 200
@@ -14,6 +14,10 @@ from scan_worker.application.classify.ports.prompt_repository import (
 )
 from scan_worker.application.classify.ports.result_cache import ResultCachePort
 from scan_worker.application.classify.ports.retriever import RetrieverPort
+from scan_worker.application.classify.ports.vision_cache import (
+    VisionCacheHit,
+    VisionCachePort,
+)
 from scan_worker.application.classify.ports.vision_model import VisionModelPort
 
 __all__ = [
@@ -24,4 +28,6 @@ __all__ = [
     "PromptRepositoryPort",
     "EventPublisherPort",
     "ResultCachePort",
+    "VisionCacheHit",
+    "VisionCachePort",
 ]
@@ -0,0 +1,69 @@
+"""Vision Cache Port - 지각 해시 기반 Vision 결과 캐시 추상화."""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class VisionCacheHit:
+    """유사 이미지 캐시 히트."""
+
+    result: dict[str, Any]  # 캐싱된 Vision 분류 결과
+    fingerprint: str  # 매칭된 저장 이미지의 지각 해시 (hex)
+    distance: int  # 조회 이미지와의 Hamming 거리
+
+
+class VisionCachePort(ABC):
+    """Vision 결과 캐시 포트.
+
+    같은/거의 같은 사진(재업로드, 중복 제출, 인기 제품 사진)의
+    Vision 호출을 건너뛰기 위한 캐시. 구현체는 실패 시 예외 대신
+    None/무시로 처리해 캐시 장애가 분류를 막지 않아야 합니다.
+    """
+
+    @abstractmethod
+    def fingerprint(self, image_url: str) -> str | None:
+        """이미지를 내려받아 지각 해시 계산.
+
+        Args:
+            image_url: 이미지 URL
+
+        Returns:
+            지각 해시 (hex), 다운로드/디코딩 실패 시 None
+        """
+        pass
+
+    @abstractmethod
+    def find(self, fingerprint: str, scope: str) -> VisionCacheHit | None:
+        """임계 거리 이내의 가장 가까운 캐시 항목 조회.
+
+        Args:
+            fingerprint: 조회 이미지의 지각 해시
+            scope: 캐시 범위 (모델, user_input, 프롬프트 버전)
+
+        Returns:
+            VisionCacheHit 또는 None
+        """
+        pass
+
+    @abstractmethod
+    def save(self, fingerprint: str, scope: str, result: dict[str, Any]) -> None:
+        """Vision 결과 저장.
+
+        Args:
+            fingerprint: 이미지 지각 해시
+            scope: 캐시 범위
+            result: Vision 분류 결과
+        """
+        pass
+
+    @abstractmethod
+    def record_audit(self, hit: VisionCacheHit, matched: bool) -> None:
+        """오탐 감사 결과 기록 (히트 일부를 실제 Vision 결과와 비교).
+
+        Args:
+            hit: 감사한 캐시 히트
+            matched: 실제 Vision 분류와 일치 여부
+        """
+        pass
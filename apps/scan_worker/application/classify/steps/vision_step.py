@@ -2,19 +2,27 @@
 
 Stage 1: GPT Vision을 사용한 이미지 분류.
 VisionModelPort와 PromptRepositoryPort만 의존.
+VisionCachePort(선택)가 주어지면 지각 해시가 가까운 이전 결과로 Vision 호출을 대체.
 """
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import random
 import time
-from typing import TYPE_CHECKING
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
 
 import yaml
 
 from scan_worker.application.classify.ports.prompt_repository import (
     PromptRepositoryPort,
 )
+from scan_worker.application.classify.ports.vision_cache import (
+    VisionCacheHit,
+    VisionCachePort,
+)
 from scan_worker.application.classify.ports.vision_model import VisionModelPort
 from scan_worker.application.common.step_interface import Step
 
@@ -37,15 +45,24 @@ class VisionStep(Step):
         self,
         vision_model: VisionModelPort,
         prompt_repository: PromptRepositoryPort,
+        vision_cache: VisionCachePort | None = None,
+        audit_rate: float = 0.0,
+        sampler: Callable[[], float] = random.random,
     ):
         """초기화.
 
         Args:
             vision_model: Vision 모델 Port
             prompt_repository: 프롬프트 리포지토리 Port
+            vision_cache: Vision 결과 캐시 Port (None이면 매번 Vision 호출)
+            audit_rate: 캐시 히트 중 실제 Vision 결과와 비교할 비율 (오탐 감사)
+            sampler: 감사 표본 추출용 난수 (테스트용)
         """
         self._vision = vision_model
         self._prompts = prompt_repository
+        self._cache = vision_cache
+        self._audit_rate = audit_rate
+        self._sampler = sampler
 
     def run(self, ctx: "ClassifyContext") -> "ClassifyContext":
         """Step 실행.
@@ -71,12 +88,8 @@ class VisionStep(Step):
         # 2. 프롬프트 렌더링 (순수 로직)
         prompt = self._render_prompt(prompt_template, schema, tags, ctx.user_input)
 
-        # 3. Vision 모델 호출 (Port 통해 추상화)
-        result = self._vision.analyze_image(
-            prompt=prompt,
-            image_url=ctx.image_url,
-            user_input=ctx.user_input,
-        )
+        # 3. Vision 모델 호출 (Port 통해 추상화), 유사 이미지 캐시 우선
+        result = self._classify(prompt, ctx)
 
         elapsed = (time.perf_counter() - start) * 1000
 
@@ -96,6 +109,72 @@ class VisionStep(Step):
 
         return ctx
 
+    def _classify(self, prompt: str, ctx: "ClassifyContext") -> dict[str, Any]:
+        """캐시 조회 → (미스/감사 시) Vision 호출 → 캐시 저장."""
+        if self._cache is None:
+            return self._analyze(prompt, ctx)
+
+        scope = self._cache_scope(prompt, ctx)
+        fingerprint = self._cache.fingerprint(ctx.image_url)
+        if fingerprint is None:
+            return self._analyze(prompt, ctx)
+
+        hit = self._cache.find(fingerprint, scope)
+        if hit is None:
+            result = self._analyze(prompt, ctx)
+            self._cache.save(fingerprint, scope, result)
+            return result
+
+        if self._sampler() < self._audit_rate:
+            return self._audit(prompt, ctx, hit)
+
+        logger.info(
+            "VisionStep cache hit",
+            extra={
+                "task_id": ctx.task_id,
+                "distance": hit.distance,
+                "fingerprint": fingerprint,
+                "matched_fingerprint": hit.fingerprint,
+            },
+        )
+        return hit.result
+
+    def _audit(
+        self,
+        prompt: str,
+        ctx: "ClassifyContext",
+        hit: VisionCacheHit,
+    ) -> dict[str, Any]:
+        """오탐 감사: 실제 Vision 결과를 사용하고 캐시 결과와의 일치 여부 기록."""
+        result = self._analyze(prompt, ctx)
+        matched = _category_key(result) == _category_key(hit.result)
+        self._cache.record_audit(hit, matched)
+        if not matched:
+            logger.warning(
+                "VisionStep cache false match",
+                extra={
+                    "task_id": ctx.task_id,
+                    "distance": hit.distance,
+                    "cached": _category_key(hit.result),
+                    "actual": _category_key(result),
+                },
+            )
+        return result
+
+    def _analyze(self, prompt: str, ctx: "ClassifyContext") -> dict[str, Any]:
+        return self._vision.analyze_image(
+            prompt=prompt,
+            image_url=ctx.image_url,
+            user_input=ctx.user_input,
+        )
+
+    @staticmethod
+    def _cache_scope(prompt: str, ctx: "ClassifyContext") -> str:
+        """캐시 범위: 모델 + user_input + 프롬프트 버전(렌더링 결과 해시)."""
+        prompt_version = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        raw = "\n".join([ctx.llm_model, (ctx.user_input or "").strip(), prompt_version])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
     def _render_prompt(
         self,
         template: str,
@@ -123,3 +202,13 @@ class VisionStep(Step):
         prompt = prompt.replace("{{SITUATION_TAG_YAML}}", tags_text)
 
         return prompt
+
+
+def _category_key(result: dict[str, Any]) -> tuple[str | None, str | None, str | None]:
+    """감사 비교 기준 (대/중/소분류)."""
+    classification = result.get("classification", {})
+    return (
+        classification.get("major_category"),
+        classification.get("middle_category"),
+        classification.get("minor_category"),
+    )
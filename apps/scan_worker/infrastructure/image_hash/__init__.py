@@ -0,0 +1,5 @@
+"""Image Hash Infrastructure - 지각 해시 (pHash)."""
+
+from .perceptual import hamming_distance, perceptual_hash, split_segments
+
+__all__ = ["hamming_distance", "perceptual_hash", "split_segments"]
@@ -0,0 +1,76 @@
+"""Perceptual Hash (pHash).
+
+64비트 DCT 지각 해시:
+1. 흑백 변환, 32x32 축소
+2. 2D DCT-II의 저주파 8x8 계수
+3. DC 제외 계수의 중앙값보다 크면 1
+
+재압축, 리사이즈, 약간의 밝기 변화에는 Hamming 거리가 작게 유지되어
+같은 사진의 재업로드/중복 제출을 찾는 데 사용합니다.
+"""
+
+from __future__ import annotations
+
+import io
+import math
+from statistics import median
+
+from PIL import Image, ImageOps
+
+HASH_BITS = 64
+
+_SIZE = 32  # 축소 크기
+_LOW = 8  # 사용할 저주파 계수 (8x8 = 64비트)
+
+# DCT-II 코사인 테이블: _COS[k][n] = cos(pi * (2n + 1) * k / (2 * _SIZE))
+_COS = [
+    [math.cos(math.pi * (2 * n + 1) * k / (2 * _SIZE)) for n in range(_SIZE)] for k in range(_LOW)
+]
+
+
+def perceptual_hash(image_bytes: bytes) -> int:
+    """이미지 바이트의 64비트 지각 해시.
+
+    Raises:
+        PIL.UnidentifiedImageError: 이미지로 디코딩할 수 없는 경우
+    """
+    with Image.open(io.BytesIO(image_bytes)) as image:
+        # EXIF 회전 반영 (같은 사진을 다른 방향으로 저장한 경우)
+        image = ImageOps.exif_transpose(image).convert("L")
+        image = image.resize((_SIZE, _SIZE), Image.Resampling.LANCZOS)
+        pixels = list(image.getdata())
+
+    rows = [pixels[i * _SIZE : (i + 1) * _SIZE] for i in range(_SIZE)]
+
+    # 분리 가능한 DCT: 행 방향 8계수 → 열 방향 8계수
+    row_dct = [[sum(c * p for c, p in zip(_COS[u], row)) for u in range(_LOW)] for row in rows]
+    coefficients = [
+        sum(_COS[v][y] * row_dct[y][u] for y in range(_SIZE))
+        for v in range(_LOW)
+        for u in range(_LOW)
+    ]
+
+    threshold = median(coefficients[1:])
+    value = 0
+    for coefficient in coefficients:
+        value = (value << 1) | (coefficient > threshold)
+    return value
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """두 해시의 다른 비트 수."""
+    return (a ^ b).bit_count()
+
+
+def split_segments(value: int, count: int, bits: int = HASH_BITS) -> list[int]:
+    """해시를 count개의 연속 비트 구간으로 분할 (multi-index hashing).
+
+    Hamming 거리가 count 미만이면 비둘기집 원리로 최소 한 구간은 정확히 일치합니다.
+    """
+    widths = [bits // count + (1 if i < bits % count else 0) for i in range(count)]
+    segments = []
+    shift = bits
+    for width in widths:
+        shift -= width
+        segments.append((value >> shift) & ((1 << width) - 1))
+    return segments
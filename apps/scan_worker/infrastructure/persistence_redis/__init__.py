@@ -1,4 +1,4 @@
-"""Redis Persistence Infrastructure - Result Cache, Context Store.
+"""Redis Persistence Infrastructure - Result Cache, Context Store, Vision Cache.
 
 Note:
     RedisEventPublisher는 event_bus로 이동했습니다.
@@ -7,8 +7,9 @@ Note:
 
 from .context_store_impl import RedisContextStore
 from .result_cache_impl import RedisResultCache
+from .vision_cache_impl import RedisVisionCache
 
 # 하위호환성: event_bus에서 re-export
 from ..event_bus import RedisEventPublisher
 
-__all__ = ["RedisContextStore", "RedisEventPublisher", "RedisResultCache"]
+__all__ = ["RedisContextStore", "RedisEventPublisher", "RedisResultCache", "RedisVisionCache"]
@@ -0,0 +1,240 @@
+"""Redis Vision Cache - VisionCachePort 구현체.
+
+지각 해시(pHash) 기반 Vision 결과 캐시. 워커 간 공유를 위해 Redis에 저장.
+
+Hamming 거리 조회 (multi-index hashing):
+- 64비트 해시를 (max_distance + 1)개 구간으로 분할
+- 거리 ≤ max_distance면 최소 한 구간은 정확히 일치 (비둘기집 원리)
+- 구간별 버킷 ZSET(점수 = 저장 시각)에서 최근 후보를 모아 실제 거리 계산
+- 버킷은 저장 시 TTL이 지난 멤버를 제거 (활발한 버킷에 만료 항목이 쌓이지 않도록)
+
+Redis 키:
+- scan:vision_cache:{scope}:r:{fingerprint}  → 분류 결과 JSON
+- scan:vision_cache:{scope}:z{i}:{segment}   → 해당 구간 값을 가진 fingerprint ZSET
+- scan:vision_cache:stats                    → 누적 통계 HASH
+  (lookups, hits, audits, false_matches, saved_calls, saved_cost_micro_usd)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+import redis
+
+from scan_worker.application.classify.ports.vision_cache import (
+    VisionCacheHit,
+    VisionCachePort,
+)
+from scan_worker.infrastructure.image_hash import (
+    hamming_distance,
+    perceptual_hash,
+    split_segments,
+)
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "scan:vision_cache"
+STATS_KEY = f"{KEY_PREFIX}:stats"
+
+# 기본 TTL (7일)
+DEFAULT_VISION_CACHE_TTL = 7 * 24 * 3600
+# 기본 허용 Hamming 거리 (64비트 중)
+DEFAULT_MAX_DISTANCE = 4
+# 다운로드 상한 (업로드 제한과 동일)
+MAX_IMAGE_BYTES = 10 * 1024 * 1024
+# 한 버킷에서 확인할 후보 상한 (편향된 구간 값 방어)
+MAX_CANDIDATES = 256
+
+
+class RedisVisionCache(VisionCachePort):
+    """Redis 기반 지각 해시 Vision 캐시 구현체."""
+
+    def __init__(
+        self,
+        redis_url: str | None = None,
+        max_distance: int = DEFAULT_MAX_DISTANCE,
+        ttl: int = DEFAULT_VISION_CACHE_TTL,
+        download_timeout: float = 5.0,
+        call_cost_usd: float = 0.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        """초기화.
+
+        Args:
+            redis_url: Redis URL (None이면 환경변수 사용)
+            max_distance: 히트로 인정할 최대 Hamming 거리
+            ttl: 항목 TTL (초)
+            download_timeout: 이미지 다운로드 타임아웃 (초)
+            call_cost_usd: Vision 호출 1회 추정 비용 (절감액 통계용)
+            clock: 현재 시각 (epoch 초, 테스트용)
+        """
+        self._redis_url = redis_url or os.environ.get(
+            "REDIS_CACHE_URL",
+            "redis://rfr-cache-redis.redis.svc.cluster.local:6379/0",
+        )
+        self._max_distance = max_distance
+        self._segments = max_distance + 1
+        self._ttl = ttl
+        self._download_timeout = download_timeout
+        self._call_cost_micro_usd = int(call_cost_usd * 1_000_000)
+        self._clock = clock
+        self._client: redis.Redis | None = None
+        self._http: httpx.Client | None = None
+        logger.info(
+            "RedisVisionCache initialized (max_distance=%d, ttl=%d)",
+            max_distance,
+            ttl,
+        )
+
+    def _get_client(self) -> redis.Redis:
+        """Lazy Redis 클라이언트 생성."""
+        if self._client is None:
+            self._client = redis.from_url(
+                self._redis_url,
+                decode_responses=True,
+                socket_timeout=5.0,
+                socket_connect_timeout=5.0,
+            )
+        return self._client
+
+    def _get_http(self) -> httpx.Client:
+        """Lazy HTTP 클라이언트 생성."""
+        if self._http is None:
+            self._http = httpx.Client(timeout=self._download_timeout, follow_redirects=True)
+        return self._http
+
+    def fingerprint(self, image_url: str) -> str | None:
+        """이미지를 내려받아 지각 해시 계산."""
+        try:
+            with self._get_http().stream("GET", image_url) as response:
+                response.raise_for_status()
+                data = bytearray()
+                for chunk in response.iter_bytes():
+                    data += chunk
+                    if len(data) > MAX_IMAGE_BYTES:
+                        logger.info("vision_cache_image_too_large", extra={"url": image_url})
+                        return None
+            return f"{perceptual_hash(bytes(data)):016x}"
+        except Exception as e:
+            logger.warning(
+                "vision_cache_fingerprint_failed",
+                extra={"url": image_url, "error": str(e)},
+            )
+            return None
+
+    def find(self, fingerprint: str, scope: str) -> VisionCacheHit | None:
+        """임계 거리 이내의 가장 가까운 캐시 항목 조회."""
+        try:
+            client = self._get_client()
+            value = int(fingerprint, 16)
+
+            # TTL 이내에 저장된 멤버 중 최신 MAX_CANDIDATES개
+            live_since = self._clock() - self._ttl
+            pipe = client.pipeline(transaction=False)
+            for i, segment in enumerate(split_segments(value, self._segments)):
+                pipe.zrevrangebyscore(
+                    self._bucket_key(scope, i, segment),
+                    "+inf",
+                    live_since,
+                    start=0,
+                    num=MAX_CANDIDATES,
+                )
+            candidates = {fp for members in pipe.execute() for fp in members}
+
+            ranked = sorted((hamming_distance(value, int(fp, 16)), fp) for fp in candidates)
+            for distance, fp in ranked:
+                if distance > self._max_distance:
+                    break
+                data = client.get(self._result_key(scope, fp))
+                if data is None:
+                    continue  # 결과 만료, 버킷에만 남은 항목
+                self._incr(lookups=1, hits=1)
+                return VisionCacheHit(result=json.loads(data), fingerprint=fp, distance=distance)
+
+            self._incr(lookups=1)
+            return None
+        except Exception as e:
+            logger.warning(
+                "vision_cache_find_failed",
+                extra={"scope": scope, "error": str(e)},
+            )
+            return None
+
+    def save(self, fingerprint: str, scope: str, result: dict[str, Any]) -> None:
+        """Vision 결과 저장 (결과 + 구간 버킷)."""
+        try:
+            value = int(fingerprint, 16)
+            now = self._clock()
+            pipe = self._get_client().pipeline(transaction=False)
+            pipe.setex(self._result_key(scope, fingerprint), self._ttl, json.dumps(result))
+            for i, segment in enumerate(split_segments(value, self._segments)):
+                key = self._bucket_key(scope, i, segment)
+                pipe.zadd(key, {fingerprint: now})
+                pipe.zremrangebyscore(key, "-inf", now - self._ttl)
+                pipe.expire(key, self._ttl)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(
+                "vision_cache_save_failed",
+                extra={"scope": scope, "error": str(e)},
+            )
+
+    def record_audit(self, hit: VisionCacheHit, matched: bool) -> None:
+        """오탐 감사 결과 기록 (감사한 히트는 Vision을 호출했으므로 절감에서 제외)."""
+        self._incr(audits=1, false_matches=0 if matched else 1, saved_calls=-1)
+
+    def stats(self) -> dict[str, Any]:
+        """누적 통계 (히트율, 오탐률, 절감 호출/비용)."""
+        try:
+            raw = {k: int(v) for k, v in self._get_client().hgetall(STATS_KEY).items()}
+        except Exception as e:
+            logger.warning("vision_cache_stats_failed", extra={"error": str(e)})
+            return {}
+        lookups = raw.get("lookups", 0)
+        audits = raw.get("audits", 0)
+        return {
+            **raw,
+            "hit_rate": raw.get("hits", 0) / lookups if lookups else 0.0,
+            "false_match_rate": raw.get("false_matches", 0) / audits if audits else 0.0,
+            "saved_cost_usd": raw.get("saved_cost_micro_usd", 0) / 1_000_000,
+        }
+
+    def _incr(
+        self,
+        lookups: int = 0,
+        hits: int = 0,
+        audits: int = 0,
+        false_matches: int = 0,
+        saved_calls: int = 0,
+    ) -> None:
+        saved_calls += hits
+        fields = {
+            "lookups": lookups,
+            "hits": hits,
+            "audits": audits,
+            "false_matches": false_matches,
+            "saved_calls": saved_calls,
+            "saved_cost_micro_usd": saved_calls * self._call_cost_micro_usd,
+        }
+        try:
+            pipe = self._get_client().pipeline(transaction=False)
+            for name, amount in fields.items():
+                if amount:
+                    pipe.hincrby(STATS_KEY, name, amount)
+            pipe.execute()
+        except Exception as e:
+            logger.debug("vision_cache_stats_incr_failed", extra={"error": str(e)})
+
+    @staticmethod
+    def _result_key(scope: str, fingerprint: str) -> str:
+        return f"{KEY_PREFIX}:{scope}:r:{fingerprint}"
+
+    @staticmethod
+    def _bucket_key(scope: str, index: int, segment: int) -> str:
+        return f"{KEY_PREFIX}:{scope}:z{index}:{segment:x}"
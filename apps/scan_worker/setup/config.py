@@ -77,6 +77,28 @@ class Settings(BaseSettings):
         description="체크포인트 TTL (초). 파이프라인 완료 전 실패 복구 윈도우.",
     )
 
+    # === Vision Cache (지각 해시 기반 유사 이미지 결과 재사용) ===
+    # 모든 스캔(미스 포함)에 이미지 다운로드 + pHash 비용이 붙으므로 히트율 확인 전까지 기본 off
+    vision_cache_enabled: bool = Field(False, description="Vision 결과 캐시 사용 여부")
+    vision_cache_max_distance: int = Field(
+        4,
+        ge=0,
+        le=15,
+        description="히트로 인정할 최대 Hamming 거리 (64비트 pHash)",
+    )
+    vision_cache_ttl: int = Field(7 * 24 * 3600, ge=60, description="Vision 캐시 TTL (초)")
+    vision_cache_audit_rate: float = Field(
+        0.02,
+        ge=0.0,
+        le=1.0,
+        description="캐시 히트 중 실제 Vision과 비교하는 비율 (오탐 감사)",
+    )
+    vision_cache_call_cost_usd: float = Field(
+        0.002,
+        ge=0.0,
+        description="Vision 호출 1회 추정 비용 (절감액 통계용)",
+    )
+
     # === LLM API Keys (SecretStr로 로깅 마스킹) ===
     openai_api_key: SecretStr = Field(
         ...,
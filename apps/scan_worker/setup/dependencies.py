@@ -25,6 +25,7 @@ from scan_worker.application.classify.ports.prompt_repository import (
 )
 from scan_worker.application.classify.ports.result_cache import ResultCachePort
 from scan_worker.application.classify.ports.retriever import RetrieverPort
+from scan_worker.application.classify.ports.vision_cache import VisionCachePort
 from scan_worker.application.classify.ports.vision_model import VisionModelPort
 from scan_worker.application.classify.steps.answer_step import AnswerStep
 from scan_worker.application.classify.steps.reward_step import RewardStep
@@ -40,7 +41,10 @@ from scan_worker.infrastructure.llm import (
     GPTVisionAdapter,
 )
 from scan_worker.infrastructure.event_bus import RedisEventPublisher
-from scan_worker.infrastructure.persistence_redis import RedisResultCache
+from scan_worker.infrastructure.persistence_redis import (
+    RedisResultCache,
+    RedisVisionCache,
+)
 from scan_worker.infrastructure.retrievers.json_regulation import (
     JsonRegulationRetriever,
 )
@@ -89,6 +93,20 @@ def get_result_cache() -> ResultCachePort:
     )
 
 
+@lru_cache
+def get_vision_cache() -> VisionCachePort | None:
+    """VisionCache 싱글톤 (비활성화 시 None)."""
+    settings = get_settings()
+    if not settings.vision_cache_enabled:
+        return None
+    return RedisVisionCache(
+        redis_url=settings.redis_cache_url,
+        max_distance=settings.vision_cache_max_distance,
+        ttl=settings.vision_cache_ttl,
+        call_cost_usd=settings.vision_cache_call_cost_usd,
+    )
+
+
 @lru_cache
 def get_context_store() -> ContextStorePort:
     """ContextStore 싱글톤 (체크포인팅)."""
@@ -193,6 +211,8 @@ def get_vision_step(model: str | None = None) -> VisionStep:
     return VisionStep(
         vision_model=get_vision_model(model),
         prompt_repository=get_prompt_repository(),
+        vision_cache=get_vision_cache(),
+        audit_rate=get_settings().vision_cache_audit_rate,
     )
 
 
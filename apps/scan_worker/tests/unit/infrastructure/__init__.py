@@ -0,0 +1 @@
+"""Scan Worker Infrastructure Unit Tests."""
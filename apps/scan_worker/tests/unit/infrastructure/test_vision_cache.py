@@ -0,0 +1,214 @@
+"""Perceptual Hash / RedisVisionCache Unit Tests."""
+
+from __future__ import annotations
+
+import io
+import random
+from collections import defaultdict
+
+from PIL import Image, ImageDraw, ImageFilter
+
+from scan_worker.infrastructure.image_hash import (
+    hamming_distance,
+    perceptual_hash,
+    split_segments,
+)
+from scan_worker.infrastructure.persistence_redis.vision_cache_impl import (
+    RedisVisionCache,
+)
+
+# ============================================================
+# Helpers
+# ============================================================
+
+
+def _photo(seed: int) -> Image.Image:
+    """무작위 도형을 흐리게 한 사진 대용 이미지."""
+    rng = random.Random(seed)
+    image = Image.new("RGB", (256, 256))
+    draw = ImageDraw.Draw(image)
+    for _ in range(40):
+        x, y, r = rng.randrange(256), rng.randrange(256), rng.randrange(10, 60)
+        draw.ellipse([x, y, x + r, y + r], fill=tuple(rng.randrange(256) for _ in range(3)))
+    return image.filter(ImageFilter.GaussianBlur(2))
+
+
+def _encode(image: Image.Image, fmt: str = "PNG", quality: int = 95) -> bytes:
+    buffer = io.BytesIO()
+    image.save(buffer, format=fmt, quality=quality)
+    return buffer.getvalue()
+
+
+class FakePipeline:
+    def __init__(self, redis: "FakeRedis"):
+        self._redis = redis
+        self._ops: list = []
+
+    def __getattr__(self, name):
+        def op(*args, **kwargs):
+            self._ops.append((name, args, kwargs))
+            return self
+
+        return op
+
+    def execute(self):
+        return [getattr(self._redis, name)(*args, **kw) for name, args, kw in self._ops]
+
+
+class FakeRedis:
+    """RedisVisionCache가 사용하는 명령만 구현한 인메모리 Redis."""
+
+    def __init__(self):
+        self.values: dict[str, str] = {}
+        self.zsets: dict[str, dict[str, float]] = defaultdict(dict)
+        self.hashes: dict[str, dict[str, int]] = defaultdict(dict)
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def setex(self, key, ttl, value):
+        self.values[key] = value
+
+    def zadd(self, key, mapping):
+        self.zsets[key].update(mapping)
+
+    def zremrangebyscore(self, key, low, high):
+        for member, score in list(self.zsets[key].items()):
+            if score <= float(high):
+                del self.zsets[key][member]
+
+    def zrevrangebyscore(self, key, high, low, start=0, num=None):
+        members = sorted(self.zsets.get(key, {}).items(), key=lambda item: -item[1])
+        live = [m for m, score in members if float(low) <= score <= float(high)]
+        return live[start : start + num]
+
+    def expire(self, key, ttl):
+        pass
+
+    def hincrby(self, key, field, amount):
+        self.hashes[key][field] = self.hashes[key].get(field, 0) + amount
+
+    def hgetall(self, key):
+        return {k: str(v) for k, v in self.hashes.get(key, {}).items()}
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _cache(**kwargs) -> RedisVisionCache:
+    cache = RedisVisionCache(redis_url="redis://fake", **kwargs)
+    cache._client = FakeRedis()
+    return cache
+
+
+RESULT = {
+    "classification": {"major_category": "재활용폐기물", "middle_category": "플라스틱류"},
+    "situation_tags": [],
+    "meta": {"user_input": ""},
+}
+
+# ============================================================
+# Tests
+# ============================================================
+
+
+class TestPerceptualHash:
+    """pHash 테스트."""
+
+    def test_resized_recompressed_photo_is_near(self):
+        """리사이즈 + JPEG 재압축한 같은 사진은 거리가 작음."""
+        photo = _photo(seed=1)
+        original = perceptual_hash(_encode(photo))
+        recompressed = perceptual_hash(_encode(photo.resize((180, 180)), "JPEG", quality=60))
+
+        assert hamming_distance(original, recompressed) <= 4
+
+    def test_different_photo_is_far(self):
+        """다른 사진은 거리가 큼."""
+        first = perceptual_hash(_encode(_photo(seed=1)))
+        second = perceptual_hash(_encode(_photo(seed=2)))
+
+        assert hamming_distance(first, second) > 10
+
+    def test_split_segments_pigeonhole(self):
+        """구간 분할은 64비트를 빠짐없이 나눔."""
+        value = 0xF0F0_1234_ABCD_0001
+        segments = split_segments(value, 5)
+
+        assert len(segments) == 5
+        rebuilt = 0
+        for segment, width in zip(segments, [13, 13, 13, 13, 12]):
+            rebuilt = (rebuilt << width) | segment
+        assert rebuilt == value
+
+
+class TestRedisVisionCache:
+    """RedisVisionCache (multi-index hashing) 테스트."""
+
+    def test_find_within_distance(self):
+        """임계 거리 이내 항목을 찾고 거리/통계를 기록."""
+        cache = _cache(max_distance=4, call_cost_usd=0.002)
+        stored = 0x0123_4567_89AB_CDEF
+        cache.save(f"{stored:016x}", "scope-a", RESULT)
+
+        near = stored ^ 0b1011  # 3비트 차이
+        hit = cache.find(f"{near:016x}", "scope-a")
+
+        assert hit is not None
+        assert hit.distance == 3
+        assert hit.result == RESULT
+        stats = cache.stats()
+        assert stats["hit_rate"] == 1.0
+        assert stats["saved_calls"] == 1
+        assert stats["saved_cost_usd"] == 0.002
+
+    def test_miss_beyond_distance_or_scope(self):
+        """거리 초과 또는 다른 scope는 미스."""
+        cache = _cache(max_distance=2)
+        stored = 0x0123_4567_89AB_CDEF
+        cache.save(f"{stored:016x}", "scope-a", RESULT)
+
+        assert cache.find(f"{stored ^ 0b111:016x}", "scope-a") is None
+        assert cache.find(f"{stored:016x}", "scope-b") is None
+        assert cache.stats()["lookups"] == 2
+
+    def test_audit_stats(self):
+        """감사 결과는 오탐률에 반영되고 절감 호출에서 제외."""
+        cache = _cache()
+        stored = 0x0123_4567_89AB_CDEF
+        cache.save(f"{stored:016x}", "scope-a", RESULT)
+        hit = cache.find(f"{stored:016x}", "scope-a")
+
+        cache.record_audit(hit, matched=False)
+
+        stats = cache.stats()
+        assert stats["audits"] == 1
+        assert stats["false_match_rate"] == 1.0
+        assert stats["saved_calls"] == 0
+
+    def test_expired_members_pruned_from_buckets(self):
+        """TTL이 지난 fingerprint는 다음 저장 때 버킷에서 제거되고 후보에서도 빠짐."""
+        clock = Clock()
+        cache = _cache(ttl=60, clock=clock)
+        old = 0x0123_4567_89AB_CDEF
+        cache.save(f"{old:016x}", "scope-a", RESULT)
+
+        clock.now += 61
+        assert cache.find(f"{old:016x}", "scope-a") is None
+
+        fresh = old ^ 0b1
+        cache.save(f"{fresh:016x}", "scope-a", RESULT)
+
+        # 새 항목이 쓰인 버킷(공유 구간)에서는 만료 멤버가 제거됨
+        written = [b for b in cache._client.zsets.values() if f"{fresh:016x}" in b]
+        assert len(written) == 5
+        assert all(f"{old:016x}" not in bucket for bucket in written)
+        assert cache.find(f"{old:016x}", "scope-a").fingerprint == f"{fresh:016x}"
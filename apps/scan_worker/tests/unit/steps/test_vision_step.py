@@ -10,6 +10,10 @@ from scan_worker.application.classify.dto.classify_context import ClassifyContex
 from scan_worker.application.classify.ports.prompt_repository import (
     PromptRepositoryPort,
 )
+from scan_worker.application.classify.ports.vision_cache import (
+    VisionCacheHit,
+    VisionCachePort,
+)
 from scan_worker.application.classify.ports.vision_model import VisionModelPort
 
 # ============================================================
@@ -31,6 +35,7 @@ class MockVisionModel(VisionModelPort):
             "meta": {"user_input": "테스트"},
         }
         self.last_user_input = None  # 호출 확인용
+        self.call_count = 0
 
     def analyze_image(
         self,
@@ -39,9 +44,33 @@ class MockVisionModel(VisionModelPort):
         user_input: str | None = None,
     ) -> dict[str, Any]:
         self.last_user_input = user_input
+        self.call_count += 1
         return self._return_value
 
 
+class MockVisionCache(VisionCachePort):
+    """Mock Vision Cache (fingerprint = URL, 정확히 일치할 때만 히트)."""
+
+    def __init__(self):
+        self.entries: dict[tuple[str, str], dict[str, Any]] = {}
+        self.audits: list[bool] = []
+
+    def fingerprint(self, image_url: str) -> str | None:
+        return None if "broken" in image_url else image_url
+
+    def find(self, fingerprint: str, scope: str) -> VisionCacheHit | None:
+        result = self.entries.get((fingerprint, scope))
+        if result is None:
+            return None
+        return VisionCacheHit(result=result, fingerprint=fingerprint, distance=0)
+
+    def save(self, fingerprint: str, scope: str, result: dict[str, Any]) -> None:
+        self.entries[(fingerprint, scope)] = result
+
+    def record_audit(self, hit: VisionCacheHit, matched: bool) -> None:
+        self.audits.append(matched)
+
+
 class MockPromptRepository(PromptRepositoryPort):
     """Mock Prompt Repository for testing."""
 
@@ -178,6 +207,90 @@ class TestVisionStep:
         assert vision_model.last_user_input is None
 
 
+class TestVisionStepCache:
+    """VisionStep 캐시 단락 테스트."""
+
+    @staticmethod
+    def _ctx(image_url: str = "https://example.com/image.jpg", user_input: str | None = None):
+        return ClassifyContext(
+            task_id="test-task-cache",
+            user_id="user-001",
+            image_url=image_url,
+            user_input=user_input,
+        )
+
+    def test_second_scan_served_from_cache(self):
+        """같은 이미지는 두 번째부터 Vision 호출 없이 캐시 결과 사용."""
+        from scan_worker.application.classify.steps.vision_step import VisionStep
+
+        vision_model = MockVisionModel()
+        step = VisionStep(vision_model, MockPromptRepository(), vision_cache=MockVisionCache())
+
+        first = step.run(self._ctx())
+        second = step.run(self._ctx())
+
+        assert vision_model.call_count == 1
+        assert second.classification == first.classification
+
+    def test_scope_includes_user_input(self):
+        """user_input이 다르면 캐시를 공유하지 않음."""
+        from scan_worker.application.classify.steps.vision_step import VisionStep
+
+        vision_model = MockVisionModel()
+        step = VisionStep(vision_model, MockPromptRepository(), vision_cache=MockVisionCache())
+
+        step.run(self._ctx(user_input="페트병인가요?"))
+        step.run(self._ctx(user_input="캔인가요?"))
+
+        assert vision_model.call_count == 2
+
+    def test_fingerprint_failure_bypasses_cache(self):
+        """이미지 해시 실패 시 Vision 호출로 진행."""
+        from scan_worker.application.classify.steps.vision_step import VisionStep
+
+        vision_model = MockVisionModel()
+        cache = MockVisionCache()
+        step = VisionStep(vision_model, MockPromptRepository(), vision_cache=cache)
+
+        step.run(self._ctx(image_url="https://example.com/broken.jpg"))
+        step.run(self._ctx(image_url="https://example.com/broken.jpg"))
+
+        assert vision_model.call_count == 2
+        assert cache.entries == {}
+
+    def test_audit_calls_vision_and_records_mismatch(self):
+        """감사 표본은 실제 Vision 결과를 쓰고 불일치를 기록."""
+        from scan_worker.application.classify.steps.vision_step import VisionStep
+
+        cache = MockVisionCache()
+        warm = VisionStep(MockVisionModel(), MockPromptRepository(), vision_cache=cache)
+        warm.run(self._ctx())
+
+        other = MockVisionModel(
+            return_value={
+                "classification": {
+                    "major_category": "재활용폐기물",
+                    "middle_category": "금속류",
+                    "minor_category": "캔",
+                },
+                "situation_tags": [],
+                "meta": {"user_input": ""},
+            }
+        )
+        step = VisionStep(
+            other,
+            MockPromptRepository(),
+            vision_cache=cache,
+            audit_rate=1.0,
+            sampler=lambda: 0.0,
+        )
+        result = step.run(self._ctx())
+
+        assert other.call_count == 1
+        assert result.classification["classification"]["middle_category"] == "금속류"
+        assert cache.audits == [False]
+
+
 class TestClassifyContext:
     """ClassifyContext 테스트."""
 
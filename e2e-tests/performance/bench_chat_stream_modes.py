@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Chat 파이프라인 astream 구독 모드 벤치마크 (턴당 CPU 시간 / 메모리 할당)
+
+ProcessChatCommand를 실제 LangGraph 그래프(+ Fake Chat Model)로 실행해
+stream_mode 구독 조합별 오버헤드를 비교합니다.
+
+그래프: intent(LLM 1회, 짧은 응답) → answer(LLM 스트리밍, ~1k 토큰, 노드가 직접 토큰 발행)
+
+Usage:
+    PYTHONPATH=apps python e2e-tests/performance/bench_chat_stream_modes.py --turns 50
+"""
+
+import argparse
+import asyncio
+import gc
+import itertools
+import time
+import tracemalloc
+from typing import Any, TypedDict
+
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+from langgraph.graph import END, START, StateGraph
+
+from chat_worker.application.commands.process_chat import (
+    ProcessChatCommand,
+    ProcessChatRequest,
+)
+
+MODES = {
+    "messages+updates (기존)": ["messages", "updates"],
+    "updates+custom (기본)": ["updates", "custom"],
+}
+
+
+class BenchState(TypedDict, total=False):
+    message: str
+    intent: str
+    answer: str
+
+
+class NullNotifier:
+    """발행 비용을 제외하기 위한 no-op ProgressNotifier."""
+
+    async def notify_stage(self, **kwargs: Any) -> str:
+        return ""
+
+    async def notify_token_v2(self, task_id: str, content: str, node: str | None = None) -> str:
+        return ""
+
+    async def finalize_token_stream(self, task_id: str) -> None:
+        return None
+
+    def clear_token_counter(self, task_id: str) -> None:
+        return None
+
+
+def build_graph(answer_tokens: int):
+    answer_text = " ".join(f"tok{i}" for i in range(answer_tokens))
+    intent_llm = GenericFakeChatModel(messages=itertools.repeat(AIMessage(content="waste 0.93")))
+    answer_llm = GenericFakeChatModel(messages=itertools.repeat(AIMessage(content=answer_text)))
+    sink = NullNotifier()
+
+    async def intent(state: BenchState) -> BenchState:
+        result = await intent_llm.ainvoke(state["message"])
+        return {"intent": str(result.content).split()[0]}
+
+    async def answer(state: BenchState) -> BenchState:
+        # answer_node처럼 노드가 직접 토큰 발행
+        parts = []
+        async for chunk in answer_llm.astream(state["message"]):
+            parts.append(chunk.content)
+            await sink.notify_token_v2("bench", chunk.content, node="answer")
+        return {"answer": "".join(parts)}
+
+    graph = StateGraph(BenchState)
+    graph.add_node("intent", intent)
+    graph.add_node("answer", answer)
+    graph.add_edge(START, "intent")
+    graph.add_edge("intent", "answer")
+    graph.add_edge("answer", END)
+    return graph.compile()
+
+
+def _gen0_collections() -> int:
+    return gc.get_stats()[0]["collections"]
+
+
+async def run_turns(command: ProcessChatCommand, turns: int) -> dict[str, float]:
+    """턴당 CPU ms / gen0 GC 횟수 (컨테이너 객체 할당량 지표) 평균."""
+    cpu_total = 0.0
+    gc_total = 0
+    for i in range(turns):
+        request = ProcessChatRequest(
+            job_id=f"bench-{i}", session_id="bench", user_id="bench", message="페트병 버려?"
+        )
+        gc_before = _gen0_collections()
+        started = time.process_time()
+        response = await command.execute(request)
+        cpu_total += time.process_time() - started
+        gc_total += _gen0_collections() - gc_before
+        assert response.status == "completed", response.error
+    return {"cpu_ms": cpu_total / turns * 1000, "gen0": gc_total / turns}
+
+
+async def measure_alloc_kib(command: ProcessChatCommand, turns: int) -> float:
+    """턴당 tracemalloc 누적 할당 peak 평균 (KiB, CPU 측정과 분리 실행)."""
+    tracemalloc.start()
+    total = 0
+    for i in range(turns):
+        request = ProcessChatRequest(
+            job_id=f"mem-{i}", session_id="bench", user_id="bench", message="페트병 버려?"
+        )
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        await command.execute(request)
+        total += tracemalloc.get_traced_memory()[1] - before
+    tracemalloc.stop()
+    return total / turns / 1024
+
+
+async def main(turns: int, answer_tokens: int, trace_memory: bool) -> None:
+    graph = build_graph(answer_tokens)
+    commands = {
+        label: ProcessChatCommand(
+            pipeline=graph, progress_notifier=NullNotifier(), stream_modes=modes
+        )
+        for label, modes in MODES.items()
+    }
+    for command in commands.values():
+        await run_turns(command, 3)  # warm-up
+
+    print(f"turns={turns} answer_tokens={answer_tokens}")
+    print(f"{'mode':<26} {'cpu ms/turn':>12} {'gen0 gc/turn':>13} {'peak KiB/turn':>14}")
+    for label, command in commands.items():
+        stats = await run_turns(command, turns)
+        peak = await measure_alloc_kib(command, max(1, turns // 5)) if trace_memory else 0.0
+        print(f"{label:<26} {stats['cpu_ms']:>12.2f} {stats['gen0']:>13.1f} {peak:>14.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--turns", type=int, default=50)
+    parser.add_argument("--answer-tokens", type=int, default=1000)
+    parser.add_argument("--no-memory", action="store_true", help="tracemalloc 측정 생략")
+    args = parser.parse_args()
+    asyncio.run(main(args.turns, args.answer_tokens, not args.no_memory))
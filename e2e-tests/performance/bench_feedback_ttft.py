@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+RAG 피드백 평가 모드별 TTFT 벤치마크 (inline vs deferred)
+
+waste_rag 이후 feedback → answer 구간을 EvaluateFeedbackCommand + 가짜 LLM으로 재현해
+answer 첫 토큰까지의 시간(TTFT)을 비교합니다.
+
+- LLM 평가기: --eval-latency 초 후 PARTIAL 점수 반환
+- answer: --first-token-latency 초 후 첫 토큰, 이후 토큰마다 --token-interval 초
+- RAG 결과는 배출 방법이 빠져 규칙 평가가 GOOD 미만 (모든 요청이 LLM 평가 대상)
+
+Usage:
+    PYTHONPATH=apps python e2e-tests/performance/bench_feedback_ttft.py --requests 40
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from unittest.mock import MagicMock
+
+from chat_worker.application.commands.evaluate_feedback_command import (
+    EvaluateFeedbackCommand,
+    EvaluateFeedbackInput,
+)
+from chat_worker.application.dto.feedback_result import FeedbackResult
+from chat_worker.application.services.deferred_feedback_evaluator import (
+    DeferredFeedbackEvaluator,
+)
+
+RAG_RESULTS = {
+    "key": "plastic_pet",
+    "category": "플라스틱",
+    "data": {"item": "페트병"},  # 배출 방법 누락 → 규칙 평가 PARTIAL
+    "evidence": [{"chunk_id": "plastic_pet", "relevance": "medium", "matched_tags": []}],
+}
+QUERIES = ["건전지랑 페트병 같이 버려?", "페트병 어떻게 버려?"]
+
+
+class FakeLLMEvaluator:
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.calls = 0
+
+    async def evaluate(self, query, rag_results, context=None) -> FeedbackResult:
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        return FeedbackResult.from_score(0.6)
+
+
+async def answer(first_token_latency: float, token_interval: float, tokens: int, on_first):
+    await asyncio.sleep(first_token_latency)
+    first = time.perf_counter()
+    on_first()
+    for _ in range(tokens - 1):
+        await asyncio.sleep(token_interval)
+    return first
+
+
+async def run(mode: str, args: argparse.Namespace) -> dict[str, float]:
+    llm = FakeLLMEvaluator(args.eval_latency)
+    deferred = DeferredFeedbackEvaluator(llm) if mode == "deferred" else None
+    command = EvaluateFeedbackCommand(
+        fallback_orchestrator=MagicMock(),
+        llm_evaluator=llm,
+        deferred_evaluator=deferred,
+    )
+
+    async def one(i: int) -> float:
+        job_id = f"{mode}-{i}"
+        started = time.perf_counter()
+        await command.execute(
+            EvaluateFeedbackInput(
+                job_id=job_id,
+                query=QUERIES[i % len(QUERIES)],
+                intent="waste",
+                rag_results=RAG_RESULTS,
+            )
+        )
+        release = (lambda: deferred.release(job_id)) if deferred else (lambda: None)
+        first = await answer(args.first_token_latency, args.token_interval, args.tokens, release)
+        return (first - started) * 1000
+
+    ttfts = await asyncio.gather(*(one(i) for i in range(args.requests)))
+    if deferred is not None:
+        await deferred.drain()
+    ttfts = sorted(ttfts)
+    return {
+        "p50": statistics.median(ttfts),
+        "p95": ttfts[int(len(ttfts) * 0.95) - 1],
+        "llm_calls": llm.calls,
+    }
+
+
+async def main(args: argparse.Namespace) -> None:
+    print(
+        f"requests={args.requests} eval_latency={args.eval_latency}s "
+        f"first_token_latency={args.first_token_latency}s"
+    )
+    print(f"{'mode':<10} {'TTFT p50 ms':>12} {'TTFT p95 ms':>12} {'llm evals':>10}")
+    for mode in ("inline", "deferred"):
+        stats = await run(mode, args)
+        print(f"{mode:<10} {stats['p50']:>12.1f} {stats['p95']:>12.1f} {stats['llm_calls']:>10}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=40)
+    parser.add_argument("--eval-latency", type=float, default=0.8)
+    parser.add_argument("--first-token-latency", type=float, default=0.35)
+    parser.add_argument("--token-interval", type=float, default=0.01)
+    parser.add_argument("--tokens", type=int, default=50)
+    asyncio.run(main(parser.parse_args()))
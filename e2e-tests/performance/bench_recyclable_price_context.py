@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+재활용자원 시세 context 빌드 마이크로벤치마크 (per-call vs compiled)
+
+recyclable_price 노드의 Function Calling 이후 구간(SearchRecyclablePriceCommand →
+가격 조회 → RecyclablePriceService.format_search_results)을 실제 YAML 데이터로 반복해
+호출당 context 빌드 시간을 비교합니다.
+
+- per-call: 이전 구현 방식 (조회마다 품목 목록 순회 + DTO 생성 + context 문자열 조립)
+- compiled: LocalRecyclablePriceClient (권역 × 카테고리 뷰 + 미리 포맷한 context)
+
+Usage:
+    PYTHONPATH=apps python e2e-tests/performance/bench_recyclable_price_context.py --iterations 5000
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from chat_worker.application.commands.search_recyclable_price_command import (
+    SearchRecyclablePriceCommand,
+    SearchRecyclablePriceInput,
+)
+from chat_worker.application.ports.recyclable_price_client import (
+    RecyclableCategory,
+    RecyclablePriceDTO,
+    RecyclablePriceSearchResponse,
+    RecyclableRegion,
+)
+from chat_worker.infrastructure.integrations.recyclable_price import (
+    LocalRecyclablePriceClient,
+)
+from chat_worker.infrastructure.integrations.recyclable_price.price_store import (
+    CATEGORY_ID_MAP,
+    REGION_KEYS,
+)
+
+# recyclable_price 노드에 들어오는 요청 분포 (카테고리 조회 위주)
+REQUESTS = [
+    {"item_name": "plastic", "category": RecyclableCategory.PLASTIC},
+    {"item_name": "metal", "category": RecyclableCategory.METAL},
+    {
+        "item_name": "paper",
+        "category": RecyclableCategory.PAPER,
+        "region": RecyclableRegion.CAPITAL,
+    },
+    {"item_name": "캔"},
+    {"item_name": "페트병", "region": RecyclableRegion.GYEONGNAM},
+    {"item_name": "신문지"},
+]
+
+
+class PerCallPriceClient:
+    """이전 구현 방식: 조회마다 품목 목록을 순회해 DTO/context 생성."""
+
+    def __init__(self, compiled: LocalRecyclablePriceClient):
+        store = compiled._load_data()
+        self._items = store.items
+        self._store = store
+        self._survey_date = store.survey_date
+
+    def _dto(self, item, region: RecyclableRegion) -> RecyclablePriceDTO:
+        prices = item.get("prices", {})
+        return RecyclablePriceDTO(
+            item_code=item.get("id", ""),
+            item_name=item.get("name", ""),
+            category=CATEGORY_ID_MAP.get(item.get("category_id", ""), RecyclableCategory.PLASTIC),
+            price_per_kg=prices.get(REGION_KEYS[region], prices.get("nationwide", 0)),
+            region=region,
+            survey_date=self._survey_date,
+            form=item.get("form"),
+            note=item.get("note"),
+        )
+
+    def _response(self, items, query, region) -> RecyclablePriceSearchResponse:
+        return RecyclablePriceSearchResponse(
+            items=items,
+            query=query,
+            survey_date=self._survey_date,
+            region=region,
+            total_count=len(items),
+        )
+
+    async def search_price(self, item_name, region=None):
+        region = region or RecyclableRegion.NATIONAL
+        matched = [self._store.item_index[i] for i in self._store.search(item_name)]
+        return self._response([self._dto(i, region) for i in matched], item_name, region)
+
+    async def get_category_prices(self, category, region=None):
+        region = region or RecyclableRegion.NATIONAL
+        matched = [i for i in self._items if i.get("category_id") == category.value]
+        return self._response([self._dto(i, region) for i in matched], category.value, region)
+
+
+async def run(client, iterations: int) -> list[float]:
+    command = SearchRecyclablePriceCommand(price_client=client)
+    inputs = [SearchRecyclablePriceInput(job_id="bench", **request) for request in REQUESTS]
+
+    # warm-up (첫 로드/컴파일 제외)
+    for input_dto in inputs:
+        await command.execute(input_dto)
+
+    samples = []
+    for i in range(iterations):
+        input_dto = inputs[i % len(inputs)]
+        started = time.perf_counter()
+        output = await command.execute(input_dto)
+        samples.append((time.perf_counter() - started) * 1_000_000)
+        assert output.price_context and output.price_context.get("context")
+    return sorted(samples)
+
+
+async def main(args: argparse.Namespace) -> None:
+    compiled = LocalRecyclablePriceClient(reload_interval=None)
+    started = time.perf_counter()
+    compiled._load_data()
+    compile_ms = (time.perf_counter() - started) * 1000
+
+    print(f"iterations={args.iterations} compile={compile_ms:.1f}ms (1회)")
+    print(f"{'mode':<10} {'p50 us':>10} {'p99 us':>10} {'mean us':>10}")
+    for mode, client in (("per-call", PerCallPriceClient(compiled)), ("compiled", compiled)):
+        samples = await run(client, args.iterations)
+        print(
+            f"{mode:<10} {statistics.median(samples):>10.1f} "
+            f"{samples[int(len(samples) * 0.99) - 1]:>10.1f} {statistics.fmean(samples):>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    import logging
+
+    logging.disable(logging.INFO)  # 조회 로그 I/O 제외
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=5000)
+    asyncio.run(main(parser.parse_args()))
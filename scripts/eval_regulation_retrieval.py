@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""분리배출 규정 Retriever 오프라인 평가 스크립트.
+
+표현을 바꾼 질문(paraphrase) 세트로 Retriever별 recall@k와 쿼리 지연을 측정합니다.
+LLM/외부 API 없이 로컬 에셋만 사용합니다.
+
+- tag: TagBasedRetriever (태그 매칭 + 키워드 폴백)
+- semantic: SemanticRetriever(hybrid=False)
+- hybrid: SemanticRetriever (태그 + 의미 검색 RRF 융합)
+
+Usage:
+    python scripts/eval_regulation_retrieval.py [--index PATH] [--repeat N]
+"""
+
+import argparse
+import logging
+import os
+import statistics
+import sys
+import time
+
+# apps 디렉토리를 path에 추가
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "apps")
+)
+
+from chat_worker.infrastructure.retrieval import (
+    SemanticRetriever,
+    TagBasedRetriever,
+)
+
+# (질문, 정답 규정 키)
+EVAL_SET: list[tuple[str, str]] = [
+    ("생수병 라벨 떼고 버려야 돼?", "재활용폐기물_무색페트병"),
+    ("투명한 물병은 어떻게 배출해?", "재활용폐기물_무색페트병"),
+    ("음료수 페트 뚜껑 닫아서 버려?", "재활용폐기물_무색페트병"),
+    ("택배 상자 버리는 방법", "재활용폐기물_종이"),
+    ("신문이랑 잡지 묶어서 내놔도 돼?", "재활용폐기물_종이"),
+    ("우유 곽 씻어서 말려야 해?", "재활용폐기물_종이팩"),
+    ("멸균팩은 어디에 버려?", "재활용폐기물_종이팩"),
+    ("과자 봉지 버리는 법", "재활용폐기물_비닐류"),
+    ("뽁뽁이 에어캡 분리배출", "재활용폐기물_비닐류"),
+    ("택배 완충재 스티로폼", "재활용폐기물_발포합성수지"),
+    ("컵라면 용기 스티로폼 버리기", "재활용폐기물_발포합성수지"),
+    ("참치캔 버리는 방법", "재활용폐기물_금속류"),
+    ("부탄가스 통 구멍 뚫어야 해?", "재활용폐기물_금속류"),
+    ("소주병 반납해도 돼?", "재활용폐기물_유리병"),
+    ("깨진 거울은 어떻게 버려?", "불연성종량제폐기물"),
+    ("사기그릇 깨졌는데 어디다 버려", "불연성종량제폐기물"),
+    ("다 쓴 보조배터리 버리는 곳", "재활용폐기물_전지"),
+    ("폐건전지 수거함", "재활용폐기물_전지"),
+    ("LED 전구 버리기", "재활용폐기물_조명제품"),
+    ("안 입는 옷 버리는 법", "재활용폐기물_의류및원단"),
+    ("헌 이불 배출 방법", "재활용폐기물_의류및원단"),
+    ("고장난 선풍기 버리기", "재활용폐기물_전기전자제품"),
+    ("휴대폰 폐기 방법", "재활용폐기물_전기전자제품"),
+    ("쓰던 소파 버리고 싶어", "대형폐기물"),
+    ("침대 매트리스 버리는 법", "대형폐기물"),
+    ("남은 김치 국물 버리기", "음식물류폐기물"),
+    ("수박 껍질 음식물 쓰레기야?", "음식물류폐기물"),
+    ("유통기한 지난 약 버리는 곳", "생활계유해폐기물"),
+    ("다 쓴 페인트 통 처리", "생활계유해폐기물"),
+    ("샴푸 통 플라스틱 분리수거", "재활용폐기물_플라스틱류"),
+    ("배달 용기 플라스틱 씻어서 버려?", "재활용폐기물_플라스틱류"),
+    ("인테리어하고 남은 벽지랑 타일", "공사장생활폐기물"),
+    ("칫솔은 일반쓰레기야?", "일반종량제폐기물"),
+]
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def evaluate(name: str, retriever, repeat: int) -> None:
+    """recall@1, recall@3, 지연(p50/p95) 출력."""
+    hits_at_1 = 0
+    hits_at_3 = 0
+    latencies_ms: list[float] = []
+    misses: list[str] = []
+
+    for query, expected in EVAL_SET:
+        results = retriever.search_with_context(query)
+        keys = [r.chunk_id for r in results]
+        if keys[:1] == [expected]:
+            hits_at_1 += 1
+        if expected in keys[:3]:
+            hits_at_3 += 1
+        else:
+            misses.append(f"{query} → {keys[:3]}")
+
+        for _ in range(repeat):
+            start = time.perf_counter()
+            retriever.search_with_context(query)
+            latencies_ms.append((time.perf_counter() - start) * 1000)
+
+    total = len(EVAL_SET)
+    print(f"\n[{name}]")
+    print(f"  recall@1: {hits_at_1 / total:.2%} ({hits_at_1}/{total})")
+    print(f"  recall@3: {hits_at_3 / total:.2%} ({hits_at_3}/{total})")
+    print(
+        f"  latency:  p50={statistics.median(latencies_ms):.3f}ms "
+        f"p95={_percentile(latencies_ms, 0.95):.3f}ms"
+    )
+    for miss in misses:
+        print(f"  miss: {miss}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--index", default=None, help="오프라인 빌드 인덱스 경로 (.npz)")
+    parser.add_argument("--repeat", type=int, default=20, help="쿼리당 지연 측정 반복 수")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    tag = TagBasedRetriever()
+    semantic = SemanticRetriever(index_path=args.index, tag_retriever=tag, hybrid=False)
+    hybrid = SemanticRetriever(index_path=args.index, tag_retriever=tag, hybrid=True)
+
+    print("=" * 60)
+    print(f"Regulation retrieval eval ({len(EVAL_SET)} queries)")
+    print("=" * 60)
+    evaluate("tag", tag, args.repeat)
+    evaluate("semantic", semantic, args.repeat)
+    evaluate("hybrid", hybrid, args.repeat)
+
+
+if __name__ == "__main__":
+    main()